@@ -51,6 +51,19 @@ def _max_drawdown(cumulative: List[float]) -> Tuple[float, float]:
     return max_dd, pct
 
 
+def param_range_bucket(pct: float) -> str:
+    """profit_pct bucket (edge proxy) used for win-rate breakdowns."""
+    if pct < 0:
+        return "negative"
+    if pct < 1:
+        return "0-1%"
+    if pct < 3:
+        return "1-3%"
+    if pct < 6:
+        return "3-6%"
+    return "6%+"
+
+
 class StrategyDiagnosticsEngine:
     """
     Read-only diagnostics: performance breakdowns, risk metrics, failure analysis, regime detection.
@@ -88,6 +101,7 @@ class StrategyDiagnosticsEngine:
         by_param_range = self._win_rate_by_param_ranges(enriched)
         by_volatility = self._win_rate_by_volatility(enriched)
         by_time_of_day = self._win_rate_by_time_of_day(enriched)
+        by_hour_of_day = self._win_rate_by_key(enriched, "hour_of_day")
         by_arbitrage_type = self._win_rate_by_key(enriched, "arbitrage_type")
 
         # Tail loss: frequency of losses beyond 1 std
@@ -117,6 +131,7 @@ class StrategyDiagnosticsEngine:
                 "win_rate_by_param_range": by_param_range,
                 "win_rate_by_volatility": by_volatility,
                 "win_rate_by_time_of_day": by_time_of_day,
+                "win_rate_by_hour_of_day": by_hour_of_day,
                 "win_rate_by_arbitrage_type": by_arbitrage_type,
             },
             "risk_adjusted": {
@@ -153,17 +168,7 @@ class StrategyDiagnosticsEngine:
         buckets = defaultdict(list)
         for t in trades:
             pct = float(t.get("pnl_pct") or t.get("profit_pct") or 0)
-            if pct < 0:
-                bucket = "negative"
-            elif pct < 1:
-                bucket = "0-1%"
-            elif pct < 3:
-                bucket = "1-3%"
-            elif pct < 6:
-                bucket = "3-6%"
-            else:
-                bucket = "6%+"
-            buckets[bucket].append(t)
+            buckets[param_range_bucket(pct)].append(t)
         return {k: round(_win_rate(v), 4) for k, v in buckets.items()}
 
     def _win_rate_by_volatility(self, trades: List[Dict[str, Any]]) -> Dict[str, float]:
@@ -185,7 +190,9 @@ class StrategyDiagnosticsEngine:
     def _win_rate_by_key(self, trades: List[Dict[str, Any]], key: str) -> Dict[str, float]:
         by_k = defaultdict(list)
         for t in trades:
-            k = t.get(key) or "unknown"
+            k = t.get(key)
+            if k is None or k == "":
+                k = "unknown"
             by_k[str(k)].append(t)
         return {k: round(_win_rate(v), 4) for k, v in by_k.items()}
 
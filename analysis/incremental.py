@@ -0,0 +1,364 @@
+"""
+Phase 8B (incremental): Strategy diagnostics maintained as running aggregates.
+
+StrategyDiagnosticsEngine re-reads and re-enriches the whole trade history on
+every run. IncrementalDiagnostics instead folds each new trade from the SQLite
+store into per-scope aggregates (scope "all" plus one per strategy), so a refresh
+costs O(new trades) and a diagnostics read costs O(breakdown keys).
+
+Output has the same shape as StrategyDiagnosticsEngine.run. Trades are folded in
+store order (oldest first), so drawdown, streak and autocorrelation figures follow
+chronological order. losing_streaks keeps only the most recent MAX_STREAK_HISTORY
+entries; max_consecutive_losses is exact. tail_loss_frequency is estimated from a
+log-bucketed P&L histogram (bucket width TAIL_SKETCH_GAMMA relative), so each
+scope's state stays bounded however many trades are folded.
+
+Read-only with respect to trades: the only write is the derived state file
+(strategy_diagnostics_state.json next to trades.db), which can be deleted at any
+time to force a rebuild.
+"""
+
+import copy
+import logging
+import math
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from analysis.diagnostics import param_range_bucket
+from analysis.suggestions import add_evidence
+from analysis.trade_context import enrich_trades_for_analysis, get_trade_context_audit
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = "strategy_diagnostics_state.json"
+STATE_VERSION = 2
+MAX_STREAK_HISTORY = 500
+FETCH_BATCH_SIZE = 5_000
+
+# P&L histogram for tail losses: |pnl| below TAIL_SKETCH_MIN_USD shares one zero
+# bucket, larger magnitudes fall in buckets [min * g^(k-1), min * g^k)
+TAIL_SKETCH_MIN_USD = 0.01
+TAIL_SKETCH_GAMMA = 1.02
+
+ALL_SCOPE = "all"
+BREAKDOWNS = ("param_range", "volatility", "time_of_day", "hour_of_day", "arbitrage_type")
+
+
+def _pnl(t: Dict[str, Any]) -> float:
+    return float(t.get("pnl_usd") or t.get("profit_usd") or 0)
+
+
+def _breakdown_keys(t: Dict[str, Any]) -> Dict[str, str]:
+    """Same bucketing as StrategyDiagnosticsEngine's win-rate breakdowns."""
+    return {
+        "param_range": param_range_bucket(float(t.get("pnl_pct") or t.get("profit_pct") or 0)),
+        "volatility": str(t.get("volatility_proxy", "unknown")),
+        "time_of_day": str(t.get("time_of_day", "unknown")),
+        "hour_of_day": "unknown" if t.get("hour_of_day") is None else str(t["hour_of_day"]),
+        "arbitrage_type": str(t.get("arbitrage_type") or "unknown"),
+    }
+
+
+def _sketch_key(p: float) -> int:
+    """Histogram bucket for a P&L: 0 near zero, +k / -k by log magnitude."""
+    if abs(p) < TAIL_SKETCH_MIN_USD:
+        return 0
+    k = int(math.floor(math.log(abs(p) / TAIL_SKETCH_MIN_USD, TAIL_SKETCH_GAMMA))) + 1
+    return k if p > 0 else -k
+
+
+def _sketch_bounds(key: int) -> tuple:
+    """Value range [lo, hi) covered by a histogram bucket."""
+    if key == 0:
+        return -TAIL_SKETCH_MIN_USD, TAIL_SKETCH_MIN_USD
+    lo = TAIL_SKETCH_MIN_USD * TAIL_SKETCH_GAMMA ** (abs(key) - 1)
+    hi = lo * TAIL_SKETCH_GAMMA
+    return (lo, hi) if key > 0 else (-hi, -lo)
+
+
+def _sketch_count_below(sketch: Dict[str, int], threshold: float) -> int:
+    """Estimated number of P&Ls < threshold (linear within the straddling bucket)."""
+    below = 0.0
+    for key, count in sketch.items():
+        lo, hi = _sketch_bounds(int(key))
+        if hi <= threshold:
+            below += count
+        elif lo < threshold:
+            below += count * (threshold - lo) / (hi - lo)
+    return int(round(below))
+
+
+def _new_scope() -> Dict[str, Any]:
+    return {
+        "n": 0,
+        "wins": 0,
+        "sum_pnl": 0.0,
+        # Welford running mean / sum of squared deviations (for Sharpe and tail threshold)
+        "mean": 0.0,
+        "m2": 0.0,
+        "breakdowns": {name: {} for name in BREAKDOWNS},
+        "streak_current": 0,
+        "streak_max": 0,
+        "streaks": [],
+        "cumulative": 0.0,
+        "peak": None,
+        "max_dd": 0.0,
+        "dd_conditions": {},
+        # Lag-1 autocorrelation sums over (pnl[i-1], pnl[i]) pairs
+        "prev_pnl": None,
+        "ac": {"n": 0, "sx": 0.0, "sy": 0.0, "sxx": 0.0, "syy": 0.0, "sxy": 0.0},
+        # Sparse P&L histogram (bucket key -> count) for the tail-loss count
+        "pnl_sketch": {},
+        "evidence": {
+            "sample_size": 0,
+            "wins": 0,
+            "high_vol": 0,
+            "high_vol_low_edge": 0,
+            "high_vol_low_edge_wins": 0,
+            "time_of_day_counts": {},
+            "param_range_counts": {},
+        },
+    }
+
+
+def _fold(scope: Dict[str, Any], t: Dict[str, Any]) -> None:
+    """Fold one enriched trade into a scope's aggregates."""
+    p = _pnl(t)
+    win = p > 0
+
+    scope["n"] += 1
+    scope["wins"] += 1 if win else 0
+    scope["sum_pnl"] += p
+    delta = p - scope["mean"]
+    scope["mean"] += delta / scope["n"]
+    scope["m2"] += delta * (p - scope["mean"])
+
+    for name, key in _breakdown_keys(t).items():
+        cell = scope["breakdowns"][name].setdefault(key, [0, 0])
+        cell[0] += 1
+        cell[1] += 1 if win else 0
+
+    if p < 0:
+        scope["streak_current"] += 1
+        scope["streak_max"] = max(scope["streak_max"], scope["streak_current"])
+    elif scope["streak_current"] > 0:
+        scope["streaks"].append(scope["streak_current"])
+        del scope["streaks"][:-MAX_STREAK_HISTORY]
+        scope["streak_current"] = 0
+
+    scope["cumulative"] += p
+    cum = scope["cumulative"]
+    if scope["peak"] is None or cum >= scope["peak"]:
+        scope["peak"] = cum
+    else:
+        scope["max_dd"] = max(scope["max_dd"], scope["peak"] - cum)
+        combo = f"{t.get('volatility_proxy')}|{t.get('time_of_day')}"
+        scope["dd_conditions"][combo] = scope["dd_conditions"].get(combo, 0) + 1
+
+    if scope["prev_pnl"] is not None:
+        ac = scope["ac"]
+        x = scope["prev_pnl"]
+        ac["n"] += 1
+        ac["sx"] += x
+        ac["sy"] += p
+        ac["sxx"] += x * x
+        ac["syy"] += p * p
+        ac["sxy"] += x * p
+    scope["prev_pnl"] = p
+
+    key = str(_sketch_key(p))
+    scope["pnl_sketch"][key] = scope["pnl_sketch"].get(key, 0) + 1
+    add_evidence(scope["evidence"], t)
+    scope["evidence"]["sample_size"] += 1
+
+
+def _trend_label(ac: Dict[str, float]) -> str:
+    n = ac["n"]
+    if n < 2:
+        return "insufficient_data"
+    varx = ac["sxx"] - ac["sx"] * ac["sx"] / n
+    vary = ac["syy"] - ac["sy"] * ac["sy"] / n
+    # Guard against cancellation noise on constant series
+    if varx <= 1e-12 * max(1.0, ac["sxx"]) or vary <= 1e-12 * max(1.0, ac["syy"]):
+        return "insufficient_data"
+    corr = (ac["sxy"] - ac["sx"] * ac["sy"] / n) / (math.sqrt(varx) * math.sqrt(vary))
+    if corr > 0.1:
+        return "trending"
+    if corr < -0.1:
+        return "mean_reverting"
+    return "neutral"
+
+
+def _scope_diagnostics(scope: Dict[str, Any], strategy_name: Optional[str], audit: Dict[str, Any]) -> Dict[str, Any]:
+    n = scope["n"]
+    base = {
+        "strategy": strategy_name or ALL_SCOPE,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "trade_context_audit": audit,
+        "sample_size": n,
+    }
+    if not n:
+        base.update({"performance": {}, "risk_adjusted": {}, "failure_analysis": {}, "regime": {}})
+        return base
+
+    mean_pnl = scope["sum_pnl"] / n
+    variance = scope["m2"] / (n - 1) if n > 1 else 0
+    std_pnl = math.sqrt(variance) if variance > 0 else 0
+    sharpe = mean_pnl / std_pnl if n > 1 and std_pnl > 0 else None
+    tail_losses = _sketch_count_below(scope["pnl_sketch"], mean_pnl - std_pnl) if std_pnl > 0 else 0
+
+    peak = scope["peak"] or 0
+    max_dd = scope["max_dd"]
+    max_dd_pct = (max_dd / peak * 100) if peak else 0
+
+    streaks = list(scope["streaks"])
+    if scope["streak_current"] > 0:
+        streaks.append(scope["streak_current"])
+
+    conditions = []
+    for combo, count in Counter(scope["dd_conditions"]).most_common(5):
+        vol, tod = combo.split("|", 1)
+        conditions.append({"volatility_proxy": vol, "time_of_day": tod, "count": count})
+
+    win_rates = {
+        name: {k: round(w / c, 4) for k, (c, w) in cells.items()}
+        for name, cells in scope["breakdowns"].items()
+    }
+    vol_counts = {k: c for k, (c, _) in scope["breakdowns"]["volatility"].items()}
+    volatility_regime = Counter(vol_counts).most_common(1)[0][0] if vol_counts else "unknown"
+
+    base.update({
+        "performance": {
+            "win_rate_overall": round(scope["wins"] / n, 4),
+            "total_pnl": round(scope["sum_pnl"], 2),
+            "mean_pnl_per_trade": round(mean_pnl, 2),
+            "win_rate_by_param_range": win_rates["param_range"],
+            "win_rate_by_volatility": win_rates["volatility"],
+            "win_rate_by_time_of_day": win_rates["time_of_day"],
+            "win_rate_by_hour_of_day": win_rates["hour_of_day"],
+            "win_rate_by_arbitrage_type": win_rates["arbitrage_type"],
+        },
+        "risk_adjusted": {
+            "sharpe_ratio": round(sharpe, 4) if sharpe is not None else None,
+            "max_drawdown_usd": round(max_dd, 2),
+            "max_drawdown_pct": round(max_dd_pct, 2),
+            "tail_loss_frequency": round(tail_losses / n, 4),
+        },
+        "failure_analysis": {
+            "losing_streaks": streaks,
+            "max_consecutive_losses": scope["streak_max"],
+            "conditions_correlated_with_drawdown": conditions,
+        },
+        "regime": {
+            "volatility_regime": volatility_regime,
+            "trending_vs_mean_reverting": _trend_label(scope["ac"]),
+        },
+    })
+    return base
+
+
+class IncrementalDiagnostics:
+    """
+    Diagnostics over the SQLite trade store, updated incrementally by trade id.
+    Call refresh() to fold in trades inserted since the last call.
+
+    Safe to share between threads (e.g. threaded Flask requests): refresh,
+    rebuild and reads hold one lock, so a batch is never folded twice.
+    """
+
+    def __init__(self, log_dir: Path, state_path: Optional[Path] = None):
+        self.log_dir = Path(log_dir)
+        self.state_path = Path(state_path) if state_path else self.log_dir / STATE_FILENAME
+        self._audit = get_trade_context_audit()
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        return {"version": STATE_VERSION, "last_trade_id": 0, "scopes": {}}
+
+    def _load_state(self) -> Dict[str, Any]:
+        from utils.atomic_json import load_json
+
+        state = load_json(self.state_path, default=None)
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return self._empty_state()
+        return state
+
+    def _save_state(self) -> None:
+        from utils.atomic_json import atomic_write_json
+
+        try:
+            atomic_write_json(self.state_path, self._state, indent=None)
+        except Exception as e:
+            logger.warning("Could not persist diagnostics state to %s: %s", self.state_path, e)
+
+    @property
+    def last_trade_id(self) -> int:
+        return int(self._state.get("last_trade_id") or 0)
+
+    @property
+    def sample_size(self) -> int:
+        scope = self._state["scopes"].get(ALL_SCOPE)
+        return scope["n"] if scope else 0
+
+    def rebuild(self) -> int:
+        """Discard aggregates and fold the whole store again."""
+        with self._lock:
+            self._state = self._empty_state()
+            return self._refresh()
+
+    def refresh(self) -> int:
+        """Fold trades inserted since the last refresh. Returns number of trades added."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        """refresh() body; caller holds self._lock."""
+        from database.trades_store import get_max_trade_id, get_trades_since
+
+        max_id = get_max_trade_id(self.log_dir)
+        if max_id is None or max_id < self.last_trade_id:
+            # Store was reset or replaced; aggregates no longer match it
+            if self.last_trade_id:
+                self._state = self._empty_state()
+                self._save_state()
+            if max_id is None:
+                return 0
+
+        added = 0
+        scopes = self._state["scopes"]
+        while True:
+            batch = get_trades_since(self.log_dir, after_id=self.last_trade_id, limit=FETCH_BATCH_SIZE)
+            if not batch:
+                break
+            for t in enrich_trades_for_analysis(batch):
+                _fold(scopes.setdefault(ALL_SCOPE, _new_scope()), t)
+                _fold(scopes.setdefault(str(t.get("strategy")), _new_scope()), t)
+            self._state["last_trade_id"] = batch[-1]["id"]
+            added += len(batch)
+            if len(batch) < FETCH_BATCH_SIZE:
+                break
+
+        if added:
+            self._save_state()
+        return added
+
+    def diagnostics(self, strategy_name: Optional[str] = None) -> Dict[str, Any]:
+        """Diagnostics for one strategy (or all trades), same shape as StrategyDiagnosticsEngine.run."""
+        with self._lock:
+            scope = self._state["scopes"].get(strategy_name or ALL_SCOPE) or _new_scope()
+            return _scope_diagnostics(scope, strategy_name, self._audit)
+
+    def evidence_counts(self, strategy_name: Optional[str] = None) -> Dict[str, Any]:
+        """Suggestion evidence counts (see analysis.suggestions.evidence_counts)."""
+        with self._lock:
+            scope = self._state["scopes"].get(strategy_name or ALL_SCOPE) or _new_scope()
+            return copy.deepcopy(scope["evidence"])
+
+    def strategies(self) -> List[str]:
+        with self._lock:
+            return sorted(k for k in self._state["scopes"] if k != ALL_SCOPE)
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 import math
 
-from analysis.diagnostics import StrategyDiagnosticsEngine
+from analysis.diagnostics import StrategyDiagnosticsEngine, param_range_bucket
 from analysis.trade_context import enrich_trades_for_analysis
 
 
@@ -40,6 +40,50 @@ def _chi_square_p_value(observed_win_a: int, total_a: int, observed_win_b: int,
         return 0.5
 
 
+def _is_win(t: Dict[str, Any]) -> bool:
+    return float(t.get("pnl_usd") or t.get("profit_usd") or 0) > 0
+
+
+def _is_low_edge(t: Dict[str, Any]) -> bool:
+    return abs(float(t.get("pnl_pct") or t.get("profit_pct") or 0)) < 1.5
+
+
+def evidence_counts(enriched: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Sample counts used as suggestion evidence, computed from enriched trades.
+    The incremental diagnostics path maintains the same keys as running totals.
+    """
+    counts: Dict[str, Any] = {
+        "sample_size": len(enriched),
+        "wins": 0,
+        "high_vol": 0,
+        "high_vol_low_edge": 0,
+        "high_vol_low_edge_wins": 0,
+        "time_of_day_counts": {},
+        "param_range_counts": {},
+    }
+    for t in enriched:
+        add_evidence(counts, t)
+    return counts
+
+
+def add_evidence(counts: Dict[str, Any], t: Dict[str, Any]) -> None:
+    """Fold one enriched trade into evidence counts (see evidence_counts)."""
+    win = _is_win(t)
+    if win:
+        counts["wins"] += 1
+    if t.get("volatility_proxy") == "high":
+        counts["high_vol"] += 1
+        if _is_low_edge(t):
+            counts["high_vol_low_edge"] += 1
+            if win:
+                counts["high_vol_low_edge_wins"] += 1
+    tod = t.get("time_of_day")
+    counts["time_of_day_counts"][tod] = counts["time_of_day_counts"].get(tod, 0) + 1
+    bucket = param_range_bucket(float(t.get("pnl_pct") or t.get("profit_pct") or 0))
+    counts["param_range_counts"][bucket] = counts["param_range_counts"].get(bucket, 0) + 1
+
+
 class SuggestionGenerator:
     """
     Generates ranked suggestions from diagnostics. Read-only; never modifies strategy or config.
@@ -65,26 +109,37 @@ class SuggestionGenerator:
             return []
 
         enriched = enrich_trades_for_analysis(trades)
+        return self.generate(diagnostics, evidence_counts(enriched), strategy_name)
+
+    def generate(
+        self,
+        diagnostics: Dict[str, Any],
+        counts: Dict[str, Any],
+        strategy_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate suggestions from diagnostics plus evidence counts (see evidence_counts).
+        Used by run() and by the incremental diagnostics path, which maintains the
+        counts without re-reading trade history.
+        """
+        sample_size = counts.get("sample_size", 0)
+        if not sample_size:
+            return []
         strategy = strategy_name or diagnostics.get("strategy", "all")
         suggestions = []
 
         # 1) Low edge (profit_pct) underperforms in high volatility
         by_vol = diagnostics.get("performance", {}).get("win_rate_by_volatility") or {}
-        if len(enriched) >= MIN_SAMPLE_FOR_REGIME_SUGGESTION and by_vol:
-            high_vol_trades = [t for t in enriched if t.get("volatility_proxy") == "high"]
-            low_edge_trades = [t for t in enriched if abs(float(t.get("pnl_pct") or t.get("profit_pct") or 0)) < 1.5]
-            high_vol_low_edge = [t for t in enriched if t.get("volatility_proxy") == "high" and abs(float(t.get("pnl_pct") or t.get("profit_pct") or 0)) < 1.5]
-            if len(high_vol_low_edge) >= 10 and len(high_vol_trades) >= 15:
-                wr_low_edge_high_vol = sum(1 for t in high_vol_low_edge if (float(t.get("pnl_usd") or t.get("profit_usd") or 0) > 0)) / len(high_vol_low_edge)
-                wr_rest = []
-                for t in enriched:
-                    if t not in high_vol_low_edge:
-                        wr_rest.append(1 if float(t.get("pnl_usd") or t.get("profit_usd") or 0) > 0 else 0)
-                wr_rest_rate = sum(wr_rest) / len(wr_rest) if wr_rest else 0
+        if sample_size >= MIN_SAMPLE_FOR_REGIME_SUGGESTION and by_vol:
+            n_high_vol_low_edge = counts.get("high_vol_low_edge", 0)
+            if n_high_vol_low_edge >= 10 and counts.get("high_vol", 0) >= 15:
+                wins_l = counts.get("high_vol_low_edge_wins", 0)
+                wr_low_edge_high_vol = wins_l / n_high_vol_low_edge
+                n_rest = sample_size - n_high_vol_low_edge
+                wins_r = counts.get("wins", 0) - wins_l
+                wr_rest_rate = wins_r / n_rest if n_rest else 0
                 if wr_rest_rate > 0 and wr_low_edge_high_vol < wr_rest_rate - 0.1:
-                    wins_l = sum(1 for t in high_vol_low_edge if float(t.get("pnl_usd") or t.get("profit_usd") or 0) > 0)
-                    wins_r = sum(wr_rest)
-                    p_val = _chi_square_p_value(wins_l, len(high_vol_low_edge), int(wins_r), len(wr_rest))
+                    p_val = _chi_square_p_value(wins_l, n_high_vol_low_edge, int(wins_r), n_rest)
                     confidence = max(0.3, min(0.95, 1.0 - p_val))
                     suggestions.append({
                         "strategy": strategy,
@@ -92,7 +147,7 @@ class SuggestionGenerator:
                         "suggested_change": "Consider increasing minimum edge (e.g. min profit %) during high-volatility regimes, or reducing size for small-edge trades in those regimes",
                         "confidence": round(confidence, 2),
                         "evidence": {
-                            "sample_size": len(high_vol_low_edge),
+                            "sample_size": n_high_vol_low_edge,
                             "win_rate_before": round(wr_low_edge_high_vol, 2),
                             "win_rate_after_threshold": round(wr_rest_rate, 2),
                             "p_value": round(p_val, 4),
@@ -106,11 +161,11 @@ class SuggestionGenerator:
 
         # 2) Time-of-day underperformance
         by_tod = diagnostics.get("performance", {}).get("win_rate_by_time_of_day") or {}
-        if len(enriched) >= MIN_SAMPLE_FOR_REGIME_SUGGESTION and len(by_tod) >= 2:
+        if sample_size >= MIN_SAMPLE_FOR_REGIME_SUGGESTION and len(by_tod) >= 2:
             worst_tod = min(by_tod.items(), key=lambda x: x[1])
             best_tod = max(by_tod.items(), key=lambda x: x[1])
             if worst_tod[1] < best_tod[1] - 0.15:
-                count_worst = len([t for t in enriched if t.get("time_of_day") == worst_tod[0]])
+                count_worst = (counts.get("time_of_day_counts") or {}).get(worst_tod[0], 0)
                 if count_worst >= 15:
                     suggestions.append({
                         "strategy": strategy,
@@ -133,14 +188,14 @@ class SuggestionGenerator:
         # 3) Consecutive loss streaks
         failure = diagnostics.get("failure_analysis") or {}
         max_streak = failure.get("max_consecutive_losses", 0)
-        if len(enriched) >= MIN_SAMPLE_FOR_SUGGESTION and max_streak >= 4:
+        if sample_size >= MIN_SAMPLE_FOR_SUGGESTION and max_streak >= 4:
             suggestions.append({
                 "strategy": strategy,
                 "issue_detected": f"Observed consecutive losing streak of {max_streak} trades",
                 "suggested_change": "Consider adding or tightening a daily loss limit or max consecutive loss rule to reduce drawdown severity (no automatic change; review risk parameters manually)",
                 "confidence": 0.6,
                 "evidence": {
-                    "sample_size": len(enriched),
+                    "sample_size": sample_size,
                     "max_consecutive_losses": max_streak,
                     "win_rate_overall": diagnostics.get("performance", {}).get("win_rate_overall"),
                 },
@@ -153,18 +208,12 @@ class SuggestionGenerator:
 
         # 4) Low win rate in a profit_pct bucket (single worst bucket with enough sample)
         by_param = diagnostics.get("performance", {}).get("win_rate_by_param_range") or {}
-        if len(enriched) >= MIN_SAMPLE_FOR_SUGGESTION and by_param:
+        if sample_size >= MIN_SAMPLE_FOR_SUGGESTION and by_param:
+            param_counts = counts.get("param_range_counts") or {}
+
             def _count_in_bucket(bucket: str) -> int:
-                pct_vals = [float(t.get("pnl_pct") or t.get("profit_pct") or 0) for t in enriched]
-                if bucket == "0-1%":
-                    return sum(1 for p in pct_vals if 0 <= p < 1)
-                if bucket == "1-3%":
-                    return sum(1 for p in pct_vals if 1 <= p < 3)
-                if bucket == "3-6%":
-                    return sum(1 for p in pct_vals if 3 <= p < 6)
-                if bucket == "6%+":
-                    return sum(1 for p in pct_vals if p >= 6)
-                return 0
+                return param_counts.get(bucket, 0)
+
             candidates = [(b, wr) for b, wr in by_param.items() if b != "negative" and _count_in_bucket(b) >= 20 and wr < 0.45]
             if candidates:
                 bucket, wr = min(candidates, key=lambda x: x[1])
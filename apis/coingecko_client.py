@@ -9,10 +9,11 @@ Provides:
 """
 
 import requests
-import time
 from typing import Dict, Optional, List
 from datetime import datetime
 
+from utils.rate_limiter import get_rate_limiter
+
 
 class CoinGeckoClient:
     """
@@ -60,16 +61,12 @@ class CoinGeckoClient:
         """
         self.logger = logger
         self.session = requests.Session()
-        self.last_request_time = 0
-        self.min_request_interval = 1.2  # 50 req/min = 1.2s between requests
+        # Shared budget: 50 req/min, no burst (same spacing as the free tier allows)
+        self.rate_limiter = get_rate_limiter("coingecko", calls_per_minute=50, burst=1)
 
     def _rate_limit(self) -> None:
         """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def _symbol_to_id(self, symbol: str) -> str:
         """Convert symbol to CoinGecko ID"""
@@ -105,6 +102,7 @@ class CoinGeckoClient:
             params = {"ids": coin_id, "vs_currencies": vs_currency}
 
             response = self.session.get(url, params=params, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -172,6 +170,7 @@ class CoinGeckoClient:
             params = {"ids": ",".join(converted_ids), "vs_currencies": vs_currency}
 
             response = self.session.get(url, params=params, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -226,6 +225,7 @@ class CoinGeckoClient:
             }
 
             response = self.session.get(url, params=params, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -276,6 +276,7 @@ class CoinGeckoClient:
             params = {"query": query}
 
             response = self.session.get(url, params=params, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -9,10 +9,11 @@ Provides:
 """
 
 import requests
-import time
 from typing import Dict, Optional, List, Any
 from datetime import datetime
 
+from utils.rate_limiter import get_rate_limiter
+
 
 class PolymarketSubgraph:
     """
@@ -42,15 +43,12 @@ class PolymarketSubgraph:
         self.logger = logger
         self.session = requests.Session()
         self.graphql_url = self.ALT_GRAPHQL_URL if use_alternative else self.GRAPHQL_URL
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # Be respectful, even though it's "unlimited"
+        # Be respectful, even though it's "unlimited": ~10 req/s with small bursts
+        self.rate_limiter = get_rate_limiter("polymarket_subgraph", calls_per_minute=600, burst=5)
 
     def _rate_limit(self) -> None:
         """Enforce minimal rate limiting for politeness"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def _execute_query(
         self, query: str, variables: Optional[Dict] = None
@@ -73,6 +71,7 @@ class PolymarketSubgraph:
                 payload["variables"] = variables
 
             response = self.session.post(self.graphql_url, json=payload, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 result = response.json()
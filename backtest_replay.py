@@ -0,0 +1,360 @@
+"""
+Columnar Replay Engine - vectorized backtests over historical snapshots
+
+Loads market snapshots (historical CSV, the trades.db store or the
+polymarket_history table) once into NumPy columns and evaluates the basic
+YES+NO arbitrage rule and fixed sizing across all rows at once. Produces the
+same result dictionary as Backtester._calculate_results, so
+Backtester.generate_backtest_report can format it.
+
+CSV columns are built with bulk NumPy conversions (no per-row datetime
+parsing for UTC or naive timestamps), cached as .npy columns next to the file
+(<file>.replay/) and memory-mapped on later loads; the cache is rebuilt when
+the CSV changes.
+
+Per-trade arithmetic and running sums follow the same IEEE operations and
+order as Backtester (np.cumsum is a sequential fold), so counts, totals,
+best/worst trades and drawdown match exactly; the Sharpe ratio agrees to
+floating-point rounding (statistics.stdev is exact-rational).
+
+Timestamps are stored as int64 microseconds since the epoch (UTC for
+offset-aware sources); reported timestamps are therefore normalized to UTC.
+"""
+
+import csv
+import json
+import math
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CACHE_VERSION = 1
+CACHE_SUFFIX = ".replay"
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
+
+class SnapshotColumns:
+    """Market snapshots as parallel NumPy columns"""
+
+    __slots__ = ("ts_us", "market_codes", "markets", "yes", "no", "tz_aware")
+
+    def __init__(
+        self,
+        ts_us: "np.ndarray",
+        market_codes: "np.ndarray",
+        markets: List[str],
+        yes: "np.ndarray",
+        no: "np.ndarray",
+        tz_aware: bool,
+    ):
+        """
+        Args:
+            ts_us: int64 microseconds since the epoch
+            market_codes: int32 index into markets per row
+            markets: Market names
+            yes / no: float64 YES and NO prices
+            tz_aware: Timestamps were offset-aware (UTC) rather than naive
+        """
+        self.ts_us = ts_us
+        self.market_codes = market_codes
+        self.markets = markets
+        self.yes = yes
+        self.no = no
+        self.tz_aware = tz_aware
+
+    def __len__(self) -> int:
+        return len(self.ts_us)
+
+    def to_datetime(self, ts_us: int) -> datetime:
+        """Row timestamp as datetime (UTC-aware if the source was aware)."""
+        epoch = _EPOCH_UTC if self.tz_aware else _EPOCH_NAIVE
+        return epoch + timedelta(microseconds=int(ts_us))
+
+
+def _to_micros(dt: datetime) -> int:
+    """datetime -> the int64 microsecond scale used by ts_us."""
+    return (dt - (_EPOCH_UTC if dt.tzinfo else _EPOCH_NAIVE)) // _US
+
+
+def _columns_from_lists(
+    ts: Sequence[int], markets: List[str], yes: List[float], no: List[float], tz_aware: bool
+) -> SnapshotColumns:
+    names: Dict[str, int] = {}
+    codes = np.fromiter((names.setdefault(m, len(names)) for m in markets), dtype=np.int32, count=len(markets))
+    return SnapshotColumns(
+        np.asarray(ts, dtype=np.int64),
+        codes,
+        list(names),
+        np.asarray(yes, dtype=np.float64),
+        np.asarray(no, dtype=np.float64),
+        tz_aware,
+    )
+
+
+# ----------------------------------------------------------------------
+# Loaders
+# ----------------------------------------------------------------------
+
+
+def _utc_stamps(stamps: List[str], tz_aware: bool) -> Optional[List[str]]:
+    """
+    ISO timestamps with the UTC suffix removed, ready for NumPy's datetime64
+    parser; None if any row carries another offset (or, for naive data, any
+    offset at all) and needs datetime.fromisoformat.
+    """
+    cleaned = []
+    for s in stamps:
+        if s.endswith("Z"):
+            s, utc = s[:-1], True
+        elif s.endswith("+00:00"):
+            s, utc = s[:-6], True
+        else:
+            utc = False
+        if utc != tz_aware:
+            return None
+        cleaned.append(s)
+    if not tz_aware and any(len(s) > 19 and s[-6] in "+-" for s in cleaned):
+        return None
+    return cleaned
+
+
+def _parse_csv(path: Path) -> SnapshotColumns:
+    """
+    timestamp,market,yes_price,no_price CSV -> columns.
+
+    Prices and UTC / naive timestamps are converted column-at-a-time by NumPy;
+    files with other UTC offsets fall back to datetime.fromisoformat per row.
+    """
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        rows = list(reader)
+    if not header or not rows:
+        return _columns_from_lists([], [], [], [], False)
+
+    ts_i, market_i, yes_i, no_i = (
+        header.index(name) for name in ("timestamp", "market", "yes_price", "no_price")
+    )
+    stamps = [r[ts_i] for r in rows]
+    markets = [r[market_i] for r in rows]
+    yes = np.array([r[yes_i] for r in rows], dtype=np.float64)
+    no = np.array([r[no_i] for r in rows], dtype=np.float64)
+    del rows
+
+    tz_aware = datetime.fromisoformat(stamps[0].replace("Z", "+00:00")).tzinfo is not None
+    cleaned = _utc_stamps(stamps, tz_aware)
+    ts = None
+    if cleaned is not None:
+        try:
+            ts = np.array(cleaned, dtype="datetime64[us]").astype(np.int64)
+        except ValueError:
+            ts = None
+    if ts is None:
+        parsed = [datetime.fromisoformat(s.replace("Z", "+00:00")) for s in stamps]
+        tz_aware = parsed[-1].tzinfo is not None
+        ts = [_to_micros(dt) for dt in parsed]
+    return _columns_from_lists(ts, markets, yes, no, tz_aware)
+
+
+def load_csv(filepath: str, use_cache: bool = True) -> SnapshotColumns:
+    """
+    Load a historical CSV (timestamp,market,yes_price,no_price).
+
+    Args:
+        filepath: CSV path
+        use_cache: Read / write the memory-mapped .npy cache next to the file
+
+    Returns:
+        SnapshotColumns (cached columns are read-only memory maps)
+    """
+    path = Path(filepath)
+    st = path.stat()
+    cache_dir = path.with_name(path.name + CACHE_SUFFIX)
+    meta_path = cache_dir / "meta.json"
+    source = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    if use_cache and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+            if meta.get("version") == CACHE_VERSION and meta.get("source") == source:
+                ts_us, market_codes, yes, no = (
+                    np.load(cache_dir / f"{name}.npy", mmap_mode="r")
+                    for name in ("ts_us", "market_codes", "yes", "no")
+                )
+                return SnapshotColumns(ts_us, market_codes, meta["markets"], yes, no, meta["tz_aware"])
+        except (OSError, ValueError, KeyError):
+            pass  # Corrupt / partial cache: rebuild below
+
+    cols = _parse_csv(path)
+    if use_cache:
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            for name in ("ts_us", "market_codes", "yes", "no"):
+                np.save(cache_dir / f"{name}.npy", getattr(cols, name))
+            meta = {
+                "version": CACHE_VERSION,
+                "source": source,
+                "markets": cols.markets,
+                "tz_aware": cols.tz_aware,
+                "rows": len(cols),
+            }
+            meta_path.write_text(json.dumps(meta))
+        except OSError:
+            pass  # Read-only location: replay still works uncached
+    return cols
+
+
+def load_trades_db(log_dir: Path, chunk_size: int = 100_000) -> SnapshotColumns:
+    """Snapshots from the SQLite trade store (logs/trades.db), oldest first."""
+    from database.trades_store import TRADE_EXPORT_COLUMNS, iter_trade_chunks
+
+    ts_i = TRADE_EXPORT_COLUMNS.index("timestamp")
+    market_i = TRADE_EXPORT_COLUMNS.index("market")
+    yes_i = TRADE_EXPORT_COLUMNS.index("yes_price")
+    no_i = TRADE_EXPORT_COLUMNS.index("no_price")
+    ts, markets, yes, no = [], [], [], []
+    tz_aware = False
+    for rows in iter_trade_chunks(log_dir, chunk_size=chunk_size):
+        for r in rows:
+            dt = datetime.fromisoformat(str(r[ts_i]).replace("Z", "+00:00"))
+            tz_aware = dt.tzinfo is not None
+            ts.append(_to_micros(dt))
+            markets.append(r[market_i])
+            yes.append(float(r[yes_i] or 0))
+            no.append(float(r[no_i] or 0))
+    return _columns_from_lists(ts, markets, yes, no, tz_aware)
+
+
+def load_polymarket_history(db_path: Optional[Path] = None) -> SnapshotColumns:
+    """Snapshots from the polymarket_history table (data/trading.db by default)."""
+    if db_path is None:
+        from database.models import DB_FILE as db_path
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = conn.execute(
+            "SELECT timestamp, market_id, yes_price, no_price FROM polymarket_history "
+            "ORDER BY timestamp ASC, id ASC"
+        ).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return _columns_from_lists([], [], [], [], True)
+    ts, markets, yes, no = zip(*rows)
+    # Unix seconds (UTC)
+    ts_us = np.asarray(ts, dtype=np.int64) * 1_000_000
+    return _columns_from_lists(ts_us, list(markets), list(yes), list(no), True)
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+
+
+def _sharpe(returns: "np.ndarray") -> float:
+    """Annualized Sharpe of per-trade returns (sample stdev, risk-free 0)."""
+    n = len(returns)
+    if n < 2:
+        return 0.0
+    mean = math.fsum(returns.tolist()) / n
+    deviations = returns - mean
+    var = math.fsum((deviations * deviations).tolist()) / (n - 1)
+    std = math.sqrt(var)
+    if std == 0:
+        return 0.0
+    return mean / std * 252**0.5
+
+
+def replay_basic_arbitrage(
+    cols: SnapshotColumns,
+    trade_size: float,
+    min_profit_margin: float,
+    date_range: Optional[Tuple[datetime, datetime]] = None,
+) -> Dict[str, Any]:
+    """
+    Vectorized basic arbitrage replay (YES + NO < 1, margin >= threshold).
+
+    Args:
+        cols: Snapshot columns
+        trade_size: USD per trade (Backtester.max_trade_size)
+        min_profit_margin: Minimum (1 - sum) / sum to trade
+        date_range: Optional inclusive (start, end)
+
+    Returns:
+        Result dict in Backtester._calculate_results format
+    """
+    yes, no = cols.yes, cols.no
+    row_idx = None
+    if date_range:
+        start, end = date_range
+        mask = (cols.ts_us >= _to_micros(start)) & (cols.ts_us <= _to_micros(end))
+        row_idx = np.flatnonzero(mask)
+        yes, no = yes[row_idx], no[row_idx]
+
+    price_sum = yes + no
+    opportunity = price_sum < 1.0
+    opportunities_found = int(np.count_nonzero(opportunity))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = (1.0 - price_sum) / price_sum
+    traded = np.flatnonzero(opportunity & (margin >= min_profit_margin))
+
+    if len(traded) == 0:
+        return {
+            "total_trades": 0,
+            "total_profit": 0,
+            "total_return_pct": 0,
+            "sharpe_ratio": 0,
+            "max_drawdown_pct": 0,
+            "win_rate": 0,
+            "best_trade": None,
+            "worst_trade": None,
+        }
+
+    t_yes, t_no = yes[traded], no[traded]
+    total_cost = trade_size * t_yes + trade_size * t_no
+    profit = trade_size - total_cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_pct = np.where(total_cost > 0, profit / total_cost * 100, 0.0)
+
+    cumulative = np.cumsum(profit)
+    total_profit = float(cumulative[-1])
+    total_invested = float(np.cumsum(total_cost)[-1])
+    total_return_pct = total_profit / total_invested * 100 if total_invested > 0 else 0
+
+    n_trades = len(traded)
+    winning_trades = int(np.count_nonzero(profit > 0))
+
+    peak = float(cumulative.max())
+    max_drawdown = float((np.maximum.accumulate(cumulative) - cumulative).max())
+    max_drawdown_pct = max_drawdown / abs(peak) * 100 if peak != 0 else 0
+
+    source_rows = traded if row_idx is None else row_idx[traded]
+
+    def trade_summary(i: int) -> Dict[str, Any]:
+        row = source_rows[i]
+        return {
+            "market": cols.markets[cols.market_codes[row]],
+            "profit": float(profit[i]),
+            "profit_pct": float(profit_pct[i]),
+            "timestamp": cols.to_datetime(cols.ts_us[row]).isoformat(),
+        }
+
+    return {
+        "total_trades": n_trades,
+        "opportunities_found": opportunities_found,
+        "opportunities_traded": n_trades,
+        "total_profit": total_profit,
+        "total_invested": total_invested,
+        "total_return_pct": total_return_pct,
+        "sharpe_ratio": _sharpe(profit_pct),
+        "max_drawdown_pct": max_drawdown_pct,
+        "win_rate": winning_trades / n_trades,
+        "winning_trades": winning_trades,
+        "losing_trades": n_trades - winning_trades,
+        "best_trade": trade_summary(int(np.argmax(profit))),
+        "worst_trade": trade_summary(int(np.argmin(profit))),
+    }
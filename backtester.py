@@ -196,6 +196,64 @@ class Backtester:
 
         return results
 
+    def replay(
+        self,
+        source: str = "historical_data.csv",
+        strategy: str = "basic_arbitrage",
+        date_range: Optional[Tuple[datetime, datetime]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Columnar replay: same results as load_historical_data + simulate_strategy,
+        evaluated with NumPy over the whole dataset (see backtest_replay.py).
+
+        Args:
+            source: CSV path, "polymarket_history" (data/trading.db) or a
+                logs directory holding trades.db
+            strategy: Strategy name (currently supports "basic_arbitrage")
+            date_range: Optional tuple of (start_date, end_date) to filter data
+            use_cache: Memory-map the cached .npy columns of a CSV source
+
+        Returns:
+            Dictionary with simulation results (empty on error)
+        """
+        import backtest_replay
+
+        if strategy != "basic_arbitrage":
+            self.logger.log_error(f"Unknown strategy: {strategy}")
+            return {}
+
+        try:
+            if source == "polymarket_history":
+                cols = backtest_replay.load_polymarket_history()
+            elif Path(source).is_dir():
+                cols = backtest_replay.load_trades_db(Path(source))
+            elif Path(source).exists():
+                cols = backtest_replay.load_csv(source, use_cache=use_cache)
+            else:
+                self.logger.log_error(f"Historical data file not found: {source}")
+                return {}
+        except Exception as e:
+            self.logger.log_error(f"Error loading historical data: {str(e)}")
+            return {}
+
+        if not len(cols):
+            self.logger.log_error("No data provided for backtest")
+            return {}
+
+        self.logger.log_warning(
+            f"Starting columnar backtest: {strategy} strategy on {len(cols)} data points"
+        )
+        results = backtest_replay.replay_basic_arbitrage(
+            cols, self.max_trade_size, self.min_profit_margin, date_range
+        )
+        self.logger.log_warning(
+            f"Backtest complete - Opportunities: {results.get('opportunities_found', 0)}, "
+            f"Trades: {results['total_trades']}, "
+            f"Total P&L: ${results['total_profit']:.2f}"
+        )
+        return results
+
     def _simulate_basic_arbitrage(self, data: List[Dict[str, Any]]) -> None:
         """
         Simulate basic arbitrage strategy
@@ -360,14 +418,19 @@ class Backtester:
 
         return max_drawdown_pct
 
-    def generate_backtest_report(self) -> str:
+    def generate_backtest_report(self, results: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate comprehensive backtest report
 
+        Args:
+            results: Results to format (e.g. from replay()); defaults to the
+                last simulate_strategy() run
+
         Returns:
             Formatted report string
         """
-        results = self._calculate_results()
+        if results is None:
+            results = self._calculate_results()
 
         report = "\n" + "=" * 60 + "\n"
         report += "BACKTEST REPORT\n"
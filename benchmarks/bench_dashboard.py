@@ -0,0 +1,143 @@
+"""
+Dashboard benchmarks over trade stores of 10k / 100k (1M with BENCH_FULL=1)
+trades: DataParser.get_trades, per-endpoint /api/* latency through the Flask
+test client, and latency under concurrent HTTP clients against a real
+threaded server.
+"""
+
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+ROUNDS = 5
+
+ENDPOINTS = [
+    "/api/trades",
+    "/api/analytics/overview",
+    "/api/analytics/risk",
+    "/api/analytics/strategy-breakdown",
+    "/api/analytics/performance",
+    "/api/analytics/market_performance",
+    "/api/analytics/time/monthly",
+]
+
+CONCURRENT_CLIENTS = [1, 8, 32]
+REQUESTS_PER_CLIENT = 10
+CONCURRENT_TRADES = 100_000
+
+
+def bench_get_trades_cold(benchmark, trades_dir):
+    """Cache miss: reload from trades.db, then filter / summarize / paginate."""
+    from dashboard.services.data_parser import DataParser
+
+    benchmark.group = "data_parser.get_trades"
+    parser = DataParser(trades_dir)
+
+    def setup():
+        parser._cache_timestamp = None  # Force a reload (cache is TTL-based)
+        return (), {"page": 1, "per_page": 25}
+
+    result = benchmark.pedantic(parser.get_trades, setup=setup, rounds=ROUNDS, iterations=1)
+    benchmark.extra_info["rows_loaded"] = result["total_count"]
+
+
+def bench_get_trades_filtered(benchmark, trades_dir):
+    """Warm cache: date + strategy filter over the loaded rows."""
+    from dashboard.services.data_parser import DataParser
+
+    benchmark.group = "data_parser.get_trades"
+    parser = DataParser(trades_dir)
+    parser.get_trades()  # Warm the cache
+
+    result = benchmark(
+        parser.get_trades, start_date="2025-06-01", strategy="arbitrage", per_page=100
+    )
+    benchmark.extra_info["rows_matched"] = result["total_count"]
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def bench_api_endpoint(benchmark, dashboard, endpoint):
+    """Single-client latency, data parser cache warm (the dashboard's steady state)."""
+    benchmark.group = f"api{endpoint}"
+    client = dashboard.app.test_client()
+    assert client.get(endpoint).status_code == 200  # Warm-up
+
+    def get():
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        return response
+
+    benchmark.pedantic(get, rounds=ROUNDS, iterations=1)
+
+
+@pytest.fixture
+def live_server(trade_store_dirs):
+    """Threaded werkzeug server on an ephemeral port, reading the 100k trade store."""
+    from conftest import load_dashboard
+    from werkzeug.serving import make_server
+
+    dashboard_app = load_dashboard(trade_store_dirs(CONCURRENT_TRADES))
+    server = make_server("127.0.0.1", 0, dashboard_app.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@pytest.mark.parametrize("clients", CONCURRENT_CLIENTS, ids=lambda n: f"{n}clients")
+def bench_api_concurrent(benchmark, live_server, clients):
+    """
+    clients threads each issue REQUESTS_PER_CLIENT GETs cycling through
+    ENDPOINTS. The benchmark times the whole burst; per-request latency
+    percentiles and throughput go into extra_info.
+    """
+    benchmark.group = "api.concurrent"
+    latencies = []
+    errors = []
+
+    def client_loop(client_index):
+        for i in range(REQUESTS_PER_CLIENT):
+            endpoint = ENDPOINTS[(client_index + i) % len(ENDPOINTS)]
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(live_server + endpoint, timeout=60) as response:
+                    json.loads(response.read())
+            except Exception as e:
+                errors.append(f"{endpoint}: {e}")
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    def burst():
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(client_loop, range(clients)))
+
+    client_loop(0)  # Warm the data parser cache
+    latencies.clear()
+    benchmark.pedantic(burst, rounds=3, iterations=1)
+
+    assert not errors, errors[:5]
+    ordered = sorted(latencies)
+    benchmark.extra_info.update(
+        {
+            "clients": clients,
+            "requests": len(ordered),
+            "requests_per_sec": round(
+                clients * REQUESTS_PER_CLIENT / benchmark.stats.stats.median, 1
+            ),
+            "latency_mean_ms": round(statistics.fmean(ordered) * 1000, 2),
+            "latency_p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+            "latency_p95_ms": round(_percentile(ordered, 95) * 1000, 2),
+            "latency_p99_ms": round(_percentile(ordered, 99) * 1000, 2),
+        }
+    )
@@ -0,0 +1,34 @@
+"""
+Engine benchmarks: one BotRunner.run_cycle end to end, and each strategy's
+find_opportunities, over 100 / 1k / 10k mock markets.
+"""
+
+CYCLE_ROUNDS = 5
+
+
+def bench_run_cycle(benchmark, bot_runner, market_count):
+    """Fetch, alerts, risk, strategies, opportunity logging, execution, exits."""
+    benchmark.group = "engine.run_cycle"
+    bot_runner.run_cycle()  # Warm-up: generates the market set, first-use imports
+    benchmark.pedantic(bot_runner.run_cycle, rounds=CYCLE_ROUNDS, iterations=1)
+
+    assert bot_runner.error_count == 0
+    benchmark.extra_info.update(
+        {
+            "markets": market_count,
+            "strategies": sorted(bot_runner.strategy_manager.strategies),
+            "cycle_stages": bot_runner.performance_monitor.get_stage_statistics(),
+        }
+    )
+
+
+def bench_find_opportunities(benchmark, strategy_name, bot_runner, market_snapshot, market_count):
+    """One strategy scan over the cycle's (markets, prices_dict)."""
+    benchmark.group = f"strategy.{strategy_name}"
+    strategy = bot_runner.strategy_manager.strategies[strategy_name]
+    markets, prices_dict = market_snapshot
+
+    found = benchmark.pedantic(
+        strategy.find_opportunities, args=(markets, prices_dict), rounds=CYCLE_ROUNDS, iterations=1
+    )
+    benchmark.extra_info.update({"markets": market_count, "opportunities": len(found)})
@@ -0,0 +1,64 @@
+"""
+Trade store write throughput: batched insert_trades (one transaction) and
+per-row insert_trade (one commit each, the engine's default logging path).
+Every round writes into a fresh trades.db.
+"""
+
+import itertools
+
+import pytest
+from conftest import synthetic_trades
+
+ROUNDS = 5
+SINGLE_INSERT_ROWS = 500
+
+_round_ids = itertools.count()
+
+
+def _fresh_dir(workspace, name):
+    path = workspace / f"{name}_{next(_round_ids)}"
+    path.mkdir()
+    return path
+
+
+@pytest.mark.parametrize("batch", [1_000, 10_000], ids=lambda n: f"{n}rows")
+def bench_insert_trades_batch(benchmark, workspace, batch):
+    from database.trades_store import insert_trades
+
+    benchmark.group = "trade_store.insert"
+    trades = synthetic_trades(batch)
+
+    def setup():
+        return (_fresh_dir(workspace, "insert_batch"), trades), {}
+
+    benchmark.pedantic(insert_trades, setup=setup, rounds=ROUNDS, iterations=1)
+    benchmark.extra_info["rows_per_sec"] = round(batch / benchmark.stats.stats.median)
+
+
+def bench_insert_trade_single(benchmark, workspace):
+    from database.trades_store import insert_trade
+
+    benchmark.group = "trade_store.insert"
+    trades = synthetic_trades(SINGLE_INSERT_ROWS)
+
+    def insert_all(logs_dir):
+        for t in trades:
+            insert_trade(
+                logs_dir,
+                t["timestamp"],
+                t["market"],
+                t["yes_price"],
+                t["no_price"],
+                t["profit_pct"],
+                t["profit_usd"],
+                strategy=t["strategy"],
+                arbitrage_type=t["arbitrage_type"],
+            )
+
+    def setup():
+        return (_fresh_dir(workspace, "insert_single"),), {}
+
+    benchmark.pedantic(insert_all, setup=setup, rounds=ROUNDS, iterations=1)
+    benchmark.extra_info["rows_per_sec"] = round(
+        SINGLE_INSERT_ROWS / benchmark.stats.stats.median
+    )
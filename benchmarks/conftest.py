@@ -0,0 +1,194 @@
+"""
+Shared fixtures for the benchmark suite (pytest-benchmark).
+
+The session runs inside a throwaway workspace: it chdirs into a temp directory
+and points LOG_DIR / STATE_DIR there, so the engine's relative logs/ and
+state/ paths, trades.db and the paper engine state never touch the project's
+own data. Markets come from MockMarketClient with a fixed seed, trades from a
+seeded generator, so every run measures the same inputs.
+
+BENCH_FULL=1 adds the largest trade store (1M trades; ~1-2 min to build).
+"""
+
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+FULL = os.environ.get("BENCH_FULL", "").strip() not in ("", "0")
+SEED = 7
+
+MARKET_SIZES = [100, 1_000, 10_000]
+TRADE_SIZES = [10_000, 100_000] + ([1_000_000] if FULL else [])
+
+STRATEGIES = ["arbitrage", "momentum", "news", "statistical_arb"]
+# statistical_arb keeps a correlation tracker per market pair (O(n²)): ~5 GB
+# at 3k markets, so it is only benchmarked (and run in the cycle) up to here.
+STRATEGY_MARKET_LIMITS = {"statistical_arb": 1_000}
+
+TRADE_STRATEGIES = ["arbitrage", "momentum", "news", "statistical_arb"]
+TRADE_MARKETS = 500
+TRADE_HISTORY_DAYS = 365
+TRADE_INSERT_CHUNK = 50_000
+
+
+def strategies_for(market_count):
+    """Strategies that can run a cycle over market_count markets."""
+    return [s for s in STRATEGIES if STRATEGY_MARKET_LIMITS.get(s, market_count) >= market_count]
+
+
+def synthetic_trades(count, seed=SEED):
+    """
+    Seeded trade rows in the trades_store.insert_trades shape.
+
+    Args:
+        count: Number of trades, oldest first, spread over TRADE_HISTORY_DAYS
+        seed: Random seed
+
+    Returns:
+        List of trade dicts
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    step = TRADE_HISTORY_DAYS * 86400 / max(count, 1)
+    trades = []
+    for i in range(count):
+        yes = round(rng.uniform(0.30, 0.55), 4)
+        no = round(rng.uniform(0.30, 0.55), 4)
+        trades.append(
+            {
+                "timestamp": (start + timedelta(seconds=i * step)).isoformat(),
+                "market": f"bench_market_{rng.randrange(TRADE_MARKETS)}",
+                "yes_price": yes,
+                "no_price": no,
+                "profit_pct": round((1 - yes - no) * 100, 4),
+                "profit_usd": round(rng.gauss(0.4, 3.0), 4),
+                "strategy": rng.choice(TRADE_STRATEGIES),
+                "arbitrage_type": "bench",
+            }
+        )
+    return trades
+
+
+@pytest.fixture(scope="session", autouse=True)
+def workspace(tmp_path_factory):
+    """Temp working directory with LOG_DIR / STATE_DIR pointed inside it."""
+    root = tmp_path_factory.mktemp("bench")
+    saved_env = {k: os.environ.get(k) for k in ("LOG_DIR", "STATE_DIR")}
+    saved_cwd = os.getcwd()
+    os.environ["LOG_DIR"] = str(root / "logs")
+    os.environ["STATE_DIR"] = str(root / "state")
+    os.chdir(root)
+    yield root
+    os.chdir(saved_cwd)
+    for key, value in saved_env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture(params=MARKET_SIZES, ids=lambda n: f"{n}mkts")
+def market_count(request):
+    return request.param
+
+
+@pytest.fixture(params=STRATEGIES)
+def strategy_name(request, market_count):
+    if request.param not in strategies_for(market_count):
+        limit = STRATEGY_MARKET_LIMITS[request.param]
+        pytest.skip(f"{request.param} is O(n²) in markets; capped at {limit}")
+    return request.param
+
+
+@pytest.fixture
+def bot_runner(workspace, market_count):
+    """
+    BotRunner on MockMarketClient(market_count) with paper trading and no
+    live-price (reality) arbitrage, so a cycle makes no network calls.
+    """
+    from clients.mock_market_client import MockMarketClient
+    from run_bot import BotRunner
+
+    config_path = workspace / f"config_{market_count}.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "paper_trading": True,
+                "market_fetch_limit": market_count,
+                "arbitrage_types": {"reality_based": {"enabled": False}},
+                "strategies": {"enabled": strategies_for(market_count)},
+            }
+        )
+    )
+    runner = BotRunner(config_path=str(config_path))
+    runner.market_client = MockMarketClient(market_count=market_count, seed=SEED)
+    runner.market_client.connect()
+    return runner
+
+
+@pytest.fixture
+def market_snapshot(bot_runner, market_count):
+    """(markets, prices_dict) exactly as run_cycle hands them to strategies."""
+    raw = bot_runner.market_client.get_markets(min_volume=1000, limit=market_count)
+    markets = bot_runner._normalize_market_format(raw)
+    return markets, bot_runner._convert_markets_to_prices_dict(markets)
+
+
+@pytest.fixture(scope="session")
+def trade_store_dirs(workspace):
+    """Logs dirs holding a trades.db of each TRADE_SIZES size, built on first use."""
+    from database.trades_store import insert_trades
+
+    built = {}
+
+    def get(count):
+        if count not in built:
+            logs_dir = workspace / f"trades_{count}"
+            logs_dir.mkdir()
+            trades = synthetic_trades(count)
+            for i in range(0, count, TRADE_INSERT_CHUNK):
+                insert_trades(logs_dir, trades[i : i + TRADE_INSERT_CHUNK])
+            built[count] = logs_dir
+        return built[count]
+
+    return get
+
+
+@pytest.fixture(params=TRADE_SIZES, ids=lambda n: f"{n}trades")
+def trades_dir(request, trade_store_dirs):
+    return trade_store_dirs(request.param)
+
+
+def load_dashboard(logs_dir):
+    """
+    dashboard.app with its DataParser (shared by the analytics services)
+    re-targeted at logs_dir and caches dropped. The per-IP rate limit is
+    switched off: every benchmark client comes from 127.0.0.1.
+    """
+    import dashboard.app as dashboard_app
+
+    parser = dashboard_app.data_parser
+    parser.logs_dir = Path(logs_dir)
+    parser.trades_csv = parser.logs_dir / "trades.csv"
+    parser.opportunities_csv = parser.logs_dir / "opportunities.csv"
+    parser._trades_cache = None
+    parser._trades_source = None
+    parser._opportunities_cache = None
+    parser._cache_timestamp = None
+    dashboard_app.limiter.enabled = False
+    return dashboard_app
+
+
+@pytest.fixture
+def dashboard(trades_dir):
+    """dashboard.app module reading trades_dir."""
+    return load_dashboard(trades_dir)
@@ -1,7 +1,10 @@
 """
 TUI Monitor (read-only). NOT the execution engine.
 
-Displays live status from state/bot_state.json and logs/activity.json.
+Displays live status from state/bot_state.json and the logs/activity.jsonl feed.
+Reads are incremental: bot_state.json is re-parsed only after the engine
+rewrites it, the activity feed is tailed from the last offset, and only
+panels whose data changed are re-rendered.
 Does NOT fetch markets, execute strategies, or execute trades.
 - To run the trading engine: python main.py  (canonical execution path)
 - This TUI: python bot.py  (optional terminal dashboard; pause/resume via control.json)
@@ -22,6 +25,14 @@ from rich.live import Live
 from rich.text import Text
 from rich import box
 
+from utils.activity_feed import ACTIVITY_FEED_NAME, FeedTailer, FileWatcher
+
+# Activity rows shown in the LATEST ACTIVITY panel
+ACTIVITY_ROWS = 8
+
+# Longest the loop waits for a key before re-checking the engine files
+TICK_SECONDS = 0.5
+
 # Paths (env-configurable via STATE_DIR, LOG_DIR)
 def _get_paths():
     root = Path(__file__).resolve().parent
@@ -37,9 +48,14 @@ def _get_paths():
             state_dir = root / state_dir
         if not log_dir.is_absolute():
             log_dir = root / log_dir
-    return state_dir / "bot_state.json", log_dir / "activity.json", state_dir / "control.json"
+    return (
+        state_dir / "bot_state.json",
+        log_dir / "activity.json",
+        state_dir / "control.json",
+        log_dir / ACTIVITY_FEED_NAME,
+    )
 
-STATE_PATH, ACTIVITY_PATH, CONTROL_PATH = _get_paths()
+STATE_PATH, ACTIVITY_PATH, CONTROL_PATH, FEED_PATH = _get_paths()
 
 
 def _read_json(path: Path, default: Any) -> Any:
@@ -86,8 +102,11 @@ def _format_activity_item(item: Dict[str, Any]) -> str:
     return f"[{ts}] {atype}"
 
 
-def _get_key_nonblocking() -> Optional[str]:
-    """Read a single key if available (Unix/Mac). Returns None if no key or unsupported."""
+def _get_key_nonblocking(timeout: float = 0) -> Optional[str]:
+    """
+    Read a single key if one arrives within timeout (Unix/Mac).
+    Returns None if no key or unsupported; always waits out timeout then.
+    """
     try:
         import select
         import termios
@@ -95,8 +114,9 @@ def _get_key_nonblocking() -> Optional[str]:
 
         fd = sys.stdin.fileno()
         if not sys.stdin.isatty():
+            time.sleep(timeout)
             return None
-        if select.select([sys.stdin], [], [], 0)[0]:
+        if select.select([sys.stdin], [], [], timeout)[0]:
             old = termios.tcgetattr(fd)
             try:
                 tty.setcbreak(fd)
@@ -104,7 +124,7 @@ def _get_key_nonblocking() -> Optional[str]:
             finally:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old)
     except (ImportError, OSError):
-        pass
+        time.sleep(timeout)
     return None
 
 
@@ -120,21 +140,45 @@ def _write_control(signal: Dict[str, Any]) -> None:
 
 
 class BotTUI:
-    """Read-only TUI that displays engine state from state/bot_state.json and logs/activity.json."""
+    """Read-only TUI that displays engine state from state/bot_state.json and logs/activity.jsonl."""
 
     def __init__(self):
         self.console = Console()
         self.running = True
         self.paused = False  # Local TUI notion; engine pause is in control.json
 
+        self._state_watcher = FileWatcher(STATE_PATH)
+        self._state: Dict[str, Any] = {}
+        self._feed = FeedTailer(FEED_PATH, keep=ACTIVITY_ROWS)
+        # Engines that predate the feed only write activity.json
+        self._legacy_activity_watcher = FileWatcher(ACTIVITY_PATH)
+        self._legacy_activity: List[Dict[str, Any]] = []
+        # Panel name -> data it was last rendered from
+        self._rendered: Dict[str, Any] = {}
+
     def _load_state(self) -> Dict[str, Any]:
-        return _read_json(STATE_PATH, {})
+        """bot_state.json, re-parsed only when the engine has rewritten it."""
+        if self._state_watcher.changed():
+            state = _read_json(STATE_PATH, {})
+            self._state = state if isinstance(state, dict) else {}
+        return self._state
 
     def _load_activity(self) -> List[Dict[str, Any]]:
-        data = _read_json(ACTIVITY_PATH, [])
-        if not isinstance(data, list):
-            return []
-        return data
+        """Most recent activity records, oldest first (new feed lines only)."""
+        if self._feed.exists():
+            self._feed.poll()
+            return self._feed.recent()
+        if self._legacy_activity_watcher.changed():
+            data = _read_json(ACTIVITY_PATH, [])
+            self._legacy_activity = data[-ACTIVITY_ROWS:] if isinstance(data, list) else []
+        return self._legacy_activity
+
+    def _changed(self, panel: str, data: Any) -> bool:
+        """True (and remembered) if panel's input differs from its last render."""
+        if panel in self._rendered and self._rendered[panel] == data:
+            return False
+        self._rendered[panel] = data
+        return True
 
     def create_dashboard(self) -> Layout:
         layout = Layout()
@@ -150,12 +194,66 @@ class BotTUI:
         )
         return layout
 
-    def update_dashboard(self, layout: Layout) -> None:
+    def update_dashboard(self, layout: Layout) -> bool:
+        """
+        Re-render the panels whose data changed.
+
+        Returns:
+            True if any panel was updated (the screen needs a refresh)
+        """
         state = self._load_state()
         activities = self._load_activity()
+        updated = False
 
         # Header
         status = state.get("status", "unknown")
+        if self._changed("header", (status, self.paused)):
+            updated = True
+            self._render_header(layout, status)
+
+        # Status row
+        runtime = state.get("runtime_seconds", 0)
+        last = state.get("last_update", "")
+        if self._changed("status", (runtime, last)):
+            updated = True
+            self._render_status(layout, runtime, last)
+
+        if self._changed("connection", state.get("connection", {})):
+            updated = True
+            self._render_connection(layout, state.get("connection", {}))
+
+        if self._changed("rate_limit", state.get("rate_limit", {})):
+            updated = True
+            self._render_rate_limit(layout, state.get("rate_limit", {}))
+
+        if self._changed("trading", (state.get("trading", {}), state.get("balance", 0))):
+            updated = True
+            self._render_trading(layout, state)
+
+        positions = state.get("positions", [])
+        if not isinstance(positions, list):
+            positions = []
+        if self._changed("positions", positions[-5:]):
+            updated = True
+            self._render_positions(layout, positions[-5:])
+
+        act_lines = [_format_activity_item(a) for a in activities[-ACTIVITY_ROWS:]]
+        if self._changed("activity", act_lines):
+            updated = True
+            act_text = "\n".join(reversed(act_lines)) if act_lines else "(No activity yet)"
+            layout["activity"].update(
+                Panel(act_text.rstrip(), title="LATEST ACTIVITY", box=box.ROUNDED)
+            )
+
+        # Footer
+        if self._changed("footer", None):
+            updated = True
+            footer = "Q: quit | P: pause engine | R: resume engine | Ctrl+C: quit"
+            layout["footer"].update(Panel(footer, box=box.ROUNDED, style="dim"))
+
+        return updated
+
+    def _render_header(self, layout: Layout, status: str) -> None:
         if status == "running":
             status_text = "✓ RUNNING" if not self.paused else "⏸ PAUSED (local)"
         elif status == "stopped":
@@ -168,10 +266,8 @@ class BotTUI:
         header.append(f"Engine: {status_text}", style="bold green")
         layout["header"].update(Panel(header, box=box.DOUBLE))
 
-        # Status row
-        runtime = state.get("runtime_seconds", 0)
+    def _render_status(self, layout: Layout, runtime: int, last: str) -> None:
         h, m = runtime // 3600, (runtime % 3600) // 60
-        last = state.get("last_update", "")
         if last:
             try:
                 dt = datetime.fromisoformat(last.replace("Z", "+00:00"))
@@ -186,8 +282,7 @@ class BotTUI:
             )
         )
 
-        # Connection
-        conn = state.get("connection", {})
+    def _render_connection(self, layout: Layout, conn: Dict[str, Any]) -> None:
         healthy = conn.get("healthy", False)
         conn_status = "✓ Healthy" if healthy else "— Unknown"
         conn_style = "green" if healthy else "dim"
@@ -199,8 +294,7 @@ class BotTUI:
         conn_table.add_row("Response:", f"{rtt} ms")
         layout["connection"].update(Panel(conn_table, title="CONNECTION", box=box.ROUNDED))
 
-        # Rate limit
-        rl = state.get("rate_limit", {})
+    def _render_rate_limit(self, layout: Layout, rl: Dict[str, Any]) -> None:
         pct = float(rl.get("usage_pct", 0) or 0)
         bar_w = 20
         filled = int(min(100, pct) / 100 * bar_w)
@@ -215,7 +309,7 @@ class BotTUI:
             Panel(rl_table, title="API RATE LIMIT", box=box.ROUNDED)
         )
 
-        # Trading
+    def _render_trading(self, layout: Layout, state: Dict[str, Any]) -> None:
         tr = state.get("trading", {})
         opps = tr.get("opportunities_found", 0)
         trades = tr.get("trades_executed", 0)
@@ -234,12 +328,9 @@ class BotTUI:
             Panel(trade_table, title="TRADING ACTIVITY", box=box.ROUNDED)
         )
 
-        # Positions
-        positions = state.get("positions", [])
-        if not isinstance(positions, list):
-            positions = []
+    def _render_positions(self, layout: Layout, positions: List[Dict[str, Any]]) -> None:
         pos_lines = []
-        for p in positions[-5:]:
+        for p in positions:
             sym = p.get("symbol", "?")
             qty = p.get("quantity", 0)
             avg = p.get("avg_price", 0)
@@ -249,17 +340,6 @@ class BotTUI:
             Panel(pos_text, title="POSITIONS", box=box.ROUNDED)
         )
 
-        # Activity
-        act_lines = [_format_activity_item(a) for a in activities[-8:]]
-        act_text = "\n".join(reversed(act_lines)) if act_lines else "(No activity yet)"
-        layout["activity"].update(
-            Panel(act_text.rstrip(), title="LATEST ACTIVITY", box=box.ROUNDED)
-        )
-
-        # Footer
-        footer = "Q: quit | P: pause engine | R: resume engine | Ctrl+C: quit"
-        layout["footer"].update(Panel(footer, box=box.ROUNDED, style="dim"))
-
     def run(self) -> None:
         self.console.clear()
         self.console.print("[bold cyan]Bot TUI - Read-only interface[/bold cyan]")
@@ -267,18 +347,21 @@ class BotTUI:
             "[yellow]Start the engine with: python main.py[/yellow]"
         )
         self.console.print(
-            "[dim]Reading from state/bot_state.json and logs/activity.json[/dim]\n"
+            "[dim]Reading from state/bot_state.json and logs/activity.jsonl[/dim]\n"
         )
         time.sleep(2)
 
         layout = self.create_dashboard()
+        self.update_dashboard(layout)
 
         try:
+            # Redrawn only when a panel changed; idle costs two stat() calls a tick
             with Live(
-                layout, console=self.console, refresh_per_second=2, screen=True
+                layout, console=self.console, auto_refresh=False, screen=True
             ) as live:
+                live.refresh()
                 while self.running:
-                    key = _get_key_nonblocking()
+                    key = _get_key_nonblocking(timeout=TICK_SECONDS)
                     if key == "q":
                         self.running = False
                         break
@@ -289,9 +372,8 @@ class BotTUI:
                         self.paused = False
                         _write_control({"pause": False})
 
-                    self.update_dashboard(layout)
-                    live.update(layout)
-                    time.sleep(0.5)
+                    if self.update_dashboard(layout):
+                        live.refresh()
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]TUI stopped by user[/yellow]")
@@ -5,11 +5,31 @@ This package contains all data client implementations for fetching
 market and crypto data from various sources (both real and mock).
 """
 
-from .base_client import BaseClient
-from .polymarket_client import PolymarketClient
-from .coingecko_client import CoinGeckoClient
-from .mock_market_client import MockMarketClient
-from .mock_crypto_client import MockCryptoClient
+import importlib
+
+# Clients are resolved on first attribute access (PEP 562) so the engine only
+# pays for the HTTP client stack of the data sources it actually uses.
+_LAZY_EXPORTS = {
+    "BaseClient": ".base_client",
+    "PolymarketClient": ".polymarket_client",
+    "CoinGeckoClient": ".coingecko_client",
+    "MockMarketClient": ".mock_market_client",
+    "MockCryptoClient": ".mock_crypto_client",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseClient",
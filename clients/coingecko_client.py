@@ -7,6 +7,7 @@ Fetches real cryptocurrency prices from CoinGecko's free API.
 import requests
 from typing import Dict, List, Any, Optional
 from .base_client import BaseClient
+from utils.rate_limiter import get_rate_limiter
 
 
 class CoinGeckoClient(BaseClient):
@@ -36,6 +37,8 @@ class CoinGeckoClient(BaseClient):
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.session = requests.Session()
+        # Shared with apis.coingecko_client: one budget per API
+        self.rate_limiter = get_rate_limiter("coingecko", calls_per_minute=50, burst=1)
 
         # Add API key to headers if provided
         if api_key:
@@ -140,12 +143,15 @@ class CoinGeckoClient(BaseClient):
             if not coin_ids:
                 return {}
 
-            # Fetch prices
+            # Fetch prices (skip this cycle rather than stall it during a 429 backoff)
+            if not self.rate_limiter.acquire(timeout=5.0):
+                return {}
             response = self.session.get(
                 f"{self.endpoint}/simple/price",
                 params={"ids": ",".join(coin_ids), "vs_currencies": "usd"},
                 timeout=15,
             )
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             # Handle rate limiting gracefully
             if response.status_code == 429:
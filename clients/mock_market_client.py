@@ -5,7 +5,7 @@ Generates fake Polymarket market data for testing without API keys.
 """
 
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from .base_client import BaseClient
 
 
@@ -79,9 +79,17 @@ class MockMarketClient(BaseClient):
         "number": ["2", "3", "4", "5"],
     }
 
-    def __init__(self):
-        """Initialize mock market client"""
+    def __init__(self, market_count: int = 50, seed: Optional[int] = None):
+        """
+        Initialize mock market client
+
+        Args:
+            market_count: Number of markets to generate
+            seed: Random seed for a reproducible market set (benchmarks)
+        """
         super().__init__()
+        self.market_count = market_count
+        self._rng = random.Random(seed)
         self._markets = None
 
     def connect(self) -> bool:
@@ -109,14 +117,14 @@ class MockMarketClient(BaseClient):
 
     def _generate_market_name(self) -> str:
         """Generate a random market name from templates"""
-        template = random.choice(self.MARKET_TEMPLATES)
+        template = self._rng.choice(self.MARKET_TEMPLATES)
 
         # Replace placeholders with random substitutions
         result = template
         for key, values in self.SUBSTITUTIONS.items():
             placeholder = f"{{{key}}}"
             if placeholder in result:
-                result = result.replace(placeholder, random.choice(values))
+                result = result.replace(placeholder, self._rng.choice(values))
 
         return result
 
@@ -124,15 +132,14 @@ class MockMarketClient(BaseClient):
         """Generate fake market data"""
         markets = []
 
-        # Generate 50 markets
-        for i in range(50):
+        for i in range(self.market_count):
             # 30% of markets should have arbitrage opportunities
-            has_arb = random.random() < 0.3
+            has_arb = self._rng.random() < 0.3
 
             if has_arb:
                 # Create arbitrage opportunity (YES + NO < 0.98)
-                yes_price = random.uniform(0.40, 0.50)
-                no_price = random.uniform(0.40, 0.50)
+                yes_price = self._rng.uniform(0.40, 0.50)
+                no_price = self._rng.uniform(0.40, 0.50)
                 # Ensure sum is less than 0.98
                 total = yes_price + no_price
                 if total >= 0.98:
@@ -140,8 +147,8 @@ class MockMarketClient(BaseClient):
                     no_price = no_price * 0.95 / total
             else:
                 # Normal market (prices sum to ~1.0)
-                yes_price = random.uniform(0.20, 0.80)
-                no_price = 1.0 - yes_price + random.uniform(-0.02, 0.02)
+                yes_price = self._rng.uniform(0.20, 0.80)
+                no_price = 1.0 - yes_price + self._rng.uniform(-0.02, 0.02)
                 no_price = max(0.01, min(0.99, no_price))
 
             markets.append(
@@ -150,8 +157,8 @@ class MockMarketClient(BaseClient):
                     "market_name": self._generate_market_name(),
                     "yes_price": round(yes_price, 4),
                     "no_price": round(no_price, 4),
-                    "volume_24h": round(random.uniform(5000, 50000), 2),
-                    "liquidity": round(random.uniform(10000, 100000), 2),
+                    "volume_24h": round(self._rng.uniform(5000, 50000), 2),
+                    "liquidity": round(self._rng.uniform(10000, 100000), 2),
                 }
             )
 
@@ -7,6 +7,7 @@ Fetches real market data from Polymarket CLOB API.
 import requests
 from typing import Dict, List, Any, Optional
 from .base_client import BaseClient
+from utils.rate_limiter import get_rate_limiter
 
 
 class PolymarketClient(BaseClient):
@@ -28,6 +29,8 @@ class PolymarketClient(BaseClient):
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.session = requests.Session()
+        # Shared with PolymarketAPI: one budget for the CLOB API
+        self.rate_limiter = get_rate_limiter("polymarket_clob", calls_per_minute=600, burst=20)
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
 
@@ -119,9 +122,12 @@ class PolymarketClient(BaseClient):
             self.connect()
 
         try:
+            if not self.rate_limiter.acquire(timeout=5.0):
+                return []
             response = self.session.get(
                 f"{self.endpoint}/markets", params={"limit": limit}, timeout=30
             )
+            self.rate_limiter.on_response(response.status_code, response.headers)
             response.raise_for_status()
 
             raw_markets = response.json()
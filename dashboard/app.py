@@ -31,13 +31,15 @@ import json
 import psutil  # For process monitoring
 import csv
 import io
+import threading
 import traceback
 
 from dashboard.services.data_parser import DataParser
 from dashboard.services.analytics import AnalyticsService
-from dashboard.services.chart_data import ChartDataService
+from dashboard.services.chart_data import ChartDataService, DEFAULT_MAX_POINTS
 from dashboard.services.config_manager import ConfigManager
 from dashboard.services.engine_state import EngineStateReader
+from dashboard.services.log_reader import LogReader
 from dashboard.services.trade_adapter import get_normalized_trades
 from services.strategy_analytics import StrategyAnalytics
 from services.market_analytics import MarketAnalytics
@@ -50,7 +52,6 @@ from database.settings_models import (
     NotificationPreference,
     init_db,
 )
-from services.notification_service import notification_service
 from services.realtime_server import init_realtime_server
 from dashboard.routes.config_api import config_api
 from dashboard.routes.leaderboard import leaderboard_bp
@@ -63,9 +64,6 @@ from dashboard.routes.settings import settings_bp
 from dashboard.routes.strategies import strategies_bp
 from dashboard.routes.system import system_bp
 from dashboard.routes import validate_no_duplicate_endpoints
-from version_manager import VersionManager
-from services.update_service import UpdateService
-from services.process_manager import ProcessManager
 from services.health_check import health_service
 from services.prometheus_metrics import metrics
 from monitoring.metrics import get_metrics_collector
@@ -166,9 +164,16 @@ DEFAULT_OVERVIEW_STATS = {
     "max_drawdown_pct": 0,
 }
 
+# Log readers for /api/logs/recent and Socket.IO follow ('logs' room)
+log_readers = {
+    name: LogReader(LOGS_DIR / f"{name}.log") for name in ("bot", "errors", "connection")
+}
+
 # Initialize WebSocket server for real-time updates
 try:
     realtime_server = init_realtime_server(app, logger)
+    # Polls bot.log only while a client is in the 'logs' room
+    realtime_server.follow_log(log_readers["bot"])
     logger.info("WebSocket server initialized successfully")
 except Exception as e:
     logger.warning(f"Failed to initialize WebSocket server: {str(e)}")
@@ -192,14 +197,66 @@ except Exception as e:
     logger.exception("Dashboard startup: failed to initialize settings database: %s", e)
     raise
 
-# Initialize update system services
-try:
-    version_manager = VersionManager(BASE_DIR)
-    update_service = UpdateService(BASE_DIR)
-    process_manager = ProcessManager(BASE_DIR)
-except Exception as e:
-    logger.exception("Dashboard startup: failed to initialize update/process services: %s", e)
-    raise
+# Update system and notification services are only used by a handful of routes;
+# they (and their imports) are created on first use to keep dashboard startup fast.
+_lazy_services = {}
+_lazy_services_lock = threading.Lock()
+
+
+def _lazy_service(name, factory):
+    """Return the shared service `name`, creating it with factory() exactly once."""
+    service = _lazy_services.get(name)
+    if service is None:
+        with _lazy_services_lock:
+            service = _lazy_services.get(name)
+            if service is None:
+                service = factory()
+                _lazy_services[name] = service
+    return service
+
+
+def _get_version_manager():
+    """Return the shared VersionManager, creating it on first use."""
+
+    def create():
+        from version_manager import VersionManager
+
+        return VersionManager(BASE_DIR)
+
+    return _lazy_service("version_manager", create)
+
+
+def _get_update_service():
+    """Return the shared UpdateService, creating it on first use."""
+
+    def create():
+        from services.update_service import UpdateService
+
+        return UpdateService(BASE_DIR)
+
+    return _lazy_service("update_service", create)
+
+
+def _get_process_manager():
+    """Return the shared ProcessManager, creating it on first use."""
+
+    def create():
+        from services.process_manager import ProcessManager
+
+        return ProcessManager(BASE_DIR)
+
+    return _lazy_service("process_manager", create)
+
+
+def _get_notification_service():
+    """Return the notification service singleton, importing it on first use."""
+
+    def create():
+        from services.notification_service import notification_service
+
+        return notification_service
+
+    return _lazy_service("notification_service", create)
 
 
 # ============================================================================
@@ -303,7 +360,7 @@ def health_check():
         health_status["application"] = {
             "status": "healthy",
             "version": (
-                version_manager.get_current_version() if version_manager else "unknown"
+                _get_version_manager().get_current_version()
             ),
             "uptime_seconds": (
                 metrics_collector.get_system_stats()["uptime_seconds"]
@@ -361,6 +418,11 @@ def prometheus_metrics():
     Returns metrics in Prometheus exposition format.
     """
     try:
+        # Per-stage cycle latencies are published by the engine in engine_health.json
+        engine_health = engine_state_reader.get_engine_health() or {}
+        metrics.update_cycle_stages(engine_health.get("cycle_stages"))
+        metrics.update_rate_limits((engine_state_reader.get_bot_state() or {}).get("rate_limit"))
+
         # Get Prometheus-formatted metrics
         metrics_data = metrics.get_metrics()
 
@@ -381,10 +443,23 @@ def metrics_stats():
     Returns JSON format of all collected metrics.
     """
     try:
+        # Per-stage cycle latencies come from the engine and do not need the collector
+        engine_health = engine_state_reader.get_engine_health() or {}
+        cycle_stages = engine_health.get("cycle_stages", {})
+
         if not metrics_collector:
-            return jsonify({"error": "Metrics collector not initialized"}), 503
+            return (
+                jsonify(
+                    {
+                        "error": "Metrics collector not initialized",
+                        "cycle_stages": cycle_stages,
+                    }
+                ),
+                503,
+            )
 
         stats = metrics_collector.get_comprehensive_stats()
+        stats["cycle_stages"] = cycle_stages
         return jsonify(stats)
 
     except Exception as e:
@@ -543,7 +618,9 @@ def get_cumulative_pnl():
     """Get cumulative P&L chart data"""
     try:
         time_range = request.args.get("range", "1M")
-        data = chart_data.get_cumulative_pnl(time_range)
+        strategy = request.args.get("strategy") or None
+        max_points = request.args.get("points", DEFAULT_MAX_POINTS, type=int)
+        data = chart_data.get_cumulative_pnl(time_range, strategy, max_points)
         return jsonify(data)
     except Exception as e:
         logger.error(f"Error getting cumulative P&L: {str(e)}")
@@ -554,7 +631,11 @@ def get_cumulative_pnl():
 def get_daily_pnl():
     """Get daily P&L chart data"""
     try:
-        data = chart_data.get_daily_pnl()
+        data = chart_data.get_daily_pnl(
+            request.args.get("range", "ALL"),
+            request.args.get("strategy") or None,
+            request.args.get("points", type=int),
+        )
         return jsonify(data)
     except Exception as e:
         logger.error(f"Error getting daily P&L: {str(e)}")
@@ -783,87 +864,44 @@ def analytics_charts():
         return jsonify({"error": str(e)}), 500
 
 
-@core_bp.route("/api/export/trades", methods=["POST"], endpoint="core_export_trades")
+@core_bp.route("/api/export/trades", methods=["GET", "POST"], endpoint="core_export_trades")
 def export_trades():
     """
-    Export trades to CSV for external analysis
+    Stream trades for external analysis (no row cap, constant memory)
 
-    Accepts filters in request body:
+    Accepts filters in the request body (POST) or query string (GET):
     - start_date: Filter trades after this date
     - end_date: Filter trades before this date
     - market: Filter by specific market
     - strategy: Filter by strategy name
+    - format: csv (default) | parquet | arrow (Arrow IPC stream; needs pyarrow)
+    - gzip: Gzip the download (csv / arrow)
     """
     try:
-        import csv
-        import io
-        from flask import make_response
+        from dashboard.services.trade_export import stream_trade_export
 
         # Get filters from request
-        data = request.json or {}
-        start_date = data.get("start_date")
-        end_date = data.get("end_date")
-        market = data.get("market")
-        strategy = data.get("strategy")
-
-        # Get all trades matching filters
-        trades_data = data_parser.get_trades(
-            start_date=start_date,
-            end_date=end_date,
-            symbol=market,
-            strategy=strategy,
-            page=1,
-            per_page=10000,  # Get all trades
-        )
-
-        trade_list = (
-            trades_data.get("trades", []) if isinstance(trades_data, dict) else []
-        )
-
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "Timestamp",
-                "Market",
-                "Strategy",
-                "Entry Price",
-                "Exit Price",
-                "Size",
-                "Profit/Loss",
-                "Status",
-                "Notes",
-            ]
+        data = (request.get_json(silent=True) or {}) if request.method == "POST" else request.args
+        compress = str(data.get("gzip", "")).lower() in ("1", "true", "yes")
+
+        blocks, mimetype, filename = stream_trade_export(
+            data_parser,
+            fmt=data.get("format") or "csv",
+            start_date=data.get("start_date"),
+            end_date=data.get("end_date"),
+            market=data.get("market"),
+            strategy=data.get("strategy"),
+            compress=compress,
         )
-
-        # Write data rows
-        for trade in trade_list:
-            writer.writerow(
-                [
-                    trade.get("timestamp", ""),
-                    trade.get("market", ""),
-                    trade.get("strategy", ""),
-                    trade.get("entry_price", ""),
-                    trade.get("exit_price", ""),
-                    trade.get("size", ""),
-                    trade.get("profit", 0),
-                    trade.get("status", ""),
-                    trade.get("notes", ""),
-                ]
-            )
-
-        # Create response
-        output.seek(0)
-        response = make_response(output.getvalue())
-        response.headers["Content-Type"] = "text/csv"
-        response.headers["Content-Disposition"] = (
-            f'attachment; filename=trades_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        return Response(
+            blocks,
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
-
-        return response
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except ImportError as e:
+        return jsonify({"error": str(e)}), 501
     except Exception as e:
         logger.error(f"Error exporting trades: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -883,16 +921,20 @@ def test_notification():
         notifier = Notifier(config)
 
         result = False
-        if notification_type == "desktop":
-            result = notifier.send_desktop_notification(
-                "Test Notification", "This is a test from the web dashboard"
-            )
-        elif notification_type == "email":
-            result = notifier.send_email("Test email from web dashboard")
-        elif notification_type == "telegram":
-            result = notifier.send_push(
-                "Test Notification", "This is a test from the web dashboard"
-            )
+        try:
+            if notification_type == "desktop":
+                result = notifier.send_desktop_notification(
+                    "Test Notification", "This is a test from the web dashboard"
+                )
+            elif notification_type == "email":
+                result = notifier.send_email("Test email from web dashboard")
+            elif notification_type == "telegram":
+                result = notifier.send_push(
+                    "Test Notification", "This is a test from the web dashboard"
+                )
+        finally:
+            # Per-request notifier: release its SMTP / HTTP sessions
+            notifier.close()
 
         return jsonify(
             {
@@ -931,37 +973,21 @@ def get_bot_status():
             result["control_note"] = "Engine status from state. Start/Stop below control the engine (main.py)."
             return jsonify(result)
 
-        # Fallback: process_manager tracks engine (main.py) started by dashboard; or scan for main.py/run_bot.py
-        bot_running = process_manager.is_bot_running()
-        bot_pid = process_manager.get_bot_pid()
+        # Fallback: engine lock file / dashboard PID file, validated cheaply and cached;
+        # full process scan at most once per FULL_SCAN_INTERVAL_SEC
+        engine = _get_process_manager().find_engine()
+        bot_running = engine is not None
+        bot_pid = engine["pid"] if engine else None
         bot_uptime = 0
-        if bot_pid and bot_running:
-            try:
-                proc = psutil.Process(bot_pid)
-                bot_uptime = int(datetime.now().timestamp() - proc.create_time())
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        if not bot_running and bot_pid is None:
-            for proc in psutil.process_iter(["pid", "name", "cmdline", "create_time"]):
-                try:
-                    cmdline = proc.info.get("cmdline", [])
-                    if cmdline:
-                        c = " ".join(str(c) for c in cmdline)
-                        if "main.py" in c or "run_bot.py" in c:
-                            bot_running = True
-                            bot_pid = proc.info["pid"]
-                            bot_uptime = int(
-                                datetime.now().timestamp() - proc.info["create_time"]
-                            )
-                            break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+        if engine and engine.get("create_time"):
+            bot_uptime = int(datetime.now().timestamp() - engine["create_time"])
 
         result = {
             **bot_status,
             "running": bot_running,
             "pid": bot_pid,
             "uptime": bot_uptime,
+            "heartbeat": engine.get("heartbeat") if engine else None,
             "control_disabled": False,
             "control_note": "Start engine: python main.py (or use Start Engine below).",
         }
@@ -992,7 +1018,7 @@ def get_bot_status():
 def start_bot():
     """Start the engine (main.py). Phase 7B: Actually starts process."""
     try:
-        success, pid = process_manager.start_bot()
+        success, pid = _get_process_manager().start_bot()
         if success:
             bot_status["running"] = True
             bot_status["paused"] = False
@@ -1008,7 +1034,7 @@ def start_bot():
 def stop_bot():
     """Stop the engine (main.py). Phase 7B: Actually stops process."""
     try:
-        success = process_manager.stop_bot()
+        success = _get_process_manager().stop_bot()
         if success:
             bot_status["running"] = False
         return jsonify({"success": True, "message": "Engine stopped"})
@@ -1021,7 +1047,7 @@ def stop_bot():
 def restart_bot():
     """Restart the engine (main.py). Phase 7B: Actually restarts process."""
     try:
-        success, pid = process_manager.restart_bot()
+        success, pid = _get_process_manager().restart_bot()
         if success:
             bot_status["running"] = True
             bot_status["last_restart"] = datetime.now().isoformat()
@@ -1034,36 +1060,30 @@ def restart_bot():
 
 @core_bp.route("/api/logs/recent", endpoint="core_get_recent_logs")
 def get_recent_logs():
-    """Get recent log entries"""
+    """
+    Get recent log entries
+
+    Query params:
+    - limit: Max entries (default 100)
+    - level: Minimum level (DEBUG, INFO, WARNING, ERROR, CRITICAL; default all)
+    - minutes: Only entries from the last N minutes (indexed search)
+    - file: bot (default) | errors | connection
+    """
     try:
         limit = int(request.args.get("limit", 100))
         level = request.args.get("level", "all")
+        minutes = request.args.get("minutes", type=int)
 
-        # Read from bot.log file if it exists
-        logs = []
-        log_file = LOGS_DIR / "bot.log"
-
-        if log_file.exists():
-            try:
-                with open(log_file, "r") as f:
-                    lines = f.readlines()
-                    # Get last 'limit' lines
-                    recent_lines = lines[-limit:] if len(lines) > limit else lines
-
-                    for line in recent_lines:
-                        line = line.strip()
-                        if line:
-                            # Parse log line (basic parsing)
-                            logs.append(
-                                {
-                                    "timestamp": datetime.now().isoformat(),  # Would parse from log
-                                    "level": "INFO",  # Would parse from log
-                                    "message": line,
-                                }
-                            )
-            except Exception as e:
-                logger.error(f"Error reading log file: {str(e)}")
+        reader = log_readers.get(request.args.get("file", "bot"))
+        if reader is None:
+            return jsonify({"error": "Unknown log file"}), 400
 
+        if minutes:
+            logs = reader.search(
+                since=datetime.now() - timedelta(minutes=minutes), level=level, limit=limit
+            )
+        else:
+            logs = reader.tail(limit=limit, level=level)
         return jsonify(logs)
     except Exception as e:
         logger.error(f"Error getting logs: {str(e)}")
@@ -2326,7 +2346,7 @@ def test_notification_channel(channel_type):
             )
 
         # Test the channel
-        result = notification_service.test_channel(channel_type, data)
+        result = _get_notification_service().test_channel(channel_type, data)
 
         return jsonify(result)
 
@@ -3317,7 +3337,7 @@ def research_export():
 def check_for_updates():
     """Check if updates are available"""
     try:
-        update_info = version_manager.check_for_updates()
+        update_info = _get_version_manager().check_for_updates()
         return jsonify(update_info)
     except Exception as e:
         logger.error(f"Error checking for updates: {e}")
@@ -3328,7 +3348,7 @@ def check_for_updates():
 def get_update_history():
     """Get past updates"""
     try:
-        history = version_manager.get_update_history()
+        history = _get_version_manager().get_update_history()
         return jsonify({"history": history})
     except Exception as e:
         logger.error(f"Error getting update history: {e}")
@@ -3340,7 +3360,7 @@ def start_update():
     """Start update process"""
     try:
         # Run pre-flight checks
-        checks_passed, checks = update_service.pre_flight_checks()
+        checks_passed, checks = _get_update_service().pre_flight_checks()
 
         if not checks_passed:
             return (
@@ -3363,7 +3383,7 @@ def start_update():
         import threading
 
         def run_update():
-            result = update_service.perform_update()
+            result = _get_update_service().perform_update()
             logger.log_info(f"Update completed: {result}")
 
         thread = threading.Thread(target=run_update, daemon=True)
@@ -3372,7 +3392,7 @@ def start_update():
         return jsonify(
             {
                 "status": "started",
-                "update_id": update_service.current_update_id or update_id,
+                "update_id": _get_update_service().current_update_id or update_id,
                 "message": "Update started successfully",
             }
         )
@@ -3386,7 +3406,7 @@ def start_update():
 def get_update_progress():
     """Get real-time update progress"""
     try:
-        progress = update_service.get_progress()
+        progress = _get_update_service().get_progress()
         if progress is None:
             return jsonify(
                 {
@@ -3407,7 +3427,7 @@ def cancel_update():
     """Cancel in-progress update"""
     try:
         # For now, just unlock - actual cancellation is complex
-        success = update_service.unlock_update(force=True)
+        success = _get_update_service().unlock_update(force=True)
 
         if success:
             return jsonify(
@@ -3428,7 +3448,7 @@ def manual_rollback():
         data = request.get_json() or {}
         backup_name = data.get("backup_name")
 
-        success = update_service.rollback(backup_name)
+        success = _get_update_service().rollback(backup_name)
 
         if success:
             return jsonify(
@@ -3455,11 +3475,11 @@ def get_system_health():
     """System health check"""
     try:
         # Run pre-flight checks (they're comprehensive)
-        checks_passed, checks = update_service.pre_flight_checks()
+        checks_passed, checks = _get_update_service().pre_flight_checks()
 
         # Additional checks
-        bot_running = process_manager.is_bot_running()
-        dashboard_running = process_manager.is_dashboard_running()
+        bot_running = _get_process_manager().is_bot_running()
+        dashboard_running = _get_process_manager().is_dashboard_running()
 
         # Get disk space
         stat = shutil.disk_usage(BASE_DIR)
@@ -3474,7 +3494,7 @@ def get_system_health():
         )
 
         # Get last update
-        history = version_manager.get_update_history()
+        history = _get_version_manager().get_update_history()
         last_update = history[0] if history else None
 
         return jsonify(
@@ -3551,7 +3571,7 @@ def restore_backup():
         if not backup_id:
             return jsonify({"success": False, "error": "backup_id required"}), 400
 
-        success = update_service.rollback(backup_id)
+        success = _get_update_service().rollback(backup_id)
 
         if success:
             return jsonify(
@@ -3569,7 +3589,7 @@ def restore_backup():
 def force_stop_all():
     """Emergency stop all processes"""
     try:
-        success = process_manager.force_stop_all()
+        success = _get_process_manager().force_stop_all()
 
         if success:
             return jsonify({"success": True, "message": "All processes stopped"})
@@ -3588,7 +3608,7 @@ def unlock_update_system():
         data = request.get_json() or {}
         force = data.get("force", False)
 
-        success = update_service.unlock_update(force=force)
+        success = _get_update_service().unlock_update(force=force)
 
         if success:
             return jsonify({"success": True, "message": "Update system unlocked"})
@@ -4171,7 +4191,7 @@ def send_notification():
         notification_type = data.get("type", "info")
 
         # Use existing notification service
-        notification_service.send_alert(
+        _get_notification_service().send_alert(
             title=data.get("title", "Bot Notification"),
             message=message,
             priority=notification_type,
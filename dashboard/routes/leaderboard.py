@@ -65,7 +65,10 @@ def get_strategy_performance(strategy_name):
     """Get historical performance for a strategy"""
     try:
         hours = request.args.get("hours", default=24, type=int)
-        history = performance_tracker.get_historical_performance(strategy_name, hours)
+        points = request.args.get("points", default=None, type=int)
+        history = performance_tracker.get_historical_performance(
+            strategy_name, hours, max_points=points
+        )
         return jsonify({"success": True, "strategy": strategy_name, "history": history})
     except Exception as e:
         logger.error(f"Error getting strategy performance: {e}", exc_info=True)
@@ -2,14 +2,22 @@
 Chart Data Service
 
 Prepares data for charts and visualizations in the dashboard.
-Uses Decimal-based calculations from data_parser for accuracy.
+Uses Decimal-based calculations for accuracy; P&L series come from
+ChartSeriesEngine (one sorted pass, cached per range/strategy).
 """
 
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
-from collections import defaultdict
-from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from decimal import Decimal
 from dashboard.services.data_parser import DataParser
+from dashboard.services.chart_series import (
+    ChartSeriesEngine,
+    lttb_indices,
+    minmax_indices,
+)
+
+# Default point budget for line charts; longer histories are downsampled
+DEFAULT_MAX_POINTS = 1000
 
 
 class ChartDataService:
@@ -23,100 +31,74 @@ class ChartDataService:
             data_parser: Data parser instance
         """
         self.data_parser = data_parser
-
-    def get_cumulative_pnl(self, time_range: str = "1M") -> Dict[str, Any]:
+        self.series = ChartSeriesEngine(data_parser)
+
+    def get_cumulative_pnl(
+        self,
+        time_range: str = "1M",
+        strategy: Optional[str] = None,
+        max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    ) -> Dict[str, Any]:
         """
         Get cumulative P&L chart data using Decimal-based calculations
 
         Args:
             time_range: Time range (1D, 1W, 1M, 3M, 6M, 1Y, ALL)
+            strategy: Optional strategy filter
+            max_points: Downsample (LTTB) to about this many points; None = all days
 
         Returns:
-            Dictionary with chart data
+            Dictionary with chart data (one point per trading day, last trade of the day)
         """
-        trades = self.data_parser.get_all_trades()
+        series = self.series.get_series(time_range, strategy)
 
-        # Determine date range
-        now = datetime.now()
-        if time_range == "1D":
-            start_date = now - timedelta(days=1)
-        elif time_range == "1W":
-            start_date = now - timedelta(weeks=1)
-        elif time_range == "1M":
-            start_date = now - timedelta(days=30)
-        elif time_range == "3M":
-            start_date = now - timedelta(days=90)
-        elif time_range == "6M":
-            start_date = now - timedelta(days=180)
-        elif time_range == "1Y":
-            start_date = now - timedelta(days=365)
-        else:  # ALL
-            start_date = datetime.min
-
-        # Filter trades by date range
-        filtered_trades = [
-            t for t in trades if datetime.fromisoformat(t["timestamp"]) >= start_date
-        ]
-
-        # Sort by entry time
-        filtered_trades.sort(key=lambda x: x["timestamp"])
-
-        # Use data_parser's Decimal-based cumulative calculation
-        chart_data = self.data_parser.prepare_cumulative_pnl_chart_data(filtered_trades)
+        indices = range(len(series["dates"]))
+        if max_points:
+            indices = lttb_indices(series["cumulative"], max_points)
 
-        # Convert to the format expected by existing code
         data_points = []
-        for i, (label, value) in enumerate(
-            zip(chart_data["labels"], chart_data["data"])
-        ):
-            # Find corresponding trade for this date
-            date_obj = (
-                datetime.fromisoformat(label).date()
-                if isinstance(label, str)
-                else label
+        for i in indices:
+            last_trade = series["last_trades"][i]
+            data_points.append(
+                {
+                    "timestamp": last_trade["timestamp"],
+                    "value": round(series["cumulative"][i], 2),
+                    "drawdown": round(series["drawdown"][i], 2),
+                    "trade_id": last_trade["id"],
+                    "symbol": last_trade["symbol"],
+                }
             )
-            trades_on_date = [
-                t
-                for t in filtered_trades
-                if datetime.fromisoformat(t["timestamp"]).date() == date_obj
-            ]
-
-            # Use last trade of the day for display
-            if trades_on_date:
-                last_trade = trades_on_date[-1]
-                data_points.append(
-                    {
-                        "timestamp": last_trade["timestamp"],
-                        "value": round(value, 2),
-                        "trade_id": last_trade["id"],
-                        "symbol": last_trade["symbol"],
-                    }
-                )
 
         return {
             "data": data_points,
-            "start_date": (
-                start_date.isoformat() if start_date != datetime.min else None
-            ),
-            "end_date": now.isoformat(),
+            "start_date": series["start_date"],
+            "end_date": series["end_date"],
             "total_pnl": data_points[-1]["value"] if data_points else 0,
+            "total_days": len(series["dates"]),
         }
 
-    def get_daily_pnl(self) -> Dict[str, Any]:
+    def get_daily_pnl(
+        self,
+        time_range: str = "ALL",
+        strategy: Optional[str] = None,
+        max_points: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Get daily P&L chart data using Decimal-based calculations
 
+        Args:
+            time_range: Time range (1D, 1W, 1M, 3M, 6M, 1Y, ALL)
+            strategy: Optional strategy filter
+            max_points: Downsample (min/max buckets, keeps spikes); None = all days
+
         Returns:
             Dictionary with daily P&L data
         """
-        trades = self.data_parser.get_all_trades()
-
-        # Use data_parser's Decimal-based daily calculation
-        chart_data = self.data_parser.prepare_daily_pnl_chart_data(trades)
+        series = self.series.get_series(time_range, strategy)
 
         # Convert to the format expected by existing code
         data_points = []
-        for label, pnl in zip(chart_data["labels"], chart_data["data"]):
+        for label, pnl in zip(series["dates"], series["daily"]):
             data_points.append(
                 {
                     "date": label,
@@ -125,19 +107,26 @@ class ChartDataService:
                 }
             )
 
-        # Calculate moving average (7-day)
+        # Calculate moving average (7-day), sliding window sum
         ma_period = 7
+        window_sum = 0.0
         for i, point in enumerate(data_points):
-            start_idx = max(0, i - ma_period + 1)
-            ma_values = [data_points[j]["pnl"] for j in range(start_idx, i + 1)]
-            point["ma"] = round(sum(ma_values) / len(ma_values), 2)
+            window_sum += point["pnl"]
+            if i >= ma_period:
+                window_sum -= data_points[i - ma_period]["pnl"]
+            point["ma"] = round(window_sum / min(i + 1, ma_period), 2)
 
-        return {
+        result = {
             "data": data_points,
             "total_days": len(data_points),
             "profitable_days": len([p for p in data_points if p["pnl"] > 0]),
             "loss_days": len([p for p in data_points if p["pnl"] < 0]),
         }
+        if max_points and len(data_points) > max_points:
+            result["data"] = [
+                data_points[i] for i in minmax_indices(series["daily"], max_points)
+            ]
+        return result
 
     def get_strategy_performance(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,240 @@
+"""
+Chart Series Engine
+
+Builds daily / cumulative / drawdown P&L series in one pass over trades that
+are parsed and sorted once per trade-cache version, with optional downsampling
+for long ranges (LTTB for line series, min/max bucketing for bars).
+
+Series are cached per (time range, strategy) and rebuilt when the DataParser
+hands out a new trade list or the cache entry is older than SERIES_TTL_SEC.
+CRITICAL: P&L sums use Decimal for accuracy.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Range label -> lookback (None = all history)
+TIME_RANGES = {
+    "1D": timedelta(days=1),
+    "1W": timedelta(weeks=1),
+    "1M": timedelta(days=30),
+    "3M": timedelta(days=90),
+    "6M": timedelta(days=180),
+    "1Y": timedelta(days=365),
+    "ALL": None,
+}
+
+SERIES_TTL_SEC = 60
+SERIES_CACHE_SIZE = 32
+
+
+def range_start(time_range: str, now: datetime) -> datetime:
+    """Start of a time range (datetime.min for ALL / unknown labels)."""
+    lookback = TIME_RANGES.get(time_range)
+    return now - lookback if lookback else datetime.min
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling over (index, value) points.
+
+    Returns indices of the points to keep (always first and last); all indices
+    when len(values) <= threshold.
+    """
+    n = len(values)
+    if threshold >= n or n <= 2:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1]
+
+    keep = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        # Average of the next bucket is the third triangle vertex
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_start >= next_end:
+            avg_x, avg_y = n - 1, values[n - 1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2.0
+            avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        ax, ay = a, values[a]
+        best, best_area = start, -1.0
+        for j in range(start, min(end, n - 1)):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+    keep.append(n - 1)
+    return keep
+
+
+def minmax_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Min/max bucketing: keep the lowest and highest point of each bucket so
+    spikes survive downsampling. Returns sorted indices (about threshold of them).
+    """
+    n = len(values)
+    if threshold >= n or threshold < 2:
+        return list(range(n))
+    buckets = max(1, threshold // 2)
+    size = n / buckets
+    keep = set()
+    for b in range(buckets):
+        lo, hi = int(b * size), min(int((b + 1) * size), n)
+        if lo >= hi:
+            continue
+        chunk = range(lo, hi)
+        keep.add(min(chunk, key=values.__getitem__))
+        keep.add(max(chunk, key=values.__getitem__))
+    keep.update((0, n - 1))
+    return sorted(keep)
+
+
+def _parse_ts(trade: Dict[str, Any]) -> Optional[datetime]:
+    ts = trade.get("entry_time") or trade.get("timestamp")
+    if isinstance(ts, datetime):
+        dt = ts
+    else:
+        try:
+            dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+        except (TypeError, ValueError):
+            return None
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class ChartSeriesEngine:
+    """Single-pass P&L series over a DataParser's trades, cached per (range, strategy)"""
+
+    def __init__(self, data_parser, ttl_seconds: float = SERIES_TTL_SEC):
+        """
+        Initialize chart series engine
+
+        Args:
+            data_parser: Data parser instance (get_all_trades())
+            ttl_seconds: Max age of a cached series (relative ranges move with time)
+        """
+        self.data_parser = data_parser
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._index_version: Optional[Tuple[int, int]] = None
+        self._index: List[Tuple[datetime, Decimal, Dict[str, Any]]] = []
+        self._index_times: List[datetime] = []
+        self._series: "OrderedDict[Tuple[str, Optional[str]], Tuple[Tuple[int, int], float, Dict[str, Any]]]" = OrderedDict()
+
+    def _ensure_index(self) -> Tuple[int, int]:
+        """Parse and sort trades once per trade list handed out by the parser."""
+        trades = self.data_parser.get_all_trades() or []
+        version = (id(trades), len(trades))
+        if version != self._index_version:
+            parsed = []
+            for trade in trades:
+                dt = _parse_ts(trade)
+                if dt is not None:
+                    parsed.append((dt, Decimal(str(trade.get("pnl_usd", 0) or 0)), trade))
+            parsed.sort(key=lambda row: row[0])
+            self._index = parsed
+            self._index_times = [row[0] for row in parsed]
+            self._index_version = version
+            self._series.clear()
+        return version
+
+    def invalidate(self) -> None:
+        """Drop parsed trades and cached series (e.g. after new trades are written)."""
+        with self._lock:
+            self._index_version = None
+            self._series.clear()
+
+    def get_series(
+        self, time_range: str = "ALL", strategy: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Daily P&L, cumulative P&L and drawdown per trading day.
+
+        Args:
+            time_range: Time range (1D, 1W, 1M, 3M, 6M, 1Y, ALL)
+            strategy: Optional strategy filter
+
+        Returns:
+            Dictionary with parallel lists: dates, daily, cumulative, drawdown,
+            last_trades (last trade of each day), plus start_date/end_date/total_pnl
+        """
+        with self._lock:
+            version = self._ensure_index()
+            key = (time_range, strategy)
+            cached = self._series.get(key)
+            if (
+                cached
+                and cached[0] == version
+                and time.monotonic() - cached[1] < self.ttl_seconds
+            ):
+                self._series.move_to_end(key)
+                return cached[2]
+
+            series = self._build(time_range, strategy)
+            self._series[key] = (version, time.monotonic(), series)
+            self._series.move_to_end(key)
+            while len(self._series) > SERIES_CACHE_SIZE:
+                self._series.popitem(last=False)
+            return series
+
+    def _build(self, time_range: str, strategy: Optional[str]) -> Dict[str, Any]:
+        now = datetime.now()
+        start_date = range_start(time_range, now)
+        first = bisect_left(self._index_times, start_date)
+
+        dates: List[str] = []
+        daily: List[float] = []
+        cumulative: List[float] = []
+        drawdown: List[float] = []
+        last_trades: List[Dict[str, Any]] = []
+
+        running = Decimal("0")
+        peak = Decimal("0")
+        day = None
+        day_pnl = Decimal("0")
+        day_last = None
+
+        def close_day():
+            nonlocal running, peak
+            running += day_pnl
+            peak = max(peak, running)
+            dates.append(day.isoformat())
+            daily.append(float(day_pnl))
+            cumulative.append(float(running))
+            drawdown.append(float(peak - running))
+            last_trades.append(day_last)
+
+        for dt, pnl, trade in self._index[first:]:
+            if strategy and trade.get("strategy") != strategy:
+                continue
+            trade_day = dt.date()
+            if trade_day != day:
+                if day is not None:
+                    close_day()
+                day, day_pnl = trade_day, Decimal("0")
+            day_pnl += pnl
+            day_last = trade
+        if day is not None:
+            close_day()
+
+        return {
+            "dates": dates,
+            "daily": daily,
+            "cumulative": cumulative,
+            "drawdown": drawdown,
+            "last_trades": last_trades,
+            "start_date": start_date.isoformat() if start_date != datetime.min else None,
+            "end_date": now.isoformat(),
+            "total_pnl": float(running),
+        }
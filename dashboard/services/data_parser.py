@@ -50,6 +50,7 @@ class DataParser:
 
         # Cache for parsed data (bounded size; longer TTL to avoid full reload every 5s)
         self._trades_cache = None
+        self._trades_source = None  # "store" | "csv" | "sample"
         self._opportunities_cache = None
         self._cache_timestamp = None
         self._cache_ttl = CACHE_TTL_SEC
@@ -202,15 +203,26 @@ class DataParser:
             store_trades = self._read_trades_from_store(limit or DASHBOARD_TRADES_LIMIT)
             if store_trades is not None and len(store_trades) > 0:
                 self._trades_cache = store_trades
+                self._trades_source = "store"
             else:
                 csv_trades = self._read_trades_from_csv(limit=limit or DASHBOARD_TRADES_LIMIT)
                 if csv_trades is not None and len(csv_trades) > 0:
                     self._trades_cache = csv_trades
+                    self._trades_source = "csv"
                 else:
                     self._trades_cache = self._sample_trades
+                    self._trades_source = "sample"
             self._cache_timestamp = datetime.now()
         return self._trades_cache
 
+    def get_rollup_logs_dir(self) -> Optional[Path]:
+        """
+        Logs dir whose SQLite rollups back the current trades, or None when trades
+        come from CSV or sample data (analytics then aggregate trade rows instead).
+        """
+        self._get_trades_with_cache()
+        return self.logs_dir if self._trades_source == "store" else None
+
     def _get_opportunities_with_cache(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get opportunities with caching. Loads only last N rows."""
         if self._opportunities_cache is None or self._should_refresh_cache():
@@ -0,0 +1,349 @@
+"""
+Log Reader Service
+
+Reads the bot's rotating log files for the dashboard without loading them:
+
+- tail(): seeks backwards from EOF in blocks, so the last N records cost O(N)
+- search(): time / level filtered queries through a sidecar index of byte
+  offsets per minute with per-level counts; only matching minutes are read
+- read_new(): cursor-based follow for push updates (survives rotation)
+
+Records span the rotated backups (bot.log, bot.log.1, ... bot.log.N) and are
+parsed from the "[%Y-%m-%d %H:%M:%S] LEVEL ..." format used by
+utils/logging_config.py and logger.py. Lines without a header (tracebacks)
+are attached to the record above them.
+
+The index lives next to the log (.bot.log.index.json), is keyed by inode so it
+follows files through rotation, and is extended incrementally from the last
+indexed byte.
+"""
+
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.atomic_json import atomic_write_json, load_json
+
+LOG_BLOCK_SIZE = 64 * 1024
+LOG_BACKUP_COUNT = 5
+INDEX_VERSION = 1
+# Bytes at the head of a file used to detect inode reuse
+_HEAD_BYTES = 64
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+_LINE_RE = re.compile(
+    r"^\[(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] "
+    r"(?P<level>DEBUG|INFO|WARNING|ERROR|CRITICAL):?"
+    r"(?: \[(?P<source>[^\]]+)\])?"
+    r" ?(?P<message>.*)$"
+)
+
+
+def _min_level(level: Optional[str]) -> int:
+    """Level filter -> minimum severity (None / 'all' = everything)."""
+    if not level or level.lower() == "all":
+        return 0
+    return LEVELS.get(level.upper(), 0)
+
+
+def parse_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse a record header line; None for continuation lines."""
+    m = _LINE_RE.match(line)
+    if not m:
+        return None
+    return {
+        "timestamp": m.group("ts").replace(" ", "T"),
+        "level": m.group("level"),
+        "source": m.group("source"),
+        "message": m.group("message"),
+    }
+
+
+def iter_lines_reverse(path: Path, block_size: int = LOG_BLOCK_SIZE) -> Iterator[str]:
+    """Yield non-empty lines from EOF backwards, reading block_size bytes at a time."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        carry = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + carry).split(b"\n")
+            carry = lines[0]
+            for raw in reversed(lines[1:]):
+                if raw.strip():
+                    yield raw.decode("utf-8", "replace").rstrip("\r")
+        if carry.strip():
+            yield carry.decode("utf-8", "replace").rstrip("\r")
+
+
+def _iter_lines_forward(f, start: int) -> Iterator[Tuple[int, bytes]]:
+    """(offset, raw line) for complete lines from start; stops at a partial last line."""
+    f.seek(start)
+    offset = start
+    for raw in f:
+        if not raw.endswith(b"\n"):
+            return
+        yield offset, raw
+        offset += len(raw)
+
+
+def _records_from_lines(lines: Iterator[str]) -> Iterator[Dict[str, Any]]:
+    """Group chronological lines into records (leading orphan lines are skipped)."""
+    record = None
+    for line in lines:
+        parsed = parse_line(line)
+        if parsed is not None:
+            if record is not None:
+                yield record
+            record = parsed
+        elif record is not None and line.strip():
+            record["message"] += "\n" + line
+    if record is not None:
+        yield record
+
+
+class LogReader:
+    """Tail, search and follow a rotating log file and its backups"""
+
+    def __init__(
+        self,
+        log_path: Path,
+        backup_count: int = LOG_BACKUP_COUNT,
+        index_path: Optional[Path] = None,
+    ):
+        """
+        Initialize log reader
+
+        Args:
+            log_path: Active log file (e.g. logs/bot.log)
+            backup_count: Rotated backups to include (log_path.1 .. log_path.N)
+            index_path: Sidecar index file (default: .<name>.index.json next to the log)
+        """
+        self.log_path = Path(log_path)
+        self.backup_count = backup_count
+        self.index_path = (
+            Path(index_path)
+            if index_path
+            else self.log_path.parent / f".{self.log_path.name}.index.json"
+        )
+
+    def files(self) -> List[Path]:
+        """Existing log files, newest first."""
+        candidates = [self.log_path] + [
+            Path(f"{self.log_path}.{i}") for i in range(1, self.backup_count + 1)
+        ]
+        return [p for p in candidates if p.exists()]
+
+    # ------------------------------------------------------------------
+    # Tail
+    # ------------------------------------------------------------------
+
+    def tail(self, limit: int = 100, level: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Last records, oldest first.
+
+        Args:
+            limit: Max records
+            level: Minimum level (DEBUG..CRITICAL, or None / 'all')
+
+        Returns:
+            List of {timestamp, level, source, message}
+        """
+        if limit <= 0:
+            return []
+        if _min_level(level):
+            return self.search(level=level, limit=limit)
+
+        records: List[Dict[str, Any]] = []
+        for path in self.files():
+            continuation: List[str] = []
+            for line in iter_lines_reverse(path):
+                parsed = parse_line(line)
+                if parsed is None:
+                    continuation.append(line)
+                    continue
+                if continuation:
+                    parsed["message"] += "\n" + "\n".join(reversed(continuation))
+                    continuation = []
+                records.append(parsed)
+                if len(records) >= limit:
+                    return records[::-1]
+        return records[::-1]
+
+    # ------------------------------------------------------------------
+    # Indexed search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        level: Optional[str] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Newest matching records (returned oldest first), reading only index
+        minutes that fall in the time window and contain the requested levels.
+
+        Args:
+            since / until: Inclusive time window
+            level: Minimum level (DEBUG..CRITICAL, or None / 'all')
+            limit: Max records
+        """
+        min_level = _min_level(level)
+        since_ts = since.strftime("%Y-%m-%dT%H:%M:%S") if since else None
+        until_ts = until.strftime("%Y-%m-%dT%H:%M:%S") if until else None
+        since_min = since_ts[:16] if since_ts else None
+        until_min = until_ts[:16] if until_ts else None
+
+        index = self._update_index()
+        found: List[Dict[str, Any]] = []
+        for path in self.files():
+            entry = index["files"].get(self._file_key(path))
+            if not entry:
+                continue
+            minutes = entry["minutes"]
+            with open(path, "rb") as f:
+                for i in range(len(minutes) - 1, -1, -1):
+                    minute, start, counts = minutes[i]
+                    if (since_min and minute < since_min) or (until_min and minute > until_min):
+                        continue
+                    if min_level and not any(LEVELS[lv] >= min_level for lv in counts):
+                        continue
+                    end = minutes[i + 1][1] if i + 1 < len(minutes) else entry["size"]
+                    segment = [
+                        r
+                        for r in self._read_segment(f, start, end)
+                        if LEVELS[r["level"]] >= min_level
+                        and (not since_ts or r["timestamp"] >= since_ts)
+                        and (not until_ts or r["timestamp"] <= until_ts)
+                    ]
+                    found.extend(reversed(segment))
+                    if len(found) >= limit:
+                        return found[:limit][::-1]
+        return found[::-1]
+
+    def _read_segment(self, f, start: int, end: int) -> List[Dict[str, Any]]:
+        """Records whose header starts in [start, end), with trailing continuation lines."""
+
+        def lines():
+            for offset, raw in _iter_lines_forward(f, start):
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                if offset >= end and parse_line(line) is not None:
+                    return
+                yield line
+
+        return list(_records_from_lines(lines()))
+
+    @staticmethod
+    def _file_key(path: Path) -> str:
+        return str(path.stat().st_ino)
+
+    @staticmethod
+    def _head(path: Path) -> str:
+        with open(path, "rb") as f:
+            return f.read(_HEAD_BYTES).decode("utf-8", "replace")
+
+    def _update_index(self) -> Dict[str, Any]:
+        """Load the sidecar index, extend it with newly written bytes, drop vanished files."""
+        index = load_json(self.index_path, None)
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            index = {"version": INDEX_VERSION, "files": {}}
+        old_files = index["files"]
+        files: Dict[str, Any] = {}
+        changed = False
+
+        for path in self.files():
+            key = self._file_key(path)
+            size = path.stat().st_size
+            entry = old_files.get(key)
+            head = self._head(path)
+            if entry is None or entry["size"] > size or not head.startswith(entry["head"]):
+                # New file, truncated, or inode reused by a different file
+                entry = {"size": 0, "head": "", "minutes": []}
+                changed = True
+            if entry["size"] < size:
+                indexed = entry["size"]
+                self._extend_entry(path, entry)
+                entry["head"] = head
+                changed = changed or entry["size"] != indexed
+            files[key] = entry
+
+        if changed or set(files) != set(old_files):
+            index["files"] = files
+            try:
+                atomic_write_json(self.index_path, index, indent=None)
+            except OSError:
+                pass  # Read-only logs dir: index still works for this call
+        index["files"] = files
+        return index
+
+    def _extend_entry(self, path: Path, entry: Dict[str, Any]) -> None:
+        minutes = entry["minutes"]
+        with open(path, "rb") as f:
+            end = entry["size"]
+            for offset, raw in _iter_lines_forward(f, entry["size"]):
+                end = offset + len(raw)
+                parsed = parse_line(raw.decode("utf-8", "replace").rstrip("\r\n"))
+                if parsed is None:
+                    continue
+                minute = parsed["timestamp"][:16]
+                if not minutes or minutes[-1][0] != minute:
+                    minutes.append([minute, offset, {}])
+                counts = minutes[-1][2]
+                counts[parsed["level"]] = counts.get(parsed["level"], 0) + 1
+            entry["size"] = end
+
+    # ------------------------------------------------------------------
+    # Follow
+    # ------------------------------------------------------------------
+
+    def read_new(
+        self, cursor: Optional[Dict[str, int]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, int]]]:
+        """
+        Records appended since cursor.
+
+        Args:
+            cursor: {"inode", "offset"} from the previous call; None starts at EOF
+
+        Returns:
+            (records oldest first, new cursor); cursor is None while the log is missing
+        """
+        if not self.log_path.exists():
+            return [], None
+        st = self.log_path.stat()
+        if cursor is None:
+            return [], {"inode": st.st_ino, "offset": st.st_size}
+
+        records: List[Dict[str, Any]] = []
+        offset = cursor["offset"]
+        if cursor["inode"] != st.st_ino:
+            # Rotated: finish the renamed file, then start the new one from the top
+            rotated = next(
+                (p for p in self.files()[1:] if p.stat().st_ino == cursor["inode"]), None
+            )
+            if rotated is not None:
+                records.extend(self._read_from(rotated, offset)[0])
+            offset = 0
+        elif st.st_size < offset:
+            offset = 0
+
+        new_records, end = self._read_from(self.log_path, offset)
+        records.extend(new_records)
+        return records, {"inode": st.st_ino, "offset": end}
+
+    def _read_from(self, path: Path, start: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Records from complete lines after start, and the offset after the last one."""
+        end = start
+        lines: List[str] = []
+        with open(path, "rb") as f:
+            for offset, raw in _iter_lines_forward(f, start):
+                lines.append(raw.decode("utf-8", "replace").rstrip("\r\n"))
+                end = offset + len(raw)
+        return list(_records_from_lines(iter(lines))), end
@@ -0,0 +1,291 @@
+"""
+Trade Export Service
+
+Streams trade exports without materializing them. Rows come from the SQLite
+trade store in keyset-paginated chunks (no row cap, memory bounded by one
+chunk) and are encoded chunk by chunk as CSV (optionally gzip), Parquet or an
+Arrow IPC stream. Falls back to the DataParser's loaded trades when the
+dashboard is not reading from the store.
+
+Parquet / Arrow output needs pyarrow (optional dependency, imported lazily).
+"""
+
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from database.trades_store import (
+    EXPORT_CHUNK_ROWS,
+    TRADE_EXPORT_COLUMNS,
+    iter_trade_chunks,
+)
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+# CSV layout of the original export endpoint, minus Size / Notes (neither the
+# trade store nor the parsed trades record them, so they were always blank)
+CSV_HEADER = [
+    "Timestamp",
+    "Market",
+    "Strategy",
+    "Entry Price",
+    "Exit Price",
+    "Profit/Loss",
+    "Status",
+]
+
+_COL = {name: i for i, name in enumerate(TRADE_EXPORT_COLUMNS)}
+
+Row = Tuple[Any, ...]
+
+
+def _csv_row(row: Row) -> List[Any]:
+    return [
+        row[_COL["timestamp"]],
+        row[_COL["market"]],
+        row[_COL["strategy"]],
+        row[_COL["yes_price"]],
+        row[_COL["no_price"]],
+        row[_COL["profit_usd"]] if row[_COL["profit_usd"]] is not None else 0,
+        row[_COL["status"]],
+    ]
+
+
+def iter_csv(chunks: Iterable[List[Row]]) -> Iterator[bytes]:
+    """Encode row chunks as CSV, one output block per chunk."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_HEADER)
+    yield buf.getvalue().encode("utf-8")
+    for rows in chunks:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(_csv_row(r) for r in rows)
+        yield buf.getvalue().encode("utf-8")
+
+
+def iter_gzip(blocks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a byte stream incrementally (single gzip member)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in blocks:
+        out = compressor.compress(block)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def _require_pyarrow():
+    """Import pyarrow or raise ImportError with an actionable message."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet/Arrow export (pip install pyarrow)"
+        ) from e
+    return pa
+
+
+def arrow_schema():
+    """Arrow schema for TRADE_EXPORT_COLUMNS."""
+    pa = _require_pyarrow()
+    types = {
+        "id": pa.int64(),
+        "yes_price": pa.float64(),
+        "no_price": pa.float64(),
+        "sum_price": pa.float64(),
+        "profit_pct": pa.float64(),
+        "profit_usd": pa.float64(),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in TRADE_EXPORT_COLUMNS])
+
+
+def _record_batch(pa, schema, rows: List[Row]):
+    columns = list(zip(*rows))
+    return pa.record_batch(
+        [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+class _StreamSink:
+    """Write-only file object that buffers until drained by the response generator."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._pos = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        out = b"".join(self._parts)
+        self._parts.clear()
+        return out
+
+
+def iter_parquet(chunks: Iterable[List[Row]]) -> Iterator[bytes]:
+    """Encode row chunks as Parquet, one row group per chunk."""
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema()
+    sink = _StreamSink()
+    with pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema) as writer:
+        for rows in chunks:
+            writer.write_batch(_record_batch(pa, schema, rows))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def iter_arrow(chunks: Iterable[List[Row]]) -> Iterator[bytes]:
+    """Encode row chunks as an Arrow IPC stream, one record batch per chunk."""
+    pa = _require_pyarrow()
+    schema = arrow_schema()
+    sink = _StreamSink()
+    with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema) as writer:
+        yield sink.drain()
+        for rows in chunks:
+            writer.write_batch(_record_batch(pa, schema, rows))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _parser_trade_row(trade: Dict[str, Any]) -> Row:
+    """DataParser trade dict -> row in TRADE_EXPORT_COLUMNS order."""
+    return (
+        trade.get("id"),
+        trade.get("timestamp", ""),
+        trade.get("symbol", ""),
+        trade.get("strategy", ""),
+        trade.get("arbitrage_type"),
+        trade.get("entry_price"),
+        trade.get("exit_price"),
+        None,
+        trade.get("pnl_pct"),
+        trade.get("pnl_usd"),
+        trade.get("status", ""),
+    )
+
+
+def _parse_bound(value: Optional[str], name: str) -> Optional[datetime]:
+    """Parse a start / end filter, raising ValueError before anything is streamed."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name}: {value!r} (expected an ISO date or timestamp)")
+
+
+def _iter_parser_chunks(
+    data_parser,
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime],
+    market: Optional[str],
+    strategy: Optional[str],
+    chunk_size: int,
+) -> Iterator[List[Row]]:
+    """Chunks from the parser's loaded trades (CSV / sample data), same filters as the store."""
+    chunk: List[Row] = []
+    for trade in data_parser.get_all_trades():
+        if market and trade.get("symbol") != market:
+            continue
+        if strategy and trade.get("strategy") != strategy:
+            continue
+        if start_dt or end_dt:
+            ts = datetime.fromisoformat(trade["timestamp"])
+            if (start_dt and ts < start_dt) or (end_dt and ts > end_dt):
+                continue
+        chunk.append(_parser_trade_row(trade))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_trade_export(
+    data_parser,
+    fmt: str = "csv",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    market: Optional[str] = None,
+    strategy: Optional[str] = None,
+    compress: bool = False,
+    chunk_size: int = EXPORT_CHUNK_ROWS,
+) -> Tuple[Iterator[bytes], str, str]:
+    """
+    Build a streaming trade export.
+
+    Args:
+        data_parser: DataParser (store-backed exports read trades.db directly)
+        fmt: csv | parquet | arrow
+        start_date / end_date: ISO timestamps, inclusive
+        market: Only this market
+        strategy: Only this strategy
+        compress: Gzip the output (csv / arrow; Parquet is compressed internally)
+        chunk_size: Rows read and encoded per block
+
+    Returns:
+        (byte block iterator, mimetype, download filename)
+
+    Raises:
+        ValueError: Unknown format or unparseable start / end date
+        ImportError: pyarrow missing for parquet / arrow
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})"
+        )
+    # Validate everything up front: once the generator runs, the 200 and the
+    # first block have already been sent
+    start_dt = _parse_bound(start_date, "start_date")
+    end_dt = _parse_bound(end_date, "end_date")
+    if fmt != "csv":
+        _require_pyarrow()
+
+    logs_dir = data_parser.get_rollup_logs_dir()
+    if logs_dir is not None:
+        chunks = iter_trade_chunks(
+            logs_dir,
+            start_dt.isoformat() if start_dt else None,
+            end_dt.isoformat() if end_dt else None,
+            market,
+            strategy,
+            chunk_size=chunk_size,
+        )
+    else:
+        chunks = _iter_parser_chunks(
+            data_parser, start_dt, end_dt, market, strategy, chunk_size
+        )
+
+    encoders = {"csv": iter_csv, "parquet": iter_parquet, "arrow": iter_arrow}
+    blocks = encoders[fmt](chunks)
+    mimetype, ext = EXPORT_FORMATS[fmt]
+    filename = f'trades_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{ext}'
+    if compress and fmt != "parquet":
+        blocks = iter_gzip(blocks)
+        mimetype = "application/gzip"
+        filename += ".gz"
+    # Empty blocks would read as end-of-body to some chunked-encoding writers
+    return (block for block in blocks if block), mimetype, filename
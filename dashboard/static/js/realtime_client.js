@@ -65,6 +65,7 @@ class RealtimeClient {
         this.socket.on('signal_detected', (data) => this._handleEvent('signal_detected', data));
         this.socket.on('opportunity_found', (data) => this._handleEvent('opportunity_found', data));
         this.socket.on('portfolio_updated', (data) => this._handleEvent('portfolio_updated', data));
+        this.socket.on('log_records', (data) => this._handleEvent('log_records', data));
         this.socket.on('system_message', (data) => this._handleEvent('system_message', data));
         
         // Ping/pong for keepalive
@@ -135,6 +135,23 @@ class Strategy:
         cursor.execute("SELECT * FROM strategies ORDER BY id")
         return [dict(row) for row in cursor.fetchall()]
 
+    @staticmethod
+    def get_signature() -> tuple:
+        """
+        Cheap fingerprint of the strategies table
+
+        Changes when a strategy is added, removed, enabled/disabled or
+        updated, so callers can cache get_all() until it moves.
+        """
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*), COALESCE(MAX(id), 0),
+                   COALESCE(SUM(updated_at), 0), COALESCE(SUM(enabled), 0)
+            FROM strategies
+        """)
+        return tuple(cursor.fetchone())
+
     @staticmethod
     def get_enabled() -> List[Dict]:
         """Get enabled strategies"""
@@ -287,6 +287,42 @@ class PolymarketHistory:
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    @staticmethod
+    def get_range(
+        start_timestamp: int = None,
+        end_timestamp: int = None,
+        market_ids: List[str] = None,
+    ) -> List[tuple]:
+        """
+        Bulk-load snapshots for all (or the given) markets in one query
+
+        Returns:
+            (market_id, yes_price, no_price, volume, liquidity, timestamp) tuples,
+            oldest first
+        """
+        conn = get_connection()
+        query = (
+            "SELECT market_id, yes_price, no_price, volume, liquidity, timestamp "
+            "FROM polymarket_history WHERE 1=1"
+        )
+        params: List[Any] = []
+
+        if start_timestamp:
+            query += " AND timestamp >= ?"
+            params.append(start_timestamp)
+
+        if end_timestamp:
+            query += " AND timestamp <= ?"
+            params.append(end_timestamp)
+
+        if market_ids:
+            query += f" AND market_id IN ({', '.join('?' * len(market_ids))})"
+            params.extend(market_ids)
+
+        query += " ORDER BY timestamp ASC, id ASC"
+
+        return [tuple(row) for row in conn.execute(query, params)]
+
 
 class TradeJournal:
     """Model for trade journal entries"""
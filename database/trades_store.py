@@ -3,6 +3,11 @@ SQLite store for trades and opportunities.
 
 Replaces unbounded CSV growth for 6+ month unattended runtime.
 Single DB file in logs dir; bounded row counts; dashboard reads last N only.
+
+trade_rollups holds hourly/daily/monthly buckets per (strategy, market), plus a
+per-strategy row with market ROLLUP_ALL_MARKETS, maintained in the same
+transaction as each insert. Rollups are not pruned with the trades table, so
+analytics over them cover full history.
 """
 
 from __future__ import annotations
@@ -10,8 +15,9 @@ from __future__ import annotations
 import csv
 import sqlite3
 import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Bounded row counts for unattended runtime
 TRADES_MAX_ROWS = 500_000
@@ -22,6 +28,17 @@ DB_FILENAME = "trades.db"
 SQLITE_TIMEOUT_SEC = 15.0
 SQLITE_RETRY_BACKOFF_SEC = 0.5
 
+# Rollup grains -> bucket key format (lexicographic order == time order)
+ROLLUP_GRAINS = {
+    "hour": "%Y-%m-%dT%H",
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+ROLLUP_ALL_MARKETS = "*"
+
+# DB paths already known to have trade_rollups, so inserts skip the schema lookup
+_rollups_ready: set = set()
+
 
 def _get_db_path(log_dir: Path) -> Path:
     return Path(log_dir) / DB_FILENAME
@@ -75,11 +92,135 @@ def init_db(log_dir: Path) -> Path:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(timestamp)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_opportunities_ts ON opportunities(timestamp)")
         conn.commit()
+        _ensure_rollups(conn)
     finally:
         conn.close()
     return path
 
 
+def _create_rollups_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS trade_rollups (
+            grain TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            strategy TEXT NOT NULL,
+            market TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            losses INTEGER NOT NULL DEFAULT 0,
+            sum_pnl REAL NOT NULL DEFAULT 0,
+            sum_sq REAL NOT NULL DEFAULT 0,
+            gross_profit REAL NOT NULL DEFAULT 0,
+            gross_loss REAL NOT NULL DEFAULT 0,
+            max_pnl REAL,
+            min_pnl REAL,
+            PRIMARY KEY (grain, bucket, strategy, market)
+        )
+        """
+    )
+
+
+def _ensure_rollups(conn: sqlite3.Connection, log_dir: Optional[Path] = None) -> None:
+    """
+    Create trade_rollups if missing and backfill it from trades (DBs created before rollups).
+
+    With log_dir the result is cached per DB path, so repeated inserts do not query
+    sqlite_master; insert paths drop the cache entry on OperationalError.
+    """
+    key = str(_get_db_path(log_dir)) if log_dir is not None else None
+    if key in _rollups_ready:
+        return
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trade_rollups'"
+    ).fetchone()
+    if not has_table:
+        _create_rollups_table(conn)
+        _rebuild_rollups(conn)
+        conn.commit()
+    if key is not None:
+        _rollups_ready.add(key)
+
+
+def _rollup_buckets(timestamp: str) -> Optional[List[Tuple[str, str]]]:
+    """(grain, bucket) pairs for a trade timestamp, or None if it cannot be parsed."""
+    try:
+        dt = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    return [(grain, dt.strftime(fmt)) for grain, fmt in ROLLUP_GRAINS.items()]
+
+
+def _apply_rollups(
+    conn: sqlite3.Connection, timestamp: str, market: str, strategy: str, profit_usd: float
+) -> None:
+    """Fold one trade into every grain, for its market and for ROLLUP_ALL_MARKETS."""
+    buckets = _rollup_buckets(timestamp)
+    if not buckets:
+        return
+    pnl = float(profit_usd or 0)
+    strategy = strategy or "Unknown"
+    rows = [
+        (
+            grain,
+            bucket,
+            strategy,
+            m,
+            1 if pnl > 0 else 0,
+            1 if pnl < 0 else 0,
+            pnl,
+            pnl * pnl,
+            pnl if pnl > 0 else 0.0,
+            pnl if pnl < 0 else 0.0,
+            pnl,
+            pnl,
+        )
+        for grain, bucket in buckets
+        for m in (market or "", ROLLUP_ALL_MARKETS)
+    ]
+    conn.executemany(
+        """
+        INSERT INTO trade_rollups (grain, bucket, strategy, market, count, wins, losses, sum_pnl, sum_sq, gross_profit, gross_loss, max_pnl, min_pnl)
+        VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (grain, bucket, strategy, market) DO UPDATE SET
+            count = count + 1,
+            wins = wins + excluded.wins,
+            losses = losses + excluded.losses,
+            sum_pnl = sum_pnl + excluded.sum_pnl,
+            sum_sq = sum_sq + excluded.sum_sq,
+            gross_profit = gross_profit + excluded.gross_profit,
+            gross_loss = gross_loss + excluded.gross_loss,
+            max_pnl = max(max_pnl, excluded.max_pnl),
+            min_pnl = min(min_pnl, excluded.min_pnl)
+        """,
+        rows,
+    )
+
+
+def _rebuild_rollups(conn: sqlite3.Connection) -> int:
+    """Recompute trade_rollups from the trades table. Returns number of trades folded."""
+    conn.execute("DELETE FROM trade_rollups")
+    count = 0
+    for ts, market, strategy, usd in conn.execute(
+        "SELECT timestamp, market, strategy, profit_usd FROM trades ORDER BY id ASC"
+    ).fetchall():
+        _apply_rollups(conn, ts, market, strategy, usd)
+        count += 1
+    return count
+
+
+def rebuild_rollups(log_dir: Path) -> int:
+    """Recompute rollups from the trades currently in the store (drops history of pruned trades)."""
+    init_db(log_dir)
+    conn = _connect(log_dir)
+    try:
+        count = _rebuild_rollups(conn)
+        conn.commit()
+        return count
+    finally:
+        conn.close()
+
+
 def _prune_trades(conn: sqlite3.Connection) -> None:
     """Keep only the last TRADES_MAX_ROWS rows."""
     row = conn.execute(
@@ -102,45 +243,28 @@ def _prune_opportunities(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-def insert_trade(
-    log_dir: Path,
-    timestamp: str,
-    market: str,
-    yes_price: float,
-    no_price: float,
-    profit_pct: float,
-    profit_usd: float,
-    status: str = "executed",
-    strategy: str = "Unknown",
-    arbitrage_type: str = "Unknown",
-) -> None:
-    """Append one trade row. Prunes old rows if over cap. Retries once on OperationalError."""
+def _write_trade_rows(log_dir: Path, rows: List[Tuple]) -> None:
+    """
+    Insert trade rows (trades column order, sum_price included) and their rollups
+    in one transaction, then prune if over cap. Retries once on OperationalError.
+    """
     path = _get_db_path(log_dir)
     if not path.exists():
         init_db(log_dir)
-    row = (
-        timestamp,
-        market,
-        yes_price,
-        no_price,
-        yes_price + no_price,
-        profit_pct,
-        profit_usd,
-        status,
-        strategy,
-        arbitrage_type,
-    )
     for attempt in range(2):
         try:
             conn = _connect(log_dir)
             try:
-                conn.execute(
+                _ensure_rollups(conn, log_dir)
+                conn.executemany(
                     """
                     INSERT INTO trades (timestamp, market, yes_price, no_price, sum_price, profit_pct, profit_usd, status, strategy, arbitrage_type)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    row,
+                    rows,
                 )
+                for row in rows:
+                    _apply_rollups(conn, row[0], row[1], row[8], row[6])
                 conn.commit()
                 cur = conn.execute("SELECT COUNT(*) FROM trades")
                 if cur.fetchone()[0] > TRADES_MAX_ROWS:
@@ -149,12 +273,79 @@ def insert_trade(
             finally:
                 conn.close()
         except sqlite3.OperationalError:
+            # e.g. trade_rollups dropped under us: re-check the schema on retry
+            _rollups_ready.discard(str(path))
             if attempt == 0:
                 time.sleep(SQLITE_RETRY_BACKOFF_SEC)
             else:
                 raise
 
 
+def insert_trade(
+    log_dir: Path,
+    timestamp: str,
+    market: str,
+    yes_price: float,
+    no_price: float,
+    profit_pct: float,
+    profit_usd: float,
+    status: str = "executed",
+    strategy: str = "Unknown",
+    arbitrage_type: str = "Unknown",
+) -> None:
+    """Append one trade row. Prunes old rows if over cap. Retries once on OperationalError."""
+    _write_trade_rows(
+        log_dir,
+        [
+            (
+                timestamp,
+                market,
+                yes_price,
+                no_price,
+                yes_price + no_price,
+                profit_pct,
+                profit_usd,
+                status,
+                strategy,
+                arbitrage_type,
+            )
+        ],
+    )
+
+
+def insert_trades(log_dir: Path, trades: List[Dict[str, Any]]) -> int:
+    """
+    Append many trade rows in one transaction (same columns as insert_trade).
+
+    Args:
+        log_dir: Logs directory holding trades.db
+        trades: Dicts with timestamp, market, yes_price, no_price, profit_pct,
+            profit_usd and optional status / strategy / arbitrage_type
+
+    Returns:
+        Number of rows written
+    """
+    if not trades:
+        return 0
+    rows = [
+        (
+            t["timestamp"],
+            t["market"],
+            t["yes_price"],
+            t["no_price"],
+            t["yes_price"] + t["no_price"],
+            t["profit_pct"],
+            t["profit_usd"],
+            t.get("status", "executed"),
+            t.get("strategy", "Unknown"),
+            t.get("arbitrage_type", "Unknown"),
+        )
+        for t in trades
+    ]
+    _write_trade_rows(log_dir, rows)
+    return len(rows)
+
+
 def insert_opportunity(
     log_dir: Path,
     timestamp: str,
@@ -245,6 +436,202 @@ def get_trades(
         conn.close()
 
 
+def get_trades_since(
+    log_dir: Path,
+    after_id: int = 0,
+    limit: int = 10_000,
+) -> List[Dict[str, Any]]:
+    """Return up to limit trades with id > after_id, oldest first (for incremental consumers)."""
+    path = _get_db_path(log_dir)
+    if not path.exists():
+        return []
+    conn = _connect(log_dir)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(
+            """
+            SELECT id, timestamp, market, yes_price, no_price, sum_price, profit_pct, profit_usd, status, strategy, arbitrage_type
+            FROM trades
+            WHERE id > ?
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, limit),
+        ).fetchall()
+        return [_row_to_trade_dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def get_max_trade_id(log_dir: Path) -> Optional[int]:
+    """Return the highest trade id, or None if the store is missing or empty."""
+    path = _get_db_path(log_dir)
+    if not path.exists():
+        return None
+    conn = _connect(log_dir)
+    try:
+        row = conn.execute("SELECT MAX(id) FROM trades").fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+EXPORT_CHUNK_ROWS = 5_000
+TRADE_EXPORT_COLUMNS = (
+    "id", "timestamp", "market", "strategy", "arbitrage_type", "yes_price", "no_price",
+    "sum_price", "profit_pct", "profit_usd", "status",
+)
+
+
+def iter_trade_chunks(
+    log_dir: Path,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    market: Optional[str] = None,
+    strategy: Optional[str] = None,
+    chunk_size: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Yield all matching trades oldest first, chunk_size rows at a time.
+
+    Rows are tuples in TRADE_EXPORT_COLUMNS order. Keyset pagination on id, so
+    memory is bounded by one chunk and each query is short (no long read lock
+    while a slow client drains an export).
+
+    Args:
+        log_dir: Logs directory holding trades.db
+        start / end: ISO timestamps, inclusive
+        market: Only this market
+        strategy: Only this strategy
+        chunk_size: Rows per chunk
+    """
+    path = _get_db_path(log_dir)
+    if not path.exists():
+        return
+    where = ["id > ?"]
+    filters: List[Any] = []
+    if start:
+        where.append("timestamp >= ?")
+        filters.append(datetime.fromisoformat(start).isoformat())
+    if end:
+        where.append("timestamp <= ?")
+        filters.append(datetime.fromisoformat(end).isoformat())
+    if market:
+        where.append("market = ?")
+        filters.append(market)
+    if strategy:
+        where.append("strategy = ?")
+        filters.append(strategy)
+    sql = f"""
+        SELECT {", ".join(TRADE_EXPORT_COLUMNS)}
+        FROM trades
+        WHERE {" AND ".join(where)}
+        ORDER BY id ASC
+        LIMIT ?
+    """
+
+    conn = _connect(log_dir)
+    try:
+        last_id = 0
+        while True:
+            rows = conn.execute(sql, [last_id, *filters, chunk_size]).fetchall()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][0]
+    finally:
+        conn.close()
+
+
+# group_by -> (SQL key expression, finest grain needed when no date filter is given)
+_ROLLUP_GROUPS = {
+    "bucket": ("bucket", None),
+    "market": ("market", "month"),
+    "strategy": ("strategy", "month"),
+    "hour_of_day": ("CAST(substr(bucket, 12, 2) AS INTEGER)", "hour"),
+    # strftime %w: 0=Sunday; shifted so 0=Monday like datetime.weekday()
+    "day_of_week": ("(CAST(strftime('%w', substr(bucket, 1, 10)) AS INTEGER) + 6) % 7", "day"),
+}
+
+
+def query_rollups(
+    log_dir: Path,
+    group_by: str,
+    grain: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    strategy: Optional[str] = None,
+    by_market: bool = False,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Aggregate trade_rollups. O(buckets), independent of trade count.
+
+    Args:
+        log_dir: Logs directory holding trades.db
+        group_by: bucket | market | strategy | hour_of_day | day_of_week
+        grain: hour | day | month (default: coarsest grain that supports group_by;
+            hour when start/end is given)
+        start / end: ISO timestamps, inclusive, at hour resolution
+        strategy: Only this strategy
+        by_market: Read per-market rows instead of the all-markets rows
+
+    Returns:
+        List of {key, count, wins, losses, sum_pnl, sum_sq, gross_profit, gross_loss,
+        max_pnl, min_pnl} sorted by key, or None if the store is missing or empty.
+    """
+    if group_by not in _ROLLUP_GROUPS:
+        raise ValueError(f"Unsupported rollup group_by: {group_by}")
+    path = _get_db_path(log_dir)
+    if not path.exists():
+        return None
+    key_expr, default_grain = _ROLLUP_GROUPS[group_by]
+    if start or end:
+        grain = "hour"
+    grain = grain or default_grain or "month"
+    if grain not in ROLLUP_GRAINS:
+        raise ValueError(f"Unsupported rollup grain: {grain}")
+
+    where = ["grain = ?"]
+    params: List[Any] = [grain]
+    where.append("market != ?" if (by_market or group_by == "market") else "market = ?")
+    params.append(ROLLUP_ALL_MARKETS)
+    hour_fmt = ROLLUP_GRAINS["hour"]
+    if start:
+        where.append("bucket >= ?")
+        params.append(datetime.fromisoformat(start).strftime(hour_fmt))
+    if end:
+        where.append("bucket <= ?")
+        params.append(datetime.fromisoformat(end).strftime(hour_fmt))
+    if strategy:
+        where.append("strategy = ?")
+        params.append(strategy)
+
+    conn = _connect(log_dir)
+    conn.row_factory = sqlite3.Row
+    try:
+        _ensure_rollups(conn)
+        if not conn.execute("SELECT 1 FROM trade_rollups LIMIT 1").fetchone():
+            return None
+        rows = conn.execute(
+            f"""
+            SELECT {key_expr} AS key, SUM(count) AS count, SUM(wins) AS wins, SUM(losses) AS losses,
+                   SUM(sum_pnl) AS sum_pnl, SUM(sum_sq) AS sum_sq,
+                   SUM(gross_profit) AS gross_profit, SUM(gross_loss) AS gross_loss,
+                   MAX(max_pnl) AS max_pnl, MIN(min_pnl) AS min_pnl
+            FROM trade_rollups
+            WHERE {" AND ".join(where)}
+            GROUP BY key
+            ORDER BY key
+            """,
+            params,
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
 def _row_to_trade_dict(r: sqlite3.Row) -> Dict[str, Any]:
     """Map DB row to data_parser-style trade dict."""
     return {
@@ -335,6 +722,7 @@ def migrate_csv_to_db(log_dir: Path) -> int:
                         "INSERT INTO trades (timestamp, market, yes_price, no_price, sum_price, profit_pct, profit_usd, status, strategy, arbitrage_type) VALUES (?,?,?,?,?,?,?,?,?,?)",
                         (ts, market, y, no, y + no, pct, usd, status, strategy, arb),
                     )
+                    _apply_rollups(conn, ts, market, strategy, usd)
                     count += 1
                 except (ValueError, KeyError):
                     continue
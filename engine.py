@@ -120,3 +120,7 @@ class ExecutionEngine:
     def get_trade_history(self) -> List[Dict[str, Any]]:
         """Read-only: executed trades."""
         return list(self.trading_engine.trade_history)
+
+    def close(self) -> None:
+        """Flush buffered trade logs of the internal engine (call on shutdown)."""
+        self.trading_engine.close()
@@ -13,6 +13,8 @@ from typing import Dict, Optional
 from datetime import datetime
 from decimal import Decimal
 
+from utils.rate_limiter import get_rate_limiter
+
 
 class CoinbaseClient:
     """
@@ -58,16 +60,11 @@ class CoinbaseClient:
         self.session = requests.Session()
         self.cache = {}
         self.cache_duration = cache_duration
-        self.last_request_time = 0
-        self.min_request_interval = 0.006  # 10,000 req/min = 0.006s between requests
+        self.rate_limiter = get_rate_limiter("coinbase", calls_per_minute=10_000, burst=50)
 
     def _rate_limit(self) -> None:
         """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def _symbol_to_pair(self, symbol: str) -> str:
         """Convert symbol to Coinbase currency pair"""
@@ -122,6 +119,7 @@ class CoinbaseClient:
             url = f"{self.BASE_URL}/v2/prices/{currency_pair}/spot"
 
             response = self.session.get(url, timeout=10)
+            self.rate_limiter.on_response(response.status_code, response.headers)
 
             if response.status_code == 200:
                 data = response.json()
@@ -8,6 +8,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import time
 
+from utils.rate_limiter import get_rate_limiter
+
 
 class KalshiClient:
     """
@@ -31,8 +33,7 @@ class KalshiClient:
         self.enabled = config.get("enabled", False)
 
         # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0  # seconds
+        self.rate_limiter = get_rate_limiter("kalshi", calls_per_minute=60, burst=1)
 
         # Cache
         self.cache = {}
@@ -111,13 +112,7 @@ class KalshiClient:
 
     def _rate_limit(self) -> None:
         """Enforce rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def _is_cached(self, key: str) -> bool:
         """Check if cached data is still valid"""
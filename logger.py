@@ -16,13 +16,14 @@ import logging
 import os
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 try:
     from database.trades_store import (
         init_db as init_trades_db,
         insert_trade as store_insert_trade,
+        insert_trades as store_insert_trades,
         insert_opportunity as store_insert_opportunity,
         migrate_csv_to_db as migrate_trades_csv,
         migrate_opportunities_csv_to_db as migrate_opportunities_csv,
@@ -31,6 +32,7 @@ try:
 except ImportError:
     init_trades_db = None
     store_insert_trade = None
+    store_insert_trades = None
     store_insert_opportunity = None
     migrate_trades_csv = None
     migrate_opportunities_csv = None
@@ -219,6 +221,7 @@ class Logger:
         status: str = "executed",
         strategy: str = "Unknown",
         arbitrage_type: str = "Unknown",
+        timestamp: Optional[str] = None,
     ) -> None:
         """
         Log a paper trade execution (SQLite primary; no unbounded CSV append).
@@ -231,8 +234,9 @@ class Logger:
             status: Trade status (executed, failed, etc.)
             strategy: Strategy name (e.g., 'polymarket_arbitrage')
             arbitrage_type: Type of arbitrage (e.g., 'Simple', 'Cross-Exchange')
+            timestamp: When the trade happened ("%Y-%m-%d %H:%M:%S", default now)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         price_sum = yes_price + no_price
         profit_pct = ((1.0 - price_sum) / price_sum) * 100 if price_sum else 0.0
         if store_insert_trade is not None:
@@ -267,6 +271,31 @@ class Logger:
                     ]
                 )
 
+    def log_trades(self, trades: List[Dict[str, Any]]) -> None:
+        """
+        Log many paper trades with one store write (batched engines).
+
+        Args:
+            trades: Dicts of log_trade keyword arguments; each keeps its own
+                timestamp (rows without one get the flush time)
+        """
+        if store_insert_trades is None:
+            for trade in trades:
+                self.log_trade(**trade)
+            return
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        for trade in trades:
+            price_sum = trade["yes_price"] + trade["no_price"]
+            rows.append(
+                {
+                    **trade,
+                    "timestamp": trade.get("timestamp") or now,
+                    "profit_pct": ((1.0 - price_sum) / price_sum) * 100 if price_sum else 0.0,
+                }
+            )
+        store_insert_trades(self.log_dir, rows)
+
     def log_opportunity(
         self,
         market: str,
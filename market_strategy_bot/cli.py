@@ -42,6 +42,21 @@ def _system_check(skip_dashboard: bool = False, skip_cycle: bool = False) -> int
     return run_checks(skip_dashboard=skip_dashboard, skip_cycle=skip_cycle)
 
 
+def _startup_profile(budget_ms=None, skip_dashboard: bool = False) -> int:
+    from market_strategy_bot.system_check import run_startup_profile
+    return run_startup_profile(budget_ms=budget_ms, skip_dashboard=skip_dashboard)
+
+
+def _option_value(args, flag: str):
+    """Return the value following flag in args (or after flag=), else None."""
+    for i, arg in enumerate(args):
+        if arg == flag and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
 def main() -> None:
     """Main CLI entry point."""
     args = sys.argv[1:] if len(sys.argv) > 1 else []
@@ -56,6 +71,8 @@ def main() -> None:
         print("  system-check   Run system readiness checks")
         print("    --skip-dashboard  Skip dashboard import/routes check")
         print("    --skip-cycle      Skip engine cycle smoke test")
+        print("    --startup-profile Report per-module import time; fail over budget")
+        print("    --budget-ms N     Import time budget per entry point (ms)")
         sys.exit(0 if not args else 0)
 
     cmd = args[0].lower()
@@ -69,6 +86,12 @@ def main() -> None:
     elif cmd == "system-check":
         skip_dashboard = "--skip-dashboard" in args
         skip_cycle = "--skip-cycle" in args
+        if "--startup-profile" in args:
+            budget = _option_value(args, "--budget-ms")
+            sys.exit(_startup_profile(
+                budget_ms=float(budget) if budget else None,
+                skip_dashboard=skip_dashboard,
+            ))
         sys.exit(_system_check(skip_dashboard=skip_dashboard, skip_cycle=skip_cycle))
     else:
         print(f"Unknown command: {cmd}")
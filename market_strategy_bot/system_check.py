@@ -8,10 +8,17 @@ Validates:
 - Dashboard imports successfully
 - Flask routes register
 - Engine runs one cycle without crashing
+
+With --startup-profile, measures per-module import time of the engine and
+dashboard entry points (via ``python -X importtime``) and fails if the total
+exceeds the configured budget.
 """
 
+import os
+import subprocess
 import sys
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 _ROOT = Path(__file__).resolve().parent.parent
 if str(_ROOT) not in sys.path:
@@ -95,6 +102,109 @@ def _check_engine_cycle() -> bool:
         return False
 
 
+# Entry modules profiled by --startup-profile and their default import budgets (ms).
+# Override with --budget-ms or the STARTUP_IMPORT_BUDGET_MS environment variable.
+STARTUP_PROFILE_TARGETS = {"engine": "run_bot", "dashboard": "dashboard.app"}
+DEFAULT_STARTUP_BUDGET_MS = {"engine": 1000.0, "dashboard": 3000.0}
+
+
+def parse_importtime(output: str) -> List[Tuple[str, float, float, int]]:
+    """
+    Parse ``-X importtime`` stderr output.
+
+    Returns:
+        List of (module, self_ms, cumulative_ms, depth) in the order reported
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        rows.append((name, self_us / 1000.0, cumulative_us / 1000.0, depth))
+    return rows
+
+
+def profile_imports(module: str, top: int = 10) -> Dict:
+    """
+    Import module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Dict with total_ms (cumulative import time of module), slowest
+        (top modules by self time) and error (stderr tail if the import failed)
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_ROOT), env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(_ROOT),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=120,
+    )
+    rows = parse_importtime(proc.stderr)
+    total_ms = next(
+        (cum for name, _self, cum, depth in reversed(rows) if name == module and depth == 0),
+        sum(cum for _name, _self, cum, depth in rows if depth == 0),
+    )
+    slowest = sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+    error = None
+    if proc.returncode != 0:
+        error = "\n".join(
+            line for line in proc.stderr.splitlines() if not line.startswith("import time:")
+        )[-500:]
+    return {"module": module, "total_ms": total_ms, "slowest": slowest, "error": error}
+
+
+def run_startup_profile(
+    budget_ms: Optional[float] = None, skip_dashboard: bool = False, top: int = 10
+) -> int:
+    """
+    Report per-module import time for the engine and dashboard entry points.
+    Returns 0 if every target imports within budget, 1 otherwise.
+    """
+    if budget_ms is None and os.environ.get("STARTUP_IMPORT_BUDGET_MS"):
+        budget_ms = float(os.environ["STARTUP_IMPORT_BUDGET_MS"])
+
+    print("=" * 50)
+    print("Market Strategy Bot - Startup Import Profile")
+    print("=" * 50)
+
+    failed = 0
+    for target, module in STARTUP_PROFILE_TARGETS.items():
+        if skip_dashboard and target == "dashboard":
+            continue
+        budget = budget_ms if budget_ms is not None else DEFAULT_STARTUP_BUDGET_MS[target]
+        result = profile_imports(module, top=top)
+        print(f"{target} ({module}): {result['total_ms']:.1f} ms (budget {budget:.0f} ms)")
+        for name, self_ms, cum_ms, _depth in result["slowest"]:
+            print(f"    {self_ms:8.1f} ms self {cum_ms:9.1f} ms cumulative  {name}")
+        if result["error"]:
+            print(f"[FAIL] {target} import failed: {result['error']}")
+            failed += 1
+        elif result["total_ms"] > budget:
+            print(f"[FAIL] {target} import time exceeds budget")
+            failed += 1
+        else:
+            print(f"[PASS] {target} import time within budget")
+
+    print("=" * 50)
+    return 1 if failed else 0
+
+
 def run_checks(skip_cycle: bool = False, skip_dashboard: bool = False) -> int:
     """
     Run all system checks.
@@ -139,5 +249,9 @@ if __name__ == "__main__":
     p = argparse.ArgumentParser(description="Market Strategy Bot system checks")
     p.add_argument("--skip-cycle", action="store_true", help="Skip engine cycle smoke test")
     p.add_argument("--skip-dashboard", action="store_true", help="Skip dashboard import and routes")
+    p.add_argument("--startup-profile", action="store_true", help="Profile import time against budget")
+    p.add_argument("--budget-ms", type=float, default=None, help="Import time budget per entry point")
     args = p.parse_args()
+    if args.startup_profile:
+        sys.exit(run_startup_profile(budget_ms=args.budget_ms, skip_dashboard=args.skip_dashboard))
     sys.exit(run_checks(skip_cycle=args.skip_cycle, skip_dashboard=args.skip_dashboard))
@@ -12,9 +12,11 @@ Handles:
 
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any
 from logger import get_logger
+from utils.rate_limiter import get_registry as get_rate_limiter_registry
 
 # Import free API clients (from PR #8)
 from apis.price_aggregator import PriceAggregator
@@ -131,6 +133,18 @@ class PolymarketMonitor:
         self.warning_threshold = config.get("rate_limit_warning_threshold", 0.80)
         self.pause_threshold = config.get("rate_limit_pause_threshold", 0.95)
 
+        # Request pacing: a token bucket at the slower of request_delay and
+        # rate_limit_max gives each request its earliest send time, so nothing
+        # sleeps in the caller's thread
+        self.max_concurrent_requests = config.get("max_concurrent_requests", 8)
+        self.price_fetch_budget = config.get("price_fetch_budget_seconds", 5.0)
+        calls_per_minute = config.get("rate_limit_max", 100)
+        if self.request_delay > 0:
+            calls_per_minute = min(calls_per_minute, 60.0 / self.request_delay)
+        self.pacer = get_rate_limiter_registry().register(
+            "polymarket_monitor", calls_per_minute, burst=self.max_concurrent_requests
+        )
+
     def check_connection_health(self) -> bool:
         """
         Test if connection to Polymarket is stable
@@ -277,6 +291,85 @@ class PolymarketMonitor:
             "timestamp": datetime.now().isoformat(),
         }
 
+    def get_market_prices_batch(
+        self, market_ids: List[str], budget_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch prices for many markets concurrently within a time budget
+
+        Each market gets a send slot from the pacer; markets whose slot falls
+        outside the budget (or beyond the per-minute request limit) are left
+        for the next cycle instead of being waited for.
+
+        Args:
+            market_ids: Markets to price, most important first
+            budget_seconds: Latest send time from now (default:
+                            price_fetch_budget_seconds)
+
+        Returns:
+            Dictionary with:
+            - 'prices': market_id -> price dict for every market fetched
+            - 'deferred': market IDs not sent this cycle (in input order)
+            - 'failed': market IDs that were sent but returned no prices
+        """
+        if budget_seconds is None:
+            budget_seconds = self.price_fetch_budget
+
+        # Sliding-window limit: never plan more requests than it still allows
+        usage_pct = self.rate_limiter.get_usage_percentage() / 100.0
+        if usage_pct >= self.pause_threshold:
+            self.logger.log_warning(
+                f"Rate limit at {usage_pct*100:.0f}% - deferring {len(market_ids)} markets "
+                f"(resets in {self.rate_limiter.get_reset_time()}s)"
+            )
+            return {"prices": {}, "deferred": list(market_ids), "failed": []}
+        allowed = self.rate_limiter.get_remaining_requests()
+
+        # Plan send times up front; delays only grow, so the first market
+        # that misses the budget ends the plan
+        scheduled = []
+        for market_id in market_ids[:allowed]:
+            delay = self.pacer.reserve_within(budget_seconds)
+            if delay is None:
+                break
+            scheduled.append((market_id, delay))
+        deferred = list(market_ids[len(scheduled):])
+
+        prices: Dict[str, Any] = {}
+        failed: List[str] = []
+        if scheduled:
+            started = time.monotonic()
+
+            def fetch(slot):
+                market_id, delay = slot
+                wait = started + delay - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)  # Worker thread waits for its send slot
+                try:
+                    return self.get_market_prices(market_id)
+                except Exception as e:
+                    self.logger.log_error(f"Error fetching prices for {market_id}: {str(e)}")
+                    return None
+
+            workers = min(self.max_concurrent_requests, len(scheduled))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(fetch, scheduled))
+
+            for (market_id, _), result in zip(scheduled, results):
+                self.rate_limiter.record_request()
+                if result:
+                    prices[market_id] = result
+                else:
+                    failed.append(market_id)
+
+        if deferred:
+            self.logger.log_warning(
+                f"Price budget exhausted: fetched {len(scheduled)}, "
+                f"deferred {len(deferred)} markets to next cycle"
+            )
+
+        return {"prices": prices, "deferred": deferred, "failed": failed}
+
     def get_crypto_price(self, symbol: str) -> Optional[Dict]:
         """
         Get crypto price using free aggregator (Binance + CoinGecko)
@@ -331,16 +424,18 @@ class PolymarketMonitor:
             market_id: Market identifier
 
         Returns:
-            Dictionary with 'yes' and 'no' prices
+            Dictionary with 'yes' and 'no' prices, or None when the request
+            has no send slot yet (rate limited or paced); retry next cycle
         """
         # Check rate limit
         if not self._check_rate_limit():
             return None
 
-        try:
-            # Add delay between requests
-            time.sleep(self.request_delay)
+        # Pace requests without sleeping: no token now means not yet
+        if not self.pacer.try_acquire():
+            return None
 
+        try:
             if self.live_api_enabled:
                 # Use LIVE Polymarket API
                 prices = self.api.get_market_prices(market_id)
@@ -382,7 +477,7 @@ class PolymarketMonitor:
 
     def _check_rate_limit(self) -> bool:
         """
-        Check rate limit and handle accordingly
+        Check rate limit and handle accordingly (never sleeps)
 
         Returns:
             True if request can proceed, False if rate limited
@@ -393,10 +488,9 @@ class PolymarketMonitor:
         if usage_pct >= self.pause_threshold:
             wait_time = self.rate_limiter.get_reset_time()
             self.logger.log_warning(
-                f"Rate limit at {usage_pct*100:.0f}% - pausing for {wait_time}s"
+                f"Rate limit at {usage_pct*100:.0f}% - pausing requests for {wait_time}s"
             )
-            time.sleep(wait_time + 1)  # Wait for reset plus buffer
-            return True
+            return False
 
         # Check if we're at warning threshold
         if usage_pct >= self.warning_threshold:
@@ -405,12 +499,7 @@ class PolymarketMonitor:
             )
 
         # Check if we can make request
-        if not self.rate_limiter.can_make_request():
-            wait_time = self.rate_limiter.get_reset_time()
-            time.sleep(wait_time + 1)
-            return True
-
-        return True
+        return self.rate_limiter.can_make_request()
 
     def handle_rate_limit(self) -> int:
         """
@@ -443,4 +532,5 @@ class PolymarketMonitor:
             "percentage": self.rate_limiter.get_usage_percentage(),
             "remaining": self.rate_limiter.get_remaining_requests(),
             "reset_in": self.rate_limiter.get_reset_time(),
+            "pacer": self.pacer.snapshot(),
         }
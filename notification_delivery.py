@@ -0,0 +1,320 @@
+"""
+Background Delivery for Notification Channels
+
+Each notification channel (desktop, email, telegram, sound) gets its own
+worker thread, so a slow SMTP handshake or HTTP call never blocks the thread
+that raised the alert.
+
+- Bounded queue per channel: when full, the oldest pending item is dropped.
+- Coalescing: events of the same type arriving within the coalescing window
+  are merged into one digest message.
+- Statistics: queue depth, drops, failures and enqueue-to-delivery latency.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+PRIORITY_RANK = {"INFO": 0, "WARNING": 1, "CRITICAL": 2}
+
+# Messages listed in a digest before the rest are summarized as "... and N more"
+DIGEST_MAX_LINES = 10
+
+# Delivery latency samples kept for the stats percentiles
+LATENCY_SAMPLES = 500
+
+
+class _PendingBatch:
+    """Events of one type waiting out the coalescing window"""
+
+    __slots__ = ("event_type", "priority", "titles", "messages", "first_at")
+
+    def __init__(self, event_type: str, priority: str, title: str, message: str, now: float):
+        self.event_type = event_type
+        self.priority = priority
+        self.titles = [title]
+        self.messages = [message]
+        self.first_at = now
+
+    def add(self, priority: str, title: str, message: str) -> None:
+        if PRIORITY_RANK.get(priority, 0) > PRIORITY_RANK.get(self.priority, 0):
+            self.priority = priority
+        self.titles.append(title)
+        self.messages.append(message)
+
+    def render(self) -> tuple:
+        """(title, message) for delivery; a digest when more than one event merged"""
+        count = len(self.messages)
+        if count == 1:
+            return self.titles[0], self.messages[0]
+
+        distinct_titles = set(self.titles)
+        if len(distinct_titles) == 1:
+            title = f"{self.titles[0]} (x{count})"
+        else:
+            title = f"{count} {self.event_type} notifications"
+
+        lines = []
+        for t, m in list(zip(self.titles, self.messages))[:DIGEST_MAX_LINES]:
+            lines.append(f"• {m}" if len(distinct_titles) == 1 else f"• {t}: {m}")
+        if count > DIGEST_MAX_LINES:
+            lines.append(f"... and {count - DIGEST_MAX_LINES} more")
+        return title, "\n".join(lines)
+
+
+class ChannelWorker:
+    """
+    Delivery thread for one notification channel
+
+    enqueue() never blocks on delivery. The worker sends each batch once its
+    coalescing window has passed, calling send(title, message, priority).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: Callable[[str, str, str], bool],
+        max_queue: int = 100,
+        coalesce_window: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize channel worker (the thread starts on first enqueue)
+
+        Args:
+            name: Channel name
+            send: Delivery function (title, message, priority) -> success
+            max_queue: Maximum pending batches before the oldest is dropped
+            coalesce_window: Seconds to hold an event for others of its type
+            clock: Monotonic time source
+        """
+        self.name = name
+        self._send = send
+        self.max_queue = max_queue
+        self.coalesce_window = coalesce_window
+        self._clock = clock
+
+        self._queue: Deque[_PendingBatch] = deque()
+        # Batches still accepting events, by event type
+        self._open: Dict[str, _PendingBatch] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._busy = False
+        self._flushing = False
+
+        self.enqueued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.sent = 0
+        self.failed = 0
+        self.max_depth = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def enqueue(
+        self, title: str, message: str, priority: str = "INFO", event_type: str = ""
+    ) -> bool:
+        """
+        Queue an event for delivery
+
+        Args:
+            title: Notification title
+            message: Notification message
+            priority: Priority level (CRITICAL, WARNING, INFO)
+            event_type: Coalescing key
+
+        Returns:
+            False if the worker is closed, True otherwise
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            self.enqueued += 1
+            now = self._clock()
+
+            batch = self._open.get(event_type)
+            if batch is not None and self.coalesce_window > 0:
+                if len(batch.messages) >= self.max_queue:
+                    # Keep digests bounded too: drop the oldest event in it
+                    batch.titles.pop(0)
+                    batch.messages.pop(0)
+                    self.dropped += 1
+                batch.add(priority, title, message)
+                self.coalesced += 1
+                return True
+
+            if len(self._queue) >= self.max_queue:
+                oldest = self._queue.popleft()
+                if self._open.get(oldest.event_type) is oldest:
+                    del self._open[oldest.event_type]
+                self.dropped += len(oldest.messages)
+
+            batch = _PendingBatch(event_type, priority, title, message, now)
+            self._queue.append(batch)
+            self._open[event_type] = batch
+            self.max_depth = max(self.max_depth, len(self._queue))
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"notify-{self.name}", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+            return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Deliver everything pending now, ignoring the coalescing window
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue drained in time
+        """
+        deadline = self._clock() + timeout
+        with self._condition:
+            self._flushing = True
+            self._condition.notify_all()
+            try:
+                while self._queue or self._busy:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                self._flushing = False
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the worker thread"""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, counters and delivery latency (ms, enqueue to sent)"""
+        with self._condition:
+            latencies = sorted(self._latencies)
+            pending = sum(len(batch.messages) for batch in self._queue)
+            stats = {
+                "queue_depth": len(self._queue),
+                "pending_events": pending,
+                "max_queue_depth": self.max_depth,
+                "enqueued": self.enqueued,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "sent": self.sent,
+                "failed": self.failed,
+            }
+        if latencies:
+            stats["latency_ms"] = {
+                "mean": sum(latencies) / len(latencies) * 1000,
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+                "max": latencies[-1] * 1000,
+            }
+        else:
+            stats["latency_ms"] = None
+        return stats
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                batch = self._next_ready()
+                if batch is None:
+                    return
+                self._busy = True
+
+            title, message = batch.render()
+            try:
+                success = bool(self._send(title, message, batch.priority))
+            except Exception:
+                success = False
+
+            with self._condition:
+                self._busy = False
+                if success:
+                    self.sent += 1
+                    self._latencies.append(self._clock() - batch.first_at)
+                else:
+                    self.failed += 1
+                self._condition.notify_all()
+
+    def _next_ready(self) -> Optional[_PendingBatch]:
+        """Wait (lock held) for the head batch's window to close; None once closed and empty"""
+        while True:
+            if self._queue:
+                batch = self._queue[0]
+                wait = batch.first_at + self.coalesce_window - self._clock()
+                if wait <= 0 or self._closed or self._flushing:
+                    self._queue.popleft()
+                    if self._open.get(batch.event_type) is batch:
+                        del self._open[batch.event_type]
+                    return batch
+                self._condition.wait(wait)
+            elif self._closed:
+                return None
+            else:
+                self._condition.wait()
+
+
+class NotificationDispatcher:
+    """One ChannelWorker per channel, created on first use"""
+
+    def __init__(
+        self,
+        senders: Dict[str, Callable[[str, str, str], bool]],
+        max_queue: int = 100,
+        coalesce_window: float = 2.0,
+    ):
+        """
+        Initialize dispatcher
+
+        Args:
+            senders: channel name -> delivery function (title, message, priority)
+            max_queue: Pending batch limit per channel
+            coalesce_window: Coalescing window in seconds
+        """
+        self._senders = senders
+        self.max_queue = max_queue
+        self.coalesce_window = coalesce_window
+        self._workers: Dict[str, ChannelWorker] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, channel: str, title: str, message: str, priority: str, event_type: str
+    ) -> bool:
+        """Queue an event on channel; False for unknown channels"""
+        if channel not in self._senders:
+            return False
+        with self._lock:
+            worker = self._workers.get(channel)
+            if worker is None:
+                worker = ChannelWorker(
+                    channel, self._senders[channel], self.max_queue, self.coalesce_window
+                )
+                self._workers[channel] = worker
+        return worker.enqueue(title, message, priority, event_type)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Deliver every pending event on every channel"""
+        with self._lock:
+            workers = list(self._workers.values())
+        return all([worker.flush(timeout) for worker in workers])
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush and stop every channel worker"""
+        with self._lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            worker.close(timeout)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-channel worker stats"""
+        with self._lock:
+            workers = dict(self._workers)
+        return {name: worker.stats() for name, worker in workers.items()}
@@ -12,14 +12,33 @@ Features:
 - Rate limiting to prevent spam
 - Quiet hours support
 - Priority-based routing
+- Background delivery per channel with coalescing (notification_delivery);
+  notifiers not closed explicitly are flushed and closed at interpreter exit
 """
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from logger import get_logger
+from notification_delivery import NotificationDispatcher
 from notification_rate_limiter import NotificationRateLimiter
 from quiet_hours import QuietHours
+import atexit
 import platform
+import threading
+import weakref
+
+
+# Notifiers not yet closed: queued notifications are delivered at exit
+_open_notifiers: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_notifiers_at_exit() -> None:
+    for notifier in list(_open_notifiers):
+        try:
+            notifier.close()
+        except Exception:
+            pass  # Best effort this late in shutdown
 
 
 class Notifier:
@@ -126,6 +145,32 @@ class Notifier:
         self.notification_count = 0
         self.last_notification = None
 
+        # Reused connections: one SMTP session and one keep-alive HTTP session
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._http_session = None
+
+        # Background delivery: notify() queues per channel and returns at once
+        delivery_config = notif_config.get("delivery", {})
+        if delivery_config.get("async", True):
+            self.dispatcher = NotificationDispatcher(
+                {
+                    "desktop": lambda title, message, priority: self.send_desktop_notification(
+                        title, message
+                    ),
+                    "email": lambda title, message, priority: self.send_email(
+                        f"{title}: {message}"
+                    ),
+                    "telegram": lambda title, message, priority: self.send_push(title, message),
+                    "sound": lambda title, message, priority: self.play_alert_sound(priority),
+                },
+                max_queue=delivery_config.get("max_queue", 100),
+                coalesce_window=delivery_config.get("coalesce_window_seconds", 2.0),
+            )
+        else:
+            self.dispatcher = None
+        _open_notifiers.add(self)
+
         # Try to import plyer for desktop notifications
         self.plyer_available = False
         try:
@@ -216,6 +261,16 @@ class Notifier:
         # Check each channel and send if allowed
         sent_any = False
 
+        if self.dispatcher is not None:
+            for channel in channels:
+                if channel != "sound" and not self.should_send(event_type, channel):
+                    continue
+                accepted = self.dispatcher.submit(channel, title, message, priority, event_type)
+                if accepted and channel != "sound":
+                    sent_any = True
+            self._record_sent(sent_any)
+            return
+
         if "desktop" in channels and self.should_send(event_type, "desktop"):
             if self.send_desktop_notification(title, message):
                 sent_any = True
@@ -231,13 +286,41 @@ class Notifier:
         if "sound" in channels:
             self.play_alert_sound(priority)
 
-        # Record notification if any channel succeeded
+        self._record_sent(sent_any)
+
+    def _record_sent(self, sent_any: bool) -> None:
+        """Record notification if any channel succeeded (or accepted it for delivery)"""
         if sent_any:
             self.notification_count += 1
             self.last_notification = datetime.now()
             if self.rate_limiter:
                 self.rate_limiter.record()
 
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Deliver queued notifications now, without waiting out coalescing windows
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if every channel queue drained in time
+        """
+        if self.dispatcher is None:
+            return True
+        return self.dispatcher.flush(timeout)
+
+    def close(self) -> None:
+        """Deliver queued notifications and close the SMTP / HTTP connections"""
+        _open_notifiers.discard(self)
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        with self._smtp_lock:
+            self._close_smtp()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+
     def determine_priority(self, event: str) -> list:
         """
         Determine which notification channels to use based on event priority
@@ -346,19 +429,44 @@ class Notifier:
 
             msg.attach(MIMEText(message, "plain"))
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_from, self.email_password)
-            server.send_message(msg)
-            server.quit()
+            with self._smtp_lock:
+                try:
+                    self._smtp_connection().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Server closed the idle session: reconnect once
+                    self._close_smtp()
+                    self._smtp_connection().send_message(msg)
 
             self.logger.log_warning(f"[EMAIL SENT] {message}")
             return True
 
         except Exception as e:
+            with self._smtp_lock:
+                self._close_smtp()
             self.logger.log_error(f"Email error: {str(e)}")
             return False
 
+    def _smtp_connection(self):
+        """Logged-in SMTP session, opened on first use and then reused (lock held)"""
+        if self._smtp is None:
+            import smtplib
+
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+            server.starttls()
+            server.login(self.email_from, self.email_password)
+            self._smtp = server
+        return self._smtp
+
+    def _close_smtp(self) -> None:
+        """Drop the SMTP session (lock held)"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None
+
     def send_push(self, title: str, message: str) -> bool:
         """
         Send push notification via Telegram
@@ -375,7 +483,11 @@ class Notifier:
 
         # Send to Telegram
         try:
-            import requests
+            if self._http_session is None:
+                import requests
+
+                # Keep-alive: later messages reuse the TLS connection
+                self._http_session = requests.Session()
 
             url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
             payload = {
@@ -383,7 +495,7 @@ class Notifier:
                 "text": f"🚨 *{title}*\n\n{message}",
                 "parse_mode": "Markdown",
             }
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._http_session.post(url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 self.logger.log_warning(f"[TELEGRAM SENT] {title}: {message}")
@@ -611,4 +723,8 @@ class Notifier:
         # Add quiet hours status
         stats["quiet_hours"] = self.quiet_hours.get_status()
 
+        # Per-channel queue depth, drops and delivery latency
+        if self.dispatcher is not None:
+            stats["delivery"] = self.dispatcher.stats()
+
         return stats
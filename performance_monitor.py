@@ -10,15 +10,149 @@ Measures and tracks system performance metrics:
 
 Provides performance grades and competitive position estimates.
 Identifies bottlenecks and suggests optimizations.
+
+Per-stage cycle tracing: wrap cycle stages in ``monitor.span("fetch")`` and
+each stage feeds a fixed-memory StreamingHistogram (O(1) record,
+O(buckets) quantiles) exposed via get_stage_statistics().
 """
 
 from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import math
 import time
 import statistics
 from logger import get_logger
 
 
+class StreamingHistogram:
+    """
+    Fixed-memory, log-bucketed latency histogram (HDR-style).
+
+    Buckets grow geometrically by ``precision`` so every recorded value is
+    within that relative error of its bucket. Recording is O(1); quantiles
+    walk the buckets once, O(buckets), independent of how many values were seen.
+    """
+
+    def __init__(
+        self,
+        min_value: float = 0.001,
+        max_value: float = 3_600_000.0,
+        precision: float = 0.02,
+    ):
+        """
+        Initialize histogram
+
+        Args:
+            min_value: Smallest distinguishable value (values below share bucket 0)
+            max_value: Largest tracked value (values above share the last bucket)
+            precision: Relative bucket width (0.02 = 2% error)
+        """
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(precision)
+        self._bucket_count = int(math.ceil(math.log(max_value / min_value) / self._log_base)) + 2
+        self.counts: List[int] = [0] * self._bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def record(self, value: float) -> None:
+        """Record a single value in O(1)"""
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = min(
+                int(math.log(value / self.min_value) / self._log_base) + 1,
+                self._bucket_count - 1,
+            )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative (geometric mid-point) value of a bucket, clamped to observed range"""
+        if index == 0:
+            value = self.min_value
+        else:
+            value = self.min_value * math.exp((index - 0.5) * self._log_base)
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """
+        Return values at the given quantiles (0-1) in a single pass over buckets
+
+        Args:
+            qs: Quantiles in ascending order
+
+        Returns:
+            List of values, one per quantile (0.0 when empty)
+        """
+        if self.count == 0:
+            return [0.0 for _ in qs]
+        results: List[float] = []
+        targets = [max(1, int(math.ceil(q * self.count))) for q in qs]
+        cumulative = 0
+        target_idx = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            cumulative += bucket_count
+            while target_idx < len(targets) and cumulative >= targets[target_idx]:
+                results.append(self._bucket_value(index))
+                target_idx += 1
+            if target_idx == len(targets):
+                break
+        while len(results) < len(qs):
+            results.append(self.max)
+        return results
+
+    def quantile(self, q: float) -> float:
+        """Return value at quantile q (0-1)"""
+        return self.quantiles([q])[0]
+
+    def mean(self) -> float:
+        """Exact mean of recorded values"""
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics in the same shape as PerformanceMonitor.get_statistics"""
+        if self.count == 0:
+            return {
+                "min": 0.0,
+                "max": 0.0,
+                "mean": 0.0,
+                "median": 0.0,
+                "p95": 0.0,
+                "p99": 0.0,
+                "count": 0,
+            }
+        median, p95, p99 = self.quantiles([0.5, 0.95, 0.99])
+        return {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean(),
+            "median": median,
+            "p95": p95,
+            "p99": p99,
+            "count": self.count,
+        }
+
+    def reset(self) -> None:
+        """Clear all recorded values"""
+        self.counts = [0] * self._bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+
 class PerformanceMonitor:
     """
     Tracks and analyzes system performance in real-time
@@ -48,16 +182,32 @@ class PerformanceMonitor:
         self.config = config
         self.logger = get_logger()
 
-        # Timing measurements (lists to track history)
-        self.detection_times: List[float] = []  # Time to find opportunities
-        self.decision_times: List[float] = []  # Time to make trading decision
-        self.execution_times: List[float] = []  # Time to execute trade
-        self.network_latencies: List[float] = []  # API response times
-        self.total_cycle_times: List[float] = []  # End-to-end processing time
-
-        # Keep last N measurements (sliding window)
+        # Keep last N measurements (sliding window, O(1) trim)
         self.history_size = config.get("performance_history_size", 100)
 
+        # Timing measurements (bounded deques to track recent history)
+        self.detection_times: deque = deque(maxlen=self.history_size)  # Time to find opportunities
+        self.decision_times: deque = deque(maxlen=self.history_size)  # Time to make trading decision
+        self.execution_times: deque = deque(maxlen=self.history_size)  # Time to execute trade
+        self.network_latencies: deque = deque(maxlen=self.history_size)  # API response times
+        self.total_cycle_times: deque = deque(maxlen=self.history_size)  # End-to-end processing time
+
+        # Streaming histograms for quantiles (fixed memory, no sorting)
+        self._series: Dict[str, deque] = {
+            "detection": self.detection_times,
+            "decision": self.decision_times,
+            "execution": self.execution_times,
+            "network": self.network_latencies,
+            "total_cycle": self.total_cycle_times,
+        }
+        self._histograms: Dict[str, StreamingHistogram] = {
+            metric: StreamingHistogram() for metric in self._series
+        }
+
+        # Per-stage cycle spans (fetch, alerts, risk, strategy.<name>, execution, ...)
+        self.stage_histograms: Dict[str, StreamingHistogram] = {}
+        self.last_stage_times: Dict[str, float] = {}
+
         # Current cycle tracking
         self.current_cycle_start: Optional[float] = None
         self.current_detection_start: Optional[float] = None
@@ -96,7 +246,7 @@ class PerformanceMonitor:
         cycle_time_ms = (time.time() - self.current_cycle_start) * 1000
 
         # Record the measurement
-        self._record_measurement(self.total_cycle_times, cycle_time_ms)
+        self._record_measurement("total_cycle", cycle_time_ms)
 
         # Track statistics
         self.total_cycles += 1
@@ -124,7 +274,7 @@ class PerformanceMonitor:
         detection_time_ms = (time.time() - start_time) * 1000
 
         # Record the measurement
-        self._record_measurement(self.detection_times, detection_time_ms)
+        self._record_measurement("detection", detection_time_ms)
 
         # Log if detection was slow
         if detection_time_ms > 100:  # More than 100ms is concerning
@@ -148,7 +298,7 @@ class PerformanceMonitor:
         decision_time_ms = (time.time() - start_time) * 1000
 
         # Record the measurement
-        self._record_measurement(self.decision_times, decision_time_ms)
+        self._record_measurement("decision", decision_time_ms)
 
         return decision_time_ms
 
@@ -165,7 +315,7 @@ class PerformanceMonitor:
         execution_time_ms = (time.time() - start_time) * 1000
 
         # Record the measurement
-        self._record_measurement(self.execution_times, execution_time_ms)
+        self._record_measurement("execution", execution_time_ms)
 
         return execution_time_ms
 
@@ -185,7 +335,7 @@ class PerformanceMonitor:
         latency_ms = (time.time() - start_time) * 1000
 
         # Record the measurement
-        self._record_measurement(self.network_latencies, latency_ms)
+        self._record_measurement("network", latency_ms)
 
         # Log if latency is high
         if latency_ms > self.target_network_latency:
@@ -195,19 +345,63 @@ class PerformanceMonitor:
 
         return latency_ms
 
-    def _record_measurement(self, measurement_list: List[float], value: float) -> None:
+    def _record_measurement(self, metric: str, value: float) -> None:
         """
-        Record a measurement and maintain sliding window
+        Record a measurement in its sliding window and streaming histogram
 
         Args:
-            measurement_list: List to store measurement in
+            metric: Metric name ('detection', 'decision', 'execution', 'network', 'total_cycle')
             value: Measurement value to record
         """
-        measurement_list.append(value)
+        self._series[metric].append(value)  # deque(maxlen) drops the oldest in O(1)
+        self._histograms[metric].record(value)
 
-        # Maintain sliding window (keep only last N measurements)
-        if len(measurement_list) > self.history_size:
-            measurement_list.pop(0)
+    @contextmanager
+    def span(self, stage: str):
+        """
+        Time a cycle stage and record it in the stage's streaming histogram
+
+        Usage:
+            with monitor.span("fetch"):
+                markets = fetch()
+
+        Args:
+            stage: Stage name (e.g. 'fetch', 'alerts', 'strategy.arbitrage')
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, (time.perf_counter() - start) * 1000)
+
+    def record_stage(self, stage: str, duration_ms: float) -> None:
+        """
+        Record a stage duration measured elsewhere
+
+        Args:
+            stage: Stage name
+            duration_ms: Duration in milliseconds
+        """
+        histogram = self.stage_histograms.get(stage)
+        if histogram is None:
+            histogram = self.stage_histograms[stage] = StreamingHistogram()
+        histogram.record(duration_ms)
+        self.last_stage_times[stage] = duration_ms
+
+    def get_stage_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-stage latency statistics
+
+        Returns:
+            Dictionary mapping stage name to min/max/mean/median/p95/p99/count
+            plus 'last' (most recent duration), all in milliseconds
+        """
+        stats = {}
+        for stage, histogram in self.stage_histograms.items():
+            stage_stats = histogram.snapshot()
+            stage_stats["last"] = self.last_stage_times.get(stage, 0.0)
+            stats[stage] = stage_stats
+        return stats
 
     def get_statistics(self, metric: str = "total_cycle") -> Dict[str, float]:
         """
@@ -218,53 +412,11 @@ class PerformanceMonitor:
                    'network', 'total_cycle')
 
         Returns:
-            Dictionary with min, max, mean, median, p95, p99 values
+            Dictionary with min, max, mean, median, p95, p99 values over all
+            measurements since the last reset (from the streaming histogram)
         """
-        # Select the appropriate measurement list
-        metric_map = {
-            "detection": self.detection_times,
-            "decision": self.decision_times,
-            "execution": self.execution_times,
-            "network": self.network_latencies,
-            "total_cycle": self.total_cycle_times,
-        }
-
-        measurements = metric_map.get(metric, self.total_cycle_times)
-
-        if not measurements:
-            return {
-                "min": 0.0,
-                "max": 0.0,
-                "mean": 0.0,
-                "median": 0.0,
-                "p95": 0.0,
-                "p99": 0.0,
-                "count": 0,
-            }
-
-        sorted_measurements = sorted(measurements)
-
-        # Calculate percentiles
-        p95_index = int(len(sorted_measurements) * 0.95)
-        p99_index = int(len(sorted_measurements) * 0.99)
-
-        return {
-            "min": min(measurements),
-            "max": max(measurements),
-            "mean": statistics.mean(measurements),
-            "median": statistics.median(measurements),
-            "p95": (
-                sorted_measurements[p95_index]
-                if p95_index < len(sorted_measurements)
-                else sorted_measurements[-1]
-            ),
-            "p99": (
-                sorted_measurements[p99_index]
-                if p99_index < len(sorted_measurements)
-                else sorted_measurements[-1]
-            ),
-            "count": len(measurements),
-        }
+        histogram = self._histograms.get(metric, self._histograms["total_cycle"])
+        return histogram.snapshot()
 
     def analyze_bottlenecks(self) -> Dict[str, Any]:
         """
@@ -550,9 +702,10 @@ class PerformanceMonitor:
             return {"status": "insufficient_data"}
 
         # Compare first half vs second half of recent measurements
-        mid_point = len(self.total_cycle_times) // 2
-        first_half = self.total_cycle_times[:mid_point]
-        second_half = self.total_cycle_times[mid_point:]
+        recent = list(self.total_cycle_times)
+        mid_point = len(recent) // 2
+        first_half = recent[:mid_point]
+        second_half = recent[mid_point:]
 
         avg_first = statistics.mean(first_half)
         avg_second = statistics.mean(second_half)
@@ -613,6 +766,10 @@ class PerformanceMonitor:
         self.execution_times.clear()
         self.network_latencies.clear()
         self.total_cycle_times.clear()
+        for histogram in self._histograms.values():
+            histogram.reset()
+        self.stage_histograms.clear()
+        self.last_stage_times.clear()
         self.total_cycles = 0
         self.slow_cycles = 0
         self.logger.log_warning("Performance statistics reset")
@@ -4,7 +4,7 @@ Documentation: https://docs.polymarket.com/
 
 Official Polymarket CLOB (Central Limit Order Book) API client
 - Public endpoints (no authentication needed for market data)
-- Rate limiting: respects API limits with exponential backoff
+- Rate limiting: shared token bucket; honours 429 Retry-After, else exponential backoff
 - Error handling: retries with exponential backoff
 """
 
@@ -13,6 +13,7 @@ import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from logger import get_logger
+from utils.rate_limiter import get_rate_limiter, parse_retry_after
 
 
 class PolymarketAPI:
@@ -39,6 +40,7 @@ class PolymarketAPI:
         self.retry_attempts = retry_attempts
         self.logger = get_logger()
         self.session = requests.Session()
+        self.rate_limiter = get_rate_limiter("polymarket_clob", calls_per_minute=600, burst=20)
         self.session.headers.update(
             {
                 "User-Agent": "Market-Strategy-Testing-Bot/1.0",
@@ -66,17 +68,21 @@ class PolymarketAPI:
         url = f"{self.BASE_URL}{endpoint}"
 
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(url, params=params, timeout=self.timeout)
 
             # Check for rate limiting
             if response.status_code == 429:
                 if retry_count < self.retry_attempts:
-                    # Exponential backoff: 2^retry_count seconds
-                    wait_time = 2**retry_count
+                    # Retry-After if the server sent one, else exponential backoff: 2^retry_count seconds.
+                    # Pausing the shared bucket makes every caller wait, not just this retry.
+                    wait_time = parse_retry_after(response.headers.get("Retry-After"))
+                    if wait_time is None:
+                        wait_time = 2**retry_count
+                    self.rate_limiter.penalize(wait_time)
                     self.logger.log_warning(
-                        f"Rate limited by API. Waiting {wait_time}s before retry..."
+                        f"Rate limited by API. Waiting {wait_time:.0f}s before retry..."
                     )
-                    time.sleep(wait_time)
                     return self._make_request(endpoint, params, retry_count + 1)
                 else:
                     self.logger.log_error("Rate limit exceeded, max retries reached")
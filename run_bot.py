@@ -41,39 +41,60 @@ from polymarket_api import PolymarketAPI
 from services.secure_config_manager import SecureConfigManager
 from config.config_loader import get_config
 from services.data_flow_manager import DataFlowManager
-from clients import (
-    PolymarketClient,
-    CoinGeckoClient,
-    MockMarketClient,
-    MockCryptoClient,
-)
+from performance_monitor import PerformanceMonitor
+from utils.rate_limiter import get_registry as get_rate_limiter_registry
+from utils.activity_feed import ACTIVITY_FEED_NAME, append_activity
+from telegram_delivery import TELEGRAM_API_URL, create_outbox
 import os
 import requests
 
 print(">>> run_bot.py STARTED <<<", flush=True)
 
-# Import all available strategies
-from strategies.mean_reversion_strategy import MeanReversionStrategy
-from strategies.momentum_strategy import MomentumStrategy
-from strategies.news_strategy import NewsStrategy
-from strategies.volatility_breakout_strategy import VolatilityBreakoutStrategy
-from strategies.weather_trading import WeatherTradingStrategy
-from strategies.btc_arbitrage import BTCArbitrageStrategy
-from strategies.polymarket_arbitrage import PolymarketArbitrageStrategy
-from strategies.statistical_arb_strategy import StatisticalArbStrategy
-from strategies.contrarian_strategy import ContrarianStrategy
+# Strategies are imported by StrategyManager only when enabled (see
+# strategy_manager.STRATEGY_REGISTRY); data clients are imported in
+# _initialize_data_clients only for the sources that are configured.
 
 
 class SimpleTelegramBot:
-    """Simple synchronous telegram bot for notifications"""
+    """
+    Simple telegram bot for notifications
+
+    Messages go through a TelegramOutbox: send_message() queues and returns,
+    and a background worker sends them paced, batched and persisted. With
+    restore_outbox=False nothing is sent (and the outbox file is untouched)
+    until start_delivery().
+    """
 
-    def __init__(self, token: str, chat_id: str):
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        outbox_path: Optional[Path] = None,
+        delivery_config: Optional[Dict[str, Any]] = None,
+        api_url: str = TELEGRAM_API_URL,
+        restore_outbox: bool = True,
+    ):
         self.token = token
         self.chat_id = chat_id
-        self.base_url = f"https://api.telegram.org/bot{token}"
+        self.base_url = f"{api_url.rstrip('/')}/bot{token}"
+        self.outbox = create_outbox(
+            token,
+            chat_id,
+            delivery_config,
+            outbox_path=outbox_path,
+            api_url=api_url,
+            restore=restore_outbox,
+        )
+
+    def start_delivery(self) -> None:
+        """Resend persisted messages and start sending queued ones"""
+        if self.outbox is not None:
+            self.outbox.restore()
 
     def send_message(self, text: str) -> bool:
-        """Send a message via telegram API"""
+        """Queue a message via telegram API (sent directly if delivery.async is off)"""
+        if self.outbox is not None:
+            return self.outbox.submit(text)
         try:
             url = f"{self.base_url}/sendMessage"
             response = requests.post(
@@ -91,17 +112,25 @@ class SimpleTelegramBot:
     def test_connection(self) -> Dict[str, Any]:
         """Test telegram API connection"""
         try:
-            url = f"{self.base_url}/getMe"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            if self.outbox is not None:
+                result = self.outbox.get_me()
+            else:
+                url = f"{self.base_url}/getMe"
+                response = requests.get(url, timeout=10)
+                response.raise_for_status()
+                result = response.json()["result"]
             return {
                 "success": True,
-                "bot_name": data["result"].get("username", "Unknown"),
+                "bot_name": result.get("username", "Unknown"),
             }
         except Exception:
             return {"success": False, "error": "Connection failed"}
 
+    def close(self, timeout: float = 5.0) -> None:
+        """Send what the rate limit allows, persist the rest for the next start"""
+        if self.outbox is not None:
+            self.outbox.close(timeout)
+
 
 class BotRunner:
     """Main bot runner that orchestrates all strategies and trading"""
@@ -131,10 +160,19 @@ class BotRunner:
             self.config = self._load_config(config_path)
             self.config_loader = None
 
+        # Shared API rate limiters: config rate_limits overrides client defaults
+        get_rate_limiter_registry().configure(self.config.get("rate_limits"))
+
         # Initialize core components (single execution engine; StrategyManager routes to it)
         self.execution_engine = ExecutionEngine(self.config)
         self._restore_paper_engine_state()
-        self.strategy_manager = StrategyManager(self.config, self.execution_engine)
+        # Per-stage cycle tracing (fetch, alerts, risk, strategy.<name>, execution, persistence)
+        self.performance_monitor = PerformanceMonitor(self.config)
+        self.strategy_manager = StrategyManager(
+            self.config,
+            self.execution_engine,
+            performance_monitor=self.performance_monitor,
+        )
         self.polymarket_api = PolymarketAPI(
             timeout=self.config.get("api_timeout_seconds", 10),
             retry_attempts=self.config.get("api_retry_attempts", 3),
@@ -176,7 +214,23 @@ class BotRunner:
 
         self.alert_system = get_alert_system(self.config)
 
-        # Initialize telegram bot for notifications (simple sync version)
+        # Setup directories (env-configurable via STATE_DIR, LOG_DIR)
+        try:
+            from market_strategy_bot.paths import get_state_dir, get_log_dir
+            self.logs_dir = get_log_dir()
+            self.state_dir = get_state_dir()
+        except ImportError:
+            self.logs_dir = Path(os.environ.get("LOG_DIR", "logs"))
+            self.state_dir = Path(os.environ.get("STATE_DIR", "state"))
+        self.logs_dir.mkdir(exist_ok=True)
+        self.activity_log_path = self.logs_dir / "activity.json"
+        self.activity_feed_path = self.logs_dir / ACTIVITY_FEED_NAME
+        self.state_dir.mkdir(exist_ok=True)
+        self.state_path = self.state_dir / "bot_state.json"
+        self.control_path = self.state_dir / "control.json"
+        self.engine_health_path = self.state_dir / "engine_health.json"
+
+        # Initialize telegram bot for notifications (queued; outbox persisted in state/)
         self.telegram_bot = None
         telegram_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
         telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
@@ -184,7 +238,13 @@ class BotRunner:
         if telegram_token and telegram_chat_id:
             try:
                 self.telegram_bot = SimpleTelegramBot(
-                    token=telegram_token, chat_id=telegram_chat_id
+                    token=telegram_token,
+                    chat_id=telegram_chat_id,
+                    outbox_path=self.state_dir / "telegram_outbox.json",
+                    delivery_config=self.config.get("telegram", {}).get("delivery"),
+                    # The outbox file is shared with any running engine: resend
+                    # it only once run() holds the engine lock
+                    restore_outbox=False,
                 )
                 # Test connection
                 test_result = self.telegram_bot.test_connection()
@@ -196,6 +256,7 @@ class BotRunner:
                     self.logger.log_warning(
                         f"⚠️ Telegram bot failed: {test_result.get('error', 'Unknown error')}"
                     )
+                    self.telegram_bot.close(timeout=0)
                     self.telegram_bot = None
             except Exception as e:
                 self.logger.log_warning(f"⚠️ Telegram bot failed: {e}")
@@ -205,20 +266,7 @@ class BotRunner:
                 "⚠️ Telegram not configured (set TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID)"
             )
 
-        # Setup directories (env-configurable via STATE_DIR, LOG_DIR)
-        try:
-            from market_strategy_bot.paths import get_state_dir, get_log_dir
-            self.logs_dir = get_log_dir()
-            self.state_dir = get_state_dir()
-        except ImportError:
-            self.logs_dir = Path(os.environ.get("LOG_DIR", "logs"))
-            self.state_dir = Path(os.environ.get("STATE_DIR", "state"))
-        self.logs_dir.mkdir(exist_ok=True)
-        self.activity_log_path = self.logs_dir / "activity.json"
-        self.state_dir.mkdir(exist_ok=True)
-        self.state_path = self.state_dir / "bot_state.json"
-        self.control_path = self.state_dir / "control.json"
-        self.engine_health_path = self.state_dir / "engine_health.json"
+        self.engine_lock = None  # EngineLock, acquired in run()
         self._last_prices_dict = {}
         self._last_bot_state_hash: Optional[str] = None
         self.paused = False
@@ -355,6 +403,7 @@ class BotRunner:
             Tuple of (market_client, crypto_client)
         """
         config_manager = SecureConfigManager()
+        self._market_client_is_live = False
 
         # Initialize Market Client (Polymarket or Mock)
         market_client = None
@@ -364,6 +413,8 @@ class BotRunner:
             )
             creds = config_manager.get_api_credentials("polymarket")
             try:
+                from clients.polymarket_client import PolymarketClient
+
                 endpoint = creds.get("endpoint", "https://clob.polymarket.com")
                 api_key = creds.get("api_key")
                 market_client = PolymarketClient(endpoint=endpoint, api_key=api_key)
@@ -371,6 +422,7 @@ class BotRunner:
                 # Test connection
                 result = market_client.test_connection()
                 if result["success"]:
+                    self._market_client_is_live = True
                     self.logger.log_warning(f"✅ {result['message']}")
                     self.logger.log_warning("📊 Using LIVE Polymarket data")
                 else:
@@ -391,6 +443,8 @@ class BotRunner:
             self.logger.log_warning(
                 "📊 No Polymarket API configured - Using MOCK market data"
             )
+            from clients.mock_market_client import MockMarketClient
+
             market_client = MockMarketClient()
             market_client.connect()
 
@@ -404,6 +458,8 @@ class BotRunner:
             try:
                 provider = creds.get("provider", "coingecko")
                 if provider == "coingecko":
+                    from clients.coingecko_client import CoinGeckoClient
+
                     endpoint = creds.get("endpoint", "https://api.coingecko.com/api/v3")
                     api_key = creds.get("api_key")
                     crypto_client = CoinGeckoClient(endpoint=endpoint, api_key=api_key)
@@ -431,6 +487,8 @@ class BotRunner:
             self.logger.log_warning(
                 "💰 No crypto API configured - Using MOCK crypto data"
             )
+            from clients.mock_crypto_client import MockCryptoClient
+
             crypto_client = MockCryptoClient()
             crypto_client.connect()
 
@@ -520,11 +578,7 @@ class BotRunner:
                     "healthy": True,
                     "response_time_ms": 0,
                 },
-                "rate_limit": {
-                    "usage_pct": 0.0,
-                    "remaining": 0,
-                    "reset_seconds": 0,
-                },
+                "rate_limit": get_rate_limiter_registry().summary(),
                 "trading": {
                     "opportunities_found": self.total_opportunities_found,
                     "trades_executed": self.total_trades_executed,
@@ -594,9 +648,12 @@ class BotRunner:
             "disk_status": disk_status,
             "data_source": self._data_source,
             "mock_cycles": self._mock_cycles,
+            "cycle_stages": self.performance_monitor.get_stage_statistics(),
         }
         try:
             atomic_write_json(self.engine_health_path, health)
+            if self.engine_lock is not None:
+                self.engine_lock.heartbeat()
         except Exception as e:
             self.logger.log_error(f"Disk write failed (engine_health): {e}")
             self.write_error_count += 1
@@ -605,7 +662,16 @@ class BotRunner:
         """
         Log activity to activity.json for dashboard consumption.
         Uses atomic write + lock; recovers from corrupt JSON via backup/default.
+        Also appended to activity.jsonl, the feed the TUI tails.
         """
+        try:
+            if "timestamp" not in activity:
+                activity["timestamp"] = datetime.now(timezone.utc).isoformat()
+            append_activity(self.activity_feed_path, activity)
+        except Exception as e:
+            self.logger.log_error(f"Failed to append activity feed (disk write): {e}")
+            self.write_error_count += 1
+
         try:
             activities = load_json(
                 self.activity_log_path,
@@ -615,8 +681,6 @@ class BotRunner:
             if not isinstance(activities, list):
                 activities = []
 
-            if "timestamp" not in activity:
-                activity["timestamp"] = datetime.now(timezone.utc).isoformat()
             activities.append(activity)
             activities = activities[-1000:]
 
@@ -634,10 +698,12 @@ class BotRunner:
         """
         try:
             # Use the configured market client (live or mock)
-            markets = self.market_client.get_markets(min_volume=1000, limit=100)
+            markets = self.market_client.get_markets(
+                min_volume=1000, limit=self.config.get("market_fetch_limit", 100)
+            )
 
             if markets:
-                is_live = isinstance(self.market_client, PolymarketClient)
+                is_live = self._market_client_is_live
                 self._data_source = "live" if is_live else "mock"
                 if is_live:
                     self._mock_cycles = 0
@@ -1082,30 +1148,40 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
             )
             self.logger.log_warning(f"{'=' * 60}")
 
+            span = self.performance_monitor.span
+
             # 1. Fetch markets
-            markets = self._fetch_markets()
-            prices_dict = self._convert_markets_to_prices_dict(markets)
+            with span("fetch"):
+                markets = self._fetch_markets()
+                prices_dict = self._convert_markets_to_prices_dict(markets)
             self._last_prices_dict = prices_dict
 
             # 2. Check alerts with current market data
-            self._check_alerts(markets, prices_dict)
+            with span("alerts"):
+                self._check_alerts(markets, prices_dict)
 
             # 3. Check risk limits and open positions
-            self._check_risk_positions(prices_dict)
-
-            # 4. Run all strategies to find opportunities
-            all_opportunities = self.strategy_manager.run_all_strategies(
-                markets, prices_dict
-            )
+            with span("risk"):
+                self._check_risk_positions(prices_dict)
+
+            # 4. Run all strategies to find opportunities (each strategy is
+            #    recorded as its own 'strategy.<name>' stage by StrategyManager)
+            with span("strategies"):
+                all_opportunities = self.strategy_manager.run_all_strategies(
+                    markets, prices_dict
+                )
 
             # 5. Process and log all opportunities (even if not traded)
-            self._process_opportunities(all_opportunities)
+            with span("opportunity_logging"):
+                self._process_opportunities(all_opportunities)
 
             # 6. Execute best opportunities (paper trades) with risk checks
-            self._execute_trades(all_opportunities)
+            with span("execution"):
+                self._execute_trades(all_opportunities)
 
             # 7. Check open positions for exits (stop-loss/take-profit)
-            self._check_exit_conditions(prices_dict)
+            with span("exits"):
+                self._check_exit_conditions(prices_dict)
 
             # 8. Log cycle summary
             total_opps_this_cycle = sum(
@@ -1135,7 +1211,19 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
 
     def run(self) -> None:
         """Main bot loop - runs continuously until stopped"""
+        # PID/lock file with heartbeat: lets the dashboard find the engine without scanning
+        from services.process_manager import EngineLock
+
+        self.engine_lock = EngineLock(self.state_dir)
+        if not self.engine_lock.acquire():
+            self.logger.log_error("❌ Another engine instance is running; exiting")
+            self.engine_lock = None
+            if self.telegram_bot:
+                self.telegram_bot.close(timeout=0)
+            return
         self.running = True
+        if self.telegram_bot:
+            self.telegram_bot.start_delivery()
 
         # Print startup banner
         self.logger.log_warning("📊 Loaded 4 strategies:")
@@ -1203,6 +1291,7 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
                 trades_before = self.total_trades_executed
                 self.run_cycle()
                 cycle_duration = time.time() - cycle_start
+                self.performance_monitor.record_stage("cycle", cycle_duration * 1000)
                 if cycle_duration > self._cycle_timeout_seconds:
                     self.logger.log_warning(
                         f"Cycle timeout: cycle #{self.cycles_completed} took "
@@ -1239,8 +1328,9 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
                         self.logger.log_logs_disk_usage()
                     except Exception:
                         pass
-                self._write_bot_state()
-                self._save_paper_engine_state()
+                with self.performance_monitor.span("persistence"):
+                    self._write_bot_state()
+                    self._save_paper_engine_state()
                 self._last_cycle_end_time = time.time()
                 loop_cycles += 1
                 if self.max_cycles is not None and loop_cycles >= self.max_cycles:
@@ -1276,7 +1366,10 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
         self.running = False
         self._write_engine_health()
         self._save_paper_engine_state()
+        self.execution_engine.close()
         self._write_bot_state()
+        if self.engine_lock is not None:
+            self.engine_lock.release()
         self.logger.log_warning("\n" + "=" * 60)
         self.logger.log_warning("🛑 Bot Shutdown Summary")
         self.logger.log_warning("=" * 60)
@@ -1307,6 +1400,10 @@ Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
             }
         )
 
+        # Undelivered telegram messages stay in the outbox for the next start
+        if self.telegram_bot:
+            self.telegram_bot.close()
+
         self.logger.log_warning("👋 Bot stopped. Goodbye!")
 
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the columnar replay engine against the row-by-row Backtester.
+
+Generates a synthetic timestamp,market,yes_price,no_price CSV, runs
+Backtester.load_historical_data + simulate_strategy and Backtester.replay
+(cold: parse + cache, warm: memory-mapped cache), checks the results are
+identical and prints timings.
+
+Run from project root: python scripts/benchmark_replay.py [--rows 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _write_csv(path: Path, rows: int, markets: int = 200) -> None:
+    rng = random.Random(42)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "market", "yes_price", "no_price"])
+        for i in range(rows):
+            writer.writerow([
+                (base + timedelta(seconds=i)).isoformat().replace("+00:00", "Z"),
+                f"market-{rng.randrange(markets)}",
+                round(rng.uniform(0.3, 0.6), 4),
+                round(rng.uniform(0.3, 0.6), 4),
+            ])
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _same(a: dict, b: dict) -> bool:
+    if a.keys() != b.keys():
+        return False
+    for key in a:
+        if key == "sharpe_ratio":
+            if not math.isclose(a[key], b[key], rel_tol=1e-12, abs_tol=1e-12):
+                return False
+        elif a[key] != b[key]:
+            return False
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic snapshots")
+    args = parser.parse_args()
+
+    from backtester import Backtester
+
+    backtester = Backtester({"max_trade_size": 10, "min_profit_margin": 0.02})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "history.csv"
+        _write_csv(path, args.rows)
+
+        def row_by_row():
+            data = backtester.load_historical_data(filepath=str(path))
+            return backtester.simulate_strategy("basic_arbitrage", data)
+
+        reference, t_rows = _timed(row_by_row)
+        cold, t_cold = _timed(lambda: backtester.replay(str(path)))
+        warm, t_warm = _timed(lambda: backtester.replay(str(path)))
+
+    ok = _same(reference, cold) and _same(reference, warm)
+    print(f"Snapshots:            {args.rows:,}")
+    print(f"Trades:               {reference.get('total_trades', 0):,}")
+    print(f"Row-by-row backtest:  {t_rows:8.3f}s")
+    print(f"Columnar (cold):      {t_cold:8.3f}s  ({t_rows / t_cold:5.1f}x)")
+    print(f"Columnar (cached):    {t_warm:8.3f}s  ({t_rows / t_warm:5.1f}x)")
+    print(f"Identical results:    {'yes' if ok else 'NO'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Analytics Rollups
+
+Grouped trade statistics for the analytics services, read from the SQLite
+trade store's rollup buckets (O(buckets), full history) when the DataParser is
+backed by the store. Returns None otherwise so callers fall back to grouping
+trade rows.
+CRITICAL: Money values are returned as Decimal, like the row-based paths.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _money(value: Any) -> Decimal:
+    """REAL sum from SQLite -> Decimal without float noise (trade P&L has <= 8 decimals)."""
+    return Decimal(str(round(float(value or 0), 8)))
+
+
+def get_rollup_groups(
+    data_parser,
+    group_by: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    strategy: Optional[str] = None,
+) -> Optional[Dict[Any, Dict[str, Any]]]:
+    """
+    Grouped stats from trade rollups.
+
+    Args:
+        data_parser: DataParser (rollups used only if its trades come from the store)
+        group_by: bucket | market | strategy | hour_of_day | day_of_week
+        start_date: Start date filter (ISO format, hour resolution)
+        end_date: End date filter (ISO format, hour resolution)
+        strategy: Optional strategy filter
+
+    Returns:
+        {key: {count, wins, losses, total_pnl, gross_profit, gross_loss, best_trade,
+        worst_trade}} or None if rollups are unavailable
+    """
+    get_logs_dir = getattr(data_parser, "get_rollup_logs_dir", None)
+    if get_logs_dir is None:
+        return None
+    try:
+        from database.trades_store import query_rollups
+
+        logs_dir = get_logs_dir()
+        if logs_dir is None:
+            return None
+        rows = query_rollups(
+            logs_dir, group_by, start=start_date, end=end_date, strategy=strategy
+        )
+    except Exception as e:
+        logger.warning("Trade rollups unavailable, aggregating trades instead: %s", e)
+        return None
+    if rows is None:
+        return None
+
+    return {
+        row["key"]: {
+            "count": int(row["count"] or 0),
+            "wins": int(row["wins"] or 0),
+            "losses": int(row["losses"] or 0),
+            "total_pnl": _money(row["sum_pnl"]),
+            "gross_profit": _money(row["gross_profit"]),
+            "gross_loss": _money(row["gross_loss"]),
+            "best_trade": _money(row["max_pnl"]),
+            "worst_trade": _money(row["min_pnl"]),
+        }
+        for row in rows
+    }
@@ -0,0 +1,297 @@
+"""
+Content-Addressed Backup Store
+
+Backups for UpdateService. File contents are stored once under
+backups/.objects/<sha256[:2]>/<sha256>; each backup is a directory holding only
+manifest.json (relative path -> sha256, size, mtime, mode). A backup therefore
+costs the changed bytes only, and restores copy only files whose content
+differs from the manifest.
+
+A stat cache (path, size, mtime_ns -> sha256) in backups/.objects/stat_cache.json
+avoids re-hashing unchanged files, so a snapshot is mostly stat() calls.
+Objects are copies, never hard links to live files: in-place writes to a
+linked file would silently change every backup that references it.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from logger import get_logger
+from utils.atomic_json import atomic_write_json, load_json
+
+logger = get_logger()
+
+MANIFEST_FILENAME = "manifest.json"
+OBJECTS_DIRNAME = ".objects"
+STAT_CACHE_FILENAME = "stat_cache.json"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# What a backup covers: top-level files by pattern, plus whole directories
+BACKUP_FILE_PATTERNS = ("*.py", "VERSION", "config.yaml")
+BACKUP_DIRS = ("services", "dashboard", "database", "state")
+IGNORED_DIRS = {"__pycache__"}
+IGNORED_SUFFIXES = (".pyc", ".pyo")
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """Deduplicated snapshots of the install directory"""
+
+    def __init__(self, base_dir: Path, backups_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            base_dir: Install directory being backed up / restored
+            backups_dir: Directory holding backup manifests and the object store
+        """
+        self.base_dir = Path(base_dir)
+        self.backups_dir = Path(backups_dir)
+        self.objects_dir = self.backups_dir / OBJECTS_DIRNAME
+        self.stat_cache_path = self.objects_dir / STAT_CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def iter_backup_files(self) -> Iterator[Path]:
+        """Files covered by a backup, relative to base_dir."""
+        for pattern in BACKUP_FILE_PATTERNS:
+            for path in sorted(self.base_dir.glob(pattern)):
+                if path.is_file():
+                    yield path.relative_to(self.base_dir)
+        for root_name in BACKUP_DIRS:
+            root = self.base_dir / root_name
+            if not root.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_DIRS)
+                for name in sorted(filenames):
+                    if not name.endswith(IGNORED_SUFFIXES):
+                        yield (Path(dirpath) / name).relative_to(self.base_dir)
+
+    def _object_path(self, sha: str) -> Path:
+        return self.objects_dir / sha[:2] / sha
+
+    def _hash_with_cache(self, rel: str, st: os.stat_result, cache: Dict[str, Any]) -> str:
+        key = [st.st_size, st.st_mtime_ns]
+        cached = cache.get(rel)
+        if cached and cached[:2] == key:
+            return cached[2]
+        sha = file_sha256(self.base_dir / rel)
+        cache[rel] = key + [sha]
+        return sha
+
+    def _store_object(self, src: Path, sha: str) -> bool:
+        """Copy src into the object store unless present. Returns True if bytes were written."""
+        obj = self._object_path(sha)
+        if obj.exists():
+            return False
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp = obj.with_name(f"{sha}.tmp.{os.getpid()}")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, obj)
+        return True
+
+    def snapshot(self, backup_name: str) -> Dict[str, Any]:
+        """
+        Create a backup: store new contents, write the manifest.
+
+        Args:
+            backup_name: Backup directory name
+
+        Returns:
+            Manifest dict (files, total_size, new_bytes, ...)
+        """
+        with self._lock:
+            cache = load_json(self.stat_cache_path, {}) or {}
+            files: Dict[str, Dict[str, Any]] = {}
+            total_size = 0
+            new_bytes = 0
+            for rel_path in self.iter_backup_files():
+                rel = rel_path.as_posix()
+                src = self.base_dir / rel_path
+                try:
+                    st = src.stat()
+                    sha = self._hash_with_cache(rel, st, cache)
+                    if self._store_object(src, sha):
+                        new_bytes += st.st_size
+                except FileNotFoundError:
+                    continue  # Removed while snapshotting (e.g. state temp files)
+                files[rel] = {
+                    "sha256": sha,
+                    "size": st.st_size,
+                    "mtime": st.st_mtime,
+                    "mode": st.st_mode & 0o777,
+                }
+                total_size += st.st_size
+
+            # Drop cache entries for files that no longer exist
+            cache = {rel: v for rel, v in cache.items() if rel in files}
+            manifest = {
+                "version": 1,
+                "name": backup_name,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "roots": [d for d in BACKUP_DIRS if (self.base_dir / d).is_dir()],
+                "files": files,
+                "total_size": total_size,
+                "new_bytes": new_bytes,
+            }
+            backup_path = self.backups_dir / backup_name
+            backup_path.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(backup_path / MANIFEST_FILENAME, manifest, indent=None)
+            atomic_write_json(self.stat_cache_path, cache, indent=None)
+            return manifest
+
+    def snapshot_in_background(self, backup_name: str) -> threading.Thread:
+        """Run snapshot() in a daemon thread; wait() joins it."""
+        self.wait()
+        thread = threading.Thread(
+            target=self._background_snapshot, args=(backup_name,), daemon=True
+        )
+        self._background = thread
+        thread.start()
+        return thread
+
+    def _background_snapshot(self, backup_name: str) -> None:
+        try:
+            manifest = self.snapshot(backup_name)
+            logger.log_info(
+                f"Background backup created: {backup_name} "
+                f"({manifest['new_bytes'] / (1024 * 1024):.1f}MB new)"
+            )
+        except Exception as e:
+            logger.log_error(f"Background backup failed ({backup_name}): {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background snapshot. Returns False if still running after timeout."""
+        thread = self._background
+        if thread is None:
+            return True
+        thread.join(timeout)
+        if thread.is_alive():
+            return False
+        self._background = None
+        return True
+
+    # ------------------------------------------------------------------
+    # Restore
+    # ------------------------------------------------------------------
+
+    def load_manifest(self, backup_name: str) -> Optional[Dict[str, Any]]:
+        """Manifest of a backup, or None for legacy full-copy backups."""
+        data = load_json(self.backups_dir / backup_name / MANIFEST_FILENAME, None)
+        return data if isinstance(data, dict) and "files" in data else None
+
+    def restore(self, backup_name: str) -> Tuple[int, int]:
+        """
+        Restore a backup, copying only files whose content differs.
+
+        Files under the backed-up directories that are not in the manifest are
+        removed, matching the old rmtree + copytree behaviour.
+
+        Returns:
+            (files copied, files removed)
+        """
+        manifest = self.load_manifest(backup_name)
+        if manifest is None:
+            raise FileNotFoundError(f"No manifest for backup {backup_name}")
+
+        with self._lock:
+            cache = load_json(self.stat_cache_path, {}) or {}
+            copied = 0
+            for rel, entry in manifest["files"].items():
+                dest = self.base_dir / rel
+                if dest.is_file():
+                    st = dest.stat()
+                    if st.st_size == entry["size"] and (
+                        self._hash_with_cache(rel, st, cache) == entry["sha256"]
+                    ):
+                        continue
+                obj = self._object_path(entry["sha256"])
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                tmp = dest.with_name(f".{dest.name}.restore.{os.getpid()}")
+                shutil.copyfile(obj, tmp)
+                os.chmod(tmp, entry.get("mode", 0o644))
+                os.utime(tmp, (entry["mtime"], entry["mtime"]))
+                os.replace(tmp, dest)
+                st = dest.stat()
+                cache[rel] = [st.st_size, st.st_mtime_ns, entry["sha256"]]
+                copied += 1
+
+            removed = 0
+            wanted = set(manifest["files"])
+            for root_name in manifest.get("roots", []):
+                root = self.base_dir / root_name
+                if not root.is_dir():
+                    continue
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+                    for name in filenames:
+                        if name.endswith(IGNORED_SUFFIXES):
+                            continue
+                        path = Path(dirpath) / name
+                        if path.relative_to(self.base_dir).as_posix() not in wanted:
+                            path.unlink()
+                            removed += 1
+
+            atomic_write_json(self.stat_cache_path, cache, indent=None)
+            return copied, removed
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def list_backups(self) -> List[Path]:
+        """Backup directories (manifest or legacy copies), newest first."""
+        if not self.backups_dir.exists():
+            return []
+        backups = [
+            d for d in self.backups_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
+        ]
+        return sorted(backups, key=lambda d: d.stat().st_mtime, reverse=True)
+
+    def prune(self, keep: int = 5) -> int:
+        """
+        Remove all but the newest keep backups, then delete unreferenced objects.
+
+        Returns:
+            Number of objects deleted
+        """
+        self.wait()
+        with self._lock:
+            for old_backup in self.list_backups()[keep:]:
+                logger.log_info(f"Removing old backup: {old_backup.name}")
+                shutil.rmtree(old_backup)
+
+            if not self.objects_dir.exists():
+                return 0
+            referenced = set()
+            for backup in self.list_backups():
+                manifest = self.load_manifest(backup.name)
+                if manifest:
+                    referenced.update(e["sha256"] for e in manifest["files"].values())
+            deleted = 0
+            for bucket in self.objects_dir.iterdir():
+                if not bucket.is_dir():
+                    continue
+                for obj in bucket.iterdir():
+                    if obj.name not in referenced:
+                        obj.unlink()
+                        deleted += 1
+            return deleted
@@ -2,6 +2,7 @@
 Market Analytics Service
 
 Analyze performance by individual market.
+Reads trade store rollups when available (full history, O(buckets)).
 CRITICAL: All money calculations use Decimal for accuracy.
 """
 
@@ -9,6 +10,8 @@ from typing import Dict, List, Any, Optional
 from decimal import Decimal, ROUND_HALF_UP
 from collections import defaultdict
 
+from services.analytics_rollups import get_rollup_groups
+
 
 class MarketAnalytics:
     """Calculate performance metrics by market (symbol)"""
@@ -39,28 +42,34 @@ class MarketAnalytics:
         Returns:
             List of market performance dictionaries
         """
-        # Get all trades
-        trades_data = self.data_parser.get_trades(
-            start_date=start_date, end_date=end_date, per_page=10000  # Get all trades
+        market_stats = get_rollup_groups(
+            self.data_parser, "market", start_date=start_date, end_date=end_date
         )
-        all_trades = trades_data["trades"]
-        total_trade_count = len(all_trades)
+        if market_stats is None:
+            # Get all trades
+            trades_data = self.data_parser.get_trades(
+                start_date=start_date, end_date=end_date, per_page=10000  # Get all trades
+            )
+
+            # Group trades by market (symbol)
+            market_trades = defaultdict(list)
+            for trade in trades_data["trades"]:
+                market_trades[trade["symbol"]].append(trade)
+            market_stats = {
+                market_name: self._market_stats(trades)
+                for market_name, trades in market_trades.items()
+            }
 
-        # Group trades by market (symbol)
-        market_trades = defaultdict(list)
-        for trade in all_trades:
-            market_trades[trade["symbol"]].append(trade)
+        total_trade_count = sum(stats["count"] for stats in market_stats.values())
 
         # Calculate metrics for each market
         results = []
-        for market_name, trades in market_trades.items():
+        for market_name, stats in market_stats.items():
             # Filter out markets with too few trades
-            if len(trades) < min_trades:
+            if stats["count"] < min_trades:
                 continue
 
-            metrics = self._calculate_market_metrics(
-                market_name, trades, total_trade_count
-            )
+            metrics = self._metrics_from_stats(market_name, stats, total_trade_count)
             results.append(metrics)
 
         return results
@@ -121,11 +130,29 @@ class MarketAnalytics:
         self, market_name: str, trades: List[Dict], total_trade_count: int
     ) -> Dict[str, Any]:
         """Calculate performance metrics for a single market"""
+        return self._metrics_from_stats(
+            market_name, self._market_stats(trades), total_trade_count
+        )
+
+    def _market_stats(self, trades: List[Dict]) -> Dict[str, Any]:
+        """Aggregate trade rows into the same stats shape as the rollup path"""
+        pnls = [Decimal(str(t["pnl_usd"])) for t in trades]
+        return {
+            "count": len(trades),
+            "wins": len([p for p in pnls if p > 0]),
+            "total_pnl": sum(pnls, Decimal("0")),
+            "best_trade": max(pnls) if pnls else Decimal("0"),
+            "worst_trade": min(pnls) if pnls else Decimal("0"),
+        }
+
+    def _metrics_from_stats(
+        self, market_name: str, stats: Dict[str, Any], total_trade_count: int
+    ) -> Dict[str, Any]:
+        """Calculate performance metrics for a single market from aggregated stats"""
 
         # Basic counts
-        total_trades = len(trades)
-        winning_trades = [t for t in trades if t["pnl_usd"] > 0]
-        winning_count = len(winning_trades)
+        total_trades = stats["count"]
+        winning_count = stats["wins"]
 
         # Win rate
         win_rate = (
@@ -137,7 +164,7 @@ class MarketAnalytics:
         )
 
         # P&L calculations using Decimal
-        total_pnl = sum(Decimal(str(t["pnl_usd"])) for t in trades)
+        total_pnl = stats["total_pnl"]
         avg_profit = (
             (total_pnl / Decimal(total_trades)).quantize(
                 Decimal("0.01"), rounding=ROUND_HALF_UP
@@ -147,12 +174,8 @@ class MarketAnalytics:
         )
 
         # Best and worst trades
-        best_trade = (
-            max(Decimal(str(t["pnl_usd"])) for t in trades) if trades else Decimal("0")
-        )
-        worst_trade = (
-            min(Decimal(str(t["pnl_usd"])) for t in trades) if trades else Decimal("0")
-        )
+        best_trade = stats["best_trade"]
+        worst_trade = stats["worst_trade"]
 
         # Frequency: (market_trades / total_trades) × 100
         frequency = (
@@ -3,8 +3,19 @@ Paper Trading Engine - Unified Simulation System
 
 Simulates real trading with live market data without risking real money.
 Phase 7A: place_order and execute_order enforce execution gate (defense in depth).
+
+Per-fill cost is O(1): trade history is a ring buffer (deque), closed positions
+are dropped and the portfolio's cost basis is maintained incrementally for the
+drawdown check. fast_path=True additionally prunes finished orders and batches
+trade logging (TRADE_LOG_BATCH_SIZE fills per store write) for backtests and
+stress tests; buffered fills are written by close() and, failing that, at
+interpreter exit.
 """
 
+import atexit
+import weakref
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -14,6 +25,21 @@ from pathlib import Path
 
 from logger import get_logger
 
+# Fills buffered before one batched trade-log write (fast_path only)
+TRADE_LOG_BATCH_SIZE = 500
+
+# fast_path engines not yet closed: their buffered trade logs are flushed at exit
+_unflushed_engines: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_engines_at_exit() -> None:
+    for engine in list(_unflushed_engines):
+        try:
+            engine.flush_trade_logs()
+        except Exception:
+            pass  # Logging is best effort this late in shutdown
+
 
 class OrderType(Enum):
     """Order types"""
@@ -31,6 +57,9 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
+_ORDER_SIDES = {"buy": OrderSide.BUY, "sell": OrderSide.SELL}
+
+
 class OrderStatus(Enum):
     """Order statuses"""
 
@@ -44,6 +73,11 @@ class OrderStatus(Enum):
 class Order:
     """Represents a trading order"""
 
+    __slots__ = (
+        "order_id", "symbol", "side", "order_type", "quantity", "price", "stop_price",
+        "filled_quantity", "avg_fill_price", "status", "created_at", "filled_at", "commission",
+    )
+
     def __init__(
         self,
         order_id: str,
@@ -90,6 +124,8 @@ class Order:
 class Position:
     """Represents a trading position"""
 
+    __slots__ = ("symbol", "quantity", "avg_price", "realized_pnl", "opened_at")
+
     def __init__(self, symbol: str, quantity: float, avg_price: float):
         self.symbol = symbol
         self.quantity = quantity
@@ -167,6 +203,8 @@ class PaperTradingEngine:
         log_dir: str = "logs",
         logger=None,
         config: Optional[Dict[str, Any]] = None,
+        replay: bool = False,
+        fast_path: bool = False,
     ):
         """
         Initialize paper trading engine
@@ -178,10 +216,17 @@ class PaperTradingEngine:
             log_dir: Directory for trade logs
             logger: Logger instance
             config: Bot config for execution gate (required for gate check; None = deny)
+            replay: Historical replay (services/replay_harness.py): no execution
+                gate (nothing is traded, live or paper), no log dir, no trade logging
+            fast_path: High-throughput mode: filled / rejected orders are dropped from
+                self.orders and trade logs are written in batches (flush_trade_logs)
         """
         self.logger = logger or get_logger()
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        self.replay = replay
+        self.fast_path = fast_path
+        if not replay:
+            self.log_dir.mkdir(exist_ok=True)
         self._config = config
 
         # Account state
@@ -195,11 +240,16 @@ class PaperTradingEngine:
         self.orders: Dict[str, Order] = {}
         self.order_counter = 0
 
-        # Performance tracking (capped to prevent unbounded memory growth)
-        self.trade_history: List[Dict[str, Any]] = []
+        # Performance tracking (ring buffer: bounded memory, O(1) append)
         self.trade_history_max_len = (
             (config or {}).get("trade_history_max_len", 10000)
         )
+        self.trade_history: deque = deque(maxlen=self.trade_history_max_len)
+        self._pending_trade_logs: List[Dict[str, Any]] = []
+        if fast_path and not replay:
+            _unflushed_engines.add(self)
+        # Sum of quantity * avg_price over open positions (drawdown basis)
+        self._position_cost = 0.0
         self.total_commission_paid = 0.0
         self.total_trades = 0
         self.winning_trades = 0
@@ -231,17 +281,18 @@ class PaperTradingEngine:
             Order result dictionary
         """
         # Phase 7A: Execution gate (defense in depth)
-        from services.execution_gate import may_execute_trade
-        if self._config is not None:
-            allowed, reason = may_execute_trade(self._config)
-            if not allowed:
+        if not self.replay:
+            from services.execution_gate import may_execute_trade
+            if self._config is not None:
+                allowed, reason = may_execute_trade(self._config)
+                if not allowed:
+                    if self.logger:
+                        self.logger.log_warning(f"Execution gate closed in place_order: {reason}")
+                    return {"success": False, "error": reason}
+            else:
                 if self.logger:
-                    self.logger.log_warning(f"Execution gate closed in place_order: {reason}")
-                return {"success": False, "error": reason}
-        else:
-            if self.logger:
-                self.logger.log_warning("Execution gate: no config (deny)")
-            return {"success": False, "error": "execution_gate: no config"}
+                    self.logger.log_warning("Execution gate: no config (deny)")
+                return {"success": False, "error": "execution_gate: no config"}
 
         # Generate order ID
         self.order_counter += 1
@@ -312,15 +363,16 @@ class PaperTradingEngine:
             }
 
         # Phase 7A: Re-check gate at fill time (order may have been placed before kill)
-        from services.execution_gate import may_execute_trade
-        if self._config is not None:
-            allowed, reason = may_execute_trade(self._config)
-            if not allowed:
-                if self.logger:
-                    self.logger.log_warning(f"Execution gate closed in execute_order: {reason}")
-                return {"success": False, "error": reason}
-        else:
-            return {"success": False, "error": "execution_gate: no config"}
+        if not self.replay:
+            from services.execution_gate import may_execute_trade
+            if self._config is not None:
+                allowed, reason = may_execute_trade(self._config)
+                if not allowed:
+                    if self.logger:
+                        self.logger.log_warning(f"Execution gate closed in execute_order: {reason}")
+                    return {"success": False, "error": reason}
+            else:
+                return {"success": False, "error": "execution_gate: no config"}
 
         order = self.orders[order_id]
 
@@ -340,61 +392,120 @@ class PaperTradingEngine:
                 "reason": "price_condition_not_met",
             }
 
+        result = self._fill(order_id, order.symbol, order.side, order.quantity, fill_price)
+        if not result["success"]:
+            if "required" in result:  # Insufficient funds
+                order.status = OrderStatus.REJECTED
+                if self.fast_path:
+                    del self.orders[order_id]
+            return result
+
+        order.filled_quantity = result["quantity"]
+        order.avg_fill_price = result["execution_price"]
+        order.commission = result["commission"]
+        order.status = OrderStatus.FILLED
+        order.filled_at = result["filled_at"]
+        if self.fast_path:
+            del self.orders[order_id]
+
+        return {
+            "success": True,
+            "order_id": order_id,
+            "execution_price": result["execution_price"],
+            "commission": result["commission"],
+            "realized_pnl": result["realized_pnl"],
+            "cash_balance": self.cash_balance,
+            "order": order.to_dict(),
+        }
+
+    def fill_market_order(
+        self, symbol: str, side: str, quantity: float, current_price: float
+    ) -> Dict[str, Any]:
+        """
+        Place and fill a market order in one step (high-throughput path)
+
+        Same gate, slippage, commission and accounting as place_order +
+        execute_order, without keeping an Order object.
+
+        Args:
+            symbol: Trading symbol
+            side: 'buy' or 'sell'
+            quantity: Order quantity
+            current_price: Current market price
+
+        Returns:
+            Execution result (order_id, execution_price, commission, realized_pnl,
+            cash_balance) or {"success": False, "error": ...}
+        """
+        if not self.replay:
+            from services.execution_gate import may_execute_trade
+            if self._config is None:
+                return {"success": False, "error": "execution_gate: no config"}
+            allowed, reason = may_execute_trade(self._config)
+            if not allowed:
+                if self.logger:
+                    self.logger.log_warning(f"Execution gate closed in fill_market_order: {reason}")
+                return {"success": False, "error": reason}
+
+        order_side = _ORDER_SIDES.get(side.lower())
+        if order_side is None:
+            return {"success": False, "error": f"Invalid order parameters: {side!r} is not a valid OrderSide"}
+        if quantity <= 0:
+            return {"success": False, "error": "Invalid quantity"}
+
+        self.order_counter += 1
+        order_id = f"ORDER_{self.order_counter:06d}"
+        result = self._fill(order_id, symbol, order_side, quantity, current_price)
+        if result["success"]:
+            del result["quantity"], result["filled_at"]
+            result["order_id"] = order_id
+            result["cash_balance"] = self.cash_balance
+        return result
+
+    def _fill(
+        self, order_id: str, symbol: str, side: OrderSide, quantity: float, fill_price: float
+    ) -> Dict[str, Any]:
+        """Apply a fill to cash, position, metrics, history and trade log."""
+        is_buy = side is OrderSide.BUY
+
         # Simulate execution with slippage
-        execution_price = self._apply_slippage(fill_price, order.side)
+        execution_price = self._apply_slippage(fill_price, side)
+
+        # For sell: cap quantity to current position (close/reduce only, no shorting)
+        if is_buy:
+            fill_quantity = quantity
+        else:
+            pos = self.positions.get(symbol)
+            available = pos.quantity if pos and pos.quantity > 0 else 0
+            if available <= 0:
+                return {
+                    "success": False,
+                    "error": "No position to close",
+                    "symbol": symbol,
+                }
+            fill_quantity = min(quantity, available)
 
         # Calculate commission
-        trade_value = order.quantity * execution_price
+        trade_value = fill_quantity * execution_price
         commission = trade_value * self.commission_rate
 
         # Check if we have enough cash for buy orders
-        if order.side == OrderSide.BUY:
+        if is_buy:
             total_cost = trade_value + commission
             if total_cost > self.cash_balance:
-                order.status = OrderStatus.REJECTED
                 return {
                     "success": False,
                     "error": "Insufficient funds",
                     "required": total_cost,
                     "available": self.cash_balance,
                 }
-
-        # For sell: cap quantity to current position (close/reduce only, no shorting)
-        fill_quantity = order.quantity
-        if order.side == OrderSide.SELL:
-            pos = self.positions.get(order.symbol)
-            available = pos.quantity if pos and pos.quantity > 0 else 0
-            if available <= 0:
-                return {
-                    "success": False,
-                    "error": "No position to close",
-                    "symbol": order.symbol,
-                }
-            fill_quantity = min(order.quantity, available)
-            trade_value = fill_quantity * execution_price
-            commission = trade_value * self.commission_rate
-        else:
-            fill_quantity = order.quantity
-
-        # Execute the trade
-        order.filled_quantity = fill_quantity
-        order.avg_fill_price = execution_price
-        order.commission = commission
-        order.status = OrderStatus.FILLED
-        order.filled_at = datetime.now()
-
-        # Update cash balance
-        if order.side == OrderSide.BUY:
-            self.cash_balance -= trade_value + commission
+            self.cash_balance -= total_cost
         else:
             self.cash_balance += trade_value - commission
 
         # Update position (reduce/close for sell, add for buy)
-        quantity_change = (
-            fill_quantity if order.side == OrderSide.BUY else -fill_quantity
-        )
         realized_pnl = self._update_position(
-            order.symbol, quantity_change, execution_price
+            symbol, fill_quantity if is_buy else -fill_quantity, execution_price
         )
 
         # Update metrics
@@ -411,42 +522,72 @@ class PaperTradingEngine:
         self._update_drawdown()
 
         # Record trade
-        trade_record = {
-            "order_id": order_id,
-            "symbol": order.symbol,
-            "side": order.side.value,
-            "quantity": fill_quantity,
-            "price": execution_price,
-            "commission": commission,
-            "realized_pnl": realized_pnl,
-            "timestamp": datetime.now().isoformat(),
-        }
-        self.trade_history.append(trade_record)
-        if len(self.trade_history) > self.trade_history_max_len:
-            self.trade_history = self.trade_history[-self.trade_history_max_len:]
+        filled_at = datetime.now()
+        self.trade_history.append(
+            {
+                "order_id": order_id,
+                "symbol": symbol,
+                "side": side.value,
+                "quantity": fill_quantity,
+                "price": execution_price,
+                "commission": commission,
+                "realized_pnl": realized_pnl,
+                "timestamp": filled_at.isoformat(),
+            }
+        )
 
         # Log trade
-        if self.logger:
-            self.logger.log_trade(
-                market=order.symbol,
-                yes_price=execution_price,
-                no_price=0,
-                profit_usd=realized_pnl,
-                status="filled",
-                strategy="paper_trading",
-                arbitrage_type=order.side.value,
-            )
+        if self.logger and not self.replay:
+            trade_log = {
+                "market": symbol,
+                "yes_price": execution_price,
+                "no_price": 0,
+                "profit_usd": realized_pnl,
+                "status": "filled",
+                "strategy": "paper_trading",
+                "arbitrage_type": side.value,
+                # Fill time, not the (later) batch flush time
+                "timestamp": filled_at.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            if self.fast_path:
+                self._pending_trade_logs.append(trade_log)
+                if len(self._pending_trade_logs) >= TRADE_LOG_BATCH_SIZE:
+                    self.flush_trade_logs()
+            else:
+                self.logger.log_trade(**trade_log)
 
         return {
             "success": True,
-            "order_id": order_id,
+            "quantity": fill_quantity,
             "execution_price": execution_price,
             "commission": commission,
             "realized_pnl": realized_pnl,
-            "cash_balance": self.cash_balance,
-            "order": order.to_dict(),
+            "filled_at": filled_at,
         }
 
+    def flush_trade_logs(self) -> int:
+        """
+        Write buffered fast_path trade logs in one batch
+
+        Returns:
+            Number of trades written
+        """
+        batch = self._pending_trade_logs
+        if not batch:
+            return 0
+        self._pending_trade_logs = []
+        if hasattr(self.logger, "log_trades"):
+            self.logger.log_trades(batch)
+        else:
+            for trade_log in batch:
+                self.logger.log_trade(**trade_log)
+        return len(batch)
+
+    def close(self) -> None:
+        """Write any buffered trade logs; call when the engine is done trading"""
+        self.flush_trade_logs()
+        _unflushed_engines.discard(self)
+
     def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get position for a symbol"""
         if symbol not in self.positions or self.positions[symbol].quantity == 0:
@@ -556,19 +697,22 @@ class PaperTradingEngine:
     def _update_position(
         self, symbol: str, quantity_change: float, price: float
     ) -> float:
-        """Update or create position, returns realized P&L"""
-        if symbol not in self.positions:
-            self.positions[symbol] = Position(symbol, 0, 0)
-
-        return self.positions[symbol].update(quantity_change, price)
+        """Update or create position (closed positions are dropped), returns realized P&L"""
+        position = self.positions.get(symbol)
+        if position is None:
+            position = self.positions[symbol] = Position(symbol, 0, 0)
+
+        self._position_cost -= position.quantity * position.avg_price
+        realized_pnl = position.update(quantity_change, price)
+        if position.quantity == 0:
+            del self.positions[symbol]
+        else:
+            self._position_cost += position.quantity * position.avg_price
+        return realized_pnl
 
     def _update_drawdown(self) -> None:
         """Update maximum drawdown"""
-        current_value = self.cash_balance + sum(
-            pos.quantity * pos.avg_price
-            for pos in self.positions.values()
-            if pos.quantity != 0
-        )
+        current_value = self.cash_balance + self._position_cost
 
         if current_value > self.peak_balance:
             self.peak_balance = current_value
@@ -579,6 +723,7 @@ class PaperTradingEngine:
 
     def get_state(self) -> Dict[str, Any]:
         """Export engine state for persistence (crash recovery, restart idempotency)."""
+        self.flush_trade_logs()
         positions_list = []
         for symbol, pos in self.positions.items():
             if pos.quantity != 0:
@@ -594,7 +739,9 @@ class PaperTradingEngine:
             "cash_balance": self.cash_balance,
             "positions": positions_list,
             "order_counter": self.order_counter,
-            "trade_history": self.trade_history[-1000:],
+            "trade_history": list(
+                islice(self.trade_history, max(0, len(self.trade_history) - 1000), None)
+            ),
             "total_commission_paid": self.total_commission_paid,
             "total_trades": self.total_trades,
             "winning_trades": self.winning_trades,
@@ -633,6 +780,7 @@ class PaperTradingEngine:
             except (ValueError, TypeError):
                 pos.opened_at = datetime.now()
             self.positions[symbol] = pos
-        self.trade_history = list(state.get("trade_history", []))
-        if len(self.trade_history) > self.trade_history_max_len:
-            self.trade_history = self.trade_history[-self.trade_history_max_len:]
+        self._position_cost = sum(p.quantity * p.avg_price for p in self.positions.values())
+        self.trade_history = deque(
+            state.get("trade_history", []), maxlen=self.trade_history_max_len
+        )
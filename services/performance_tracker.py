@@ -2,19 +2,168 @@
 Real-Time Performance Tracking
 
 Track and broadcast performance updates via WebSocket for real-time monitoring.
+
+In-memory history is a columnar ring buffer per strategy (NumPy arrays of
+timestamp, portfolio value, return and P&L) rather than a deque of dicts:
+24h of 1-second snapshots is ~2.7 MB per strategy instead of ~86k dicts,
+range queries bisect the timestamps, and chart requests can be downsampled
+server-side.
 """
 
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from collections import deque
 import json
 
+import numpy as np
+
 from database.competition_models import Strategy, StrategyPerformanceSnapshot
 from logger import get_logger
 
 logger = get_logger()
 
 
+# Rows allocated up front; the buffer doubles up to its capacity
+INITIAL_HISTORY_ROWS = 1024
+
+
+class PerformanceHistory:
+    """
+    Fixed-capacity columnar ring of performance snapshots for one strategy
+
+    Timestamps are kept non-decreasing so a time window is two binary
+    searches. Missing (None) values are stored as NaN and returned as None.
+    """
+
+    def __init__(self, capacity: int, initial_rows: int = INITIAL_HISTORY_ROWS):
+        """
+        Initialize history
+
+        Args:
+            capacity: Maximum snapshots kept (the oldest is overwritten beyond this)
+            initial_rows: Rows allocated before the first growth
+        """
+        self.capacity = max(1, int(capacity))
+        rows = min(self.capacity, max(1, int(initial_rows)))
+        self._timestamps = np.zeros(rows, dtype=np.int64)
+        self._values = np.zeros(rows, dtype=np.float64)
+        self._returns = np.zeros(rows, dtype=np.float64)
+        self._pnl = np.zeros(rows, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self,
+        timestamp: int,
+        portfolio_value: Optional[float],
+        return_pct: Optional[float],
+        pnl: Optional[float],
+    ) -> None:
+        """
+        Add a snapshot, overwriting the oldest once at capacity
+
+        Args:
+            timestamp: Unix seconds (clamped so timestamps never go backwards)
+            portfolio_value: Portfolio value
+            return_pct: Total return percentage
+            pnl: Daily P&L
+        """
+        rows = len(self._timestamps)
+        if self._size == rows and rows < self.capacity:
+            self._grow(min(self.capacity, rows * 2))
+            rows = len(self._timestamps)
+
+        if self._size:
+            timestamp = max(int(timestamp), int(self._timestamps[self._physical(self._size - 1)]))
+
+        if self._size == rows:
+            index = self._start
+            self._start = (self._start + 1) % rows
+        else:
+            index = self._physical(self._size)
+            self._size += 1
+
+        self._timestamps[index] = timestamp
+        self._values[index] = np.nan if portfolio_value is None else portfolio_value
+        self._returns[index] = np.nan if return_pct is None else return_pct
+        self._pnl[index] = np.nan if pnl is None else pnl
+
+    def latest(self) -> Optional[Dict]:
+        """Most recent snapshot, or None when empty"""
+        if not self._size:
+            return None
+        return self._rows(np.array([self._physical(self._size - 1)]))[0]
+
+    def since(self, cutoff: int, max_points: Optional[int] = None) -> List[Dict]:
+        """
+        Snapshots with timestamp >= cutoff, oldest first
+
+        Args:
+            cutoff: Unix seconds
+            max_points: Downsample to at most this many points, keeping the
+                        last snapshot of each equal-sized bucket (None = all)
+
+        Returns:
+            List of {'timestamp', 'portfolio_value', 'return_pct', 'pnl'}
+        """
+        first = self._first_at_or_after(cutoff)
+        count = self._size - first
+        if count <= 0:
+            return []
+
+        logical = np.arange(first, self._size)
+        if max_points is not None and 0 < max_points < count:
+            # Last index of each bucket, so the newest point is always kept
+            logical = logical[(np.arange(1, max_points + 1) * count) // max_points - 1]
+        return self._rows((self._start + logical) % len(self._timestamps))
+
+    def _rows(self, indices: np.ndarray) -> List[Dict]:
+        columns = []
+        for column in (self._values, self._returns, self._pnl):
+            selected = column[indices]
+            values = selected.tolist()
+            if np.isnan(selected).any():
+                values = [None if v != v else v for v in values]
+            columns.append(values)
+        return [
+            {"timestamp": timestamp, "portfolio_value": value, "return_pct": ret, "pnl": pnl}
+            for timestamp, value, ret, pnl in zip(
+                self._timestamps[indices].tolist(), *columns
+            )
+        ]
+
+    def _grow(self, rows: int) -> None:
+        """Reallocate every column in logical order (only before reaching capacity)"""
+        order = (self._start + np.arange(self._size)) % len(self._timestamps)
+        for name in ("_timestamps", "_values", "_returns", "_pnl"):
+            old = getattr(self, name)
+            new = np.zeros(rows, dtype=old.dtype)
+            new[: self._size] = old[order]
+            setattr(self, name, new)
+        self._start = 0
+
+    def _physical(self, logical: int) -> int:
+        return (self._start + logical) % len(self._timestamps)
+
+    def _first_at_or_after(self, cutoff: int) -> int:
+        """Logical index of the first snapshot with timestamp >= cutoff"""
+        if not self._size:
+            return 0
+        rows = len(self._timestamps)
+        # The logical sequence is at most two sorted runs of the array
+        end = self._start + self._size
+        if end <= rows:
+            return int(np.searchsorted(self._timestamps[self._start : end], cutoff, side="left"))
+
+        older = self._timestamps[self._start :]
+        if cutoff <= older[-1]:
+            return int(np.searchsorted(older, cutoff, side="left"))
+        newer = self._timestamps[: end - rows]
+        return len(older) + int(np.searchsorted(newer, cutoff, side="left"))
+
+
 class RealTimePerformanceTracker:
     """Track and broadcast performance updates"""
 
@@ -31,7 +180,12 @@ class RealTimePerformanceTracker:
         self.max_history_size = max_history_hours * 3600  # Assuming 1 second updates
 
         # In-memory storage for quick access (last 24 hours)
-        self.performance_history = {}  # strategy_id -> deque of snapshots
+        self.performance_history: Dict[int, PerformanceHistory] = {}
+
+        # Strategy rows, reloaded only when the table signature changes
+        self._strategies: List[Dict] = []
+        self._strategy_ids: Dict[str, int] = {}
+        self._strategies_signature = None
 
         # Initialize history for all strategies
         self._initialize_history()
@@ -39,7 +193,7 @@ class RealTimePerformanceTracker:
     def _initialize_history(self):
         """Initialize performance history from database"""
         try:
-            strategies = Strategy.get_all()
+            strategies = self._get_strategies()
 
             for strategy in strategies:
                 strategy_id = strategy["id"]
@@ -49,25 +203,40 @@ class RealTimePerformanceTracker:
                     strategy_id, hours=self.max_history_hours
                 )
 
-                # Initialize deque with max size
-                self.performance_history[strategy_id] = deque(
-                    maxlen=self.max_history_size
-                )
-
                 # Load existing history
+                ring = self._history(strategy_id)
                 for snapshot in history:
-                    self.performance_history[strategy_id].append(
-                        {
-                            "timestamp": snapshot["timestamp"],
-                            "portfolio_value": snapshot["portfolio_value"],
-                            "return_pct": snapshot["total_return_pct"],
-                            "pnl": snapshot["daily_pnl"],
-                        }
+                    ring.append(
+                        snapshot["timestamp"],
+                        snapshot["portfolio_value"],
+                        snapshot["total_return_pct"],
+                        snapshot["daily_pnl"],
                     )
 
         except Exception as e:
             logger.error(f"Error initializing performance history: {e}")
 
+    def _history(self, strategy_id: int) -> PerformanceHistory:
+        """Ring buffer for a strategy, created on first use"""
+        ring = self.performance_history.get(strategy_id)
+        if ring is None:
+            ring = PerformanceHistory(self.max_history_size)
+            self.performance_history[strategy_id] = ring
+        return ring
+
+    def _get_strategies(self) -> List[Dict]:
+        """All strategies, cached until Strategy.get_signature() changes"""
+        signature = Strategy.get_signature()
+        if signature != self._strategies_signature:
+            self._strategies = Strategy.get_all()
+            self._strategy_ids = {s["name"]: s["id"] for s in self._strategies}
+            self._strategies_signature = signature
+        return self._strategies
+
+    def invalidate_strategies(self) -> None:
+        """Force the strategy list to be reloaded on next use"""
+        self._strategies_signature = None
+
     def take_snapshot(self, strategy_performance: Dict = None) -> Dict:
         """
         Take performance snapshot of all strategies
@@ -79,9 +248,12 @@ class RealTimePerformanceTracker:
             Snapshot data
         """
         try:
-            snapshot = {"timestamp": datetime.utcnow().isoformat(), "strategies": {}}
+            now = datetime.utcnow()
+            timestamp = int(now.timestamp())
+            snapshot = {"timestamp": now.isoformat(), "strategies": {}}
 
-            strategies = Strategy.get_all()
+            strategies = self._get_strategies()
+            latest_snapshots = None
 
             for strategy in strategies:
                 strategy_id = strategy["id"]
@@ -91,8 +263,13 @@ class RealTimePerformanceTracker:
                 if strategy_performance and strategy_id in strategy_performance:
                     metrics = strategy_performance[strategy_id]
                 else:
-                    # Get latest snapshot from database
-                    db_snapshot = StrategyPerformanceSnapshot.get_latest(strategy_id)
+                    # Latest snapshots for every strategy in one query
+                    if latest_snapshots is None:
+                        latest_snapshots = {
+                            s["strategy_id"]: s
+                            for s in StrategyPerformanceSnapshot.get_all_latest()
+                        }
+                    db_snapshot = latest_snapshots.get(strategy_id)
                     if db_snapshot:
                         metrics = {
                             "portfolio_value": db_snapshot["portfolio_value"],
@@ -118,18 +295,11 @@ class RealTimePerformanceTracker:
                 snapshot["strategies"][strategy_name] = metrics
 
                 # Add to in-memory history
-                if strategy_id not in self.performance_history:
-                    self.performance_history[strategy_id] = deque(
-                        maxlen=self.max_history_size
-                    )
-
-                self.performance_history[strategy_id].append(
-                    {
-                        "timestamp": int(datetime.utcnow().timestamp()),
-                        "portfolio_value": metrics.get("portfolio_value", 10000.0),
-                        "return_pct": metrics.get("return_pct", 0.0),
-                        "pnl": metrics.get("daily_pnl", 0.0),
-                    }
+                self._history(strategy_id).append(
+                    timestamp,
+                    metrics.get("portfolio_value", 10000.0),
+                    metrics.get("return_pct", 0.0),
+                    metrics.get("daily_pnl", 0.0),
                 )
 
             # Broadcast via WebSocket
@@ -155,7 +325,7 @@ class RealTimePerformanceTracker:
             logger.error(f"Error broadcasting update: {e}")
 
     def get_historical_performance(
-        self, strategy_name: str, hours: int = 24
+        self, strategy_name: str, hours: int = 24, max_points: Optional[int] = None
     ) -> List[Dict]:
         """
         Get last X hours of performance data
@@ -163,29 +333,25 @@ class RealTimePerformanceTracker:
         Args:
             strategy_name: Name of the strategy
             hours: Number of hours of history to return
+            max_points: Downsample in-memory history to at most this many
+                        points for charting (None = every snapshot)
 
         Returns:
             List of performance snapshots
         """
         try:
             # Get strategy ID
-            strategy = Strategy.get_by_name(strategy_name)
-            if not strategy:
+            self._get_strategies()
+            strategy_id = self._strategy_ids.get(strategy_name)
+            if strategy_id is None:
                 return []
 
-            strategy_id = strategy["id"]
-
             # Get from in-memory cache first
             if strategy_id in self.performance_history:
-                history = list(self.performance_history[strategy_id])
-
-                # Filter by time window
                 cutoff_timestamp = int(datetime.utcnow().timestamp()) - (hours * 3600)
-                filtered_history = [
-                    h for h in history if h["timestamp"] >= cutoff_timestamp
-                ]
-
-                return filtered_history
+                return self.performance_history[strategy_id].since(
+                    cutoff_timestamp, max_points
+                )
 
             # Fallback to database
             db_history = StrategyPerformanceSnapshot.get_history(strategy_id, hours)
@@ -206,7 +372,10 @@ class RealTimePerformanceTracker:
     def get_real_time_stats(self) -> Dict:
         """Get real-time statistics across all strategies"""
         try:
-            strategies = Strategy.get_all()
+            strategies = self._get_strategies()
+            latest_snapshots = {
+                s["strategy_id"]: s for s in StrategyPerformanceSnapshot.get_all_latest()
+            }
 
             total_value = 0
             total_return = 0
@@ -217,10 +386,9 @@ class RealTimePerformanceTracker:
                     continue
 
                 active_strategies += 1
-                strategy_id = strategy["id"]
 
                 # Get latest performance
-                snapshot = StrategyPerformanceSnapshot.get_latest(strategy_id)
+                snapshot = latest_snapshots.get(strategy["id"])
                 if snapshot:
                     total_value += snapshot["portfolio_value"] or 0
                     total_return += snapshot["total_return_pct"] or 0
@@ -248,17 +416,15 @@ class RealTimePerformanceTracker:
     def save_hourly_snapshot(self):
         """Save hourly snapshot to database"""
         try:
-            strategies = Strategy.get_all()
+            strategies = self._get_strategies()
 
             for strategy in strategies:
                 strategy_id = strategy["id"]
 
                 # Get latest in-memory performance
                 if strategy_id in self.performance_history:
-                    recent = list(self.performance_history[strategy_id])
-                    if recent:
-                        latest = recent[-1]
-
+                    latest = self.performance_history[strategy_id].latest()
+                    if latest:
                         # Save to database
                         StrategyPerformanceSnapshot.create(
                             strategy_id=strategy_id,
@@ -4,27 +4,127 @@ Process Manager for Market Strategy Testing Bot
 Manages engine and dashboard process lifecycle.
 Phase 7B: Canonical execution path only. start_bot() starts the engine (main.py).
 bot.py is TUI/monitor only and is NOT started or tracked here.
+
+Engine discovery: the engine publishes state/engine.lock.json (PID, process
+create time, heartbeat) via EngineLock. ProcessManager.find_engine() keeps the
+last result and re-validates it with pid_exists + create_time (no cmdline
+reads); a full process scan runs at most once per FULL_SCAN_INTERVAL_SEC.
 """
 
 import os
 import signal
 import subprocess
+import threading
 import time
 import psutil
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from logger import get_logger
+from utils.atomic_json import atomic_write_json, load_json
 
 logger = get_logger()
 
+ENGINE_LOCK_FILENAME = "engine.lock.json"
+ENGINE_SCRIPTS = ("main.py", "run_bot.py")
+# Minimum seconds between full psutil.process_iter scans
+FULL_SCAN_INTERVAL_SEC = 30.0
+
+
+def _pid_matches(pid: Optional[int], create_time: Optional[float]) -> bool:
+    """True if pid is alive and (when given) is the same process that started at create_time."""
+    if not pid or not psutil.pid_exists(pid):
+        return False
+    if create_time is None:
+        return True
+    try:
+        return abs(psutil.Process(pid).create_time() - float(create_time)) < 1.0
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
+def read_engine_lock(state_dir: Path) -> Optional[Dict[str, Any]]:
+    """Read state/engine.lock.json. None if missing or invalid."""
+    data = load_json(Path(state_dir) / ENGINE_LOCK_FILENAME, None)
+    return data if isinstance(data, dict) and data.get("pid") else None
+
+
+class EngineLock:
+    """PID/lock file published by the running engine (start time + heartbeat)"""
+
+    def __init__(self, state_dir: Path):
+        self.path = Path(state_dir) / ENGINE_LOCK_FILENAME
+        self.pid = os.getpid()
+        self.create_time = psutil.Process(self.pid).create_time()
+        self.started_at: Optional[str] = None
+
+    def acquire(self) -> bool:
+        """
+        Publish the lock for this process.
+
+        Returns:
+            False if another live engine holds the lock
+        """
+        current = read_engine_lock(self.path.parent)
+        if (
+            current
+            and current.get("pid") != self.pid
+            and _pid_matches(current.get("pid"), current.get("create_time"))
+        ):
+            logger.log_error(
+                f"Engine already running (PID {current['pid']}, lock {self.path})"
+            )
+            return False
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._write()
+        return True
+
+    def heartbeat(self) -> None:
+        """Refresh the heartbeat timestamp (called once per engine cycle)."""
+        if self.started_at is not None:
+            self._write()
+
+    def release(self) -> None:
+        """Remove the lock if this process still owns it."""
+        if self.started_at is None:
+            return
+        self.started_at = None
+        current = read_engine_lock(self.path.parent)
+        if current and current.get("pid") == self.pid:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _write(self) -> None:
+        atomic_write_json(
+            self.path,
+            {
+                "pid": self.pid,
+                "create_time": self.create_time,
+                "started_at": self.started_at,
+                "heartbeat": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
 
 class ProcessManager:
     """Manages bot and dashboard processes"""
 
-    def __init__(self, base_dir: Path = None):
+    def __init__(
+        self,
+        base_dir: Path = None,
+        state_dir: Path = None,
+        scan_interval: float = FULL_SCAN_INTERVAL_SEC,
+    ):
         self.base_dir = base_dir or Path(__file__).resolve().parent
+        self.state_dir = state_dir or self.base_dir / "state"
         self.bot_pid_file = self.base_dir / ".bot.pid"
         self.dashboard_pid_file = self.base_dir / ".dashboard.pid"
+        self.scan_interval = scan_interval
+        self._engine: Optional[Dict[str, Any]] = None
+        self._last_scan = float("-inf")
+        self._engine_lock = threading.Lock()
 
     def _read_pid(self, pid_file: Path) -> Optional[int]:
         """Read PID from file"""
@@ -96,6 +196,83 @@ class ProcessManager:
             pid, "run_bot.py"
         )
 
+    def find_engine(self) -> Optional[Dict[str, Any]]:
+        """
+        Locate the running engine, cheaply.
+
+        Order: cached result (pid_exists + create_time), engine lock file, the
+        dashboard's .bot.pid, then a full process scan at most once per
+        scan_interval seconds. Shared by all callers (thread-safe).
+
+        Returns:
+            {pid, create_time, source, heartbeat} or None if no engine was found
+        """
+        with self._engine_lock:
+            cached = self._engine
+            if cached and _pid_matches(cached["pid"], cached["create_time"]):
+                if cached["source"] == "lock":
+                    lock = read_engine_lock(self.state_dir)
+                    if lock and lock.get("pid") == cached["pid"]:
+                        cached["heartbeat"] = lock.get("heartbeat")
+                return cached
+            self._engine = None
+
+            lock = read_engine_lock(self.state_dir)
+            if lock and _pid_matches(lock["pid"], lock.get("create_time")):
+                self._engine = {
+                    "pid": lock["pid"],
+                    "create_time": lock.get("create_time"),
+                    "source": "lock",
+                    "heartbeat": lock.get("heartbeat"),
+                }
+                return self._engine
+
+            pid = self.get_bot_pid()
+            if pid and self.is_bot_running():
+                self._engine = self._engine_entry(pid, "pid_file")
+                if self._engine:
+                    return self._engine
+
+            now = time.monotonic()
+            if now - self._last_scan < self.scan_interval:
+                return None
+            self._last_scan = now
+            self._engine = self._scan_for_engine()
+            return self._engine
+
+    def invalidate_engine_cache(self) -> None:
+        """Forget the cached engine and allow an immediate full scan."""
+        with self._engine_lock:
+            self._engine = None
+            self._last_scan = float("-inf")
+
+    @staticmethod
+    def _engine_entry(pid: int, source: str) -> Optional[Dict[str, Any]]:
+        try:
+            create_time = psutil.Process(pid).create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+        return {"pid": pid, "create_time": create_time, "source": source, "heartbeat": None}
+
+    def _scan_for_engine(self) -> Optional[Dict[str, Any]]:
+        """Full scan for main.py / run_bot.py (expensive on busy hosts)."""
+        own_pid = os.getpid()
+        for proc in psutil.process_iter(["pid", "cmdline", "create_time"]):
+            try:
+                if proc.info["pid"] == own_pid:
+                    continue
+                cmdline = " ".join(str(c) for c in (proc.info.get("cmdline") or []))
+                if any(script in cmdline for script in ENGINE_SCRIPTS):
+                    return {
+                        "pid": proc.info["pid"],
+                        "create_time": proc.info["create_time"],
+                        "source": "scan",
+                        "heartbeat": None,
+                    }
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return None
+
     def is_dashboard_running(self) -> bool:
         """Check if dashboard process is running"""
         pid = self.get_dashboard_pid()
@@ -154,6 +331,7 @@ class ProcessManager:
         success = self.stop_process_gracefully(pid, timeout)
         if success:
             self._remove_pid(self.bot_pid_file)
+            self.invalidate_engine_cache()
         return success
 
     def stop_dashboard(self, timeout: int = 10) -> bool:
@@ -198,6 +376,7 @@ class ProcessManager:
 
             if self._is_process_running(pid, "main.py"):
                 self._write_pid(self.bot_pid_file, pid)
+                self.invalidate_engine_cache()
                 logger.log_info(f"Engine started with PID {pid}")
                 return True, pid
             else:
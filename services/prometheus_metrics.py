@@ -42,6 +42,9 @@ rate_limit_hits = Counter("rate_limit_hits_total", "Rate limit hits", ["service"
 rate_limit_usage = Gauge(
     "rate_limit_usage_percent", "Rate limit usage percentage", ["service"]
 )
+rate_limit_remaining = Gauge(
+    "rate_limit_remaining_tokens", "Rate limit tokens available now", ["service"]
+)
 
 # Health metrics
 connection_status = Gauge(
@@ -59,6 +62,16 @@ notification_failures = Counter(
     "notification_failures_total", "Notification failures", ["channel"]
 )
 
+# Engine cycle stage metrics (from engine_health.json "cycle_stages")
+cycle_stage_latency = Gauge(
+    "cycle_stage_latency_ms",
+    "Engine cycle stage latency in milliseconds",
+    ["stage", "quantile"],
+)
+cycle_stage_count = Gauge(
+    "cycle_stage_observations", "Engine cycle stage observations", ["stage"]
+)
+
 # System metrics
 memory_usage = Gauge("memory_usage_bytes", "Memory usage in bytes")
 cpu_usage = Gauge("cpu_usage_percent", "CPU usage percentage")
@@ -130,6 +143,14 @@ class PrometheusMetrics:
         """Update rate limit usage"""
         rate_limit_usage.labels(service=service).set(usage_percent)
 
+    def update_rate_limits(self, rate_limit: Dict[str, Any]):
+        """Update rate limit gauges from the engine's rate_limit state block"""
+        for service, snapshot in ((rate_limit or {}).get("limiters") or {}).items():
+            if not isinstance(snapshot, dict):
+                continue
+            rate_limit_usage.labels(service=service).set(float(snapshot.get("usage_pct", 0.0) or 0.0))
+            rate_limit_remaining.labels(service=service).set(float(snapshot.get("remaining", 0) or 0))
+
     def record_rate_limit_hit(self, service: str):
         """Record rate limit hit"""
         rate_limit_hits.labels(service=service).inc()
@@ -150,6 +171,17 @@ class PrometheusMetrics:
         """Record notification failure"""
         notification_failures.labels(channel=channel).inc()
 
+    def update_cycle_stages(self, stages: Dict[str, Dict[str, Any]]):
+        """Update per-stage cycle latency gauges from engine stage statistics"""
+        for stage, stats in (stages or {}).items():
+            if not isinstance(stats, dict):
+                continue
+            for quantile, key in (("0.5", "median"), ("0.95", "p95"), ("0.99", "p99"), ("max", "max")):
+                cycle_stage_latency.labels(stage=stage, quantile=quantile).set(
+                    float(stats.get(key, 0.0) or 0.0)
+                )
+            cycle_stage_count.labels(stage=stage).set(float(stats.get("count", 0) or 0))
+
     def set_bot_status(self, running: bool):
         """Set bot running status"""
         bot_status.set(1 if running else 0)
@@ -10,14 +10,13 @@ Replaces 30-second polling with instant push notifications for:
 - Market opportunities
 """
 
-from typing import Dict, List, Any, Optional
+import time
 from datetime import datetime
+from threading import Event, Lock
+from typing import Any, Dict, List, Optional
+
 from flask import Flask
 from flask_socketio import SocketIO, emit, join_room, leave_room
-from flask_cors import CORS
-import json
-from threading import Thread, Lock
-import time
 
 from logger import get_logger
 
@@ -66,9 +65,16 @@ class RealtimeServer:
             "portfolio": [],
             "opportunities": [],
             "system": [],
+            "logs": [],
         }
         self.queue_lock = Lock()
 
+        # 'logs' room follower: runs only while the room has subscribers
+        self._log_follow_reader = None
+        self._log_follow_interval = 1.0
+        self._log_follow_stop: Optional[Event] = None
+        self._log_follow_lock = Lock()
+
         # Rate limiting
         self.last_broadcast_time: Dict[str, float] = {}
         self.min_broadcast_interval = 0.1  # 100ms minimum between broadcasts
@@ -123,6 +129,7 @@ class RealtimeServer:
             with self.connection_lock:
                 if client_id in self.active_connections:
                     del self.active_connections[client_id]
+            self._update_log_follow()
 
             if self.logger:
                 self.logger.info(f"WebSocket client disconnected: {client_id}")
@@ -141,6 +148,8 @@ class RealtimeServer:
                         self.active_connections[client_id]["rooms"] = []
                     if room not in self.active_connections[client_id]["rooms"]:
                         self.active_connections[client_id]["rooms"].append(room)
+            if room == "logs":
+                self._update_log_follow()
 
             emit(
                 "subscribed",
@@ -163,6 +172,8 @@ class RealtimeServer:
                     rooms = self.active_connections[client_id].get("rooms", [])
                     if room in rooms:
                         rooms.remove(room)
+            if room == "logs":
+                self._update_log_follow()
 
             emit(
                 "unsubscribed",
@@ -338,6 +349,66 @@ class RealtimeServer:
 
         self._broadcast_to_room("system", "system_message", event_data)
 
+    def broadcast_log_records(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Push new log records to clients in the 'logs' room (one batch per poll)
+
+        Args:
+            records: Parsed log records (timestamp, level, source, message)
+        """
+        if not records:
+            return
+        self.socketio.emit("log_records", {"records": records}, room="logs")
+        self.stats["messages_sent"] += 1
+
+    def follow_log(self, log_reader, interval: float = 1.0) -> None:
+        """
+        Push records appended to a log file to the 'logs' room, replacing
+        /api/logs/recent polling for subscribed clients.
+
+        The file is only polled while the room has subscribers: the first
+        subscribe starts a background task, the last unsubscribe or disconnect
+        stops it.
+
+        Args:
+            log_reader: LogReader for the followed log
+            interval: Seconds between size checks
+        """
+        self._log_follow_reader = log_reader
+        self._log_follow_interval = interval
+        self._update_log_follow()
+
+    def _update_log_follow(self) -> None:
+        """Start or stop the log follower to match the 'logs' room"""
+        if self._log_follow_reader is None:
+            return
+        with self._log_follow_lock:
+            wanted = self._room_has_subscribers("logs")
+            if wanted and self._log_follow_stop is None:
+                self._log_follow_stop = Event()
+                self.socketio.start_background_task(
+                    self._follow_log,
+                    self._log_follow_reader,
+                    self._log_follow_interval,
+                    self._log_follow_stop,
+                )
+            elif not wanted and self._log_follow_stop is not None:
+                self._log_follow_stop.set()
+                self._log_follow_stop = None
+
+    def _follow_log(self, log_reader, interval: float, stop: Event) -> None:
+        """Background task: poll log_reader until stop is set"""
+        cursor = None  # First read starts at EOF
+        while not stop.is_set():
+            try:
+                records, cursor = log_reader.read_new(cursor)
+                if records:
+                    self.broadcast_log_records(records)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Log follow failed: {str(e)}")
+            self.socketio.sleep(interval)
+
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics"""
         with self.connection_lock:
@@ -382,6 +453,13 @@ class RealtimeServer:
 
         return request.sid
 
+    def _room_has_subscribers(self, room: str) -> bool:
+        """True if any connected client has joined room"""
+        with self.connection_lock:
+            return any(
+                room in conn.get("rooms", []) for conn in self.active_connections.values()
+            )
+
     def _broadcast_to_room(
         self, room: str, event_name: str, data: Dict[str, Any]
     ) -> None:
@@ -0,0 +1,318 @@
+"""
+Strategy Replay Harness
+
+Replays recorded Polymarket snapshots (polymarket_history) through real
+strategy classes. History is bulk-loaded once and grouped into cycles of
+(markets, prices_dict), the same shapes StrategyManager passes to
+find_opportunities. Signals are routed the way
+StrategyManager.execute_best_opportunities routes them, into an in-memory
+PaperTradingEngine in replay mode (no execution gate, no log files, no trade
+logging).
+
+run_replays() fans strategies / parameter sets out to worker processes; the
+cycles are handed to each worker once (process initializer), not per job.
+
+Open positions are marked to market at each cycle's last YES price; there is
+no resolution data in polymarket_history, so nothing is settled.
+"""
+
+import importlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from database.models import PolymarketHistory
+from services.paper_trading_engine import PaperTradingEngine
+
+DEFAULT_CYCLE_SECONDS = 60
+DEFAULT_TRADES_PER_CYCLE = 3  # Same cap as StrategyManager.execute_best_opportunities
+
+# (cycle start unix ts, markets, prices_dict)
+ReplayCycle = Tuple[int, List[Dict[str, Any]], Dict[str, Dict[str, float]]]
+
+
+class _NullLogger:
+    """Logger stand-in: every log_* call is a no-op"""
+
+    def __getattr__(self, name):
+        return _noop
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+NULL_LOGGER = _NullLogger()
+
+
+# ----------------------------------------------------------------------
+# Data
+# ----------------------------------------------------------------------
+
+
+def cycles_from_rows(
+    rows: Iterable[Sequence[Any]], cycle_seconds: int = DEFAULT_CYCLE_SECONDS
+) -> List[ReplayCycle]:
+    """
+    Group snapshots into replay cycles.
+
+    Args:
+        rows: (market_id, yes_price, no_price, volume, liquidity, timestamp),
+            oldest first (PolymarketHistory.get_range)
+        cycle_seconds: Cycle length; the latest snapshot per market in a cycle wins
+
+    Returns:
+        Cycles oldest first
+    """
+    cycles: List[ReplayCycle] = []
+    bucket: Optional[int] = None
+    markets: Dict[str, Dict[str, Any]] = {}
+    prices: Dict[str, Dict[str, float]] = {}
+
+    for market_id, yes, no, volume, liquidity, ts in rows:
+        cycle_start = int(ts) - int(ts) % cycle_seconds
+        if cycle_start != bucket:
+            if prices:
+                cycles.append((bucket, list(markets.values()), prices))
+            bucket, markets, prices = cycle_start, {}, {}
+        volume = volume or 0.0
+        liquidity = liquidity or 0.0
+        markets[market_id] = {
+            "id": market_id,
+            "market_id": market_id,
+            "question": market_id,
+            "volume": volume,
+            "liquidity": liquidity,
+        }
+        # Both key styles used by strategies/*
+        prices[market_id] = {
+            "yes": yes,
+            "no": no,
+            "yes_price": yes,
+            "no_price": no,
+            "volume": volume,
+            "liquidity": liquidity,
+        }
+    if prices:
+        cycles.append((bucket, list(markets.values()), prices))
+    return cycles
+
+
+def load_replay_cycles(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cycle_seconds: int = DEFAULT_CYCLE_SECONDS,
+    market_ids: Optional[List[str]] = None,
+) -> List[ReplayCycle]:
+    """Bulk-load polymarket_history (one query) and group it into cycles."""
+    rows = PolymarketHistory.get_range(
+        int(start_date.timestamp()) if start_date else None,
+        int(end_date.timestamp()) if end_date else None,
+        market_ids,
+    )
+    return cycles_from_rows(rows, cycle_seconds)
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+
+
+def build_strategy(
+    strategy: str, params: Optional[Dict[str, Any]] = None, config: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Instantiate a strategy for replay.
+
+    Args:
+        strategy: STRATEGY_REGISTRY name (strategy_manager.py) or "module:ClassName"
+        params: Parameter overrides merged into the config
+        config: Base config (as given to StrategyManager)
+
+    Returns:
+        Strategy instance with logging disabled
+    """
+    from strategy_manager import STRATEGY_REGISTRY
+
+    spec = STRATEGY_REGISTRY.get(strategy, strategy)
+    module_path, class_name = spec.split(":", 1)
+    strategy_class = getattr(importlib.import_module(module_path), class_name)
+
+    strategy_config = dict(config or {})
+    strategy_config.update(params or {})
+    # Reality arbitrage compares against *live* crypto prices: meaningless in a replay
+    # (copied so the caller's config keeps its own setting)
+    arbitrage_types = dict(strategy_config.get("arbitrage_types") or {})
+    arbitrage_types["reality_based"] = {**(arbitrage_types.get("reality_based") or {}), "enabled": False}
+    strategy_config["arbitrage_types"] = arbitrage_types
+
+    instance = strategy_class(strategy_config)
+    if hasattr(instance, "logger"):
+        instance.logger = NULL_LOGGER
+    return instance
+
+
+def _sharpe(equity_curve: List[float]) -> float:
+    """Per-cycle equity returns, annualized as in BacktestingEngine._calculate_metrics."""
+    import numpy as np
+
+    if len(equity_curve) < 2:
+        return 0.0
+    equity = np.asarray(equity_curve, dtype=float)
+    returns = np.diff(equity) / equity[:-1]
+    std = np.std(returns)
+    return float(np.mean(returns) / std * np.sqrt(252)) if std > 0 else 0.0
+
+
+def run_replay(
+    strategy: str,
+    params: Optional[Dict[str, Any]],
+    cycles: Sequence[ReplayCycle],
+    config: Optional[Dict[str, Any]] = None,
+    initial_capital: float = 10000.0,
+    commission_rate: float = 0.001,
+    slippage_rate: float = 0.001,
+    trades_per_cycle: int = DEFAULT_TRADES_PER_CYCLE,
+) -> Dict[str, Any]:
+    """
+    Replay cycles through one strategy.
+
+    Args:
+        strategy: Strategy name or "module:ClassName" (see build_strategy)
+        params: Parameter overrides
+        cycles: Replay cycles (load_replay_cycles)
+        config: Base config
+        initial_capital: Paper account balance
+        commission_rate / slippage_rate: PaperTradingEngine rates
+        trades_per_cycle: Top opportunities considered per cycle
+
+    Returns:
+        {strategy, parameters, cycles, opportunities, trades, errors, metrics, elapsed_sec}
+    """
+    from strategy_manager import opportunity_to_signal
+
+    started = time.perf_counter()
+    config = config or {}
+    instance = build_strategy(strategy, params, config)
+    engine = PaperTradingEngine(
+        initial_balance=initial_capital,
+        commission_rate=commission_rate,
+        slippage_rate=slippage_rate,
+        logger=NULL_LOGGER,
+        config=config,
+        replay=True,
+        fast_path=True,
+    )
+    trade_size = min(
+        (params or {}).get("max_trade_size", config.get("max_trade_size", 10)),
+        initial_capital * 0.1,
+    )
+
+    last_prices: Dict[str, float] = {}
+    equity_curve = [initial_capital]
+    opportunities = 0
+    errors = 0
+
+    for _, markets, prices_dict in cycles:
+        for market_id, prices in prices_dict.items():
+            last_prices[market_id] = prices["yes"]
+
+        try:
+            found = instance.find_opportunities(markets, prices_dict)
+        except Exception:
+            errors += 1
+            found = []
+        opportunities += len(found)
+
+        ranked = sorted(
+            found,
+            key=lambda x: x.profit_margin if hasattr(x, "profit_margin") else 0,
+            reverse=True,
+        )
+        for opp in ranked[:trades_per_cycle]:
+            if hasattr(instance, "should_enter") and not instance.should_enter(opp):
+                continue
+            signal = opportunity_to_signal(opp, trade_size, strategy)
+            if signal is None:
+                continue
+            held = engine.positions.get(signal.symbol)
+            if held is not None and held.quantity:
+                continue  # One position per market
+            engine.fill_market_order(signal.symbol, signal.side, signal.quantity, signal.price)
+
+        equity_curve.append(engine.get_portfolio_value(last_prices))
+
+    engine.close()
+    metrics = engine.get_performance_metrics(last_prices)
+    metrics.update(
+        {
+            "return_pct": metrics["total_return_pct"],
+            "win_rate": metrics["win_rate_pct"],
+            "sharpe_ratio": _sharpe(equity_curve),
+        }
+    )
+    return {
+        "strategy": strategy,
+        "parameters": dict(params or {}),
+        "cycles": len(cycles),
+        "opportunities": opportunities,
+        "trades": engine.total_trades,
+        "errors": errors,
+        "metrics": metrics,
+        "elapsed_sec": time.perf_counter() - started,
+    }
+
+
+# ----------------------------------------------------------------------
+# Parallel
+# ----------------------------------------------------------------------
+
+_worker_cycles: Sequence[ReplayCycle] = ()
+
+
+def _init_worker(cycles: Sequence[ReplayCycle]) -> None:
+    global _worker_cycles
+    _worker_cycles = cycles
+
+
+def _run_job(job: Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+    strategy, params, config, kwargs = job
+    return run_replay(strategy, params, _worker_cycles, config, **kwargs)
+
+
+def run_replays(
+    jobs: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+    cycles: Sequence[ReplayCycle],
+    config: Optional[Dict[str, Any]] = None,
+    processes: Optional[int] = None,
+    **replay_kwargs,
+) -> List[Dict[str, Any]]:
+    """
+    Replay the same cycles through many strategies / parameter sets.
+
+    Args:
+        jobs: (strategy, params) pairs
+        cycles: Replay cycles, shipped to each worker once
+        config: Base config for every job
+        processes: Worker processes (None = CPU count, 1 = run in this process)
+        **replay_kwargs: Passed to run_replay (initial_capital, ...)
+
+    Returns:
+        run_replay results, in job order
+    """
+    config = config or {}
+    if processes == 1 or len(jobs) <= 1:
+        return [
+            run_replay(strategy, params, cycles, config, **replay_kwargs)
+            for strategy, params in jobs
+        ]
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(cycles,)
+    ) as pool:
+        return list(
+            pool.map(
+                _run_job,
+                [(strategy, params or {}, config, replay_kwargs) for strategy, params in jobs],
+            )
+        )
@@ -9,19 +9,22 @@ and remove this module; execution is unchanged.
 SAFETY:
 - No automatic changes to strategy, config, or code.
 - Reads only: logs/trades.csv, logs/activity.json (via DataParser / EngineStateReader).
-- Writes only: optional JSON under analysis/reports/ for export; never strategy or config.
+- Writes only: optional JSON under analysis/reports/ for export, and the derived
+  incremental diagnostics cache (logs/strategy_diagnostics_state.json); never strategy or config.
 """
 
+import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-import json
+
 
 # Lazy import of analysis package so execution path can run without it
 def _get_analysis():
-    from analysis.trade_context import enrich_trades_for_analysis, get_trade_context_audit
     from analysis.diagnostics import StrategyDiagnosticsEngine
     from analysis.suggestions import SuggestionGenerator
+    from analysis.trade_context import enrich_trades_for_analysis, get_trade_context_audit
     return enrich_trades_for_analysis, get_trade_context_audit, StrategyDiagnosticsEngine, SuggestionGenerator
 
 
@@ -30,6 +33,23 @@ _last_diagnostics: Dict[str, Any] = {}
 _last_suggestions: List[Dict[str, Any]] = []
 _last_run_at: Optional[str] = None
 
+# Incremental diagnostics per logs dir (kept in memory between runs)
+_incremental: Dict[str, Any] = {}
+_incremental_lock = threading.Lock()
+
+
+def _get_incremental(data_parser):
+    """Return IncrementalDiagnostics for the parser's SQLite store, or None if there is no store."""
+    logs_dir = getattr(data_parser, "logs_dir", None)
+    if logs_dir is None or not (Path(logs_dir) / "trades.db").exists():
+        return None
+    key = str(Path(logs_dir).resolve())
+    with _incremental_lock:
+        if key not in _incremental:
+            from analysis.incremental import IncrementalDiagnostics
+            _incremental[key] = IncrementalDiagnostics(Path(logs_dir))
+        return _incremental[key]
+
 
 def run_analysis(data_parser, strategy_name: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -44,10 +64,25 @@ def run_analysis(data_parser, strategy_name: Optional[str] = None) -> Dict[str,
         SuggestionGenerator,
     ) = _get_analysis()
 
-    engine = StrategyDiagnosticsEngine(data_parser)
-    diag = engine.run(strategy_name)
+    incremental = None
+    try:
+        incremental = _get_incremental(data_parser)
+        if incremental is not None:
+            incremental.refresh()
+            if not incremental.sample_size:
+                incremental = None
+    except Exception:
+        incremental = None
+
     gen = SuggestionGenerator(data_parser)
-    suggestions = gen.run(strategy_name)
+    if incremental is not None:
+        # Aggregates updated by trade id: no full history re-read
+        diag = incremental.diagnostics(strategy_name)
+        suggestions = gen.generate(diag, incremental.evidence_counts(strategy_name), strategy_name)
+    else:
+        engine = StrategyDiagnosticsEngine(data_parser)
+        diag = engine.run(strategy_name)
+        suggestions = gen.run(strategy_name)
 
     _last_diagnostics = diag
     _last_suggestions = suggestions
@@ -2,6 +2,7 @@
 Time Analytics Service
 
 Analyze when trades perform best (hour of day, day of week, monthly).
+Reads trade store rollups when available (full history, O(buckets)).
 CRITICAL: All money calculations use Decimal for accuracy.
 """
 
@@ -10,6 +11,8 @@ from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
 from collections import defaultdict
 
+from services.analytics_rollups import get_rollup_groups
+
 
 class TimeAnalytics:
     """Calculate time-based performance analytics"""
@@ -23,34 +26,98 @@ class TimeAnalytics:
         """
         self.data_parser = data_parser
 
-    def get_hour_of_day_analysis(
-        self, start_date: Optional[str] = None, end_date: Optional[str] = None
-    ) -> Dict[str, Any]:
+    def _group_stats(
+        self,
+        group_by: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[Any, Dict[str, Any]]:
         """
-        Analyze performance by hour of day (0-23)
+        Trade count, wins and total P&L per time group.
+
+        Reads SQLite rollups (full history, O(buckets)) when available; otherwise
+        groups trade rows from the data parser.
 
         Args:
+            group_by: hour_of_day (0-23) | day_of_week (0=Monday) | bucket (month "YYYY-MM")
             start_date: Start date filter (ISO format)
             end_date: End date filter (ISO format)
-
-        Returns:
-            Dictionary with hourly analysis data
         """
-        # Get all trades
+        rollups = get_rollup_groups(
+            self.data_parser,
+            group_by,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if rollups is not None:
+            if group_by == "bucket":
+                # Buckets are months, or hours when a date filter forces hour grain
+                monthly: Dict[str, Dict[str, Any]] = {}
+                for bucket, stats in rollups.items():
+                    month = monthly.setdefault(
+                        bucket[:7], {"count": 0, "wins": 0, "total_pnl": Decimal("0")}
+                    )
+                    month["count"] += stats["count"]
+                    month["wins"] += stats["wins"]
+                    month["total_pnl"] += stats["total_pnl"]
+                return monthly
+            return rollups
+
         trades_data = self.data_parser.get_trades(
             start_date=start_date, end_date=end_date, per_page=10000  # Get all trades
         )
-        trades = trades_data["trades"]
+        key_fns = {
+            "hour_of_day": lambda dt: dt.hour,  # 0-23
+            "day_of_week": lambda dt: dt.weekday(),  # 0=Monday, 6=Sunday
+            "bucket": lambda dt: dt.strftime("%Y-%m"),
+        }
+        key_fn = key_fns[group_by]
 
-        # Group trades by hour
-        hourly_trades = defaultdict(list)
-        for trade in trades:
+        groups: Dict[Any, Dict[str, Any]] = defaultdict(
+            lambda: {"count": 0, "wins": 0, "total_pnl": Decimal("0")}
+        )
+        for trade in trades_data["trades"]:
             try:
-                entry_time = datetime.fromisoformat(trade["entry_time"])
-                hour = entry_time.hour  # 0-23
-                hourly_trades[hour].append(trade)
+                key = key_fn(datetime.fromisoformat(trade["entry_time"]))
             except (ValueError, KeyError):
                 continue
+            stats = groups[key]
+            stats["count"] += 1
+            if trade["pnl_usd"] > 0:
+                stats["wins"] += 1
+            stats["total_pnl"] += Decimal(str(trade["pnl_usd"]))
+        return groups
+
+    @staticmethod
+    def _win_rate(stats: Dict[str, Any]) -> float:
+        return float(
+            (
+                Decimal(stats["wins"]) / Decimal(stats["count"]) * Decimal("100")
+            ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        )
+
+    @staticmethod
+    def _avg_profit(stats: Dict[str, Any]) -> float:
+        return float(
+            (Decimal(str(float(stats["total_pnl"]))) / Decimal(stats["count"])).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+        )
+
+    def get_hour_of_day_analysis(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze performance by hour of day (0-23)
+
+        Args:
+            start_date: Start date filter (ISO format)
+            end_date: End date filter (ISO format)
+
+        Returns:
+            Dictionary with hourly analysis data
+        """
+        hourly = self._group_stats("hour_of_day", start_date, end_date)
 
         # Calculate metrics for each hour
         hours = list(range(24))
@@ -60,29 +127,13 @@ class TimeAnalytics:
         avg_profit_per_hour = []
 
         for hour in hours:
-            hour_trades = hourly_trades.get(hour, [])
-
-            if hour_trades:
-                # Calculate metrics
-                trade_count = len(hour_trades)
-                winning_count = len([t for t in hour_trades if t["pnl_usd"] > 0])
-                win_rate = float(
-                    (
-                        Decimal(winning_count) / Decimal(trade_count) * Decimal("100")
-                    ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                )
-
-                total_pnl = float(sum(Decimal(str(t["pnl_usd"])) for t in hour_trades))
-                avg_profit = float(
-                    (Decimal(str(total_pnl)) / Decimal(trade_count)).quantize(
-                        Decimal("0.01"), rounding=ROUND_HALF_UP
-                    )
-                )
+            stats = hourly.get(hour)
 
-                trades_per_hour.append(trade_count)
-                pnl_per_hour.append(total_pnl)
-                win_rate_per_hour.append(win_rate)
-                avg_profit_per_hour.append(avg_profit)
+            if stats and stats["count"]:
+                trades_per_hour.append(stats["count"])
+                pnl_per_hour.append(float(stats["total_pnl"]))
+                win_rate_per_hour.append(self._win_rate(stats))
+                avg_profit_per_hour.append(self._avg_profit(stats))
             else:
                 trades_per_hour.append(0)
                 pnl_per_hour.append(0.0)
@@ -110,21 +161,7 @@ class TimeAnalytics:
         Returns:
             Dictionary with daily analysis data
         """
-        # Get all trades
-        trades_data = self.data_parser.get_trades(
-            start_date=start_date, end_date=end_date, per_page=10000  # Get all trades
-        )
-        trades = trades_data["trades"]
-
-        # Group trades by day of week
-        daily_trades = defaultdict(list)
-        for trade in trades:
-            try:
-                entry_time = datetime.fromisoformat(trade["entry_time"])
-                day = entry_time.weekday()  # 0=Monday, 6=Sunday
-                daily_trades[day].append(trade)
-            except (ValueError, KeyError):
-                continue
+        daily = self._group_stats("day_of_week", start_date, end_date)
 
         # Calculate metrics for each day
         days = list(range(7))
@@ -143,29 +180,13 @@ class TimeAnalytics:
         avg_profit_per_day = []
 
         for day in days:
-            day_trades = daily_trades.get(day, [])
-
-            if day_trades:
-                # Calculate metrics
-                trade_count = len(day_trades)
-                winning_count = len([t for t in day_trades if t["pnl_usd"] > 0])
-                win_rate = float(
-                    (
-                        Decimal(winning_count) / Decimal(trade_count) * Decimal("100")
-                    ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                )
-
-                total_pnl = float(sum(Decimal(str(t["pnl_usd"])) for t in day_trades))
-                avg_profit = float(
-                    (Decimal(str(total_pnl)) / Decimal(trade_count)).quantize(
-                        Decimal("0.01"), rounding=ROUND_HALF_UP
-                    )
-                )
+            stats = daily.get(day)
 
-                trades_per_day.append(trade_count)
-                pnl_per_day.append(total_pnl)
-                win_rate_per_day.append(win_rate)
-                avg_profit_per_day.append(avg_profit)
+            if stats and stats["count"]:
+                trades_per_day.append(stats["count"])
+                pnl_per_day.append(float(stats["total_pnl"]))
+                win_rate_per_day.append(self._win_rate(stats))
+                avg_profit_per_day.append(self._avg_profit(stats))
             else:
                 trades_per_day.append(0)
                 pnl_per_day.append(0.0)
@@ -194,58 +215,22 @@ class TimeAnalytics:
         Returns:
             List of monthly performance dictionaries
         """
-        # Get all trades
-        trades_data = self.data_parser.get_trades(
-            start_date=start_date, end_date=end_date, per_page=10000  # Get all trades
-        )
-        trades = trades_data["trades"]
-
-        # Group trades by month
-        monthly_trades = defaultdict(list)
-        for trade in trades:
-            try:
-                entry_time = datetime.fromisoformat(trade["entry_time"])
-                month_key = entry_time.strftime("%Y-%m")
-                monthly_trades[month_key].append(trade)
-            except (ValueError, KeyError):
-                continue
+        monthly = self._group_stats("bucket", start_date, end_date)
 
         # Calculate metrics for each month
         results = []
-        for month_key in sorted(monthly_trades.keys()):
-            month_trades = monthly_trades[month_key]
-
-            trade_count = len(month_trades)
-            winning_count = len([t for t in month_trades if t["pnl_usd"] > 0])
-            win_rate = (
-                float(
-                    (
-                        Decimal(winning_count) / Decimal(trade_count) * Decimal("100")
-                    ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                )
-                if trade_count > 0
-                else 0.0
-            )
-
-            total_pnl = float(sum(Decimal(str(t["pnl_usd"])) for t in month_trades))
-            avg_profit = (
-                float(
-                    (Decimal(str(total_pnl)) / Decimal(trade_count)).quantize(
-                        Decimal("0.01"), rounding=ROUND_HALF_UP
-                    )
-                )
-                if trade_count > 0
-                else 0.0
-            )
+        for month_key in sorted(monthly.keys()):
+            stats = monthly[month_key]
+            trade_count = stats["count"]
 
             results.append(
                 {
                     "month": month_key,
                     "total_trades": trade_count,
-                    "winning_trades": winning_count,
-                    "win_rate": win_rate,
-                    "total_pnl": total_pnl,
-                    "avg_profit": avg_profit,
+                    "winning_trades": stats["wins"],
+                    "win_rate": self._win_rate(stats) if trade_count > 0 else 0.0,
+                    "total_pnl": float(stats["total_pnl"]),
+                    "avg_profit": self._avg_profit(stats) if trade_count > 0 else 0.0,
                 }
             )
 
@@ -19,6 +19,7 @@ from enum import Enum
 from logger import get_logger
 from version_manager import VersionManager
 from services.process_manager import ProcessManager
+from services.backup_store import BackupStore
 
 logger = get_logger()
 
@@ -49,6 +50,7 @@ class UpdateService:
 
         self.lock_file = self.base_dir / ".update_lock"
         self.backups_dir = self.base_dir / "backups"
+        self.backup_store = BackupStore(self.base_dir, self.backups_dir)
         self.progress_file = self.base_dir / "logs" / "update_progress.json"
 
         # Ensure directories exist
@@ -379,9 +381,16 @@ class UpdateService:
 
         return all_passed, checks
 
-    def create_backup(self) -> Tuple[bool, Optional[str]]:
+    def create_backup(self, background: bool = False) -> Tuple[bool, Optional[str]]:
         """
-        Create full backup of current system
+        Create a deduplicated backup of the current system
+
+        Only file contents not already in the backup store are copied; the
+        backup itself is a manifest (see services/backup_store.py).
+
+        Args:
+            background: Snapshot in a daemon thread and return immediately
+                (rollback / cleanup wait for it)
 
         Returns:
             (success, backup_name) tuple
@@ -389,58 +398,18 @@ class UpdateService:
         try:
             # Generate backup name
             backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            backup_path = self.backups_dir / backup_name
-            backup_path.mkdir(exist_ok=True)
-
             logger.log_info(f"Creating backup: {backup_name}")
 
-            # Backup Python files
-            for py_file in self.base_dir.glob("*.py"):
-                shutil.copy2(py_file, backup_path)
+            if background:
+                self.backup_store.snapshot_in_background(backup_name)
+                return True, backup_name
 
-            # Backup VERSION file
-            if (self.base_dir / "VERSION").exists():
-                shutil.copy2(self.base_dir / "VERSION", backup_path)
-
-            # Backup config
-            if (self.base_dir / "config.yaml").exists():
-                shutil.copy2(self.base_dir / "config.yaml", backup_path)
-
-            # Backup services directory
-            if (self.base_dir / "services").exists():
-                shutil.copytree(
-                    self.base_dir / "services",
-                    backup_path / "services",
-                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-                )
-
-            # Backup dashboard directory
-            if (self.base_dir / "dashboard").exists():
-                shutil.copytree(
-                    self.base_dir / "dashboard",
-                    backup_path / "dashboard",
-                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-                )
-
-            # Backup database files
-            if (self.base_dir / "database").exists():
-                shutil.copytree(
-                    self.base_dir / "database",
-                    backup_path / "database",
-                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-                )
-
-            # Backup state directory
-            if (self.base_dir / "state").exists():
-                shutil.copytree(self.base_dir / "state", backup_path / "state")
-
-            # Calculate backup size
-            total_size = sum(
-                f.stat().st_size for f in backup_path.rglob("*") if f.is_file()
+            manifest = self.backup_store.snapshot(backup_name)
+            size_mb = manifest["total_size"] / (1024 * 1024)
+            new_mb = manifest["new_bytes"] / (1024 * 1024)
+            logger.log_info(
+                f"Backup created: {backup_name} ({size_mb:.1f}MB, {new_mb:.1f}MB new)"
             )
-            size_mb = total_size / (1024 * 1024)
-
-            logger.log_info(f"Backup created: {backup_name} ({size_mb:.1f}MB)")
 
             # Cleanup old backups (keep 5 most recent)
             self._cleanup_old_backups(keep=5)
@@ -452,18 +421,9 @@ class UpdateService:
             return False, None
 
     def _cleanup_old_backups(self, keep: int = 5):
-        """Remove old backups, keeping only the most recent ones"""
+        """Remove old backups, keeping only the most recent ones, and unreferenced objects"""
         try:
-            backups = sorted(
-                [d for d in self.backups_dir.iterdir() if d.is_dir()],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True,
-            )
-
-            for old_backup in backups[keep:]:
-                logger.log_info(f"Removing old backup: {old_backup.name}")
-                shutil.rmtree(old_backup)
-
+            self.backup_store.prune(keep=keep)
         except Exception as e:
             logger.log_error(f"Error cleaning up backups: {e}")
 
@@ -701,17 +661,23 @@ class UpdateService:
             self.process_manager.stop_dashboard()
             time.sleep(2)
 
-            # Restore files
+            # Restore files (only those that differ from the backup)
             logger.log_info("Restoring files from backup...")
-            for item in backup_path.iterdir():
-                dest = self.base_dir / item.name
-
-                if item.is_file():
-                    shutil.copy2(item, dest)
-                elif item.is_dir():
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    shutil.copytree(item, dest)
+            self.backup_store.wait()
+            if self.backup_store.load_manifest(backup_name) is not None:
+                copied, removed = self.backup_store.restore(backup_name)
+                logger.log_info(f"Restored {copied} files, removed {removed}")
+            else:
+                # Legacy full-copy backup
+                for item in backup_path.iterdir():
+                    dest = self.base_dir / item.name
+
+                    if item.is_file():
+                        shutil.copy2(item, dest)
+                    elif item.is_dir():
+                        if dest.exists():
+                            shutil.rmtree(dest)
+                        shutil.copytree(item, dest)
 
             # Restart processes
             logger.log_info("Restarting processes...")
@@ -17,17 +17,37 @@ Tracking and Orchestration:
 - ArbitrageOrchestrator: Orchestrates arbitrage with integrated tracking
 """
 
-from .arbitrage_strategy import ArbitrageStrategy
-from .momentum_strategy import MomentumStrategy
-from .news_strategy import NewsStrategy
-from .statistical_arb_strategy import StatisticalArbStrategy
-from .mean_reversion_strategy import MeanReversionStrategy
-from .volatility_breakout_strategy import VolatilityBreakoutStrategy
-from .pairs_trading_strategy import PairsTradingStrategy
-from .weather_trading import WeatherTradingStrategy
-from .btc_arbitrage import BTCArbitrageStrategy
-from .arbitrage_tracker import ArbitrageTracker
-from .arbitrage_orchestrator import ArbitrageOrchestrator
+import importlib
+
+# Strategy classes are resolved on first attribute access (PEP 562) so importing
+# one strategy does not pull in every other strategy and its dependencies.
+_LAZY_EXPORTS = {
+    "ArbitrageStrategy": ".arbitrage_strategy",
+    "MomentumStrategy": ".momentum_strategy",
+    "NewsStrategy": ".news_strategy",
+    "StatisticalArbStrategy": ".statistical_arb_strategy",
+    "MeanReversionStrategy": ".mean_reversion_strategy",
+    "VolatilityBreakoutStrategy": ".volatility_breakout_strategy",
+    "PairsTradingStrategy": ".pairs_trading_strategy",
+    "WeatherTradingStrategy": ".weather_trading",
+    "BTCArbitrageStrategy": ".btc_arbitrage",
+    "ArbitrageTracker": ".arbitrage_tracker",
+    "ArbitrageOrchestrator": ".arbitrage_orchestrator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "ArbitrageStrategy",
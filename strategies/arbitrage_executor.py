@@ -3,11 +3,19 @@ Arbitrage Executor Module
 
 Executes different types of arbitrage opportunities with rollback on failure.
 Supports 2-way, 3-way, and multi-leg arbitrage strategies.
+
+Legs run one after another by default. In concurrent mode the Kalshi legs go
+first (Kalshi-first rule), then every remaining leg is placed at once under
+per-leg and total latency budgets; a leg that overruns its budget is
+cancelled and the filled legs are unwound in parallel.
 """
 
-from typing import Dict, Any, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import logging
+import threading
+import time
 from strategies.arbitrage_types import ArbitrageOpportunity, ArbitrageType, ArbitrageLeg
 from strategies.kalshi_priority import validate_kalshi_first
 from strategies.rollback_handler import RollbackHandler
@@ -25,9 +33,41 @@ class ArbitrageExecutor:
     Implements rollback on failure.
     """
 
-    def __init__(self):
-        """Initialize executor with rollback handler"""
-        self.rollback_handler = RollbackHandler()
+    def __init__(
+        self,
+        exchanges: Optional[Dict[str, Any]] = None,
+        concurrent: bool = False,
+        leg_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        cancel_grace: float = 1.0,
+        max_workers: int = 8,
+        tracker: Optional[Any] = None,
+    ):
+        """
+        Initialize executor with rollback handler
+
+        Args:
+            exchanges: Optional exchange name -> client with
+                       place_order(leg, cancel_event) and reverse_order(leg)
+                       (e.g. SimulatedExchange); legs on other exchanges use
+                       the mock fill
+            concurrent: Place non-Kalshi legs in parallel
+            leg_timeout: Per-leg latency budget in seconds (concurrent mode)
+            total_timeout: Budget in seconds for the whole opportunity
+                           (concurrent mode)
+            cancel_grace: Seconds to wait for a cancelled order to confirm
+            max_workers: Thread pool size for concurrent legs
+            tracker: Optional ArbitrageTracker that receives latency samples
+        """
+        self.exchanges = {name.lower(): client for name, client in (exchanges or {}).items()}
+        self.rollback_handler = RollbackHandler(self.exchanges)
+        self.concurrent = concurrent
+        self.leg_timeout = leg_timeout
+        self.total_timeout = total_timeout
+        self.cancel_grace = cancel_grace
+        self.max_workers = max_workers
+        self.tracker = tracker
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     def execute_two_way(self, opportunity: ArbitrageOpportunity) -> Dict[str, Any]:
         """
@@ -56,6 +96,9 @@ class ArbitrageExecutor:
                 "timestamp": datetime.now(),
             }
 
+        if self.concurrent:
+            return self._execute_concurrent(opportunity, ArbitrageType.TWO_WAY)
+
         executed_legs: List[ArbitrageLeg] = []
 
         # Sort legs by execution order
@@ -66,7 +109,7 @@ class ArbitrageExecutor:
         logger.info(f"Executing leg 1: {leg1.exchange} {leg1.action} {leg1.market_id}")
 
         # Simulate execution (in production, would call exchange API)
-        leg1_success = self._execute_leg(leg1)
+        leg1_success = self._run_leg(leg1)
 
         if not leg1_success:
             logger.error(f"Leg 1 failed: {leg1.exchange} {leg1.market_id}")
@@ -87,14 +130,14 @@ class ArbitrageExecutor:
         leg2 = sorted_legs[1]
         logger.info(f"Executing leg 2: {leg2.exchange} {leg2.action} {leg2.market_id}")
 
-        leg2_success = self._execute_leg(leg2)
+        leg2_success = self._run_leg(leg2)
 
         if not leg2_success:
             logger.error(f"Leg 2 failed: {leg2.exchange} {leg2.market_id}")
             logger.warning("Rolling back leg 1...")
 
             # Rollback first leg
-            self.rollback_handler.rollback_opportunity(executed_legs)
+            self._rollback(executed_legs)
 
             return {
                 "success": False,
@@ -147,6 +190,9 @@ class ArbitrageExecutor:
                 "timestamp": datetime.now(),
             }
 
+        if self.concurrent:
+            return self._execute_concurrent(opportunity, ArbitrageType.THREE_WAY)
+
         executed_legs: List[ArbitrageLeg] = []
         sorted_legs = sorted(opportunity.legs, key=lambda leg: leg.order)
 
@@ -156,7 +202,7 @@ class ArbitrageExecutor:
                 f"Executing leg {i}: {leg.exchange} {leg.action} {leg.market_id}"
             )
 
-            success = self._execute_leg(leg)
+            success = self._run_leg(leg)
 
             if not success:
                 logger.error(f"Leg {i} failed: {leg.exchange} {leg.market_id}")
@@ -166,7 +212,7 @@ class ArbitrageExecutor:
                     logger.warning(
                         f"Rolling back {len(executed_legs)} executed legs..."
                     )
-                    self.rollback_handler.rollback_opportunity(executed_legs)
+                    self._rollback(executed_legs)
 
                 return {
                     "success": False,
@@ -220,6 +266,9 @@ class ArbitrageExecutor:
                 "timestamp": datetime.now(),
             }
 
+        if self.concurrent:
+            return self._execute_concurrent(opportunity, ArbitrageType.MULTI_LEG)
+
         executed_legs: List[ArbitrageLeg] = []
         sorted_legs = sorted(opportunity.legs, key=lambda leg: leg.order)
 
@@ -229,7 +278,7 @@ class ArbitrageExecutor:
                 f"Executing leg {i}/{num_legs}: {leg.exchange} {leg.action} {leg.market_id}"
             )
 
-            success = self._execute_leg(leg)
+            success = self._run_leg(leg)
 
             if not success:
                 logger.error(f"Leg {i} failed: {leg.exchange} {leg.market_id}")
@@ -239,7 +288,7 @@ class ArbitrageExecutor:
                     logger.warning(
                         f"Rolling back {len(executed_legs)} executed legs..."
                     )
-                    self.rollback_handler.rollback_opportunity(executed_legs)
+                    self._rollback(executed_legs)
 
                 return {
                     "success": False,
@@ -292,12 +341,13 @@ class ArbitrageExecutor:
             }
 
         # Route to appropriate executor
+        started = time.monotonic()
         if opportunity.type == ArbitrageType.TWO_WAY:
-            return self.execute_two_way(opportunity)
+            result = self.execute_two_way(opportunity)
         elif opportunity.type == ArbitrageType.THREE_WAY:
-            return self.execute_three_way(opportunity)
+            result = self.execute_three_way(opportunity)
         elif opportunity.type == ArbitrageType.MULTI_LEG:
-            return self.execute_multi_leg(opportunity)
+            result = self.execute_multi_leg(opportunity)
         else:
             return {
                 "success": False,
@@ -309,19 +359,238 @@ class ArbitrageExecutor:
                 "timestamp": datetime.now(),
             }
 
-    def _execute_leg(self, leg: ArbitrageLeg) -> bool:
+        self._record_latency("total", time.monotonic() - started)
+        return result
+
+    def close(self) -> None:
+        """Shut down the concurrent leg pool (without waiting on stragglers)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _execute_concurrent(
+        self, opportunity: ArbitrageOpportunity, arb_type: ArbitrageType
+    ) -> Dict[str, Any]:
         """
-        Execute a single leg (mock implementation)
+        Execute legs concurrently under the latency budgets
 
-        In production, this would call actual exchange APIs.
-        For now, simulates successful execution.
+        Kalshi legs at the front of the order run first; the remaining legs are
+        then placed together. The first rejection or an exhausted budget
+        cancels every leg still in flight, and whatever filled is rolled back
+        concurrently.
+
+        Args:
+            opportunity: Validated ArbitrageOpportunity
+            arb_type: Type reported in the result
+
+        Returns:
+            Execution result dictionary, plus latency_ms ({"total", "legs"}),
+            timed_out_legs, unresolved_legs and rollback
+        """
+        num_legs = len(opportunity.legs)
+        started = time.monotonic()
+        deadline = started + self.total_timeout if self.total_timeout else None
+
+        sorted_legs = sorted(opportunity.legs, key=lambda leg: leg.order)
+        kalshi_count = 0
+        while (
+            kalshi_count < num_legs
+            and sorted_legs[kalshi_count].exchange.lower() == "kalshi"
+        ):
+            kalshi_count += 1
+        stages = [sorted_legs[:kalshi_count], sorted_legs[kalshi_count:]]
+
+        filled: List[ArbitrageLeg] = []
+        failures: List[Tuple[ArbitrageLeg, str]] = []
+        unresolved: List[ArbitrageLeg] = []
+        leg_latency: Dict[int, float] = {}
+
+        for stage in stages:
+            if not stage:
+                continue
+            logger.info(
+                f"Placing {len(stage)} leg(s) concurrently: "
+                + ", ".join(f"{leg.exchange} {leg.action} {leg.market_id}" for leg in stage)
+            )
+            stage_filled, stage_failures, stage_unresolved = self._run_stage(
+                stage, deadline, leg_latency
+            )
+            filled.extend(stage_filled)
+            failures.extend(stage_failures)
+            unresolved.extend(stage_unresolved)
+            if stage_failures or stage_unresolved:
+                break
+
+        rollback = None
+        if failures or unresolved:
+            for leg, reason in failures:
+                logger.error(f"Leg {leg.order} {reason}: {leg.exchange} {leg.market_id}")
+            for leg in unresolved:
+                logger.error(
+                    f"Leg {leg.order} cancel unconfirmed after {self.cancel_grace}s: "
+                    f"{leg.exchange} {leg.market_id} (not rolled back)"
+                )
+            if filled:
+                logger.warning(f"Rolling back {len(filled)} executed legs...")
+                rollback = self._rollback(filled)
+
+        total = time.monotonic() - started
+        success = not failures and not unresolved
+        error = None
+        if not success:
+            reasons = "; ".join(f"leg {leg.order} {reason}" for leg, reason in failures)
+            if unresolved:
+                unresolved_orders = ", ".join(str(leg.order) for leg in unresolved)
+                reasons = "; ".join(filter(None, [reasons, f"legs {unresolved_orders} unresolved"]))
+            error = f"{reasons}, rolled back {len(filled)} legs"
+
+        return {
+            "success": success,
+            "type": arb_type.value,
+            "legs_executed": len(filled),
+            "legs_failed": num_legs - len(filled),
+            "profit": opportunity.expected_profit if success else 0.0,
+            "error": error,
+            "timestamp": datetime.now(),
+            "latency_ms": {
+                "total": total * 1000,
+                "legs": {order: seconds * 1000 for order, seconds in leg_latency.items()},
+            },
+            "timed_out_legs": [leg.order for leg, reason in failures if reason.startswith("timed out")],
+            "unresolved_legs": [leg.order for leg in unresolved],
+            "rollback": rollback,
+        }
+
+    def _run_stage(
+        self,
+        legs: List[ArbitrageLeg],
+        deadline: Optional[float],
+        leg_latency: Dict[int, float],
+    ) -> Tuple[List[ArbitrageLeg], List[Tuple[ArbitrageLeg, str]], List[ArbitrageLeg]]:
+        """
+        Place legs in parallel and wait for them within the budgets
+
+        Args:
+            legs: Legs to place together
+            deadline: time.monotonic() deadline of the whole opportunity
+            leg_latency: Filled in with leg order -> seconds
+
+        Returns:
+            (filled legs, [(failed leg, reason)], legs whose cancel was not
+            confirmed within cancel_grace)
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="arbitrage-leg"
+            )
+
+        cancel_events: Dict[Future, threading.Event] = {}
+        leg_of: Dict[Future, ArbitrageLeg] = {}
+        for leg in legs:
+            cancel_event = threading.Event()
+            future = self._pool.submit(self._timed_leg, leg, cancel_event)
+            cancel_events[future] = cancel_event
+            leg_of[future] = leg
+
+        submitted = time.monotonic()
+        stage_deadline = deadline
+        if self.leg_timeout:
+            leg_deadline = submitted + self.leg_timeout
+            stage_deadline = leg_deadline if deadline is None else min(deadline, leg_deadline)
+
+        filled: List[ArbitrageLeg] = []
+        failures: List[Tuple[ArbitrageLeg, str]] = []
+
+        def collect(future: Future, cancel_reason: Optional[str] = None) -> None:
+            leg = leg_of[future]
+            try:
+                success, seconds = future.result()
+            except Exception as e:
+                success, seconds = False, time.monotonic() - submitted
+                cancel_reason = f"raised {e}"
+            leg_latency[leg.order] = seconds
+            self._record_latency(f"leg:{leg.exchange.lower()}", seconds)
+            if success:
+                filled.append(leg)
+            else:
+                failures.append((leg, cancel_reason or "rejected"))
+
+        pending = set(leg_of)
+        while pending:
+            timeout = None
+            if stage_deadline is not None:
+                timeout = max(0.0, stage_deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future)
+            if not done or failures:
+                break
+
+        if not pending:
+            return filled, failures, []
+
+        # Budget exhausted or a leg failed: cancel the rest. A leg can still
+        # fill before its cancel lands, in which case it is rolled back too.
+        if failures:
+            cancel_reason = "cancelled"
+        else:
+            budget = stage_deadline - submitted
+            cancel_reason = f"timed out after {budget * 1000:.0f}ms"
+        for future in pending:
+            cancel_events[future].set()
+        done, still_pending = wait(pending, timeout=self.cancel_grace)
+        for future in done:
+            collect(future, cancel_reason)
+        return filled, failures, [leg_of[future] for future in still_pending]
+
+    def _run_leg(self, leg: ArbitrageLeg) -> bool:
+        """Execute one leg in the calling thread and record its latency"""
+        success, seconds = self._timed_leg(leg)
+        self._record_latency(f"leg:{leg.exchange.lower()}", seconds)
+        return success
+
+    def _timed_leg(
+        self, leg: ArbitrageLeg, cancel_event: Optional[threading.Event] = None
+    ) -> Tuple[bool, float]:
+        """Execute one leg, returning (success, seconds taken)"""
+        started = time.monotonic()
+        success = self._execute_leg(leg, cancel_event)
+        return success, time.monotonic() - started
+
+    def _rollback(self, executed_legs: List[ArbitrageLeg]) -> Dict[str, Any]:
+        """Unwind executed legs (in parallel in concurrent mode) and record latency"""
+        started = time.monotonic()
+        result = self.rollback_handler.rollback_opportunity(
+            executed_legs, concurrent=self.concurrent
+        )
+        self._record_latency("rollback", time.monotonic() - started)
+        return result
+
+    def _record_latency(self, name: str, seconds: float) -> None:
+        if self.tracker is not None:
+            self.tracker.record_latency(name, seconds)
+
+    def _execute_leg(
+        self, leg: ArbitrageLeg, cancel_event: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Execute a single leg
+
+        Legs on an exchange passed to the constructor are placed there; the
+        rest use the mock implementation. In production, this would call
+        actual exchange APIs.
 
         Args:
             leg: ArbitrageLeg to execute
+            cancel_event: Set by the executor to cancel an in-flight order
 
         Returns:
             True if execution successful
         """
+        exchange = self.exchanges.get(leg.exchange.lower())
+        if exchange is not None:
+            return exchange.place_order(leg, cancel_event)
+
         # In production:
         # 1. Connect to exchange API
         # 2. Place order with leg parameters
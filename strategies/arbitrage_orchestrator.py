@@ -30,7 +30,14 @@ class ArbitrageOrchestrator:
         self.config = config
         self.strategy = ArbitrageStrategy(config)
         self.tracker = ArbitrageTracker()
-        self.executor = ArbitrageExecutor()
+
+        execution_config = config.get("multi_leg_execution", {})
+        self.executor = ArbitrageExecutor(
+            concurrent=execution_config.get("concurrent", False),
+            leg_timeout=execution_config.get("leg_timeout_seconds"),
+            total_timeout=execution_config.get("total_timeout_seconds"),
+            tracker=self.tracker,
+        )
 
     def detect_opportunity(
         self, market_data: Dict[str, Any], price_data: Dict[str, float]
@@ -9,6 +9,11 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from logger import get_logger
 from engine import TradeSignal
+from strategies.threshold_ladder import ThresholdLadderIndex
+from utils.market_parser import get_market_parse_cache
+
+# Correlated markets: minimum YES price inversion between ladder rungs (noise floor)
+CORRELATED_MIN_PRICE_GAP = 0.05
 
 
 class ArbitrageOpportunity:
@@ -110,6 +115,12 @@ class ArbitrageStrategy:
 
         # Arbitrage types configuration
         self.arbitrage_types_config = config.get("arbitrage_types", {})
+        self.correlated_min_price_gap = self.arbitrage_types_config.get(
+            "correlated_markets", {}
+        ).get("min_price_gap", CORRELATED_MIN_PRICE_GAP)
+
+        # Threshold ladders for correlated markets, updated incrementally per cycle
+        self.threshold_ladders = ThresholdLadderIndex()
 
         # DEPRECATED: strategies do not own execution state.
         # Kept only for backward compatibility / analytics.
@@ -444,7 +455,12 @@ class ArbitrageStrategy:
         Type 3: Detect correlated markets arbitrage
 
         Detects logical impossibilities like:
-        - "BTC > 100k" priced higher than "BTC > 95k"
+        - "BTC > 100k" priced higher than "BTC > 95k" (same expiry)
+        - "BTC < 90k" priced higher than "BTC < 95k"
+
+        Markets are kept on threshold ladders (strategies/threshold_ladder.py)
+        that are synced with the market list each call, so only new or changed
+        questions are parsed, and each ladder is checked in one sweep.
 
         Args:
             markets: List of market information
@@ -453,103 +469,24 @@ class ArbitrageStrategy:
         Returns:
             List of correlated markets arbitrage opportunities
         """
-        opportunities = []
-
-        # Look for related markets (simplified implementation)
-        # In production, would use more sophisticated matching
-        market_pairs = []
-        for i, market1 in enumerate(markets):
-            for market2 in markets[i + 1 :]:
-                # Check if markets are related (e.g., same asset, different thresholds)
-                if self._markets_are_related(market1, market2):
-                    market_pairs.append((market1, market2))
-
-        # Check each pair for logical inconsistencies
-        for market1, market2 in market_pairs:
-            market_id_1 = market1.get("id", "")
-            market_id_2 = market2.get("id", "")
-
-            prices_1 = prices_dict.get(market_id_1, {})
-            prices_2 = prices_dict.get(market_id_2, {})
+        ladders = self.threshold_ladders
+        ladders.sync(markets)
 
-            if not prices_1 or not prices_2:
-                continue
-
-            # Example: If "BTC > 100k" has higher YES price than "BTC > 95k", there's an opportunity
-            # This is a simplified check - production would need more sophisticated logic
-            yes_1 = prices_1.get("yes", 0)
-            yes_2 = prices_2.get("yes", 0)
-
-            # Check if there's a logical inconsistency
-            if self._is_correlated_inconsistency(market1, market2, yes_1, yes_2):
-                # Create opportunity (simplified - would need more complex structure)
-                opportunity = ArbitrageOpportunity(
-                    market_id=f"{market_id_1}_{market_id_2}",
-                    market_name=f"Correlated: {market1.get('question', '')} vs {market2.get('question', '')}",
-                    yes_price=yes_1,
-                    no_price=1 - yes_1,
+        opportunities = []
+        for rich_id, cheap_id, rich_yes, _ in ladders.violations(
+            prices_dict, self.correlated_min_price_gap
+        ):
+            opportunities.append(
+                ArbitrageOpportunity(
+                    market_id=f"{rich_id}_{cheap_id}",
+                    market_name=f"Correlated: {ladders.question(rich_id)} vs {ladders.question(cheap_id)}",
+                    yes_price=rich_yes,
+                    no_price=1 - rich_yes,
                     arbitrage_type="Correlated Markets",
                 )
-                opportunities.append(opportunity)
-
+            )
         return opportunities
 
-    def _markets_are_related(
-        self, market1: Dict[str, Any], market2: Dict[str, Any]
-    ) -> bool:
-        """Check if two markets are related (same asset, different thresholds)"""
-        # Simplified: Check if they share keywords
-        q1 = market1.get("question", "").lower()
-        q2 = market2.get("question", "").lower()
-
-        # Check for common assets
-        assets = ["btc", "eth", "sol", "bitcoin", "ethereum", "solana"]
-        for asset in assets:
-            if asset in q1 and asset in q2:
-                return True
-
-        return False
-
-    def _is_correlated_inconsistency(
-        self,
-        market1: Dict[str, Any],
-        market2: Dict[str, Any],
-        price1: float,
-        price2: float,
-    ) -> bool:
-        """Check if there's a logical inconsistency in correlated markets"""
-        # Simplified implementation
-        # In production, would parse thresholds and check logical consistency
-
-        # Example: Extract numbers from market questions
-        import re
-
-        q1 = market1.get("question", "")
-        q2 = market2.get("question", "")
-
-        # Find numbers in questions
-        nums1 = re.findall(r"\d+", q1)
-        nums2 = re.findall(r"\d+", q2)
-
-        if not nums1 or not nums2:
-            return False
-
-        # Simple check: if first market has higher threshold but higher probability
-        # This is a placeholder - real implementation would need more context
-        try:
-            threshold1 = float(nums1[0])
-            threshold2 = float(nums2[0])
-
-            # If threshold1 > threshold2 but price1 > price2, that's inconsistent
-            if threshold1 > threshold2 and price1 > price2:
-                # Require significant difference to avoid noise
-                if price1 - price2 > 0.05:  # 5% difference
-                    return True
-        except (ValueError, IndexError):
-            pass
-
-        return False
-
     def detect_time_based_arbitrage(
         self, markets: List[Dict[str, Any]], prices_dict: Dict[str, Dict[str, float]]
     ) -> List[ArbitrageOpportunity]:
@@ -570,16 +507,10 @@ class ArbitrageStrategy:
         # Group markets by similar questions with different timeframes
         # Simplified implementation - production would use date parsing
 
+        parse_cache = get_market_parse_cache()
         for market in markets:
-            question = market.get("question", "").lower()
-
-            # Look for time-related keywords
-            if (
-                "by" in question
-                or "before" in question
-                or "2024" in question
-                or "2025" in question
-            ):
+            # Parsed once per market; time-bound questions carry an expiry key
+            if parse_cache.get(market).expiry is not None:
                 # This is a placeholder - real implementation would match related markets
                 # and check if near-term has higher probability than long-term
                 pass
@@ -5,9 +5,14 @@ Tracks and analyzes arbitrage strategy performance metrics including
 opportunities found, execution results, win rate, and profit/loss statistics.
 """
 
-from typing import Dict, List, Any
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Upper bounds (ms) of the execution latency histogram buckets; the last
+# bucket catches everything slower
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
 
 class ArbitrageTracker:
     """
@@ -27,6 +32,8 @@ class ArbitrageTracker:
         self.total_loss: float = 0.0
         self.start_time: datetime = datetime.now()
         self.execution_history: List[Dict[str, Any]] = []
+        # Histogram name ("total", "leg:<exchange>", "rollback") -> bucket counts
+        self.latency_histograms: Dict[str, Dict[str, Any]] = {}
 
     @property
     def win_rate(self) -> float:
@@ -100,6 +107,74 @@ class ArbitrageTracker:
 
         self.execution_history.append(execution_record)
 
+    def record_latency(self, name: str, seconds: float) -> None:
+        """
+        Add one execution latency sample to a histogram
+
+        Args:
+            name: Histogram name, e.g. "total" for a whole opportunity or
+                  "leg:kalshi" for one exchange's legs
+            seconds: Measured latency in seconds
+        """
+        histogram = self.latency_histograms.get(name)
+        if histogram is None:
+            histogram = {
+                "counts": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                "count": 0,
+                "sum_ms": 0.0,
+                "max_ms": 0.0,
+            }
+            self.latency_histograms[name] = histogram
+
+        ms = seconds * 1000
+        histogram["counts"][bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        histogram["count"] += 1
+        histogram["sum_ms"] += ms
+        histogram["max_ms"] = max(histogram["max_ms"], ms)
+
+    def get_latency_summary(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Summarize one latency histogram
+
+        Percentiles are bucket upper bounds (the overflow bucket reports the
+        observed maximum), so they over-estimate by at most one bucket.
+
+        Args:
+            name: Histogram name passed to record_latency()
+
+        Returns:
+            Dictionary with count, mean_ms, max_ms, p50_ms, p95_ms, p99_ms and
+            buckets ({"<=5ms": n, ..., ">10000ms": n}), or None if no samples
+        """
+        histogram = self.latency_histograms.get(name)
+        if not histogram or histogram["count"] == 0:
+            return None
+
+        counts = histogram["counts"]
+        total = histogram["count"]
+
+        def percentile(pct: float) -> float:
+            target = pct / 100 * total
+            running = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, counts):
+                running += count
+                if running >= target:
+                    return float(min(bound, histogram["max_ms"]))
+            return histogram["max_ms"]
+
+        buckets = {f"<={bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, counts)}
+        buckets[f">{LATENCY_BUCKETS_MS[-1]}ms"] = counts[-1]
+
+        return {
+            "count": total,
+            "mean_ms": histogram["sum_ms"] / total,
+            "max_ms": histogram["max_ms"],
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+            "buckets": buckets,
+        }
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get current metrics snapshot
@@ -123,6 +198,9 @@ class ArbitrageTracker:
             "running_time_hours": hours,
             "running_time_minutes": minutes,
             "execution_history": self.execution_history,
+            "execution_latency": {
+                name: self.get_latency_summary(name) for name in self.latency_histograms
+            },
         }
 
     def reset_metrics(self) -> None:
@@ -133,6 +211,7 @@ class ArbitrageTracker:
         self.total_loss = 0.0
         self.start_time = datetime.now()
         self.execution_history = []
+        self.latency_histograms = {}
 
     def export_summary(self) -> str:
         """
@@ -152,6 +231,12 @@ class ArbitrageTracker:
         summary += f"Total Profit: ${net_profit:.2f}\n"
         summary += f"Average Profit: ${metrics['average_profit']:.2f}\n"
         summary += f"Running Time: {metrics['running_time_hours']}h {metrics['running_time_minutes']}m\n"
+        total_latency = metrics["execution_latency"].get("total")
+        if total_latency:
+            summary += (
+                f"Execution Latency: p50 {total_latency['p50_ms']:.0f}ms, "
+                f"p95 {total_latency['p95_ms']:.0f}ms\n"
+            )
         summary += "============================"
 
         return summary
@@ -3,14 +3,22 @@ BTC Arbitrage Strategy Module
 
 Implements Bitcoin volatility arbitrage on Polymarket's 15-minute BTC UP/DOWN markets.
 Captures risk-free profit when UP_price + DOWN_price < $1.00.
+
+Markets are classified and paired once, when first listed: a pairing index
+keyed by market ID holds one bucket per expiry with its UP/DOWN pairs
+pre-matched, and a heap ordered by expiry drops buckets as they expire. Each
+cycle only refreshes prices, classifies new listings and drops delistings.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+import heapq
+import time
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+
 from logger import get_logger
 from engine import TradeSignal
-import time
+from utils.market_parser import get_market_parse_cache
 
 
 @dataclass
@@ -35,6 +43,30 @@ class ArbitrageOpportunity:
     reasoning: str
 
 
+class _PairingEntry:
+    """Classified BTC market (pairing index entry)"""
+
+    __slots__ = ("market", "expiry", "expiry_key", "estimated")
+
+    def __init__(self, market: Dict, expiry: datetime, estimated: bool):
+        self.market = market  # Latest dict for this market (current prices)
+        self.expiry = expiry
+        self.expiry_key = expiry.isoformat()
+        self.estimated = estimated
+
+
+class _ExpiryBucket:
+    """BTC markets sharing one expiry; pairs rebuilt only when membership changes"""
+
+    __slots__ = ("expiry", "expiry_ts", "members", "pairs")
+
+    def __init__(self, expiry: datetime):
+        self.expiry = expiry
+        self.expiry_ts = expiry.timestamp()
+        self.members: Dict[str, None] = {}  # market_id, in listing order
+        self.pairs: Optional[List[Tuple[str, str]]] = None  # (up_id, down_id)
+
+
 class BTCArbitrageStrategy:
     """
     Bitcoin Volatility Arbitrage Strategy
@@ -73,30 +105,38 @@ class BTCArbitrageStrategy:
             {}
         )  # expiry_time -> (up_id, down_id)
 
+        # Pairing index: market_id -> entry (None = not a BTC 15-min market, or
+        # expired), market_id -> (question, end_date, parent) it was classified
+        # from, expiry key -> bucket, and an (expiry_ts, expiry key) min-heap
+        self._pairing_entries: Dict[str, Optional[_PairingEntry]] = {}
+        self._pairing_identity: Dict[str, Tuple] = {}
+        self._expiry_buckets: Dict[str, _ExpiryBucket] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+
         self.logger.log_info(
             f"BTC Arbitrage Strategy initialized with min profit margin: {self.min_profit_margin:.2%}"
         )
 
-    def find_opportunities(self, markets: List[Dict]) -> List[ArbitrageOpportunity]:
+    def find_opportunities(
+        self, markets: List[Dict], prices_dict: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> List[ArbitrageOpportunity]:
         """
         Find BTC arbitrage opportunities
 
         Args:
-            markets: List of available markets
+            markets: List of available markets (prices are read from each market)
+            prices_dict: Unused; accepted for StrategyManager's
+                find_opportunities(markets, prices_dict) call
 
         Returns:
             List of identified arbitrage opportunities
         """
         opportunities = []
 
-        # First, identify and pair BTC UP/DOWN markets
-        btc_markets = self._identify_btc_markets(markets)
-        market_pairs = self._pair_markets(btc_markets)
-
-        # Analyze each pair for arbitrage
-        for up_market, down_market in market_pairs:
+        # Re-price the pre-matched UP/DOWN pairs of the pairing index
+        for up_market, down_market, expiry in self._sync_pairing_index(markets):
             try:
-                opportunity = self.analyze_pair(up_market, down_market)
+                opportunity = self.analyze_pair(up_market, down_market, expiry_time=expiry)
 
                 if opportunity and opportunity.profit_margin >= self.min_profit_margin:
                     opportunities.append(opportunity)
@@ -110,6 +150,118 @@ class BTCArbitrageStrategy:
 
         return opportunities
 
+    def _sync_pairing_index(
+        self, markets: List[Dict], now: Optional[float] = None
+    ) -> List[Tuple[Dict, Dict, datetime]]:
+        """
+        Bring the pairing index in line with this cycle's markets
+
+        Args:
+            markets: Current market list
+            now: Unix time (default: time.time())
+
+        Returns:
+            (up_market, down_market, expiry) for every live pair, with the
+            market dicts from this cycle
+        """
+        now = time.time() if now is None else now
+        entries = self._pairing_entries
+        seen = set()
+
+        for market in markets:
+            market_id = market.get("id")
+            if market_id is None:
+                continue
+            seen.add(market_id)
+            identity = (
+                market.get("question", ""),
+                market.get("end_date") or market.get("endDate"),
+                market.get("parent_market_id") or market.get("groupItemId"),
+            )
+            if market_id in entries and self._pairing_identity[market_id] == identity:
+                entry = entries[market_id]
+                if entry is not None:
+                    entry.market = market
+                continue
+            if market_id in entries:
+                self._unindex_market(market_id)
+            self._index_market(market_id, market, identity, now)
+
+        for market_id in [m for m in entries if m not in seen]:
+            self._unindex_market(market_id)
+
+        # Drop buckets whose expiry has passed (stale heap items are skipped)
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry_ts, expiry_key = heapq.heappop(heap)
+            bucket = self._expiry_buckets.get(expiry_key)
+            if bucket is None or bucket.expiry_ts != expiry_ts:
+                continue
+            del self._expiry_buckets[expiry_key]
+            for market_id in bucket.members:
+                if entries[market_id].estimated:
+                    # Estimated expiry: re-estimate if it is still listed next cycle
+                    del entries[market_id]
+                    del self._pairing_identity[market_id]
+                else:
+                    entries[market_id] = None
+
+        pairs = []
+        for bucket in self._expiry_buckets.values():
+            if bucket.pairs is None:
+                members = [entries[m].market for m in bucket.members]
+                bucket.pairs = [
+                    (up.get("id"), down.get("id")) for up, down in self._pair_group(members)
+                ]
+            for up_id, down_id in bucket.pairs:
+                pairs.append((entries[up_id].market, entries[down_id].market, bucket.expiry))
+        return pairs
+
+    def _index_market(self, market_id: str, market: Dict, identity: Tuple, now: float) -> None:
+        """Classify a newly listed (or edited) market and add it to its expiry bucket."""
+        self._pairing_identity[market_id] = identity
+        if not self._is_btc_market(market):
+            self._pairing_entries[market_id] = None
+            return
+
+        expiry = self._extract_expiry_time(market)
+        entry = _PairingEntry(market, expiry, estimated=not identity[1])
+        if expiry.timestamp() <= now:
+            self._pairing_entries[market_id] = None  # Listed after its expiry
+            return
+        self._pairing_entries[market_id] = entry
+
+        bucket = self._expiry_buckets.get(entry.expiry_key)
+        if bucket is None:
+            bucket = self._expiry_buckets[entry.expiry_key] = _ExpiryBucket(expiry)
+            heapq.heappush(self._expiry_heap, (bucket.expiry_ts, entry.expiry_key))
+        bucket.members[market_id] = None
+        bucket.pairs = None
+
+    def _unindex_market(self, market_id: str) -> None:
+        """Remove a delisted (or edited) market from the index."""
+        entry = self._pairing_entries.pop(market_id)
+        del self._pairing_identity[market_id]
+        if entry is None:
+            return
+        bucket = self._expiry_buckets.get(entry.expiry_key)
+        if bucket is None or market_id not in bucket.members:
+            return
+        del bucket.members[market_id]
+        bucket.pairs = None
+        if not bucket.members:
+            del self._expiry_buckets[entry.expiry_key]
+
+    def _is_btc_market(self, market: Dict) -> bool:
+        """Check if market is a 15-minute BTC UP/DOWN market"""
+        parsed = get_market_parse_cache().get(market)
+        # BTC/Bitcoin, an UP/DOWN or directional keyword, and a 15-minute expiry
+        return (
+            parsed.asset == "BTC"
+            and (parsed.is_up or parsed.is_down)
+            and parsed.fifteen_minute
+        )
+
     def _identify_btc_markets(self, markets: List[Dict]) -> List[Dict]:
         """
         Identify BTC UP/DOWN markets
@@ -120,26 +272,7 @@ class BTCArbitrageStrategy:
         Returns:
             List of BTC-related markets
         """
-        btc_markets = []
-
-        for market in markets:
-            question = market.get("question", "").lower()
-
-            # Look for BTC/Bitcoin markets with UP/DOWN or directional indicators
-            if "btc" in question or "bitcoin" in question:
-                # Check for UP/DOWN or directional keywords
-                if any(
-                    keyword in question
-                    for keyword in ["up", "down", "higher", "lower", "above", "below"]
-                ):
-                    # Check for 15-minute or short-term expiry
-                    if any(
-                        keyword in question
-                        for keyword in ["15 min", "15-min", "15min", "fifteen minute"]
-                    ):
-                        btc_markets.append(market)
-
-        return btc_markets
+        return [market for market in markets if self._is_btc_market(market)]
 
     def _pair_markets(self, btc_markets: List[Dict]) -> List[Tuple[Dict, Dict]]:
         """
@@ -168,16 +301,31 @@ class BTCArbitrageStrategy:
 
         # Pair UP and DOWN markets for each expiry
         for expiry_key, markets in expiry_groups.items():
-            up_markets = [m for m in markets if self._is_up_market(m)]
-            down_markets = [m for m in markets if self._is_down_market(m)]
+            pairs.extend(self._pair_group(markets))
+
+        return pairs
 
-            # Create pairs (assuming 1:1 pairing)
-            for up_market in up_markets:
-                for down_market in down_markets:
-                    # Verify they're for the same underlying event
-                    if self._markets_match(up_market, down_market):
-                        pairs.append((up_market, down_market))
-                        break  # Move to next up_market
+    def _pair_group(self, markets: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """
+        Pair UP and DOWN markets sharing one expiry
+
+        Args:
+            markets: Markets of one expiry group
+
+        Returns:
+            List of (up_market, down_market) tuples
+        """
+        pairs = []
+        up_markets = [m for m in markets if self._is_up_market(m)]
+        down_markets = [m for m in markets if self._is_down_market(m)]
+
+        # Create pairs (assuming 1:1 pairing)
+        for up_market in up_markets:
+            for down_market in down_markets:
+                # Verify they're for the same underlying event
+                if self._markets_match(up_market, down_market):
+                    pairs.append((up_market, down_market))
+                    break  # Move to next up_market
 
         return pairs
 
@@ -217,14 +365,12 @@ class BTCArbitrageStrategy:
         return expiry
 
     def _is_up_market(self, market: Dict) -> bool:
-        """Check if market is an UP market"""
-        question = market.get("question", "").lower()
-        return "up" in question or "higher" in question or "above" in question
+        """Check if market is an UP market (up / higher / above)"""
+        return get_market_parse_cache().get(market).is_up
 
     def _is_down_market(self, market: Dict) -> bool:
-        """Check if market is a DOWN market"""
-        question = market.get("question", "").lower()
-        return "down" in question or "lower" in question or "below" in question
+        """Check if market is a DOWN market (down / lower / below)"""
+        return get_market_parse_cache().get(market).is_down
 
     def _markets_match(self, up_market: Dict, down_market: Dict) -> bool:
         """
@@ -266,7 +412,7 @@ class BTCArbitrageStrategy:
         return similarity > 0.7
 
     def analyze_pair(
-        self, up_market: Dict, down_market: Dict
+        self, up_market: Dict, down_market: Dict, expiry_time: Optional[datetime] = None
     ) -> Optional[ArbitrageOpportunity]:
         """
         Analyze a UP/DOWN market pair for arbitrage opportunity
@@ -274,6 +420,7 @@ class BTCArbitrageStrategy:
         Args:
             up_market: UP market data
             down_market: DOWN market data
+            expiry_time: Pair expiry if already known (parsed from up_market otherwise)
 
         Returns:
             ArbitrageOpportunity or None if no opportunity
@@ -293,10 +440,10 @@ class BTCArbitrageStrategy:
         profit_margin = profit / total_cost if total_cost > 0 else 0
 
         # Extract expiry time
-        expiry_time = self._extract_expiry_time(up_market)
-        seconds_until_expiry = (
-            (expiry_time - datetime.now()).total_seconds() if expiry_time else 0
-        )
+        if expiry_time is None:
+            expiry_time = self._extract_expiry_time(up_market)
+        # Via timestamps: works for naive and tz-aware ("...Z") expiries alike
+        seconds_until_expiry = expiry_time.timestamp() - time.time() if expiry_time else 0
 
         # Estimate costs
         estimated_fees = total_cost * self.trading_fee_rate
@@ -11,14 +11,165 @@ and trades based on real momentum signals with:
 """
 
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
-from collections import deque, defaultdict
-import statistics
+from datetime import datetime
+from collections import defaultdict
+import time
+
+import numpy as np
 
 from logger import get_logger
 from engine import TradeSignal
 
 
+class PriceRingBuffer:
+    """
+    Fixed-size tick history for one symbol
+
+    Timestamps (time.monotonic() seconds), prices and volumes live in
+    preallocated NumPy arrays written in a ring, so memory is bounded by
+    capacity regardless of tick rate. Timestamps are non-decreasing, which
+    makes the start of a time window a binary search (O(log n)). Sums and
+    counts of positive volumes are kept for the older and newer half of the
+    history as ticks arrive, so the volume ratio is O(1).
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of ticks kept (oldest are overwritten)
+        """
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._prices = np.zeros(capacity, dtype=np.float64)
+        self._volumes = np.zeros(capacity, dtype=np.float64)
+        self._start = 0  # Physical index of the oldest tick
+        self._size = 0
+
+        # Positive-volume sum / count over the older half (logical
+        # [0, _old_len), _old_len == size // 2) and the newer half
+        self._old_len = 0
+        self._old_sum = 0.0
+        self._old_count = 0
+        self._new_sum = 0.0
+        self._new_count = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, price: float, volume: float = 0.0, timestamp: Optional[float] = None) -> None:
+        """
+        Add a tick, overwriting the oldest once full
+
+        Args:
+            price: Price in USD
+            volume: 24h volume (ticks with volume <= 0 are left out of volume ratios)
+            timestamp: time.monotonic() seconds (defaults to now; clamped so
+                       timestamps never go backwards)
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._size:
+            timestamp = max(timestamp, self._timestamps[self._physical(self._size - 1)])
+
+        if self._size == self.capacity:
+            # Evict the oldest tick from the older half
+            evicted = self._volumes[self._start]
+            if evicted > 0:
+                self._old_sum -= evicted
+                self._old_count -= 1
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+            self._old_len -= 1
+
+        index = self._physical(self._size)
+        self._timestamps[index] = timestamp
+        self._prices[index] = price
+        self._volumes[index] = volume
+        self._size += 1
+        if volume > 0:
+            self._new_sum += volume
+            self._new_count += 1
+
+        # Move ticks across the midpoint until the older half is size // 2 long
+        while self._old_len < self._size // 2:
+            moved = self._volumes[self._physical(self._old_len)]
+            if moved > 0:
+                self._new_sum -= moved
+                self._new_count -= 1
+                self._old_sum += moved
+                self._old_count += 1
+            self._old_len += 1
+
+        if index == self.capacity - 1:
+            self._resync_volume_sums()
+
+    def price_change(self, window_seconds: float, now: Optional[float] = None) -> float:
+        """
+        Percentage change from the first tick inside the window to the latest
+
+        Args:
+            window_seconds: Window length in seconds
+            now: time.monotonic() seconds (defaults to now)
+
+        Returns:
+            Price change percentage (0.0 with fewer than 2 ticks in the window)
+        """
+        if now is None:
+            now = time.monotonic()
+        first = self._first_at_or_after(now - window_seconds)
+        if self._size - first < 2:
+            return 0.0
+
+        old_price = self._prices[self._physical(first)]
+        new_price = self._prices[self._physical(self._size - 1)]
+        if old_price == 0:
+            return 0.0
+        return float((new_price - old_price) / old_price * 100)
+
+    def volume_change(self) -> float:
+        """
+        Percentage change of mean positive volume, newer half vs older half
+
+        Returns:
+            Volume change percentage (0.0 with fewer than 10 ticks or when
+            either half has no volume)
+        """
+        if self._size < 10 or self._old_count == 0 or self._new_count == 0:
+            return 0.0
+        old_volume = self._old_sum / self._old_count
+        new_volume = self._new_sum / self._new_count
+        if old_volume == 0:
+            return 0.0
+        return float((new_volume - old_volume) / old_volume * 100)
+
+    def _physical(self, logical: int) -> int:
+        return (self._start + logical) % self.capacity
+
+    def _first_at_or_after(self, cutoff: float) -> int:
+        """Logical index of the first tick with timestamp >= cutoff (size if none)"""
+        # The logical sequence is at most two sorted runs of the array
+        end = self._start + self._size
+        if end <= self.capacity:
+            return int(np.searchsorted(self._timestamps[self._start:end], cutoff, side="left"))
+
+        older = self._timestamps[self._start:]
+        if cutoff <= older[-1]:
+            return int(np.searchsorted(older, cutoff, side="left"))
+        newer = self._timestamps[: end - self.capacity]
+        return len(older) + int(np.searchsorted(newer, cutoff, side="left"))
+
+    def _resync_volume_sums(self) -> None:
+        """Recompute the running sums once per lap so float drift cannot build up"""
+        volumes = np.roll(self._volumes, -self._start)[: self._size]
+        old, new = volumes[: self._old_len], volumes[self._old_len :]
+        self._old_sum = float(old[old > 0].sum())
+        self._old_count = int((old > 0).sum())
+        self._new_sum = float(new[new > 0].sum())
+        self._new_count = int((new > 0).sum())
+
+
 class CryptoMomentumStrategy:
     """
     Professional crypto momentum strategy with REAL signal detection
@@ -61,8 +212,10 @@ class CryptoMomentumStrategy:
         self.take_profit_pct = 5.0  # 5% take profit
         self.trailing_stop_pct = 1.5  # 1.5% trailing stop
 
-        # Price history tracking (symbol -> price history)
-        self.price_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        # Price history tracking (symbol -> fixed-size tick ring)
+        self.price_history: Dict[str, PriceRingBuffer] = defaultdict(
+            lambda: PriceRingBuffer(capacity=1000)
+        )
 
         # DEPRECATED: strategies do not own execution state.
         # Kept only for backward compatibility / analytics.
@@ -86,13 +239,7 @@ class CryptoMomentumStrategy:
             price: Current price in USD
             volume: Current 24h volume
         """
-        self.price_history[symbol].append(
-            {
-                "timestamp": datetime.now(),
-                "price": price,
-                "volume": volume,
-            }
-        )
+        self.price_history[symbol].append(price, volume)
 
     def analyze_momentum(
         self, symbol: str, current_price: float, current_volume: float = 0.0
@@ -118,7 +265,7 @@ class CryptoMomentumStrategy:
         self.update_price(symbol, current_price, current_volume)
 
         # Need sufficient history
-        history = list(self.price_history[symbol])
+        history = self.price_history[symbol]
         if len(history) < 20:
             return None
 
@@ -289,40 +436,13 @@ class CryptoMomentumStrategy:
 
     # Private helper methods
 
-    def _calculate_price_change(self, history: List[Dict], minutes: int) -> float:
+    def _calculate_price_change(self, history: PriceRingBuffer, minutes: int) -> float:
         """Calculate price change over time window"""
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_prices = [h["price"] for h in history if h["timestamp"] >= cutoff_time]
-
-        if len(recent_prices) < 2:
-            return 0.0
-
-        old_price = recent_prices[0]
-        new_price = recent_prices[-1]
-
-        if old_price == 0:
-            return 0.0
-
-        return ((new_price - old_price) / old_price) * 100
-
-    def _calculate_volume_change(self, history: List[Dict]) -> float:
-        """Calculate volume change"""
-        if len(history) < 10:
-            return 0.0
-
-        # Compare recent volume to older volume
-        mid_point = len(history) // 2
-        old_volume = statistics.mean(
-            h["volume"] for h in history[:mid_point] if h["volume"] > 0
-        )
-        new_volume = statistics.mean(
-            h["volume"] for h in history[mid_point:] if h["volume"] > 0
-        )
-
-        if old_volume == 0:
-            return 0.0
+        return history.price_change(minutes * 60)
 
-        return ((new_volume - old_volume) / old_volume) * 100
+    def _calculate_volume_change(self, history: PriceRingBuffer) -> float:
+        """Calculate volume change (recent half of the history vs older half)"""
+        return history.volume_change()
 
     def _calculate_momentum_score(
         self, price_5m: float, price_15m: float, price_1h: float, volume: float
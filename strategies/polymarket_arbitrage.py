@@ -7,13 +7,16 @@ This module implements ACTUAL arbitrage detection and execution with:
 - Position sizing based on liquidity
 - Advanced risk management
 - Performance tracking and analytics
+- Batch scanning: simple arbitrage over packed price arrays (numpy)
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 import math
 
+import numpy as np
+
 from logger import get_logger
 from engine import TradeSignal
 
@@ -168,6 +171,150 @@ class PolymarketArbitrageStrategy:
         if adjusted_profit <= 0:
             return None
 
+        return self._build_simple_opportunity(
+            market_id,
+            market_name,
+            yes_price,
+            no_price,
+            price_sum,
+            profit_margin_pct,
+            position_size,
+            estimated_slippage,
+            adjusted_profit,
+        )
+
+    def analyze_markets(
+        self,
+        markets: List[Dict[str, Any]],
+        prices_dict: Dict[str, Dict[str, float]],
+        liquidity_dict: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze every market in one pass (same results as analyze_market per market)
+
+        Args:
+            markets: Market information dicts (id / market_id, question)
+            prices_dict: market_id -> {'yes': float, 'no': float}
+            liquidity_dict: Optional market_id -> {'yes': float, 'no': float}
+
+        Returns:
+            Opportunity dicts, in market order
+        """
+        arrays = pack_market_arrays(markets, prices_dict, liquidity_dict)
+        return self.analyze_markets_batch(markets, *arrays)
+
+    def analyze_markets_batch(
+        self,
+        markets: Sequence[Dict[str, Any]],
+        yes_prices: np.ndarray,
+        no_prices: np.ndarray,
+        yes_liquidity: Optional[np.ndarray] = None,
+        no_liquidity: Optional[np.ndarray] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Simple arbitrage over packed arrays, one element per market
+
+        Validation, spread, position size, slippage and slippage-adjusted
+        profit are computed for all markets at once; opportunity dicts are
+        built only for the markets that pass. A market with NaN liquidity on
+        both sides is treated as having no liquidity data (NaN on one side
+        counts as 0, like a missing key in liquidity_data).
+
+        Args:
+            markets: Market information dicts, aligned with the arrays
+            yes_prices: YES prices
+            no_prices: NO prices
+            yes_liquidity: Optional YES-side liquidity in USD
+            no_liquidity: Optional NO-side liquidity in USD
+
+        Returns:
+            Opportunity dicts, in market order
+        """
+        if not self.enabled or not self.simple_enabled or len(markets) == 0:
+            return []
+
+        yes = np.asarray(yes_prices, dtype=np.float64)
+        no = np.asarray(no_prices, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # _validate_prices, then _detect_simple_arbitrage's thresholds
+            price_sum = yes + no
+            eligible = (yes > 0) & (no > 0) & (yes <= 1.0) & (no <= 1.0) & (price_sum <= 2.0)
+            eligible &= price_sum < 1.0
+            profit_per_dollar = 1.0 - price_sum
+            profit_margin_pct = (profit_per_dollar / price_sum) * 100
+            eligible &= profit_margin_pct >= self.min_profit_margin
+
+            # _calculate_position_size
+            position_size = np.minimum(
+                self.max_trade_size,
+                self.max_trade_size * (profit_margin_pct / self.min_profit_margin),
+            )
+            if yes_liquidity is not None and no_liquidity is not None:
+                yes_liq = np.asarray(yes_liquidity, dtype=np.float64)
+                no_liq = np.asarray(no_liquidity, dtype=np.float64)
+                has_liquidity = ~(np.isnan(yes_liq) & np.isnan(no_liq))
+                min_liq = np.minimum(np.nan_to_num(yes_liq), np.nan_to_num(no_liq))
+            else:
+                has_liquidity = np.zeros(len(yes), dtype=bool)
+                min_liq = np.zeros(len(yes))
+
+            limited = np.minimum(position_size, min_liq * 0.1)
+            position_size = np.where(
+                has_liquidity,
+                np.where(min_liq < self.min_liquidity, 0.0, limited),
+                position_size,
+            )
+            position_size = np.minimum(position_size, self.max_position_size)
+            eligible &= position_size > 0
+
+            # _estimate_slippage
+            slippage = np.where(
+                ~has_liquidity,
+                0.005,
+                np.where(
+                    min_liq == 0,
+                    self.max_slippage,
+                    np.minimum((position_size / min_liq) * 0.05, self.max_slippage),
+                ),
+            )
+            adjusted_profit = (profit_per_dollar * position_size) - (slippage * position_size)
+            eligible &= adjusted_profit > 0
+
+        opportunities = []
+        for i in np.flatnonzero(eligible):
+            market_data = markets[i]
+            market_id = market_data.get("id", market_data.get("market_id"))
+            market_name = market_data.get("question", market_data.get("name", market_id))
+            opportunities.append(
+                self._build_simple_opportunity(
+                    market_id,
+                    market_name,
+                    float(yes[i]),
+                    float(no[i]),
+                    float(price_sum[i]),
+                    float(profit_margin_pct[i]),
+                    float(position_size[i]),
+                    float(slippage[i]),
+                    float(adjusted_profit[i]),
+                )
+            )
+        return opportunities
+
+    def _build_simple_opportunity(
+        self,
+        market_id: str,
+        market_name: str,
+        yes_price: float,
+        no_price: float,
+        price_sum: float,
+        profit_margin_pct: float,
+        position_size: float,
+        estimated_slippage: float,
+        adjusted_profit: float,
+    ) -> Dict[str, Any]:
+        """Count, log and return a simple arbitrage opportunity that passed every check"""
+        profit_per_dollar = 1.0 - price_sum
         self.opportunities_detected += 1
 
         opportunity = {
@@ -383,3 +530,42 @@ class PolymarketArbitrageStrategy:
             "expected_profit": profit_after_execution,
             "execution_time": datetime.now(),
         }
+
+
+def pack_market_arrays(
+    markets: Sequence[Dict[str, Any]],
+    prices_dict: Dict[str, Dict[str, float]],
+    liquidity_dict: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Pack per-market price / liquidity dicts into arrays for analyze_markets_batch
+
+    Args:
+        markets: Market information dicts (id / market_id)
+        prices_dict: market_id -> {'yes': float, 'no': float}; missing prices are 0
+        liquidity_dict: Optional market_id -> {'yes': float, 'no': float}
+
+    Returns:
+        (yes_prices, no_prices, yes_liquidity, no_liquidity); the liquidity
+        arrays are None without liquidity_dict, NaN on both sides for markets
+        with no (or empty) liquidity data
+    """
+    count = len(markets)
+    yes = np.zeros(count)
+    no = np.zeros(count)
+    yes_liq = no_liq = None
+    if liquidity_dict is not None:
+        yes_liq = np.full(count, np.nan)
+        no_liq = np.full(count, np.nan)
+
+    for i, market in enumerate(markets):
+        market_id = market.get("id", market.get("market_id"))
+        prices = prices_dict.get(market_id) or {}
+        yes[i] = prices.get("yes", 0)
+        no[i] = prices.get("no", 0)
+        if liquidity_dict is not None:
+            liquidity = liquidity_dict.get(market_id)
+            if liquidity:
+                yes_liq[i] = liquidity.get("yes", 0)
+                no_liq[i] = liquidity.get("no", 0)
+    return yes, no, yes_liq, no_liq
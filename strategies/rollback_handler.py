@@ -5,7 +5,8 @@ Handles rollback of failed arbitrage trades by reversing executed legs.
 Rollback is "best effort" - logs failures but doesn't raise exceptions.
 """
 
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 import logging
 from strategies.arbitrage_types import ArbitrageLeg
 
@@ -22,6 +23,16 @@ class RollbackHandler:
     stop the rollback process.
     """
 
+    def __init__(self, exchanges: Optional[Dict[str, Any]] = None):
+        """
+        Initialize rollback handler
+
+        Args:
+            exchanges: Optional exchange name -> client with reverse_order(leg);
+                       legs on other exchanges use the simulated reversal
+        """
+        self.exchanges = {name.lower(): client for name, client in (exchanges or {}).items()}
+
     def rollback_leg(self, leg: ArbitrageLeg) -> bool:
         """
         Reverse a single executed leg (buy → sell, sell → buy)
@@ -44,7 +55,12 @@ class RollbackHandler:
                 f"(market: {leg.market_id}, quantity: {leg.quantity})"
             )
 
-            # In production, this would:
+            exchange = self.exchanges.get(leg.exchange.lower())
+            if exchange is not None:
+                if not exchange.reverse_order(leg):
+                    logger.error(f"✗ Rollback rejected by {leg.exchange} for {leg.market_id}")
+                    return False
+            # Otherwise, in production, this would:
             # 1. Create reverse order on the exchange
             # 2. Wait for execution
             # 3. Verify completion
@@ -57,15 +73,21 @@ class RollbackHandler:
             logger.error(f"✗ Rollback failed for {leg.exchange} {leg.market_id}: {e}")
             return False
 
-    def rollback_opportunity(self, executed_legs: List[ArbitrageLeg]) -> Dict[str, Any]:
+    def rollback_opportunity(
+        self, executed_legs: List[ArbitrageLeg], concurrent: bool = False
+    ) -> Dict[str, Any]:
         """
         Rollback all executed legs in reverse order
 
         Processes legs in reverse execution order (last executed first).
-        Continues rollback even if individual legs fail.
+        Continues rollback even if individual legs fail. With concurrent=True
+        every reversal is sent at once, so unwinding takes as long as the
+        slowest exchange instead of the sum of them; details keep the reverse
+        execution order either way.
 
         Args:
             executed_legs: List of ArbitrageLeg objects that were executed
+            concurrent: Reverse all legs in parallel
 
         Returns:
             Dictionary with rollback results:
@@ -96,9 +118,13 @@ class RollbackHandler:
         failed = 0
         rollback_details = []
 
-        for leg in legs_to_rollback:
-            success = self.rollback_leg(leg)
+        if concurrent and len(legs_to_rollback) > 1:
+            with ThreadPoolExecutor(max_workers=len(legs_to_rollback)) as pool:
+                outcomes = list(pool.map(self.rollback_leg, legs_to_rollback))
+        else:
+            outcomes = [self.rollback_leg(leg) for leg in legs_to_rollback]
 
+        for leg, success in zip(legs_to_rollback, outcomes):
             rollback_details.append(
                 {
                     "exchange": leg.exchange,
@@ -0,0 +1,148 @@
+"""
+Simulated Exchange Module
+
+Offline stand-ins for the exchanges an arbitrage leg is routed to. Each one
+fills orders after a configurable latency and can be told to fail, so the
+executor's concurrency, latency budgets, cancel-on-timeout and rollback paths
+can be exercised without touching a real venue.
+"""
+
+import logging
+import random
+import threading
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from strategies.arbitrage_types import ArbitrageLeg
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# Fixed seconds, or a (min, max) range drawn uniformly per order
+Latency = Union[float, Tuple[float, float]]
+
+
+class SimulatedExchange:
+    """
+    Exchange stand-in with configurable latency and failures
+
+    place_order() and reverse_order() block for the configured latency. The
+    wait is interruptible: setting the cancel event passed to place_order()
+    cancels the order before it fills, the way a cancel request reaches a
+    resting order on a real exchange.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency: Latency = 0.0,
+        rollback_latency: Optional[Latency] = None,
+        failure_rate: float = 0.0,
+        fail_markets: Optional[Set[str]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize simulated exchange
+
+        Args:
+            name: Exchange name legs are matched on (case-insensitive)
+            latency: Order latency in seconds, fixed or a (min, max) range
+            rollback_latency: Reversal latency (defaults to latency)
+            failure_rate: Probability (0-1) that an order is rejected
+            fail_markets: Market IDs whose orders are always rejected
+            seed: Random seed for latency / failure draws
+        """
+        self.name = name.lower()
+        self.latency = latency
+        self.rollback_latency = latency if rollback_latency is None else rollback_latency
+        self.failure_rate = failure_rate
+        self.fail_markets = set(fail_markets or ())
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Order log for assertions: (market_id, action, outcome)
+        self.orders: List[Tuple[str, str, str]] = []
+        self.reversals: List[Tuple[str, str]] = []
+
+    def place_order(
+        self, leg: ArbitrageLeg, cancel_event: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Place and wait for a leg's order
+
+        Args:
+            leg: ArbitrageLeg to fill
+            cancel_event: Set by the caller to cancel the order while it waits
+
+        Returns:
+            True if the order filled, False if rejected or cancelled
+        """
+        delay, rejected = self._draw(self.latency, leg.market_id)
+        cancel_event = cancel_event or threading.Event()
+
+        if cancel_event.wait(delay):
+            self._record(leg, "cancelled")
+            logger.info(f"{self.name}: order cancelled ({leg.action} {leg.market_id})")
+            return False
+
+        if rejected:
+            self._record(leg, "rejected")
+            return False
+
+        self._record(leg, "filled")
+        return True
+
+    def reverse_order(self, leg: ArbitrageLeg) -> bool:
+        """
+        Reverse a filled leg (buy → sell, sell → buy)
+
+        Args:
+            leg: Previously filled ArbitrageLeg
+
+        Returns:
+            True once the reversal has filled
+        """
+        delay, _ = self._draw(self.rollback_latency, None)
+        threading.Event().wait(delay)
+        reverse_action = "sell" if leg.action == "buy" else "buy"
+        with self._lock:
+            self.reversals.append((leg.market_id, reverse_action))
+        return True
+
+    def _draw(self, latency: Latency, market_id: Optional[str]) -> Tuple[float, bool]:
+        """Latency and rejection for one order (the RNG is shared across threads)"""
+        with self._lock:
+            if isinstance(latency, tuple):
+                delay = self._rng.uniform(*latency)
+            else:
+                delay = float(latency)
+            rejected = market_id in self.fail_markets or (
+                self.failure_rate > 0 and self._rng.random() < self.failure_rate
+            )
+        return delay, rejected
+
+    def _record(self, leg: ArbitrageLeg, outcome: str) -> None:
+        with self._lock:
+            self.orders.append((leg.market_id, leg.action, outcome))
+
+
+def build_simulated_exchanges(
+    latencies: Dict[str, Latency], seed: Optional[int] = None, **kwargs
+) -> Dict[str, SimulatedExchange]:
+    """
+    One SimulatedExchange per exchange name
+
+    Args:
+        latencies: exchange name -> latency
+        seed: Base seed; each exchange gets its own stream
+        **kwargs: Passed to every SimulatedExchange
+
+    Returns:
+        Dictionary of exchange name -> SimulatedExchange, ready for
+        ArbitrageExecutor(exchanges=...)
+    """
+    return {
+        name.lower(): SimulatedExchange(
+            name, latency=latency, seed=None if seed is None else seed + i, **kwargs
+        )
+        for i, (name, latency) in enumerate(sorted(latencies.items()))
+    }
@@ -0,0 +1,152 @@
+"""
+Threshold Ladder Index
+
+Groups threshold markets ("Will BTC be above $100k by March 2026?") into
+ladders keyed by (asset, direction, expiry), each sorted by threshold. Prices
+on a ladder must be monotonic: P(above t) can only fall as t rises, and
+P(below t) can only rise. A rung priced above a looser rung is a correlated
+markets arbitrage, and one sweep per ladder finds every such rung.
+
+Each question is parsed once, when its market first appears (the shared
+MarketParser cache supplies asset / threshold / direction and the expiry).
+sync() applies only the listings and delistings since the previous cycle.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.market_parser import get_market_parse_cache
+
+# (asset, "above" | "below", expiry)
+LadderKey = Tuple[str, str, Optional[str]]
+
+# (rich market_id, cheap market_id, rich yes price, cheap yes price)
+LadderViolation = Tuple[str, str, float, float]
+
+
+def parse_ladder_rung(question: str) -> Optional[Tuple[LadderKey, float]]:
+    """
+    Parse a market question into (ladder key, threshold).
+
+    Args:
+        question: Market question
+
+    Returns:
+        ((asset, direction, expiry), threshold), or None for questions that
+        are not asset-above/below-a-threshold markets
+    """
+    parsed = get_market_parse_cache().parse(question)
+    if not parsed.crypto_valid:
+        return None
+    return (parsed.asset, parsed.comparator, parsed.expiry), parsed.threshold
+
+
+class ThresholdLadderIndex:
+    """
+    Incrementally maintained threshold ladders over the current market set
+
+    Markets are keyed by market ID; a market is re-parsed only when its
+    question text changes.
+    """
+
+    def __init__(self):
+        # market_id -> (question, ladder key or None, threshold)
+        self._parsed: Dict[str, Tuple[str, Optional[LadderKey], float]] = {}
+        # ladder key -> [(threshold, market_id)], ascending
+        self._ladders: Dict[LadderKey, List[Tuple[float, str]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(rungs) for rungs in self._ladders.values())
+
+    def sync(self, markets: List[Dict[str, Any]]) -> None:
+        """
+        Bring the index in line with this cycle's markets.
+
+        Args:
+            markets: Current market list (id / market_id, question)
+        """
+        seen = set()
+        for market in markets:
+            market_id = market.get("id", market.get("market_id"))
+            if market_id is None:
+                continue
+            seen.add(market_id)
+            question = market.get("question", "")
+            parsed = self._parsed.get(market_id)
+            if parsed is not None:
+                if parsed[0] == question:
+                    continue
+                self._remove(market_id)
+            self._add(market_id, question)
+
+        for market_id in [m for m in self._parsed if m not in seen]:
+            self._remove(market_id)
+
+    def question(self, market_id: str) -> str:
+        parsed = self._parsed.get(market_id)
+        return parsed[0] if parsed else ""
+
+    def ladders(self) -> Dict[LadderKey, List[Tuple[float, str]]]:
+        return self._ladders
+
+    def violations(
+        self, prices_dict: Dict[str, Dict[str, float]], min_gap: float
+    ) -> List[LadderViolation]:
+        """
+        Rungs priced more than min_gap above the cheapest looser rung.
+
+        Args:
+            prices_dict: market_id -> {'yes': float, ...}; unpriced rungs are skipped
+            min_gap: Minimum YES price difference to report
+
+        Returns:
+            One (rich, cheap, rich_yes, cheap_yes) per violating rung, against
+            the cheapest looser rung on its ladder
+        """
+        found: List[LadderViolation] = []
+        for (_, direction, _), rungs in self._ladders.items():
+            # Sweep from the loosest condition: lowest threshold for "above",
+            # highest for "below"
+            ordered = rungs if direction == "above" else reversed(rungs)
+            cheapest_id: Optional[str] = None
+            cheapest_yes = 0.0
+            # Rungs at the same threshold are not looser than each other
+            tier_threshold: Optional[float] = None
+            tier_best: Optional[Tuple[str, float]] = None
+
+            for threshold, market_id in ordered:
+                prices = prices_dict.get(market_id)
+                if not prices:
+                    continue
+                yes = prices.get("yes", 0)
+
+                if threshold != tier_threshold:
+                    if tier_best is not None and (cheapest_id is None or tier_best[1] < cheapest_yes):
+                        cheapest_id, cheapest_yes = tier_best
+                    tier_threshold, tier_best = threshold, None
+
+                if cheapest_id is not None and yes - cheapest_yes > min_gap:
+                    found.append((market_id, cheapest_id, yes, cheapest_yes))
+                if tier_best is None or yes < tier_best[1]:
+                    tier_best = (market_id, yes)
+        return found
+
+    def _add(self, market_id: str, question: str) -> None:
+        rung = parse_ladder_rung(question)
+        if rung is None:
+            self._parsed[market_id] = (question, None, 0.0)
+            return
+        key, threshold = rung
+        self._parsed[market_id] = (question, key, threshold)
+        insort(self._ladders.setdefault(key, []), (threshold, market_id))
+
+    def _remove(self, market_id: str) -> None:
+        _, key, threshold = self._parsed.pop(market_id)
+        if key is None:
+            return
+        rungs = self._ladders[key]
+        index = bisect_left(rungs, (threshold, market_id))
+        if index < len(rungs) and rungs[index] == (threshold, market_id):
+            del rungs[index]
+        if not rungs:
+            del self._ladders[key]
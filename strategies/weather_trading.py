@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from logger import get_logger
 from utils.weather_api import WeatherAPI
+from utils.market_parser import get_market_parse_cache
 import re
 
 
@@ -133,56 +134,26 @@ class WeatherTradingStrategy:
         Returns:
             Tuple of (market_type, parsed_data) or (None, None) if not weather-related
         """
-        question = market.get("question", "").lower()
-
-        # Temperature market patterns
-        temp_patterns = [
-            r"temperature.*exceed.*?(\d+).*?degrees?.*?in\s+([a-z\s]+)",
-            r"will it be.*?(\d+).*?degrees?.*?in\s+([a-z\s]+)",
-            r"(\d+).*?degrees?.*?or\s+(?:higher|hotter).*?in\s+([a-z\s]+)",
-            r"high temperature.*?(\d+).*?in\s+([a-z\s]+)",
-        ]
-
-        for pattern in temp_patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                try:
-                    threshold = float(match.group(1))
-                    location = match.group(2).strip().title()
-
-                    # Extract target date if present
-                    target_date = self._extract_date(question)
-
-                    return "temperature", {
-                        "location": location,
-                        "threshold": threshold,
-                        "target_date": target_date
-                        or (datetime.now() + timedelta(days=1)),
-                        "unit": "F",  # Assuming Fahrenheit
-                    }
-                except (ValueError, IndexError):
-                    continue
-
-        # Precipitation market patterns
-        precip_patterns = [
-            r"will it rain.*?in\s+([a-z\s]+)",
-            r"precipitation.*?in\s+([a-z\s]+)",
-            r"snow.*?in\s+([a-z\s]+)",
-            r"chance of rain.*?in\s+([a-z\s]+)",
-        ]
-
-        for pattern in precip_patterns:
-            match = re.search(pattern, question, re.IGNORECASE)
-            if match:
-                location = match.group(1).strip().title()
-                target_date = self._extract_date(question)
-
-                return "precipitation", {
-                    "location": location,
-                    "target_date": target_date or (datetime.now() + timedelta(days=1)),
-                }
-
-        return None, None
+        # Kind, location and threshold come from the shared parse cache, so
+        # non-weather markets are rejected without re-scanning the question
+        parsed = get_market_parse_cache().get(market)
+        if parsed.weather_kind is None:
+            return None, None
+
+        target_date = self._extract_date(parsed.lower)
+
+        if parsed.weather_kind == "temperature":
+            return "temperature", {
+                "location": parsed.location,
+                "threshold": parsed.weather_threshold,
+                "target_date": target_date or (datetime.now() + timedelta(days=1)),
+                "unit": "F",  # Assuming Fahrenheit
+            }
+
+        return "precipitation", {
+            "location": parsed.location,
+            "target_date": target_date or (datetime.now() + timedelta(days=1)),
+        }
 
     def _extract_date(self, text: str) -> Optional[datetime]:
         """
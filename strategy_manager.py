@@ -13,15 +13,72 @@ Tracks and compares performance across all strategies.
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import importlib
 import time
 from logger import get_logger
 from engine import ExecutionEngine, TradeSignal
 
-# Import all available strategies
-from strategies.arbitrage_strategy import ArbitrageStrategy
-from strategies.momentum_strategy import MomentumStrategy
-from strategies.statistical_arb_strategy import StatisticalArbStrategy
-from strategies.news_strategy import NewsStrategy
+# Strategy registry: config name -> "module:ClassName".
+# Strategy modules are imported only when the strategy is enabled, so startup
+# cost scales with the configured strategies rather than with everything on disk.
+STRATEGY_REGISTRY: Dict[str, str] = {
+    "arbitrage": "strategies.arbitrage_strategy:ArbitrageStrategy",
+    "momentum": "strategies.momentum_strategy:MomentumStrategy",
+    "statistical_arb": "strategies.statistical_arb_strategy:StatisticalArbStrategy",
+    "news": "strategies.news_strategy:NewsStrategy",
+}
+
+
+def load_strategy_class(strategy_name: str):
+    """
+    Import and return the strategy class registered under strategy_name.
+
+    Raises:
+        KeyError: If no strategy is registered under that name
+        ImportError: If the strategy module cannot be imported
+    """
+    module_path, class_name = STRATEGY_REGISTRY[strategy_name].split(":", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
+def opportunity_to_signal(
+    opp: Any,
+    trade_size: float,
+    strategy_name: str,
+) -> Optional[TradeSignal]:
+    """Build a buy TradeSignal from an opportunity (object or dict); None if unusable."""
+    if hasattr(opp, "market_id"):
+        symbol = opp.market_id
+    elif hasattr(opp, "to_dict"):
+        d = opp.to_dict()
+        symbol = d.get("market_id") or d.get("market_name", "")
+    elif isinstance(opp, dict):
+        symbol = opp.get("market_id") or opp.get("market_name", "")
+    else:
+        return None
+    if not symbol:
+        return None
+    price = 0.5
+    if hasattr(opp, "yes_price") and opp.yes_price:
+        price = float(opp.yes_price)
+    elif isinstance(opp, dict):
+        price = float(opp.get("yes_price", 0.5) or 0.5)
+    elif hasattr(opp, "to_dict"):
+        price = float(opp.to_dict().get("yes_price", 0.5) or 0.5)
+    if price <= 0:
+        price = 0.5
+    quantity = trade_size / price
+    if quantity <= 0:
+        return None
+    return TradeSignal(
+        symbol=str(symbol),
+        side="buy",
+        quantity=quantity,
+        order_type="market",
+        price=price,
+        strategy_name=strategy_name,
+    )
 
 
 class StrategyManager:
@@ -36,6 +93,7 @@ class StrategyManager:
         self,
         config: Dict[str, Any],
         execution_engine: Optional[ExecutionEngine] = None,
+        performance_monitor: Optional[Any] = None,
     ):
         """
         Initialize strategy manager
@@ -43,9 +101,12 @@ class StrategyManager:
         Args:
             config: Configuration dictionary from config.yaml
             execution_engine: Single execution engine; all trades route through it.
+            performance_monitor: Optional PerformanceMonitor; each strategy's
+                find_opportunities is recorded as stage 'strategy.<name>'.
         """
         self.config = config
         self.execution_engine = execution_engine
+        self.performance_monitor = performance_monitor
         self.logger = get_logger()
 
         # Total capital allocation
@@ -112,16 +173,8 @@ class StrategyManager:
     def _initialize_strategies(self) -> None:
         """Initialize all enabled strategies"""
 
-        # Map strategy names to classes
-        strategy_classes = {
-            "arbitrage": ArbitrageStrategy,
-            "momentum": MomentumStrategy,
-            "statistical_arb": StatisticalArbStrategy,
-            "news": NewsStrategy,
-        }
-
         for strategy_name in self.enabled_strategies:
-            if strategy_name not in strategy_classes:
+            if strategy_name not in STRATEGY_REGISTRY:
                 self.logger.log_warning(
                     f"Unknown strategy '{strategy_name}' - skipping"
                 )
@@ -138,8 +191,8 @@ class StrategyManager:
                     self.capital_allocation[strategy_name] * 0.1,  # Max 10% per trade
                 )
 
-                # Initialize strategy
-                strategy_class = strategy_classes[strategy_name]
+                # Initialize strategy (imports its module on first use)
+                strategy_class = load_strategy_class(strategy_name)
                 self.strategies[strategy_name] = strategy_class(strategy_config)
 
                 self.logger.log_warning(
@@ -178,6 +231,10 @@ class StrategyManager:
 
                 # Track timing
                 elapsed_ms = (time.time() - start_time) * 1000
+                if self.performance_monitor is not None:
+                    self.performance_monitor.record_stage(
+                        f"strategy.{strategy_name}", elapsed_ms
+                    )
 
                 # Store results
                 all_opportunities[strategy_name] = opportunities
@@ -263,37 +320,7 @@ class StrategyManager:
         strategy_name: str,
     ) -> Optional[TradeSignal]:
         """Build a TradeSignal from an opportunity; used for execution-engine routing."""
-        if hasattr(opp, "market_id"):
-            symbol = opp.market_id
-        elif hasattr(opp, "to_dict"):
-            d = opp.to_dict()
-            symbol = d.get("market_id") or d.get("market_name", "")
-        elif isinstance(opp, dict):
-            symbol = opp.get("market_id") or opp.get("market_name", "")
-        else:
-            return None
-        if not symbol:
-            return None
-        price = 0.5
-        if hasattr(opp, "yes_price") and opp.yes_price:
-            price = float(opp.yes_price)
-        elif isinstance(opp, dict):
-            price = float(opp.get("yes_price", 0.5) or 0.5)
-        elif hasattr(opp, "to_dict"):
-            price = float(opp.to_dict().get("yes_price", 0.5) or 0.5)
-        if price <= 0:
-            price = 0.5
-        quantity = trade_size / price
-        if quantity <= 0:
-            return None
-        return TradeSignal(
-            symbol=str(symbol),
-            side="buy",
-            quantity=quantity,
-            order_type="market",
-            price=price,
-            strategy_name=strategy_name,
-        )
+        return opportunity_to_signal(opp, trade_size, strategy_name)
 
     def compare_strategies(self) -> Dict[str, Any]:
         """
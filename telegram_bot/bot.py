@@ -9,6 +9,7 @@ from telegram.error import TelegramError
 from typing import Dict, Any, Optional
 import os
 from logger import get_logger
+from telegram_delivery import create_outbox
 
 
 class TelegramNotifier:
@@ -32,6 +33,8 @@ class TelegramNotifier:
         self.enabled = config.get("enabled", False)
         bot_token = config.get("bot_token", "")
         self.chat_id = config.get("chat_id", "")
+        # Paced, batching delivery queue (None: send_message_sync posts directly)
+        self.outbox = None
 
         # Initialize bot
         if not self.enabled:
@@ -53,6 +56,12 @@ class TelegramNotifier:
 
         try:
             self.bot = Bot(token=bot_token)
+            self.outbox = create_outbox(
+                bot_token,
+                self.chat_id,
+                config.get("delivery"),
+                outbox_path=_outbox_path(self.chat_id),
+            )
             self.logger.log_info("Telegram bot initialized successfully")
 
             # Test connection
@@ -147,17 +156,23 @@ class TelegramNotifier:
         """
         Send a message via Telegram (synchronous)
 
+        With an outbox (telegram.delivery.async, the default) the message is
+        queued for the delivery worker and this returns at once.
+
         Args:
             message: Message text
             parse_mode: Parse mode (Markdown or HTML)
             disable_notification: Whether to send silently
 
         Returns:
-            True if message was sent successfully
+            True if message was sent (or queued) successfully
         """
         if not self.is_enabled():
             return False
 
+        if self.outbox is not None:
+            return self.outbox.submit(message)
+
         try:
             import requests
 
@@ -178,6 +193,24 @@ class TelegramNotifier:
             self.logger.log_error(f"Failed to send Telegram message: {e}")
             return False
 
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the delivery worker; undelivered messages stay in the outbox file"""
+        if self.outbox is not None:
+            self.outbox.close(timeout)
+
+
+def _outbox_path(chat_id: str):
+    """state/telegram_outbox_<chat_id>.json"""
+    try:
+        from market_strategy_bot.paths import get_state_dir
+
+        state_dir = get_state_dir()
+    except ImportError:
+        from pathlib import Path
+
+        state_dir = Path(os.environ.get("STATE_DIR", "state"))
+    return state_dir / f"telegram_outbox_{chat_id}.json"
+
 
 def create_telegram_bot(config: Dict[str, Any]) -> Optional[TelegramNotifier]:
     """
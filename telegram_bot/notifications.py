@@ -39,7 +39,11 @@ class TelegramNotifications:
         if not self.notifier or not self.notifier.is_enabled():
             return False
 
-        # Simple rate limiting
+        # The outbox paces per chat and batches bursts instead of dropping them
+        if getattr(self.notifier, "outbox", None) is not None:
+            return True
+
+        # Simple rate limiting (direct sends only)
         rate_limit_config = self.notifier.config.get("rate_limit", {})
         max_per_minute = rate_limit_config.get("max_per_minute", 10)
 
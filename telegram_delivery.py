@@ -0,0 +1,419 @@
+"""
+Outbound Telegram Delivery Queue
+
+Messages for one chat go through a TelegramOutbox: callers submit() and
+return at once, and a worker thread sends over one keep-alive HTTP session.
+
+- Pacing: a per-chat token bucket (shared rate limiter registry) keeps sends
+  within Telegram's per-chat limits; a 429 pauses it for retry_after.
+- Batching: messages that pile up while the bucket is empty go out as one
+  summary message (up to Telegram's 4096-character limit) instead of being
+  dropped.
+- Persistence: undelivered messages are kept in a JSON outbox file and
+  resent after a restart.
+"""
+
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import requests
+
+from logger import get_logger
+from utils.atomic_json import atomic_write_json, load_json
+from utils.rate_limiter import get_registry, parse_retry_after
+
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+# Telegram rejects longer messages
+MAX_MESSAGE_LENGTH = 4096
+
+# Backoff cap after network / server errors, in seconds
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class TelegramOutbox:
+    """
+    Paced, batching, persistent sender for one Telegram chat
+
+    submit() never blocks on the network. The worker thread starts on the
+    first submit (or at once when persisted messages were loaded). With
+    restore=False the outbox file is left alone and nothing is sent until
+    restore() is called, e.g. once this process holds the engine lock.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        api_url: str = TELEGRAM_API_URL,
+        outbox_path: Optional[Path] = None,
+        messages_per_minute: float = 20,
+        burst: float = 3,
+        max_batch: int = 10,
+        max_pending: int = 500,
+        max_attempts: int = 5,
+        parse_mode: Optional[str] = "Markdown",
+        timeout: float = 10.0,
+        restore: bool = True,
+    ):
+        """
+        Initialize outbox
+
+        Args:
+            token: Bot token
+            chat_id: Destination chat ID
+            api_url: Bot API base URL
+            outbox_path: JSON file for undelivered messages (None = memory only)
+            messages_per_minute: Sustained send rate for this chat
+            burst: Messages that may go out back to back
+            max_batch: Most pending messages merged into one send
+            max_pending: Pending messages kept; the oldest is dropped beyond this
+            max_attempts: Sends of one batch before it is given up (429s excluded)
+            parse_mode: Telegram parse mode (None for plain text)
+            timeout: HTTP timeout in seconds
+            restore: Load and resend the outbox file now (False: wait for restore())
+        """
+        self.logger = get_logger()
+        self.chat_id = str(chat_id)
+        self.base_url = f"{api_url.rstrip('/')}/bot{token}"
+        self.outbox_path = Path(outbox_path) if outbox_path else None
+        self.max_batch = max(1, int(max_batch))
+        self.max_pending = max(1, int(max_pending))
+        self.max_attempts = max(1, int(max_attempts))
+        self.parse_mode = parse_mode
+        self.timeout = timeout
+
+        self.bucket = get_registry().register(
+            f"telegram_chat:{self.chat_id}", messages_per_minute, burst
+        )
+        # Keep-alive connection reused by every send
+        self.session = requests.Session()
+
+        self._pending: Deque[str] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Outbox file loaded: only then may the worker send or rewrite it
+        self._restored = False
+        self._busy = False
+        self._dirty = False
+        self._attempts = 0
+
+        self.submitted = 0
+        self.sent_messages = 0
+        self.sent_requests = 0
+        self.batched = 0
+        self.dropped = 0
+        self.failed = 0
+        self.restored = 0
+        self.rate_limited = 0
+
+        if restore:
+            self.restore()
+
+    def restore(self) -> int:
+        """
+        Load undelivered messages from the outbox file and start sending
+
+        Messages submitted before this are kept, after the restored ones.
+
+        Returns:
+            Number of messages restored (0 if already restored or closed)
+        """
+        with self._condition:
+            if self._restored or self._closed:
+                return 0
+            self._restored = True
+            saved = load_json(self.outbox_path, []) if self.outbox_path is not None else []
+            if isinstance(saved, list) and saved:
+                self.restored = len(saved[-self.max_pending :])
+                self._requeue([str(text) for text in saved[-self.max_pending :]])
+                self.logger.log_info(
+                    f"Telegram outbox: resending {self.restored} undelivered message(s)"
+                )
+            if self._pending:
+                self._start()
+            return self.restored
+
+    def submit(self, text: str) -> bool:
+        """
+        Queue a message for delivery
+
+        Args:
+            text: Message text
+
+        Returns:
+            False if the outbox is closed, True otherwise
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            self.submitted += 1
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(text)
+            self._dirty = True
+            if self._restored:
+                self._start()
+            self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait for every pending message to be sent (still paced)
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the outbox drained in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Send what the rate limit allows within timeout, persist the rest, stop
+
+        Never restored: the outbox file belongs to another process (or to the
+        next start), so nothing is sent or written and pending messages are dropped.
+        """
+        with self._condition:
+            abandon = not self._restored
+            if abandon:
+                self._closed = True
+                self.dropped += len(self._pending)
+                self._pending.clear()
+        if abandon:
+            self.session.close()
+            return
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(self.timeout + 1)
+        with self._condition:
+            snapshot = list(self._pending)
+        self._save(snapshot)
+        self.session.close()
+
+    def get_me(self) -> Dict[str, Any]:
+        """Bot info from getMe (raises on HTTP or API errors)"""
+        response = self.session.get(f"{self.base_url}/getMe", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get("result", {})
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and delivery counters"""
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "submitted": self.submitted,
+                "sent_messages": self.sent_messages,
+                "sent_requests": self.sent_requests,
+                "batched": self.batched,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "restored": self.restored,
+                "rate_limited": self.rate_limited,
+            }
+
+    def _start(self) -> None:
+        """Start the worker thread (lock held)"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"telegram-outbox-{self.chat_id}", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            snapshot = None
+            with self._condition:
+                if self._closed:
+                    return
+                if self._pending:
+                    wait = self.bucket.wait_time()
+                    if wait <= 0 and self.bucket.try_acquire():
+                        batch = self._take_batch()
+                        self._busy = True
+                    else:
+                        batch = None
+                else:
+                    batch, wait = None, None
+
+                if batch is None:
+                    # Persist new submissions while waiting for a token / work
+                    if self._dirty:
+                        snapshot, self._dirty = list(self._pending), False
+                    else:
+                        self._condition.wait(wait)
+                        continue
+
+            if batch is None:
+                self._save(snapshot)
+                continue
+
+            outcome, retry_after = self._send(self._render(batch))
+
+            with self._condition:
+                self._busy = False
+                if outcome == "sent":
+                    self._attempts = 0
+                    self.sent_requests += 1
+                    self.sent_messages += len(batch)
+                    if len(batch) > 1:
+                        self.batched += len(batch)
+                elif outcome == "throttled":
+                    # Not a failed attempt: wait out retry_after and resend
+                    self.rate_limited += 1
+                    self._requeue(batch)
+                elif outcome == "retry" and self._attempts + 1 < self.max_attempts:
+                    self._attempts += 1
+                    self._requeue(batch)
+                    if retry_after is None:
+                        retry_after = min(MAX_BACKOFF_SECONDS, 2.0 ** self._attempts)
+                else:
+                    self._attempts = 0
+                    self.failed += len(batch)
+                    self.logger.log_error(
+                        f"Telegram outbox: gave up on {len(batch)} message(s) ({outcome})"
+                    )
+                snapshot = list(self._pending)
+                self._dirty = False
+                self._condition.notify_all()
+
+            if retry_after is not None:
+                self.bucket.penalize(retry_after)
+            self._save(snapshot)
+
+    def _requeue(self, batch: List[str]) -> None:
+        """Put an unsent batch back at the head, then trim to max_pending (lock held)"""
+        self._pending.extendleft(reversed(batch))
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+
+    def _take_batch(self) -> List[str]:
+        """Pop the head messages that fit in one send (lock held)"""
+        batch = [self._pending.popleft()]
+        length = len(self._header(2)) + len(batch[0])
+        while self._pending and len(batch) < self.max_batch:
+            length += 2 + len(self._pending[0])
+            if length > MAX_MESSAGE_LENGTH:
+                break
+            batch.append(self._pending.popleft())
+        return batch
+
+    @staticmethod
+    def _header(count: int) -> str:
+        return f"📦 {count} notifications\n\n"
+
+    def _render(self, batch: List[str]) -> str:
+        if len(batch) == 1:
+            text = batch[0]
+        else:
+            text = self._header(len(batch)) + "\n\n".join(batch)
+        return text[:MAX_MESSAGE_LENGTH]
+
+    def _send(self, text: str) -> Tuple[str, Optional[float]]:
+        """
+        POST sendMessage
+
+        Returns:
+            ("sent" | "throttled" | "retry" | "rejected", retry_after seconds or None)
+        """
+        payload: Dict[str, Any] = {"chat_id": self.chat_id, "text": text}
+        if self.parse_mode:
+            payload["parse_mode"] = self.parse_mode
+        try:
+            response = self.session.post(
+                f"{self.base_url}/sendMessage", json=payload, timeout=self.timeout
+            )
+            if response.status_code == 400 and self.parse_mode:
+                # Usually markup the parser rejects: send it as plain text
+                del payload["parse_mode"]
+                response = self.session.post(
+                    f"{self.base_url}/sendMessage", json=payload, timeout=self.timeout
+                )
+        except requests.RequestException as e:
+            self.logger.log_warning(f"Telegram send failed, will retry: {e}")
+            return "retry", None
+
+        if response.status_code == 200:
+            return "sent", None
+        if response.status_code == 429:
+            return "throttled", self._retry_after(response)
+        if response.status_code >= 500:
+            return "retry", None
+        return "rejected", None
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """retry_after from the Bot API error body, else the Retry-After header"""
+        try:
+            retry_after = response.json().get("parameters", {}).get("retry_after")
+            if retry_after is not None:
+                return max(0.0, float(retry_after))
+        except (ValueError, AttributeError, TypeError):
+            pass
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return 1.0 if retry_after is None else retry_after
+
+    def _save(self, snapshot: Optional[List[str]]) -> None:
+        """Write undelivered messages to the outbox file (worker / close only)"""
+        if self.outbox_path is None or snapshot is None:
+            return
+        try:
+            atomic_write_json(self.outbox_path, snapshot)
+        except Exception as e:
+            self.logger.log_error(f"Telegram outbox: failed to persist: {e}")
+
+
+def create_outbox(
+    token: str,
+    chat_id: str,
+    delivery_config: Optional[Dict[str, Any]] = None,
+    outbox_path: Optional[Path] = None,
+    api_url: str = TELEGRAM_API_URL,
+    restore: bool = True,
+) -> Optional[TelegramOutbox]:
+    """
+    Create an outbox from a telegram.delivery config section
+
+    Args:
+        token: Bot token
+        chat_id: Destination chat ID
+        delivery_config: {'async', 'messages_per_minute', 'burst', 'max_batch', 'max_pending'}
+        outbox_path: JSON file for undelivered messages
+        api_url: Bot API base URL
+        restore: Resend the outbox file now (False: wait for TelegramOutbox.restore())
+
+    Returns:
+        TelegramOutbox, or None when delivery.async is false
+    """
+    delivery_config = delivery_config or {}
+    if not delivery_config.get("async", True):
+        return None
+    return TelegramOutbox(
+        token,
+        chat_id,
+        api_url=api_url,
+        outbox_path=outbox_path,
+        messages_per_minute=delivery_config.get("messages_per_minute", 20),
+        burst=delivery_config.get("burst", 3),
+        max_batch=delivery_config.get("max_batch", 10),
+        max_pending=delivery_config.get("max_pending", 500),
+        restore=restore,
+    )
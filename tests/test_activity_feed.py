@@ -0,0 +1,146 @@
+"""
+Unit Tests for the activity feed and the TUI's change-driven refresh
+
+Tests that the feed tailer reads only appended records (holding back partial
+lines and following rotation), that FileWatcher reports changes from stat
+alone, and that BotTUI re-renders only panels whose data changed.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.activity_feed import FeedTailer, FileWatcher, append_activity
+
+
+class TestActivityFeed:
+    """Test suite for append_activity / FeedTailer / FileWatcher"""
+
+    def setup_method(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "activity.jsonl"
+
+    def teardown_method(self):
+        self.tmp.cleanup()
+
+    def test_poll_reads_only_new_records(self):
+        tailer = FeedTailer(self.path, keep=3)
+        assert tailer.poll() == 0  # No feed yet
+
+        for i in range(5):
+            append_activity(self.path, {"i": i})
+        assert tailer.poll() == 5
+        assert [r["i"] for r in tailer.recent()] == [2, 3, 4]
+
+        assert tailer.poll() == 0
+        append_activity(self.path, {"i": 5})
+        assert tailer.poll() == 1
+        assert [r["i"] for r in tailer.recent()] == [3, 4, 5]
+
+    def test_partial_line_held_until_complete(self):
+        tailer = FeedTailer(self.path)
+        with open(self.path, "w") as f:
+            f.write('{"i": 0}\n{"i":')
+        assert tailer.poll() == 1
+
+        with open(self.path, "a") as f:
+            f.write(' 1}\nnot json\n')
+        assert tailer.poll() == 1
+        assert [r["i"] for r in tailer.recent()] == [0, 1]
+
+    def test_rotation_restarts_from_new_file(self):
+        tailer = FeedTailer(self.path)
+        for i in range(3):
+            append_activity(self.path, {"i": i, "pad": "x" * 50}, max_bytes=150)
+        tailer.poll()
+        append_activity(self.path, {"i": 3}, max_bytes=150)
+
+        assert self.path.with_name("activity.jsonl.1").exists()
+        assert tailer.poll() >= 1
+        assert tailer.recent()[-1]["i"] == 3
+
+    def test_first_poll_backfill_skips_partial_first_line(self):
+        for i in range(100):
+            append_activity(self.path, {"i": i})
+        tailer = FeedTailer(self.path, keep=100, backfill_bytes=200)
+        tailer.poll()
+        records = tailer.recent()
+        assert 0 < len(records) < 100
+        assert records[-1]["i"] == 99
+        assert [r["i"] for r in records] == list(range(records[0]["i"], 100))
+
+    def test_file_watcher(self):
+        watcher = FileWatcher(self.path)
+        assert watcher.changed()  # First check always reports
+        assert not watcher.changed()
+
+        self.path.write_text("{}")
+        assert watcher.changed()
+        assert not watcher.changed()
+
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert watcher.changed()
+
+
+class TestBotTUIRefresh:
+    """Test suite for BotTUI.update_dashboard change detection"""
+
+    def setup_method(self):
+        import bot
+
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.bot = bot
+        self.saved = (bot.STATE_PATH, bot.ACTIVITY_PATH, bot.FEED_PATH)
+        bot.STATE_PATH = root / "bot_state.json"
+        bot.ACTIVITY_PATH = root / "activity.json"
+        bot.FEED_PATH = root / "activity.jsonl"
+
+        self.tui = bot.BotTUI()
+        self.layout = self.tui.create_dashboard()
+
+    def teardown_method(self):
+        self.bot.STATE_PATH, self.bot.ACTIVITY_PATH, self.bot.FEED_PATH = self.saved
+        self.tmp.cleanup()
+
+    def _write_state(self, **state):
+        self.bot.STATE_PATH.write_text(json.dumps(state))
+        # Make the rewrite visible even within one mtime tick
+        stat = os.stat(self.bot.STATE_PATH)
+        os.utime(self.bot.STATE_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_unchanged_files_skip_render(self):
+        self._write_state(status="running", runtime_seconds=60)
+        assert self.tui.update_dashboard(self.layout)
+        assert not self.tui.update_dashboard(self.layout)
+
+    def test_only_changed_panels_render(self):
+        self._write_state(status="running", runtime_seconds=60, trading={"trades_executed": 1})
+        self.tui.update_dashboard(self.layout)
+
+        rendered = []
+        for name in ("_render_header", "_render_status", "_render_trading"):
+            original = getattr(self.tui, name)
+            setattr(
+                self.tui,
+                name,
+                lambda *a, _n=name, _o=original: (rendered.append(_n), _o(*a))[1],
+            )
+
+        self._write_state(status="running", runtime_seconds=60, trading={"trades_executed": 2})
+        assert self.tui.update_dashboard(self.layout)
+        assert rendered == ["_render_trading"]
+
+    def test_new_feed_record_updates_activity(self):
+        self._write_state(status="running")
+        self.tui.update_dashboard(self.layout)
+
+        append_activity(self.bot.FEED_PATH, {"type": "alert_triggered", "message": "hello"})
+        assert self.tui.update_dashboard(self.layout)
+        assert "hello" in self.tui._rendered["activity"][-1]
+        assert not self.tui.update_dashboard(self.layout)
@@ -5,6 +5,7 @@ Tests type-specific arbitrage execution with rollback logic.
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -12,6 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from strategies.arbitrage_types import ArbitrageType, ArbitrageLeg, ArbitrageOpportunity
 from strategies.arbitrage_executor import ArbitrageExecutor
+from strategies.arbitrage_tracker import ArbitrageTracker
+from strategies.simulated_exchange import SimulatedExchange, build_simulated_exchanges
 
 
 class TestArbitrageExecutor:
@@ -233,6 +236,102 @@ class TestArbitrageExecutor:
         print("✓ test_executor_returns_valid_result_structure: Result structure valid")
 
 
+class TestConcurrentExecution:
+    """Concurrent mode against simulated exchanges"""
+
+    def setup_method(self):
+        self.tracker = ArbitrageTracker()
+        self.exchanges = build_simulated_exchanges(
+            {"kalshi": 0.05, "polymarket": 0.2, "binance": 0.2, "predictit": 0.2}, seed=1
+        )
+
+    def _executor(self, **kwargs):
+        return ArbitrageExecutor(
+            exchanges=self.exchanges, concurrent=True, tracker=self.tracker, **kwargs
+        )
+
+    def _multi_leg(self):
+        legs = [
+            ArbitrageLeg("kalshi", "buy", "k1", 0.40, 10, 1),
+            ArbitrageLeg("polymarket", "sell", "p1", 0.55, 10, 2),
+            ArbitrageLeg("binance", "buy", "b1", 0.50, 10, 3),
+            ArbitrageLeg("predictit", "sell", "pi1", 0.60, 10, 4),
+        ]
+        return ArbitrageOpportunity(ArbitrageType.MULTI_LEG, legs, expected_profit=5.0)
+
+    def test_legs_after_kalshi_run_in_parallel(self):
+        executor = self._executor()
+        started = time.monotonic()
+        result = executor.execute(self._multi_leg())
+        elapsed = time.monotonic() - started
+        executor.close()
+
+        assert result["success"] is True
+        assert result["legs_executed"] == 4
+        # Kalshi (0.05s) then three 0.2s legs together, not 0.65s in series
+        assert elapsed < 0.45
+        assert set(result["latency_ms"]["legs"]) == {1, 2, 3, 4}
+
+    def test_kalshi_leg_fills_before_other_legs_are_placed(self):
+        self.exchanges["kalshi"].latency = 0.1
+        self.exchanges["polymarket"].latency = 0.0
+        executor = self._executor()
+        result = executor.execute(self._multi_leg())
+        executor.close()
+
+        assert result["success"] is True
+        # Polymarket is instant, so it would finish first if started alongside Kalshi
+        assert result["latency_ms"]["legs"][2] < 50
+        assert self.exchanges["kalshi"].orders == [("k1", "buy", "filled")]
+
+    def test_leg_over_budget_is_cancelled_and_filled_legs_rolled_back(self):
+        self.exchanges["binance"].latency = 5.0
+        executor = self._executor(leg_timeout=0.5)
+        started = time.monotonic()
+        result = executor.execute(self._multi_leg())
+        elapsed = time.monotonic() - started
+        executor.close()
+
+        assert result["success"] is False
+        assert result["timed_out_legs"] == [3]
+        assert result["unresolved_legs"] == []
+        assert result["legs_executed"] == 3
+        assert elapsed < 2.0
+        assert self.exchanges["binance"].orders == [("b1", "buy", "cancelled")]
+        # Kalshi, Polymarket and PredictIt legs are unwound
+        assert result["rollback"]["successful_rollbacks"] == 3
+        assert self.exchanges["kalshi"].reversals == [("k1", "sell")]
+
+    def test_rejection_cancels_in_flight_legs(self):
+        self.exchanges["polymarket"] = SimulatedExchange(
+            "polymarket", latency=0.01, fail_markets={"p1"}
+        )
+        self.exchanges["binance"].latency = 2.0
+        self.exchanges["predictit"].latency = 2.0
+        executor = self._executor()
+        started = time.monotonic()
+        result = executor.execute(self._multi_leg())
+        elapsed = time.monotonic() - started
+        executor.close()
+
+        assert result["success"] is False
+        assert result["profit"] == 0.0
+        assert elapsed < 1.0
+        assert result["legs_executed"] == 1  # Kalshi only, rolled back
+        assert "leg 2 rejected" in result["error"]
+        assert self.exchanges["binance"].orders == [("b1", "buy", "cancelled")]
+
+    def test_latency_histograms_reach_tracker(self):
+        executor = self._executor()
+        executor.execute(self._multi_leg())
+        executor.close()
+
+        metrics = self.tracker.get_metrics()["execution_latency"]
+        assert metrics["total"]["count"] == 1
+        assert metrics["leg:kalshi"]["count"] == 1
+        assert metrics["leg:polymarket"]["p50_ms"] >= 100
+
+
 def run_all_tests():
     """Run all tests and report results"""
     test_suite = TestArbitrageExecutor()
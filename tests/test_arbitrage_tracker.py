@@ -350,6 +350,26 @@ class TestArbitrageTracker:
             f"✓ test_net_profit_calculation: Net profit ${metrics['net_profit']} == ${expected_net_profit}"
         )
 
+    def test_latency_histogram_summary(self):
+        """Test latency samples are bucketed and summarized"""
+        for ms in [3, 8, 8, 40, 40, 40, 40, 40, 200, 20000]:
+            self.tracker.record_latency("total", ms / 1000)
+
+        summary = self.tracker.get_latency_summary("total")
+
+        assert summary["count"] == 10
+        assert summary["buckets"]["<=5ms"] == 1
+        assert summary["buckets"]["<=50ms"] == 5
+        assert summary["buckets"][">10000ms"] == 1
+        assert summary["p50_ms"] == 50
+        assert summary["p99_ms"] == summary["max_ms"] == 20000
+        assert self.tracker.get_latency_summary("leg:kalshi") is None
+
+        self.tracker.reset_metrics()
+        assert self.tracker.get_metrics()["execution_latency"] == {}
+
+        print("✓ test_latency_histogram_summary: Latency histogram summarized")
+
 
 def run_all_tests():
     """Run all tests and report results"""
@@ -0,0 +1,150 @@
+"""
+Tests for the columnar replay engine (backtest_replay.py).
+
+- Replay results equal Backtester.simulate_strategy on the same CSV
+- Date range filtering matches load_historical_data
+- The .npy cache is reused (memory-mapped) and rebuilt when the CSV changes
+- polymarket_history snapshots load as UTC columns
+"""
+
+import csv
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backtest_replay import CACHE_SUFFIX, load_csv, load_polymarket_history, replay_basic_arbitrage
+from backtester import Backtester
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _write_csv(path, rows, seed=7, zulu=True):
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "market", "yes_price", "no_price"])
+        for i in range(rows):
+            ts = (BASE + timedelta(minutes=i)).isoformat()
+            if zulu:
+                ts = ts.replace("+00:00", "Z")
+            else:
+                ts = ts.replace("+00:00", "")
+            writer.writerow([
+                ts,
+                f"market-{rng.randrange(20)}",
+                round(rng.uniform(0.3, 0.6), 4),
+                round(rng.uniform(0.3, 0.6), 4),
+            ])
+
+
+def _assert_same(columnar, reference):
+    assert columnar.keys() == reference.keys()
+    for key, expected in reference.items():
+        if key == "sharpe_ratio":
+            assert columnar[key] == pytest.approx(expected, rel=1e-12)
+        else:
+            assert columnar[key] == expected, key
+
+
+class TestBacktestReplay:
+    """Test suite for replay_basic_arbitrage"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.config = {"max_trade_size": 25, "min_profit_margin": 0.03}
+
+    @pytest.mark.parametrize("zulu", [True, False])
+    def test_matches_backtester(self, tmp_path, zulu):
+        """Same metrics, best/worst trades and report as the row-by-row backtester"""
+        path = tmp_path / "history.csv"
+        _write_csv(path, 3000, zulu=zulu)
+        backtester = Backtester(self.config)
+        reference = backtester.simulate_strategy(
+            "basic_arbitrage", backtester.load_historical_data(filepath=str(path))
+        )
+        columnar = backtester.replay(str(path), use_cache=False)
+        assert reference["total_trades"] > 100
+        _assert_same(columnar, reference)
+        assert backtester.generate_backtest_report(columnar).splitlines() == (
+            backtester.generate_backtest_report().splitlines()
+        )
+
+    def test_date_range_and_no_trades(self, tmp_path):
+        """Date filter matches the CSV loader; no trades gives the short result"""
+        path = tmp_path / "history.csv"
+        _write_csv(path, 2000)
+        date_range = (BASE + timedelta(minutes=500), BASE + timedelta(minutes=900))
+        backtester = Backtester(self.config)
+        reference = backtester.simulate_strategy(
+            "basic_arbitrage",
+            backtester.load_historical_data(date_range=date_range, filepath=str(path)),
+        )
+        _assert_same(backtester.replay(str(path), date_range=date_range), reference)
+
+        strict = Backtester({"max_trade_size": 25, "min_profit_margin": 5.0})
+        result = replay_basic_arbitrage(load_csv(str(path)), 25, 5.0)
+        assert result == strict.simulate_strategy(
+            "basic_arbitrage", strict.load_historical_data(filepath=str(path))
+        )
+
+    def test_cache_is_memory_mapped_and_invalidated(self, tmp_path):
+        """Second load maps the cached columns; rewriting the CSV rebuilds them"""
+        path = tmp_path / "history.csv"
+        _write_csv(path, 500)
+        first = load_csv(str(path))
+        assert (tmp_path / ("history.csv" + CACHE_SUFFIX) / "meta.json").exists()
+
+        cached = load_csv(str(path))
+        assert isinstance(cached.yes, np.memmap)
+        assert np.array_equal(cached.yes, first.yes)
+        assert cached.markets == first.markets
+
+        _write_csv(path, 600, seed=11)
+        rebuilt = load_csv(str(path))
+        assert len(rebuilt) == 600
+        assert not isinstance(rebuilt.yes, np.memmap)
+
+    @pytest.mark.parametrize("suffix", ["+00:00", "+02:00"])
+    def test_offset_timestamps(self, tmp_path, suffix):
+        """UTC offsets go through NumPy; other offsets fall back to fromisoformat"""
+        path = tmp_path / "history.csv"
+        stamps = [f"2025-01-01T0{h}:30:00.250000{suffix}" for h in range(5)]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "market", "yes_price", "no_price"])
+            writer.writerows([ts, "m", 0.4, 0.5] for ts in stamps)
+
+        cols = load_csv(str(path), use_cache=False)
+        assert cols.tz_aware
+        assert [cols.to_datetime(t) for t in cols.ts_us] == [datetime.fromisoformat(s) for s in stamps]
+
+    def test_polymarket_history_loader(self, tmp_path):
+        """Unix-second snapshots become UTC timestamps"""
+        db = tmp_path / "trading.db"
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE polymarket_history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "market_id TEXT, yes_price REAL, no_price REAL, volume REAL, liquidity REAL, "
+            "timestamp INTEGER)"
+        )
+        stamp = int(BASE.timestamp())
+        conn.executemany(
+            "INSERT INTO polymarket_history (market_id, yes_price, no_price, timestamp) "
+            "VALUES (?, ?, ?, ?)",
+            [("m2", 0.45, 0.45, stamp + 60), ("m1", 0.5, 0.52, stamp)],
+        )
+        conn.commit()
+        conn.close()
+
+        cols = load_polymarket_history(db)
+        assert [cols.markets[c] for c in cols.market_codes] == ["m1", "m2"]
+        result = replay_basic_arbitrage(cols, 10, 0.02)
+        assert result["total_trades"] == 1
+        assert result["best_trade"]["timestamp"] == (BASE + timedelta(minutes=1)).isoformat()
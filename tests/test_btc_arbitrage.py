@@ -0,0 +1,118 @@
+"""
+Tests for the BTC arbitrage pairing index (strategies/btc_arbitrage.py).
+
+- Index pairs match a from-scratch _identify_btc_markets + _pair_markets pass
+- Markets are classified once; later cycles only refresh prices
+- Expired buckets drop off the heap; delisted markets leave their bucket
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strategies.btc_arbitrage import BTCArbitrageStrategy
+
+
+def _pair_market(market_id, direction, expiry, group, up_price=0.45, down_price=0.45):
+    return {
+        "id": market_id,
+        "question": f"Will BTC go {direction} in the next 15 min? ({group})",
+        "end_date": expiry.isoformat(),
+        "groupItemId": group,
+        "yes_price": up_price if direction == "up" else down_price,
+    }
+
+
+def _id_pairs(pairs):
+    return sorted((up["id"], down["id"]) for up, down, *_ in pairs)
+
+
+class TestBTCPairingIndex:
+    """Test suite for the BTC pairing index"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.strategy = BTCArbitrageStrategy({"min_profit_margin": 0.02})
+        self.expiry = datetime.now() + timedelta(minutes=10)
+
+    def test_pairs_match_full_rebuild(self):
+        """Same pairs as identifying and pairing every market from scratch"""
+        rng = random.Random(5)
+        markets = []
+        for i in range(200):
+            expiry = self.expiry + timedelta(minutes=15 * rng.randrange(4))
+            group = f"g{rng.randrange(40)}"
+            direction = rng.choice(["up", "down"])
+            markets.append(_pair_market(f"m{i}", direction, expiry, group))
+        markets.append({"id": "other", "question": "Will ETH go up this week?"})
+
+        expected = self.strategy._pair_markets(self.strategy._identify_btc_markets(markets))
+        assert expected
+        assert _id_pairs(self.strategy._sync_pairing_index(markets)) == _id_pairs(expected)
+
+    def test_classified_once_and_repriced(self, monkeypatch):
+        """Known markets are not re-classified; new dicts carry this cycle's prices"""
+        calls = []
+        real = self.strategy._is_btc_market
+        monkeypatch.setattr(self.strategy, "_is_btc_market", lambda m: calls.append(m["id"]) or real(m))
+
+        markets = [
+            _pair_market("up", "up", self.expiry, "g1"),
+            _pair_market("down", "down", self.expiry, "g1"),
+            {"id": "other", "question": "Will it rain?"},
+        ]
+        assert self.strategy.find_opportunities(markets) != []
+        assert sorted(calls) == ["down", "other", "up"]
+
+        repriced = [dict(m) for m in markets]
+        repriced[0]["yes_price"] = 0.55
+        repriced[1]["yes_price"] = 0.50
+        assert self.strategy.find_opportunities(repriced, {}) == []
+        assert len(calls) == 3
+
+        repriced.append(_pair_market("up2", "up", self.expiry, "g2"))
+        self.strategy.find_opportunities(repriced)
+        assert calls[3:] == ["up2"]
+
+    def test_expired_buckets_and_delistings_drop_off(self):
+        """Heap eviction at expiry; delisting empties and removes a bucket"""
+        later = self.expiry + timedelta(minutes=15)
+        markets = [
+            _pair_market("up", "up", self.expiry, "g1"),
+            _pair_market("down", "down", self.expiry, "g1"),
+            _pair_market("up_later", "up", later, "g2"),
+            _pair_market("down_later", "down", later, "g2"),
+        ]
+        index = self.strategy
+        assert _id_pairs(index._sync_pairing_index(markets)) == [
+            ("up", "down"),
+            ("up_later", "down_later"),
+        ]
+
+        after_first = self.expiry.timestamp() + 1
+        assert _id_pairs(index._sync_pairing_index(markets, now=after_first)) == [
+            ("up_later", "down_later")
+        ]
+        assert list(index._expiry_buckets) == [later.isoformat()]
+        assert len(index._expiry_heap) == 1
+
+        index._sync_pairing_index(markets[:3], now=after_first)
+        assert index._sync_pairing_index(markets[:2], now=after_first) == []
+        assert index._expiry_buckets == {}
+        assert set(index._pairing_entries) == {"up", "down"}
+
+    def test_tz_aware_end_dates(self):
+        """ISO "Z" end dates are analyzed instead of failing on naive/aware subtraction"""
+        expiry = datetime.now(timezone.utc) + timedelta(minutes=12)
+        markets = [_pair_market("up", "up", expiry, "g1"), _pair_market("down", "down", expiry, "g1")]
+        for market in markets:
+            market["end_date"] = expiry.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        (opportunity,) = self.strategy.find_opportunities(markets)
+        assert 600 < opportunity.seconds_until_expiry <= 720
+        assert abs(opportunity.expiry_time.timestamp() - expiry.timestamp()) < 1
+        assert time.time() < opportunity.expiry_time.timestamp()
@@ -0,0 +1,133 @@
+"""
+Tests for the single-pass chart series engine (dashboard/services/chart_series.py).
+
+- Daily / cumulative series match the DataParser's Decimal chart builders
+- Downsampling keeps endpoints and stays within the point budget
+- Cached series are rebuilt when the parser hands out a new trade list
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard.services.chart_data import ChartDataService
+from dashboard.services.chart_series import (
+    ChartSeriesEngine,
+    lttb_indices,
+    minmax_indices,
+)
+from dashboard.services.data_parser import DataParser
+
+
+class ListParser:
+    """Parser stand-in returning a fixed trade list (replaced to simulate new trades)"""
+
+    def __init__(self, trades):
+        self.trades = trades
+
+    def get_all_trades(self):
+        return self.trades
+
+
+def _trades(count, seed=17, days=120):
+    rng = random.Random(seed)
+    now = datetime.now()
+    trades = []
+    for i in range(count):
+        ts = (now - timedelta(minutes=rng.randint(0, days * 24 * 60))).isoformat()
+        trades.append(
+            {
+                "id": str(i),
+                "timestamp": ts,
+                "entry_time": ts,
+                "symbol": rng.choice(["BTC", "ETH"]),
+                "strategy": rng.choice(["arbitrage", "momentum"]),
+                "pnl_usd": round(rng.uniform(-25, 30), 2),
+            }
+        )
+    return trades
+
+
+class TestChartSeriesEngine:
+    """Test suite for ChartSeriesEngine"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.trades = _trades(600)
+        self.parser = ListParser(self.trades)
+        self.engine = ChartSeriesEngine(self.parser)
+
+    def test_matches_decimal_chart_builders(self, tmp_path):
+        """One pass gives the same daily and cumulative values as the builders"""
+        builder = DataParser(tmp_path)
+        series = self.engine.get_series("ALL")
+        daily = builder.prepare_daily_pnl_chart_data(self.trades)
+        cumulative = builder.prepare_cumulative_pnl_chart_data(self.trades)
+        assert series["dates"] == daily["labels"] == cumulative["labels"]
+        assert series["daily"] == daily["data"]
+        assert series["cumulative"] == cumulative["data"]
+
+    def test_range_and_strategy_filters(self):
+        """Filtered series only sums trades in range for the strategy"""
+        series = self.engine.get_series("1M", "momentum")
+        cutoff = datetime.now() - timedelta(days=30)
+        expected = sum(
+            t["pnl_usd"]
+            for t in self.trades
+            if t["strategy"] == "momentum"
+            and datetime.fromisoformat(t["timestamp"]) >= cutoff
+        )
+        assert round(series["total_pnl"], 2) == round(expected, 2)
+
+    def test_drawdown_from_running_peak(self):
+        """Drawdown is peak-to-current of the cumulative line"""
+        series = self.engine.get_series("ALL")
+        peak = 0.0
+        for value, dd in zip(series["cumulative"], series["drawdown"]):
+            peak = max(peak, value)
+            assert abs(dd - (peak - value)) < 1e-9
+
+    def test_cache_invalidated_on_new_trade_list(self):
+        """A new trade list from the parser rebuilds the cached series"""
+        first = self.engine.get_series("ALL")
+        assert self.engine.get_series("ALL") is first
+        self.parser.trades = self.trades + _trades(5, seed=99, days=1)
+        rebuilt = self.engine.get_series("ALL")
+        assert rebuilt is not first
+        expected = sum(t["pnl_usd"] for t in self.parser.trades)
+        assert round(rebuilt["total_pnl"], 2) == round(expected, 2)
+
+
+class TestDownsampling:
+    """Test suite for LTTB and min/max downsampling"""
+
+    def test_lttb_keeps_endpoints_within_budget(self):
+        """LTTB returns ordered indices including first and last"""
+        rng = random.Random(1)
+        values = [rng.uniform(-1, 1) for _ in range(5000)]
+        keep = lttb_indices(values, 200)
+        assert len(keep) == 200
+        assert keep[0] == 0 and keep[-1] == 4999
+        assert keep == sorted(set(keep))
+        assert lttb_indices(values[:50], 200) == list(range(50))
+
+    def test_minmax_keeps_spikes(self):
+        """Min/max bucketing never drops the global extremes"""
+        values = [0.0] * 3000
+        values[1234] = 500.0
+        values[2222] = -400.0
+        keep = minmax_indices(values, 100)
+        assert 1234 in keep and 2222 in keep
+        assert len(keep) <= 102
+
+    def test_chart_service_downsamples(self):
+        """ChartDataService caps points while keeping the final total"""
+        service = ChartDataService(ListParser(_trades(3000, days=900)))
+        full = service.get_cumulative_pnl("ALL", max_points=None)
+        capped = service.get_cumulative_pnl("ALL", max_points=100)
+        assert len(capped["data"]) == 100
+        assert capped["total_pnl"] == full["total_pnl"]
+        assert capped["data"][0] == full["data"][0]
@@ -0,0 +1,104 @@
+"""
+Unit Tests for CryptoMomentumStrategy price history
+
+Checks the ring buffer's window and volume queries against a plain list
+computation over the same ticks, including after the ring has wrapped.
+"""
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strategies.crypto_momentum import CryptoMomentumStrategy, PriceRingBuffer
+
+
+def reference_price_change(ticks, window_seconds, now):
+    prices = [price for ts, price, _ in ticks if ts >= now - window_seconds]
+    if len(prices) < 2 or prices[0] == 0:
+        return 0.0
+    return (prices[-1] - prices[0]) / prices[0] * 100
+
+
+def reference_volume_change(ticks):
+    if len(ticks) < 10:
+        return 0.0
+    mid = len(ticks) // 2
+    old = [v for _, _, v in ticks[:mid] if v > 0]
+    new = [v for _, _, v in ticks[mid:] if v > 0]
+    if not old or not new:
+        return 0.0
+    return (statistics.mean(new) - statistics.mean(old)) / statistics.mean(old) * 100
+
+
+class TestPriceRingBuffer:
+    """Ring buffer equivalence with a list-based reference"""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_reference_through_wraparound(self, seed):
+        rng = random.Random(seed)
+        capacity = 50
+        buffer = PriceRingBuffer(capacity=capacity)
+        ticks = []
+        now = 1000.0
+
+        for _ in range(400):
+            now += rng.choice([0.0, 0.5, 1.0, 30.0])
+            price = rng.uniform(90, 110)
+            volume = rng.choice([0.0, rng.uniform(1e6, 5e6)])
+            buffer.append(price, volume, timestamp=now)
+            ticks = (ticks + [(now, price, volume)])[-capacity:]
+
+            assert len(buffer) == len(ticks)
+            for window in (1, 30, 300, 3600):
+                assert buffer.price_change(window, now=now) == pytest.approx(
+                    reference_price_change(ticks, window, now)
+                )
+            assert buffer.volume_change() == pytest.approx(
+                reference_volume_change(ticks), rel=1e-9, abs=1e-9
+            )
+
+    def test_timestamps_never_go_backwards(self):
+        buffer = PriceRingBuffer(capacity=4)
+        buffer.append(100.0, timestamp=10.0)
+        buffer.append(110.0, timestamp=5.0)  # Clamped to 10.0
+
+        assert buffer.price_change(1, now=10.0) == pytest.approx(10.0)
+
+
+class TestCryptoMomentumStrategy:
+    """Strategy wiring over the ring buffer"""
+
+    def setup_method(self):
+        config = {
+            "strategies": {
+                "crypto_momentum": {
+                    "enabled": True,
+                    "symbols": ["BTC"],
+                    "min_price_change_5m": 2.0,
+                    "min_volume_change": 50.0,
+                    "min_score": 10.0,
+                }
+            }
+        }
+        self.strategy = CryptoMomentumStrategy(config)
+
+    def test_rally_on_rising_volume_signals_bullish(self):
+        signal = None
+        for i in range(40):
+            volume = 1e6 if i < 20 else 3e6
+            signal = self.strategy.analyze_momentum("BTC", 100.0 + i * 0.5, volume) or signal
+
+        assert signal is not None
+        assert signal["direction"] == "bullish"
+        assert signal["volume_change"] == pytest.approx(200.0)
+
+    def test_history_is_bounded(self):
+        for i in range(1500):
+            self.strategy.update_price("BTC", 100.0 + i, 1e6)
+
+        assert len(self.strategy.price_history["BTC"]) == 1000
@@ -56,3 +56,43 @@ def test_dashboard_boot_smoke():
             assert r.status_code in (200, 404, 500), "health/debug should respond"
     except Exception:
         pass  # Client creation can fail in some envs (e.g. werkzeug version)
+
+
+def test_lazy_service_created_once_under_concurrency():
+    """Concurrent first requests share one lazily created service."""
+    import threading
+    import time
+
+    from dashboard import app as app_module
+
+    created = []
+
+    def factory():
+        time.sleep(0.05)  # Widen the check-then-create window
+        created.append(object())
+        return created[-1]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(app_module._lazy_service("_test_service", factory)))
+        for _ in range(8)
+    ]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        app_module._lazy_services.pop("_test_service", None)
+    assert len(created) == 1
+    assert all(r is created[0] for r in results)
+
+
+def test_export_bad_date_returns_400():
+    """A bad export filter is a 400, not a 200 whose stream dies after the header."""
+    from dashboard.app import app
+
+    with app.test_client() as client:
+        r = client.get("/api/export/trades?start_date=yesterday")
+    assert r.status_code == 400
+    assert "start_date" in r.get_json()["error"]
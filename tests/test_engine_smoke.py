@@ -28,4 +28,44 @@ def test_system_check_module_runs():
 
     # Skip cycle to avoid side effects and slowness in pytest
     code = run_checks(skip_cycle=True, skip_dashboard=False)
-    assert code == 0, "system_check should pass with skip_cycle=True"
\ No newline at end of file
+    assert code == 0, "system_check should pass with skip_cycle=True"
+
+
+def test_strategy_modules_load_only_when_enabled():
+    """Importing the engine must not import strategy modules that are not enabled."""
+    import subprocess
+
+    code = (
+        "import sys, run_bot; "
+        "from strategy_manager import StrategyManager; "
+        "StrategyManager({'strategies': {'enabled': ['arbitrage']}}); "
+        "print(sorted(m for m in sys.modules if m.startswith('strategies.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(_project_root),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert out.returncode == 0, out.stderr
+    loaded = out.stdout.strip().splitlines()[-1]
+    assert "strategies.arbitrage_strategy" in loaded
+    assert "strategies.news_strategy" not in loaded
+    assert "strategies.weather_trading" not in loaded
+
+
+def test_parse_importtime():
+    """-X importtime output is parsed into (module, self_ms, cumulative_ms, depth)."""
+    from market_strategy_bot.system_check import parse_importtime
+
+    sample = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     yaml.reader\n"
+        "import time:      2000 |       5000 |   logger\n"
+        "import time:      3000 |      10000 | run_bot\n"
+    )
+    rows = parse_importtime(sample)
+    assert rows[-1] == ("run_bot", 3.0, 10.0, 0)
+    assert rows[1] == ("logger", 2.0, 5.0, 1)
+    assert rows[0][3] == 2
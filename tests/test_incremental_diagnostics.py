@@ -0,0 +1,159 @@
+"""
+Tests for incremental strategy diagnostics (analysis/incremental.py).
+
+- Incremental aggregates match a full StrategyDiagnosticsEngine recompute
+- Only new trades are folded on refresh; state survives a restart
+- Store reset triggers a rebuild
+"""
+
+import json
+import math
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from analysis.diagnostics import StrategyDiagnosticsEngine  # noqa: E402
+from analysis.incremental import (  # noqa: E402
+    TAIL_SKETCH_GAMMA,
+    TAIL_SKETCH_MIN_USD,
+    IncrementalDiagnostics,
+    _sketch_count_below,
+    _sketch_key,
+)
+from database import trades_store  # noqa: E402
+
+
+class _StoreParser:
+    """Minimal DataParser stand-in returning store trades oldest first."""
+
+    def __init__(self, log_dir):
+        self.logs_dir = Path(log_dir)
+
+    def get_trades(self, strategy=None, per_page=25, **kwargs):
+        trades = trades_store.get_trades_since(self.logs_dir, after_id=0, limit=100_000)
+        if strategy:
+            trades = [t for t in trades if t["strategy"] == strategy]
+        return {"trades": trades}
+
+
+def _insert_random_trades(log_dir, rng, count):
+    for _ in range(count):
+        pct = rng.uniform(-8, 10)
+        trades_store.insert_trade(
+            log_dir,
+            timestamp=f"2025-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00",
+            market=f"M{rng.randint(1, 5)}",
+            yes_price=0.4,
+            no_price=0.55,
+            profit_pct=round(pct, 3),
+            profit_usd=round(pct * rng.uniform(0.5, 3), 2),
+            strategy=rng.choice(["arbitrage", "momentum"]),
+            arbitrage_type=rng.choice(["single", "cross"]),
+        )
+
+
+def _comparable(diag):
+    """Diagnostics without the timestamp and the (histogram-estimated) tail frequency."""
+    diag = {k: v for k, v in diag.items() if k != "generated_at"}
+    if diag.get("risk_adjusted"):
+        diag["risk_adjusted"] = {k: v for k, v in diag["risk_adjusted"].items() if k != "tail_loss_frequency"}
+    return diag
+
+
+def _tail(diag):
+    return diag["risk_adjusted"]["tail_loss_frequency"]
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    trades_store.init_db(tmp_path)
+    return tmp_path
+
+
+class TestIncrementalDiagnostics:
+    @pytest.mark.parametrize("strategy", [None, "arbitrage", "momentum"])
+    def test_matches_full_recompute(self, log_dir, strategy):
+        rng = random.Random(7)
+        _insert_random_trades(log_dir, rng, 150)
+        inc = IncrementalDiagnostics(log_dir)
+        inc.refresh()
+        _insert_random_trades(log_dir, rng, 90)
+        assert inc.refresh() == 90
+
+        full = StrategyDiagnosticsEngine(_StoreParser(log_dir)).run(strategy)
+        diag = inc.diagnostics(strategy)
+        assert _comparable(diag) == _comparable(full)
+        assert _tail(diag) == pytest.approx(_tail(full), abs=0.01)
+        assert "0" in diag["performance"]["win_rate_by_hour_of_day"]
+
+    def test_state_size_bounded(self, log_dir):
+        rng = random.Random(11)
+        _insert_random_trades(log_dir, rng, 600)
+        inc = IncrementalDiagnostics(log_dir)
+        inc.refresh()
+
+        state = json.loads((log_dir / "strategy_diagnostics_state.json").read_text())
+        # |pnl| <= 30 here: at most one bucket per sign and log-magnitude step, plus zero
+        per_sign = math.ceil(math.log(30 / TAIL_SKETCH_MIN_USD, TAIL_SKETCH_GAMMA))
+        for scope in state["scopes"].values():
+            assert sum(scope["pnl_sketch"].values()) == scope["n"]
+            assert len(scope["pnl_sketch"]) <= 2 * per_sign + 1
+            assert all(len(v) < 1000 for v in scope.values() if isinstance(v, list))
+
+    def test_state_persists_across_restart(self, log_dir):
+        rng = random.Random(3)
+        _insert_random_trades(log_dir, rng, 40)
+        first = IncrementalDiagnostics(log_dir)
+        first.refresh()
+        assert (log_dir / "strategy_diagnostics_state.json").exists()
+
+        restarted = IncrementalDiagnostics(log_dir)
+        assert restarted.last_trade_id == first.last_trade_id
+        assert restarted.refresh() == 0
+        assert _comparable(restarted.diagnostics()) == _comparable(first.diagnostics())
+
+    def test_store_reset_rebuilds(self, log_dir):
+        rng = random.Random(5)
+        _insert_random_trades(log_dir, rng, 30)
+        inc = IncrementalDiagnostics(log_dir)
+        inc.refresh()
+
+        (log_dir / "trades.db").unlink()
+        trades_store.init_db(log_dir)
+        _insert_random_trades(log_dir, rng, 10)
+        inc.refresh()
+        assert inc.sample_size == 10
+
+    def test_sketch_count_below(self):
+        rng = random.Random(9)
+        pnls = [round(rng.uniform(-50, 50), 2) for _ in range(5000)]
+        sketch = {}
+        for p in pnls:
+            sketch[str(_sketch_key(p))] = sketch.get(str(_sketch_key(p)), 0) + 1
+        for threshold in (-40.0, -12.5, -0.003, 0.0, 7.7):
+            exact = sum(1 for p in pnls if p < threshold)
+            assert abs(_sketch_count_below(sketch, threshold) - exact) <= max(5, exact * 0.02)
+
+    def test_concurrent_refresh_folds_each_trade_once(self, log_dir):
+        rng = random.Random(13)
+        _insert_random_trades(log_dir, rng, 120)
+        inc = IncrementalDiagnostics(log_dir)
+        threads = [threading.Thread(target=inc.refresh) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert inc.sample_size == 120
+        restarted = IncrementalDiagnostics(log_dir)
+        assert restarted.sample_size == 120
+
+    def test_empty_store(self, log_dir):
+        inc = IncrementalDiagnostics(log_dir)
+        assert inc.refresh() == 0
+        assert inc.diagnostics()["sample_size"] == 0
@@ -0,0 +1,111 @@
+"""
+Tests for the dashboard log reader (dashboard/services/log_reader.py).
+
+- Reverse tail returns the last N parsed records across rotated backups
+- Indexed search filters by time window and minimum level
+- Sidecar index is extended incrementally and survives rotation
+- Follow cursor picks up appended lines and rotation
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard.services.log_reader import LogReader, iter_lines_reverse, parse_line
+
+BASE = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def _line(i, level="INFO", minutes_per_line=1):
+    ts = (BASE + timedelta(minutes=i * minutes_per_line)).strftime("%Y-%m-%d %H:%M:%S")
+    return f"[{ts}] {level} [bot.run:{i}] message {i}\n"
+
+
+def _write(path, lines, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+class TestLogReader:
+    """Test suite for LogReader"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.lines = [_line(i, "ERROR" if i % 10 == 0 else "INFO") for i in range(300)]
+
+    def test_parse_line_formats(self):
+        """Both the detailed and the errors.log formats parse"""
+        rec = parse_line("[2025-06-01 12:00:00] WARNING [mod.fn:3] careful")
+        assert rec == {
+            "timestamp": "2025-06-01T12:00:00",
+            "level": "WARNING",
+            "source": "mod.fn:3",
+            "message": "careful",
+        }
+        assert parse_line("[2025-06-01 12:00:00] ERROR: boom")["message"] == "boom"
+        assert parse_line("Traceback (most recent call last):") is None
+
+    def test_reverse_lines_across_blocks(self, tmp_path):
+        """Reverse iteration with tiny blocks yields every line in reverse"""
+        path = tmp_path / "bot.log"
+        _write(path, self.lines)
+        got = list(iter_lines_reverse(path, block_size=37))
+        assert got == [line.rstrip("\n") for line in reversed(self.lines)]
+
+    def test_tail_spans_backups_and_attaches_tracebacks(self, tmp_path):
+        """Tail continues into bot.log.1 and keeps traceback lines with their record"""
+        _write(tmp_path / "bot.log.1", self.lines[:200])
+        _write(tmp_path / "bot.log", self.lines[200:] + ["Traceback (most recent call last):\n", "  boom\n"])
+        records = LogReader(tmp_path / "bot.log").tail(150)
+        assert len(records) == 150
+        assert records[0]["message"] == "message 150"
+        assert records[-1]["message"] == "message 299\nTraceback (most recent call last):\n  boom"
+
+    def test_search_by_level_and_time(self, tmp_path):
+        """Indexed search returns only matching records in the window"""
+        _write(tmp_path / "bot.log.1", self.lines[:200])
+        _write(tmp_path / "bot.log", self.lines[200:])
+        reader = LogReader(tmp_path / "bot.log")
+        since = BASE + timedelta(minutes=150)
+        until = BASE + timedelta(minutes=250)
+        records = reader.search(since=since, until=until, level="ERROR")
+        assert [r["message"] for r in records] == [f"message {i}" for i in range(150, 251, 10)]
+        assert [r["message"] for r in reader.tail(3, level="ERROR")] == [
+            "message 270", "message 280", "message 290"
+        ]
+
+    def test_index_is_incremental_and_follows_rotation(self, tmp_path):
+        """Appends extend the index; a rename keeps the entry under the same inode"""
+        path = tmp_path / "bot.log"
+        _write(path, self.lines[:100])
+        reader = LogReader(path)
+        reader.search(level="ERROR")
+        assert reader.index_path.exists()
+
+        _write(path, self.lines[100:200], mode="a")
+        assert len(reader.search(level="ERROR")) == 20
+
+        os.replace(path, tmp_path / "bot.log.1")
+        _write(path, self.lines[200:])
+        assert len(reader.search(level="ERROR")) == 30
+
+    def test_read_new_follows_appends_and_rotation(self, tmp_path):
+        """Follow cursor returns only new records, including the rotated file's tail"""
+        path = tmp_path / "bot.log"
+        _write(path, self.lines[:10])
+        reader = LogReader(path)
+        records, cursor = reader.read_new(None)
+        assert records == []
+
+        _write(path, self.lines[10:12], mode="a")
+        records, cursor = reader.read_new(cursor)
+        assert [r["message"] for r in records] == ["message 10", "message 11"]
+
+        _write(path, self.lines[12:13], mode="a")
+        os.replace(path, tmp_path / "bot.log.1")
+        _write(path, self.lines[13:15])
+        records, cursor = reader.read_new(cursor)
+        assert [r["message"] for r in records] == ["message 12", "message 13", "message 14"]
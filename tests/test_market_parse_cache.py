@@ -0,0 +1,147 @@
+"""
+Unit Tests for the shared market-question parse cache
+
+Tests that MarketParser.parse agrees with the per-call extractors it
+replaces, that MarketParseCache parses each market once (re-parsing only
+edited questions), and that strategies read the cached fields correctly.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.market_parser import MarketParseCache, MarketParser, get_market_parse_cache
+
+QUESTIONS = [
+    "Will Bitcoin be above $100,000 by March 31 2026?",
+    "BTC > 100k by Feb 2026",
+    "Will Ethereum exceed $5,000 in Q2 2026?",
+    "Will BTC fall below $50,000?",
+    "Bitcoin up or down in the next 15 min?",
+    "BTC 15-minute: lower than open?",
+    "Will SOL reach $2025 by 2027?",
+    "Will the high temperature be 90 degrees or higher in Phoenix on June 5?",
+    "Will it rain in Seattle tomorrow?",
+    "Will the Fed cut rates in December?",
+    "",
+]
+
+
+def _old_is_btc_market(question):
+    """BTCArbitrageStrategy._is_btc_market before the parse cache"""
+    question = question.lower()
+    if "btc" not in question and "bitcoin" not in question:
+        return False
+    if not any(k in question for k in ["up", "down", "higher", "lower", "above", "below"]):
+        return False
+    return any(k in question for k in ["15 min", "15-min", "15min", "fifteen minute"])
+
+
+class TestMarketParser:
+    """Test suite for MarketParser.parse"""
+
+    def test_matches_extract_crypto_info(self):
+        for question in QUESTIONS:
+            info = MarketParser.extract_crypto_info(question)
+            parsed = MarketParser.parse(question)
+            assert parsed.crypto_valid == info["valid"], question
+            if info["valid"]:
+                assert parsed.asset == info["symbol"]
+                assert parsed.threshold == info["threshold"]
+                assert parsed.comparator == info["direction"]
+                assert parsed.raw_price == info["raw_price"]
+
+    def test_fields(self):
+        parsed = MarketParser.parse("Will Bitcoin be above $100,000 by March 31 2026?")
+        assert parsed.category == "crypto"
+        assert parsed.expiry == "2026-03-31"
+
+        # The price is not mistaken for a year
+        assert MarketParser.parse("Will SOL reach $2025 by 2027?").expiry == "2027"
+
+        weather = MarketParser.parse("Will it rain in Seattle tomorrow?")
+        assert weather.category == "weather"
+        assert weather.weather_kind == "precipitation"
+        assert weather.location == "Seattle Tomorrow"
+
+        other = MarketParser.parse("Will the Fed cut rates in December?")
+        assert other.category == "other"
+        assert other.asset is None
+
+    def test_btc_classification_unchanged(self):
+        from strategies.btc_arbitrage import BTCArbitrageStrategy
+
+        strategy = BTCArbitrageStrategy({})
+        for i, question in enumerate(QUESTIONS):
+            market = {"id": f"m{i}", "question": question}
+            assert strategy._is_btc_market(market) == _old_is_btc_market(question), question
+
+
+class TestMarketParseCache:
+    """Test suite for MarketParseCache"""
+
+    def setup_method(self):
+        self.cache = MarketParseCache(max_size=3)
+
+    def test_parses_each_market_once(self, monkeypatch):
+        calls = []
+        real_parse = MarketParser.parse
+        monkeypatch.setattr(
+            MarketParser, "parse", classmethod(lambda cls, q: calls.append(q) or real_parse(q))
+        )
+        markets = [{"id": "a", "question": QUESTIONS[0]}, {"id": "b", "question": QUESTIONS[1]}]
+
+        for _ in range(3):
+            for market in markets:
+                self.cache.get(market)
+        assert calls == [QUESTIONS[0], QUESTIONS[1]]
+        assert self.cache.hits == 4
+
+        # Edited question: re-parsed under the same ID
+        parsed = self.cache.get({"id": "a", "question": QUESTIONS[3]})
+        assert parsed.comparator == "below"
+        assert calls[-1] == QUESTIONS[3]
+        assert len(self.cache) == 2
+
+    def test_keys_by_question_without_id(self):
+        first = self.cache.get({"name": QUESTIONS[2]})
+        assert self.cache.parse(QUESTIONS[2]) is first
+        assert first.asset == "ETH"
+
+    def test_evicts_least_recently_used(self):
+        for i in range(3):
+            self.cache.parse(QUESTIONS[i], f"m{i}")
+        self.cache.parse(QUESTIONS[0], "m0")  # Refresh m0
+        self.cache.parse(QUESTIONS[3], "m3")
+
+        assert len(self.cache) == 3
+        misses = self.cache.misses
+        self.cache.parse(QUESTIONS[0], "m0")
+        assert self.cache.misses == misses
+        self.cache.parse(QUESTIONS[1], "m1")
+        assert self.cache.misses == misses + 1
+
+    def test_shared_instance(self):
+        assert get_market_parse_cache() is get_market_parse_cache()
+
+
+class TestWeatherParsing:
+    """Test suite for WeatherTradingStrategy reading the parse cache"""
+
+    def test_parse_weather_market(self):
+        from strategies.weather_trading import WeatherTradingStrategy
+
+        strategy = WeatherTradingStrategy({})
+        kind, data = strategy._parse_weather_market(
+            {"id": "w1", "question": "Will it be 95 degrees in Austin on July 4, 2026?"}
+        )
+        assert kind == "temperature"
+        assert data["threshold"] == 95.0
+        assert data["location"] == "Austin On July"
+        assert data["target_date"].year == 2026
+
+        assert strategy._parse_weather_market({"id": "w2", "question": QUESTIONS[0]}) == (
+            None,
+            None,
+        )
@@ -0,0 +1,79 @@
+"""
+Unit Tests for PolymarketMonitor request pacing
+
+Tests that market price requests are paced by the token bucket instead of
+per-request sleeps, fetched concurrently, and deferred past the budget.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from monitor import PolymarketMonitor
+from utils.rate_limiter import TokenBucket
+
+
+class TestMonitorPacing:
+    """Test suite for PolymarketMonitor.get_market_prices_batch"""
+
+    def setup_method(self):
+        self.monitor = PolymarketMonitor(
+            {"request_delay_seconds": 0.5, "rate_limit_max": 1000}
+        )
+        self.fetched = []
+
+        def fake_prices(market_id):
+            time.sleep(0.05)  # Network round trip
+            self.fetched.append(market_id)
+            return {"yes": 0.45, "no": 0.5, "market_id": market_id}
+
+        self.monitor.get_market_prices = fake_prices
+
+    def test_batch_runs_concurrently_within_pacing(self):
+        self.monitor.pacer = TokenBucket("test", rate_per_second=100.0, capacity=8)
+        markets = [f"m{i}" for i in range(40)]
+
+        started = time.monotonic()
+        result = self.monitor.get_market_prices_batch(markets, budget_seconds=5.0)
+        elapsed = time.monotonic() - started
+
+        assert sorted(result["prices"]) == sorted(markets)
+        assert result["deferred"] == []
+        assert result["failed"] == []
+        # Serial fetching would take 40 x 0.05s = 2s before any request_delay
+        assert elapsed < 1.0
+
+    def test_markets_past_budget_are_deferred(self):
+        self.monitor.pacer = TokenBucket("test", rate_per_second=10.0, capacity=5)
+        markets = [f"m{i}" for i in range(20)]
+
+        result = self.monitor.get_market_prices_batch(markets, budget_seconds=0.25)
+
+        # 5 from the burst, then slots at 0.1s and 0.2s
+        assert sorted(result["prices"]) == markets[:7]
+        assert result["deferred"] == markets[7:]
+        assert self.monitor.get_rate_limit_status()["current"] == 7
+
+    def test_rate_limit_pause_defers_everything(self):
+        self.monitor.rate_limiter.max_requests = 2
+        self.monitor.rate_limiter.record_request()
+        self.monitor.rate_limiter.record_request()
+
+        result = self.monitor.get_market_prices_batch(["a", "b"])
+
+        assert result == {"prices": {}, "deferred": ["a", "b"], "failed": []}
+        assert self.fetched == []
+
+    def test_single_request_never_sleeps(self):
+        monitor = PolymarketMonitor({"request_delay_seconds": 5.0})
+        monitor.pacer = TokenBucket("test", rate_per_second=0.2, capacity=1)
+
+        started = time.monotonic()
+        first = monitor._get_simulated_market_prices("m1")
+        second = monitor._get_simulated_market_prices("m2")
+
+        assert first is not None
+        assert second is None  # Paced: no slot yet, try again next cycle
+        assert time.monotonic() - started < 0.5
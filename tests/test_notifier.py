@@ -0,0 +1,128 @@
+"""
+Unit Tests for Notifier background delivery
+
+Tests that notify() returns without waiting on channels, that bursts of the
+same event type are coalesced into one digest, that full queues drop
+their oldest events, and that queued notifications survive process exit.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from notification_delivery import ChannelWorker
+from notifier import Notifier
+
+
+class TestNotifierDelivery:
+    """Notifier with the desktop channel replaced by a slow recorder"""
+
+    def setup_method(self):
+        config = {
+            "notifications": {
+                "desktop": {"enabled": True},
+                "rate_limiting": {"enabled": False},
+                "delivery": {"coalesce_window_seconds": 0.2},
+            },
+        }
+        self.notifier = Notifier(config)
+        self.delivered = []
+
+        def slow_desktop(title, message):
+            time.sleep(0.1)  # e.g. a notification subprocess
+            self.delivered.append((title, message))
+            return True
+
+        self.notifier.send_desktop_notification = slow_desktop
+
+    def teardown_method(self):
+        self.notifier.close()
+
+    def test_notify_does_not_block_on_delivery(self):
+        started = time.monotonic()
+        for i in range(20):
+            self.notifier.alert_error("Feed", f"timeout {i}")
+        assert time.monotonic() - started < 0.1
+
+        assert self.notifier.flush(timeout=5)
+        assert self.notifier.notification_count == 20
+
+    def test_burst_is_coalesced_into_digest(self):
+        for i in range(12):
+            self.notifier.alert_error("Feed", f"timeout {i}")
+        time.sleep(0.5)  # Past the coalescing window
+
+        assert len(self.delivered) == 1
+        title, message = self.delivered[0]
+        assert title == "Error: Feed (x12)"
+        assert "• timeout 0" in message
+        assert "... and 2 more" in message
+
+        stats = self.notifier.get_statistics()["delivery"]["desktop"]
+        assert stats["enqueued"] == 12
+        assert stats["coalesced"] == 11
+        assert stats["sent"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["latency_ms"]["max"] >= 200
+
+    def test_synchronous_mode_still_available(self):
+        notifier = Notifier(
+            {"notifications": {"desktop": {"enabled": True}, "delivery": {"async": False}}}
+        )
+        sent = []
+        notifier.send_desktop_notification = lambda t, m: sent.append(t) or True
+
+        notifier.notify("Hello", "world")
+
+        assert sent == ["Hello"]
+        assert notifier.dispatcher is None
+
+    def test_queued_notifications_delivered_at_exit(self, tmp_path):
+        """A short-lived script that never calls close() still delivers"""
+        out = tmp_path / "delivered.txt"
+        script = (
+            "from notifier import Notifier\n"
+            "n = Notifier({'notifications': {'desktop': {'enabled': True},"
+            " 'rate_limiting': {'enabled': False},"
+            " 'delivery': {'coalesce_window_seconds': 30}}})\n"
+            f"n.send_desktop_notification = lambda t, m: open({str(out)!r}, 'a').write(t + '\\n')\n"
+            "n.alert_error('Feed', 'timeout')\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=str(Path(__file__).resolve().parent.parent),
+            check=True,
+            timeout=20,
+        )
+        assert out.read_text().splitlines() == ["Error: Feed"]
+
+
+class TestChannelWorker:
+    """Bounded queue behaviour"""
+
+    def test_full_queue_drops_oldest(self):
+        release = threading.Event()
+        delivered = []
+
+        def blocked_send(title, message, priority):
+            release.wait(5)
+            delivered.append(title)
+            return True
+
+        worker = ChannelWorker("test", blocked_send, max_queue=3, coalesce_window=0)
+        worker.enqueue("first", "", event_type="a")
+        time.sleep(0.05)  # Worker picks "first" up and blocks in send
+        for name in ["e1", "e2", "e3", "e4", "e5"]:
+            worker.enqueue(name, "", event_type=name)
+
+        stats = worker.stats()
+        assert stats["queue_depth"] == 3
+        assert stats["dropped"] == 2
+
+        release.set()
+        worker.close()
+        assert delivered == ["first", "e3", "e4", "e5"]
@@ -0,0 +1,174 @@
+"""
+Tests for the paper trading engine fast path (services/paper_trading_engine.py).
+
+- fill_market_order matches place_order + execute_order accounting
+- fast_path prunes finished orders and batches trade logs
+- Trade history is a bounded ring buffer; get_state / set_state round-trip
+"""
+
+import itertools
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import paper_trading_engine
+from services.paper_trading_engine import PaperTradingEngine
+
+
+class RecordingLogger:
+    """Logger stand-in recording trade logs"""
+
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def log_trade(self, **kwargs):
+        self.single.append(kwargs)
+
+    def log_trades(self, trades):
+        self.batches.append(list(trades))
+
+    def log_warning(self, msg):
+        pass
+
+
+def _engine(**kwargs):
+    kwargs.setdefault("logger", RecordingLogger())
+    return PaperTradingEngine(initial_balance=1000.0, config={}, replay=True, **kwargs)
+
+
+def _trade_sequence(engine, use_fast_fill):
+    steps = [("A", "buy", 10, 0.40), ("B", "buy", 5, 0.60), ("A", "sell", 4, 0.55),
+             ("A", "sell", 10, 0.30), ("B", "buy", 5, 0.50), ("C", "sell", 1, 0.5)]
+    for symbol, side, qty, price in steps:
+        if use_fast_fill:
+            engine.fill_market_order(symbol, side, qty, price)
+        else:
+            order = engine.place_order(symbol, side, "market", qty, price)
+            engine.execute_order(order["order_id"], price)
+
+
+class TestPaperTradingFastPath:
+    """Test suite for the high-throughput engine paths"""
+
+    def test_fill_market_order_matches_order_path(self):
+        """Same cash, positions, metrics and history either way"""
+        slow, fast = _engine(), _engine(fast_path=True)
+        _trade_sequence(slow, use_fast_fill=False)
+        _trade_sequence(fast, use_fast_fill=True)
+        assert fast.cash_balance == slow.cash_balance
+        assert fast.get_performance_metrics() == slow.get_performance_metrics()
+
+        def strip(rows, key):
+            return [{k: v for k, v in r.items() if k != key} for r in rows]
+
+        assert strip(fast.get_all_positions(), "opened_at") == strip(slow.get_all_positions(), "opened_at")
+        assert strip(fast.trade_history, "timestamp") == strip(slow.trade_history, "timestamp")
+        # A was closed: dropped from positions, not kept at quantity 0
+        assert set(fast.positions) == {"B"}
+        assert fast._position_cost == fast.positions["B"].quantity * fast.positions["B"].avg_price
+
+    def test_fast_path_prunes_orders_and_batches_logs(self, monkeypatch):
+        """Filled orders are dropped; logs are written TRADE_LOG_BATCH_SIZE at a time"""
+        monkeypatch.setattr(paper_trading_engine, "TRADE_LOG_BATCH_SIZE", 4)
+        logger = RecordingLogger()
+        engine = PaperTradingEngine(
+            initial_balance=1000.0, logger=logger, config={"paper_trading": True},
+            fast_path=True, log_dir=str(Path(__file__).parent / "test_logs"),
+        )
+        monkeypatch.setattr(
+            "services.execution_gate.may_execute_trade", lambda config, control_path=None: (True, "")
+        )
+        for i in range(6):
+            order = engine.place_order(f"M{i}", "buy", "market", 1, 0.5)
+            engine.execute_order(order["order_id"], 0.5)
+        assert engine.orders == {}
+        assert logger.single == []
+        assert [len(b) for b in logger.batches] == [4]
+        engine.get_state()
+        assert [len(b) for b in logger.batches] == [4, 2]
+
+    def test_buffered_logs_flushed_on_close_and_exit(self, monkeypatch):
+        """close() writes the partial batch; unclosed engines are flushed at exit"""
+        monkeypatch.setattr(
+            "services.execution_gate.may_execute_trade", lambda config, control_path=None: (True, "")
+        )
+        log_dir = str(Path(__file__).parent / "test_logs")
+        closed_logger, open_logger = RecordingLogger(), RecordingLogger()
+        closed = PaperTradingEngine(
+            initial_balance=1000.0, logger=closed_logger, config={"paper_trading": True},
+            fast_path=True, log_dir=log_dir,
+        )
+        left_open = PaperTradingEngine(
+            initial_balance=1000.0, logger=open_logger, config={"paper_trading": True},
+            fast_path=True, log_dir=log_dir,
+        )
+        for engine in (closed, left_open):
+            for i in range(3):
+                engine.fill_market_order(f"M{i}", "buy", 1, 0.5)
+        assert closed_logger.batches == open_logger.batches == []
+
+        closed.close()
+        assert [len(b) for b in closed_logger.batches] == [3]
+        assert closed not in paper_trading_engine._unflushed_engines
+
+        paper_trading_engine._flush_engines_at_exit()
+        assert [len(b) for b in open_logger.batches] == [3]
+        assert [len(b) for b in closed_logger.batches] == [3]
+
+    def test_batched_trade_logs_keep_fill_times(self, monkeypatch, tmp_path):
+        """Each stored trade has its own fill time, not the batch flush time"""
+        from database import trades_store
+        from logger import Logger
+
+        ticks = itertools.count()
+
+        class FillClock(datetime):
+            """Ten seconds pass on every call"""
+
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2024, 5, 1, 12) + timedelta(seconds=10 * next(ticks))
+
+        monkeypatch.setattr(paper_trading_engine, "datetime", FillClock)
+        monkeypatch.setattr(
+            "services.execution_gate.may_execute_trade", lambda config, control_path=None: (True, "")
+        )
+        engine = PaperTradingEngine(
+            initial_balance=1000.0, logger=Logger(str(tmp_path)), config={"paper_trading": True},
+            fast_path=True, log_dir=str(tmp_path),
+        )
+        for i in range(3):
+            engine.fill_market_order(f"M{i}", "buy", 1, 0.5)
+        engine.close()
+
+        stored = sorted(t["timestamp"] for t in trades_store.get_trades(tmp_path))
+        filled = [
+            datetime.fromisoformat(t["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+            for t in engine.trade_history
+        ]
+        assert len(set(stored)) == 3
+        assert stored == filled
+
+    def test_ring_buffer_and_state_round_trip(self):
+        """History keeps the newest entries; restored engine has the same accounting"""
+        engine = PaperTradingEngine(
+            initial_balance=1000.0, logger=RecordingLogger(), replay=True,
+            config={"trade_history_max_len": 3},
+        )
+        for i in range(5):
+            engine.fill_market_order(f"M{i}", "buy", 2, 0.25)
+        assert [t["symbol"] for t in engine.trade_history] == ["M2", "M3", "M4"]
+
+        state = engine.get_state()
+        restored = PaperTradingEngine(
+            initial_balance=1000.0, logger=RecordingLogger(), replay=True,
+            config={"trade_history_max_len": 3},
+        )
+        restored.set_state(state)
+        assert list(restored.trade_history) == list(engine.trade_history)
+        assert restored._position_cost == engine._position_cost
+        restored.fill_market_order("M5", "buy", 2, 0.25)
+        assert len(restored.trade_history) == 3
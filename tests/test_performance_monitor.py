@@ -0,0 +1,91 @@
+"""
+Unit Tests for PerformanceMonitor
+
+Tests streaming histogram quantiles and per-stage cycle spans.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from performance_monitor import PerformanceMonitor, StreamingHistogram
+
+
+class TestStreamingHistogram:
+    """Test suite for StreamingHistogram"""
+
+    def test_empty_snapshot(self):
+        """Empty histogram reports zeros"""
+        snapshot = StreamingHistogram().snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["p99"] == 0.0
+
+    def test_quantiles_within_precision(self):
+        """Quantiles match exact sorted percentiles within bucket precision"""
+        rng = random.Random(42)
+        values = [rng.expovariate(1 / 50.0) for _ in range(20000)]
+        histogram = StreamingHistogram(precision=0.02)
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * len(values)) - 1]
+            assert abs(histogram.quantile(q) - exact) / exact < 0.03
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == len(values)
+        assert snapshot["min"] == values[0]
+        assert snapshot["max"] == values[-1]
+        assert abs(snapshot["mean"] - sum(values) / len(values)) < 1e-6
+
+    def test_fixed_memory(self):
+        """Bucket storage does not grow with the number of recorded values"""
+        histogram = StreamingHistogram()
+        buckets = len(histogram.counts)
+        for i in range(10000):
+            histogram.record(i * 0.5)
+        assert len(histogram.counts) == buckets
+
+
+class TestPerformanceMonitorSpans:
+    """Test suite for per-stage cycle tracing"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.monitor = PerformanceMonitor({"performance_history_size": 10})
+
+    def test_span_records_stage(self):
+        """span() records one observation per use"""
+        for _ in range(3):
+            with self.monitor.span("fetch"):
+                pass
+        stats = self.monitor.get_stage_statistics()
+        assert stats["fetch"]["count"] == 3
+        assert stats["fetch"]["last"] >= 0.0
+
+    def test_span_records_on_exception(self):
+        """span() still records when the wrapped stage raises"""
+        try:
+            with self.monitor.span("execution"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        assert self.monitor.get_stage_statistics()["execution"]["count"] == 1
+
+    def test_sliding_window_is_bounded(self):
+        """Window keeps history_size values; statistics cover all measurements"""
+        for _ in range(25):
+            self.monitor.start_cycle()
+            self.monitor.end_cycle()
+        assert len(self.monitor.total_cycle_times) == 10
+        assert self.monitor.get_statistics("total_cycle")["count"] == 25
+
+    def test_reset_clears_stages(self):
+        """reset_statistics clears stage histograms"""
+        self.monitor.record_stage("risk", 5.0)
+        self.monitor.reset_statistics()
+        assert self.monitor.get_stage_statistics() == {}
@@ -0,0 +1,172 @@
+"""
+Unit Tests for RealTimePerformanceTracker history storage
+
+Tests that the columnar PerformanceHistory ring answers time-window queries
+exactly like filtering the old deque of dicts (across wrap-around and
+growth), that downsampling keeps the newest point, and that take_snapshot
+reuses the cached strategy list until the strategies table changes.
+"""
+
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import performance_tracker as tracker_module
+from services.performance_tracker import PerformanceHistory, RealTimePerformanceTracker
+
+
+def _reference(rows, cutoff):
+    """The old deque filter"""
+    return [r for r in rows if r["timestamp"] >= cutoff]
+
+
+class TestPerformanceHistory:
+    """Test suite for PerformanceHistory"""
+
+    def test_matches_deque_filter_across_wrap(self):
+        rng = random.Random(50)
+        history = PerformanceHistory(capacity=300, initial_rows=16)
+        rows = []
+        timestamp = 1_700_000_000
+        for i in range(1000):
+            timestamp += rng.choice([0, 1, 1, 2, 5])
+            row = {
+                "timestamp": timestamp,
+                "portfolio_value": 10000.0 + i,
+                "return_pct": rng.uniform(-5, 5),
+                "pnl": rng.uniform(-100, 100),
+            }
+            history.append(row["timestamp"], row["portfolio_value"], row["return_pct"], row["pnl"])
+            rows = (rows + [row])[-300:]
+
+            if i % 37 == 0:
+                for cutoff in (rows[0]["timestamp"] - 1, rng.choice(rows)["timestamp"], timestamp + 1):
+                    assert history.since(cutoff) == _reference(rows, cutoff)
+
+        assert len(history) == 300
+        assert history.latest() == rows[-1]
+
+    def test_timestamps_never_go_backwards(self):
+        history = PerformanceHistory(capacity=10)
+        history.append(100, 1.0, 0.0, 0.0)
+        history.append(90, 2.0, 0.0, 0.0)
+        assert [r["timestamp"] for r in history.since(0)] == [100, 100]
+
+    def test_none_values_round_trip(self):
+        history = PerformanceHistory(capacity=10)
+        history.append(100, None, 1.5, None)
+        assert history.latest() == {
+            "timestamp": 100,
+            "portfolio_value": None,
+            "return_pct": 1.5,
+            "pnl": None,
+        }
+
+    def test_downsample_keeps_newest_point(self):
+        history = PerformanceHistory(capacity=1000)
+        for i in range(1000):
+            history.append(i, float(i), 0.0, 0.0)
+
+        points = history.since(100, max_points=90)
+        assert len(points) == 90
+        assert points[-1]["timestamp"] == 999
+        timestamps = [p["timestamp"] for p in points]
+        assert timestamps == sorted(set(timestamps))
+        assert timestamps[0] < 120
+
+        # Fewer points than requested: returned as-is
+        assert len(history.since(990, max_points=90)) == 10
+
+    def test_empty(self):
+        history = PerformanceHistory(capacity=10)
+        assert history.latest() is None
+        assert history.since(0) == []
+
+
+class TestRealTimePerformanceTracker:
+    """Test suite for RealTimePerformanceTracker with patched models"""
+
+    def setup_method(self):
+        self.strategies = [
+            {"id": 1, "name": "alpha", "enabled": 1},
+            {"id": 2, "name": "beta", "enabled": 0},
+        ]
+        self.signature = (2, 2, 0, 1)
+        self.calls = {"get_all": 0, "get_all_latest": 0, "get_latest": 0}
+
+    def _patch(self, monkeypatch):
+        Strategy = tracker_module.Strategy
+        Snapshots = tracker_module.StrategyPerformanceSnapshot
+
+        def get_all():
+            self.calls["get_all"] += 1
+            return [dict(s) for s in self.strategies]
+
+        def get_all_latest():
+            self.calls["get_all_latest"] += 1
+            return [
+                {
+                    "strategy_id": 1,
+                    "portfolio_value": 10500.0,
+                    "total_return_pct": 5.0,
+                    "daily_pnl": 25.0,
+                    "sharpe_ratio": 1.2,
+                    "total_trades": 4,
+                    "win_rate": 0.5,
+                    "open_positions": 1,
+                }
+            ]
+
+        def get_latest(strategy_id):
+            self.calls["get_latest"] += 1
+            return None
+
+        monkeypatch.setattr(Strategy, "get_all", staticmethod(get_all))
+        monkeypatch.setattr(Strategy, "get_signature", staticmethod(lambda: self.signature))
+        monkeypatch.setattr(Snapshots, "get_all_latest", staticmethod(get_all_latest))
+        monkeypatch.setattr(Snapshots, "get_latest", staticmethod(get_latest))
+        monkeypatch.setattr(Snapshots, "get_history", staticmethod(lambda sid, hours=24: []))
+
+    def test_snapshot_uses_cached_strategies(self, monkeypatch):
+        self._patch(monkeypatch)
+        tracker = RealTimePerformanceTracker(max_history_hours=1)
+        assert self.calls["get_all"] == 1
+
+        for _ in range(5):
+            snapshot = tracker.take_snapshot()
+        assert self.calls["get_all"] == 1
+        assert self.calls["get_all_latest"] == 5
+        assert self.calls["get_latest"] == 0
+        assert snapshot["strategies"]["alpha"]["portfolio_value"] == 10500.0
+        assert snapshot["strategies"]["beta"]["portfolio_value"] == 10000.0
+
+        # A new strategy changes the signature and is picked up
+        self.strategies.append({"id": 3, "name": "gamma", "enabled": 1})
+        self.signature = (3, 3, 0, 2)
+        snapshot = tracker.take_snapshot()
+        assert self.calls["get_all"] == 2
+        assert "gamma" in snapshot["strategies"]
+
+    def test_historical_performance_from_ring(self, monkeypatch):
+        self._patch(monkeypatch)
+        tracker = RealTimePerformanceTracker(max_history_hours=1)
+        tracker.take_snapshot({1: {"portfolio_value": 11000.0, "return_pct": 10.0, "daily_pnl": 5.0}})
+
+        history = tracker.get_historical_performance("alpha", hours=1)
+        assert len(history) == 1
+        assert history[0]["portfolio_value"] == 11000.0
+        assert history[0]["return_pct"] == 10.0
+        assert history[0]["timestamp"] <= int(datetime.utcnow().timestamp())
+        assert tracker.get_historical_performance("missing") == []
+
+    def test_real_time_stats_single_query(self, monkeypatch):
+        self._patch(monkeypatch)
+        tracker = RealTimePerformanceTracker(max_history_hours=1)
+        stats = tracker.get_real_time_stats()
+        assert stats["active_strategies"] == 1
+        assert stats["total_value"] == 10500.0
+        assert self.calls["get_all_latest"] == 1
+        assert self.calls["get_latest"] == 0
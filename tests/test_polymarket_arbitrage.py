@@ -0,0 +1,130 @@
+"""
+Unit Tests for PolymarketArbitrageStrategy batch scanning
+
+Tests that analyze_markets_batch finds exactly the opportunities the
+per-market analyze_market path finds, with identical values, over randomized
+prices and liquidity (including the edge cases each check guards).
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strategies.polymarket_arbitrage import PolymarketArbitrageStrategy, pack_market_arrays
+
+
+def _strip(opportunity):
+    """Opportunity without its detection timestamp"""
+    return {k: v for k, v in opportunity.items() if k != "detected_at"}
+
+
+def _random_market_set(rng, count):
+    """Markets, prices and liquidity spanning every branch of the checks"""
+    edge_prices = [0.0, -0.1, 1.0, 1.2, 0.5, 0.49, 0.485, float("nan")]
+    markets, prices, liquidity = [], {}, {}
+    for i in range(count):
+        market_id = f"m{i}"
+        markets.append({"id": market_id, "question": f"Market {i}?"})
+
+        roll = rng.random()
+        if roll < 0.1:
+            yes, no = rng.choice(edge_prices), rng.choice(edge_prices)
+        elif roll < 0.6:
+            # Near the $1.00 line, where the margin threshold matters
+            yes = round(rng.uniform(0.05, 0.95), 3)
+            no = round(1.0 - yes - rng.uniform(-0.05, 0.1), 3)
+        else:
+            yes, no = rng.uniform(0, 1), rng.uniform(0, 1)
+        if rng.random() < 0.05:
+            prices[market_id] = {}
+        else:
+            prices[market_id] = {"yes": yes, "no": no}
+
+        roll = rng.random()
+        if roll < 0.3:
+            continue  # No liquidity data
+        if roll < 0.35:
+            liquidity[market_id] = {}
+        elif roll < 0.4:
+            liquidity[market_id] = {"yes": rng.uniform(0, 50_000)}
+        elif roll < 0.45:
+            liquidity[market_id] = {"yes": 0.0, "no": 0.0}
+        else:
+            liquidity[market_id] = {
+                "yes": rng.choice([rng.uniform(0, 2_000), rng.uniform(1_000, 200_000)]),
+                "no": rng.choice([rng.uniform(0, 2_000), rng.uniform(1_000, 200_000)]),
+            }
+    return markets, prices, liquidity
+
+
+class TestBatchScan:
+    """Test suite for analyze_markets / analyze_markets_batch"""
+
+    def setup_method(self):
+        self.config = {
+            "max_trade_size": 10,
+            "max_daily_loss": 100,
+            "strategies": {"polymarket_arbitrage": {"min_profit_margin": 2.0}},
+        }
+
+    def _per_market(self, strategy, markets, prices, liquidity):
+        found = []
+        for market in markets:
+            opportunity = strategy.analyze_market(
+                market, prices[market["id"]], liquidity.get(market["id"])
+            )
+            if opportunity:
+                found.append(opportunity)
+        return found
+
+    def test_randomized_equivalence(self):
+        rng = random.Random(47)
+        for trial in range(8):
+            markets, prices, liquidity = _random_market_set(rng, 400)
+            self.config["max_trade_size"] = rng.choice([5, 10, 250])
+            self.config["strategies"]["polymarket_arbitrage"]["min_profit_margin"] = rng.choice(
+                [0.5, 2.0, 5.0]
+            )
+
+            single = PolymarketArbitrageStrategy(self.config)
+            batch = PolymarketArbitrageStrategy(self.config)
+            expected = self._per_market(single, markets, prices, liquidity)
+            actual = batch.analyze_markets(markets, prices, liquidity)
+
+            assert [_strip(o) for o in actual] == [_strip(o) for o in expected], trial
+            assert batch.opportunities_detected == single.opportunities_detected
+            assert expected, "trial produced no opportunities to compare"
+
+    def test_without_liquidity_data(self):
+        markets, prices, _ = _random_market_set(random.Random(3), 300)
+        single = PolymarketArbitrageStrategy(self.config)
+        batch = PolymarketArbitrageStrategy(self.config)
+
+        expected = self._per_market(single, markets, prices, {})
+        yes, no, yes_liq, no_liq = pack_market_arrays(markets, prices)
+        assert yes_liq is None and no_liq is None
+
+        actual = batch.analyze_markets_batch(markets, yes, no)
+        assert [_strip(o) for o in actual] == [_strip(o) for o in expected]
+
+    def test_only_passing_markets_materialized(self):
+        strategy = PolymarketArbitrageStrategy(self.config)
+        markets = [{"id": f"m{i}", "question": f"Q{i}"} for i in range(4)]
+        yes = np.array([0.45, 0.60, 0.30, 0.50])
+        no = np.array([0.45, 0.50, 0.69, 0.50])
+
+        found = strategy.analyze_markets_batch(markets, yes, no)
+
+        assert [o["market_id"] for o in found] == ["m0"]
+        assert isinstance(found[0]["position_size"], float)
+        assert found[0]["execution_ready"] is True
+
+    def test_disabled_returns_nothing(self):
+        self.config["strategies"]["polymarket_arbitrage"]["enabled"] = False
+        strategy = PolymarketArbitrageStrategy(self.config)
+        markets = [{"id": "m0"}]
+        assert strategy.analyze_markets_batch(markets, np.array([0.4]), np.array([0.4])) == []
@@ -0,0 +1,111 @@
+"""
+Tests for engine discovery (services/process_manager.py).
+
+- EngineLock publishes PID, create time and heartbeat; refuses a live foreign lock
+- find_engine() prefers the lock, caches the result and rate-limits full scans
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services import process_manager
+from services.process_manager import (
+    ENGINE_LOCK_FILENAME,
+    EngineLock,
+    ProcessManager,
+    read_engine_lock,
+)
+from utils.atomic_json import atomic_write_json
+
+
+class CountingScan:
+    """process_iter stand-in that counts full scans"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, attrs=None):
+        self.calls += 1
+        return iter([])
+
+
+class TestEngineLock:
+    """Test suite for EngineLock"""
+
+    def test_acquire_heartbeat_release(self, tmp_path):
+        """Lock records this process and is removed on release"""
+        lock = EngineLock(tmp_path)
+        assert lock.acquire() is True
+        data = read_engine_lock(tmp_path)
+        assert data["pid"] == os.getpid()
+        assert data["create_time"] == psutil.Process().create_time()
+        first_beat = data["heartbeat"]
+        lock.heartbeat()
+        assert read_engine_lock(tmp_path)["heartbeat"] >= first_beat
+        lock.release()
+        assert not (tmp_path / ENGINE_LOCK_FILENAME).exists()
+
+    def test_refuses_live_foreign_lock(self, tmp_path):
+        """A lock held by another live process is not taken over"""
+        parent = psutil.Process(os.getppid())
+        atomic_write_json(
+            tmp_path / ENGINE_LOCK_FILENAME,
+            {"pid": parent.pid, "create_time": parent.create_time()},
+        )
+        assert EngineLock(tmp_path).acquire() is False
+
+    def test_takes_over_stale_lock(self, tmp_path):
+        """A lock whose PID was reused by another process (create_time differs) is stale"""
+        atomic_write_json(
+            tmp_path / ENGINE_LOCK_FILENAME,
+            {"pid": os.getppid(), "create_time": 1.0},
+        )
+        assert EngineLock(tmp_path).acquire() is True
+
+
+class TestFindEngine:
+    """Test suite for ProcessManager.find_engine"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.scan = CountingScan()
+
+    def _manager(self, tmp_path, monkeypatch, scan_interval=60.0):
+        monkeypatch.setattr(process_manager.psutil, "process_iter", self.scan)
+        return ProcessManager(base_dir=tmp_path, state_dir=tmp_path, scan_interval=scan_interval)
+
+    def test_lock_file_found_without_scan(self, tmp_path, monkeypatch):
+        """Engine from the lock file; repeat calls reuse the cached result"""
+        EngineLock(tmp_path).acquire()
+        manager = self._manager(tmp_path, monkeypatch)
+        engine = manager.find_engine()
+        assert engine["pid"] == os.getpid()
+        assert engine["source"] == "lock"
+        assert manager.find_engine() is engine
+        assert self.scan.calls == 0
+
+    def test_full_scan_is_rate_limited(self, tmp_path, monkeypatch):
+        """Without lock or PID file, scans run at most once per interval"""
+        manager = self._manager(tmp_path, monkeypatch)
+        for _ in range(5):
+            assert manager.find_engine() is None
+        assert self.scan.calls == 1
+        manager.invalidate_engine_cache()
+        manager.find_engine()
+        assert self.scan.calls == 2
+
+    def test_dead_cached_engine_is_dropped(self, tmp_path, monkeypatch):
+        """A cached engine that exited is re-resolved"""
+        lock = EngineLock(tmp_path)
+        lock.acquire()
+        manager = self._manager(tmp_path, monkeypatch, scan_interval=0.0)
+        assert manager.find_engine() is not None
+        lock.release()
+        manager._engine["create_time"] = 1.0  # simulate PID reuse
+        assert manager.find_engine() is None
+        assert self.scan.calls == 1
@@ -0,0 +1,126 @@
+"""
+Unit Tests for the shared token bucket rate limiters
+
+Tests reservations, weighted costs, 429/Retry-After backoff, async acquire
+and the registry summary published to the dashboard.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import (
+    RateLimiterRegistry,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.clock = FakeClock()
+        self.bucket = TokenBucket("api", rate_per_second=2.0, capacity=4, clock=self.clock)
+
+    def test_burst_then_reservations_are_spaced(self):
+        """Burst up to capacity, then each reservation waits one refill interval more"""
+        assert [self.bucket.reserve() for _ in range(4)] == [0.0] * 4
+        assert self.bucket.reserve() == 0.5
+        assert self.bucket.reserve() == 1.0
+
+    def test_batch_reservation(self):
+        """A batch reserves all its tokens at once"""
+        assert self.bucket.reserve(cost=6) == 1.0
+        assert self.bucket.try_acquire() is False
+        self.clock.now += 1.5
+        assert self.bucket.try_acquire() is True
+
+    def test_reserve_within_budget(self):
+        """reserve_within() hands out send delays up to the budget, then refuses"""
+        delays = [self.bucket.reserve_within(1.0) for _ in range(7)]
+        assert delays == [0.0, 0.0, 0.0, 0.0, 0.5, 1.0, None]
+        self.clock.now += 0.5
+        assert self.bucket.reserve_within(1.0) == 1.0
+
+    def test_weighted_endpoint_cost(self):
+        """Endpoint costs draw more tokens per call"""
+        self.bucket.configure(costs={"orderbook": 3})
+        assert self.bucket.try_acquire(endpoint="orderbook") is True
+        assert self.bucket.snapshot()["remaining"] == 1
+        assert self.bucket.try_acquire(endpoint="orderbook") is False
+
+    def test_acquire_timeout_does_not_consume(self):
+        """acquire() returns False without taking tokens when the wait exceeds timeout"""
+        self.bucket.reserve(cost=4)
+        assert self.bucket.acquire(timeout=0.1) is False
+        assert self.bucket.wait_time() == 0.5
+
+    def test_retry_after_pauses_refill(self):
+        """429 with Retry-After drains the bucket and pauses refill"""
+        backoff = self.bucket.on_response(429, {"Retry-After": "10"})
+        assert backoff == 10.0
+        assert self.bucket.wait_time() == 10.5
+        self.clock.now += 10.5
+        assert self.bucket.try_acquire() is True
+        assert self.bucket.snapshot()["rate_limit_hits"] == 1
+
+    def test_remaining_header_caps_tokens(self):
+        """X-RateLimit-Remaining never lets the bucket assume more budget"""
+        self.bucket.on_response(200, {"X-RateLimit-Remaining": "1"})
+        assert self.bucket.try_acquire() is True
+        assert self.bucket.try_acquire() is False
+
+    def test_async_acquire(self):
+        """acquire_async() reserves without blocking the event loop"""
+        bucket = TokenBucket("async", rate_per_second=1000.0, capacity=2)
+        results = asyncio.run(self._acquire_many(bucket, 5))
+        assert results == [True] * 5
+        assert bucket.snapshot()["throttled"] == 3
+
+    @staticmethod
+    async def _acquire_many(bucket, count):
+        return await asyncio.gather(*(bucket.acquire_async() for _ in range(count)))
+
+    def test_parse_retry_after(self):
+        """Retry-After accepts seconds and HTTP dates"""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("not a date") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestRateLimiterRegistry:
+    """Test suite for RateLimiterRegistry"""
+
+    def test_config_overrides_client_defaults(self):
+        """Config applies whether it is loaded before or after the client registers"""
+        registry = RateLimiterRegistry()
+        limiter = registry.get("coingecko", calls_per_minute=50, burst=1)
+        registry.configure({"coingecko": {"calls_per_minute": 120, "burst": 10}})
+        assert registry.get("coingecko", calls_per_minute=50) is limiter
+        assert limiter.rate == 2.0
+        assert limiter.capacity == 10
+
+    def test_summary_reports_busiest_limiter(self):
+        """Dashboard block shows the most used limiter plus all limiters"""
+        registry = RateLimiterRegistry()
+        assert registry.summary()["usage_pct"] == 0.0
+        registry.get("a", calls_per_minute=60, burst=10).reserve(cost=5)
+        registry.get("b", calls_per_minute=60, burst=10)
+        summary = registry.summary()
+        assert summary["busiest"] == "a"
+        assert 45.0 <= summary["usage_pct"] <= 50.0
+        assert set(summary["limiters"]) == {"a", "b"}
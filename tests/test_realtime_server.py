@@ -0,0 +1,94 @@
+"""
+Unit Tests for RealtimeServer log follow
+
+Tests that the log file is only polled while the 'logs' room has subscribers:
+registering the reader starts nothing, the first subscribe starts the
+follower and the last unsubscribe / disconnect stops it.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("flask_socketio")
+
+from flask import Flask
+
+from services.realtime_server import RealtimeServer
+
+
+class CountingReader:
+    """LogReader stand-in that counts polls and returns one record per poll"""
+
+    def __init__(self):
+        self.polls = 0
+
+    def read_new(self, cursor):
+        self.polls += 1
+        if cursor is None:
+            return [], {"offset": 0}
+        return [{"message": f"line {self.polls}"}], {"offset": self.polls}
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestLogFollow:
+    """Test suite for RealtimeServer.follow_log"""
+
+    def setup_method(self):
+        self.server = RealtimeServer(Flask(__name__))
+        self.reader = CountingReader()
+        self.server.follow_log(self.reader, interval=0.02)
+
+    def _client(self):
+        return self.server.socketio.test_client(self.server.app)
+
+    def _polls_stop(self):
+        """True once the poll count stays put for a few intervals"""
+        before = self.reader.polls
+        time.sleep(0.15)
+        return self.reader.polls == before
+
+    def test_not_polled_without_subscribers(self):
+        client = self._client()
+        time.sleep(0.1)
+        assert self.reader.polls == 0
+        client.disconnect()
+
+    def test_follows_while_subscribed(self):
+        client = self._client()
+        client.emit("subscribe", {"room": "logs"})
+        assert _wait_for(lambda: self.reader.polls >= 3)
+        received = [e for e in client.get_received() if e["name"] == "log_records"]
+        assert received
+
+        client.emit("unsubscribe", {"room": "logs"})
+        assert _wait_for(self._polls_stop)
+        client.disconnect()
+
+    def test_last_disconnect_stops_follow(self):
+        first, second = self._client(), self._client()
+        first.emit("subscribe", {"room": "logs"})
+        second.emit("subscribe", {"room": "logs"})
+        first.disconnect()
+        # One subscriber left: still following
+        assert _wait_for(lambda: self.reader.polls >= 3)
+
+        second.disconnect()
+        assert _wait_for(self._polls_stop)
+
+        # A new subscriber starts it again
+        third = self._client()
+        third.emit("subscribe", {"room": "logs"})
+        polls = self.reader.polls
+        assert _wait_for(lambda: self.reader.polls > polls)
+        third.disconnect()
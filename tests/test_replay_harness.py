@@ -0,0 +1,83 @@
+"""
+Tests for the strategy replay harness (services/replay_harness.py).
+
+- Snapshots group into (markets, prices_dict) cycles, latest snapshot wins
+- The real ArbitrageStrategy is driven and its signals fill in a replay engine
+- Parallel runs return the same results as serial runs, in job order
+- Reality-based arbitrage is always off in replay
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.replay_harness import build_strategy, cycles_from_rows, run_replay, run_replays
+
+T0 = 1_750_000_000 - 1_750_000_000 % 60
+
+
+def _rows(n_cycles=30):
+    rows = []
+    for c in range(n_cycles):
+        ts = T0 + c * 60
+        # m-arb is mispriced every cycle, m-fair never is
+        rows.append(("m-arb", 0.45, 0.45 + (c % 3) * 0.01, 1000.0, 500.0, ts))
+        rows.append(("m-fair", 0.52, 0.50, 2000.0, None, ts + 5))
+    return rows
+
+
+class TestReplayHarness:
+    """Test suite for the replay harness"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.cycles = cycles_from_rows(_rows())
+        self.config = {"max_trade_size": 10, "min_profit_margin": 0.02}
+
+    def test_cycles_group_and_keep_latest_snapshot(self):
+        """One cycle per interval with both price key styles"""
+        rows = _rows(2) + [("m-arb", 0.40, 0.40, 1000.0, 500.0, T0 + 30)]
+        rows.sort(key=lambda r: r[5])
+        cycles = cycles_from_rows(rows)
+        assert [c[0] for c in cycles] == [T0, T0 + 60]
+        ts, markets, prices = cycles[0]
+        assert {m["id"] for m in markets} == {"m-arb", "m-fair"}
+        assert prices["m-arb"]["yes"] == prices["m-arb"]["yes_price"] == 0.40
+        assert prices["m-fair"]["liquidity"] == 0.0
+
+    def test_real_strategy_trades_in_replay_engine(self):
+        """ArbitrageStrategy finds m-arb; one position per market"""
+        result = run_replay("arbitrage", {"min_profit_margin": 0.05}, self.cycles, self.config)
+        assert result["cycles"] == 30
+        assert result["opportunities"] == 30
+        assert result["trades"] == 1
+        assert result["errors"] == 0
+        metrics = result["metrics"]
+        assert metrics["open_positions"] == 1
+        assert metrics["total_commission"] > 0
+        assert "sharpe_ratio" in metrics
+
+        strict = run_replay("arbitrage", {"min_profit_margin": 0.2}, self.cycles, self.config)
+        assert strict["opportunities"] == 0
+        assert strict["trades"] == 0
+
+    def test_parallel_matches_serial(self):
+        """Worker processes give the same metrics as an in-process run"""
+        jobs = [("arbitrage", {"min_profit_margin": m}) for m in (0.02, 0.05, 0.2)]
+        serial = run_replays(jobs, self.cycles, self.config, processes=1)
+        parallel = run_replays(jobs, self.cycles, self.config, processes=2)
+        assert [r["parameters"] for r in parallel] == [p for _, p in jobs]
+        for a, b in zip(serial, parallel):
+            assert a["metrics"] == b["metrics"]
+            assert a["trades"] == b["trades"]
+
+    def test_reality_arbitrage_disabled_even_when_configured(self):
+        """A config enabling reality_based is overridden on a copy"""
+        config = dict(self.config)
+        config["arbitrage_types"] = {"reality_based": {"enabled": True, "min_edge": 0.1}, "simple": {"enabled": True}}
+        strategy = build_strategy("arbitrage", config=config)
+        types = strategy.arbitrage_types_config
+        assert types["reality_based"] == {"enabled": False, "min_edge": 0.1}
+        assert types["simple"] == {"enabled": True}
+        assert config["arbitrage_types"]["reality_based"]["enabled"] is True
@@ -5,6 +5,7 @@ Tests rollback logic for failed arbitrage trades.
 """
 
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -12,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from strategies.arbitrage_types import ArbitrageLeg
 from strategies.rollback_handler import RollbackHandler
+from strategies.simulated_exchange import build_simulated_exchanges
 
 
 class TestRollbackHandler:
@@ -127,6 +129,29 @@ class TestRollbackHandler:
 
         print("✓ test_rollback_opportunity_returns_details: Detailed results returned")
 
+    def test_concurrent_rollback_overlaps_reversals(self):
+        """Test concurrent rollback takes the slowest reversal, not the sum"""
+        exchanges = build_simulated_exchanges(
+            {"kalshi": 0.15, "polymarket": 0.15, "binance": 0.15}
+        )
+        handler = RollbackHandler(exchanges)
+        legs = [
+            ArbitrageLeg("kalshi", "buy", "m1", 0.45, 100, 1),
+            ArbitrageLeg("polymarket", "sell", "m2", 0.55, 100, 2),
+            ArbitrageLeg("binance", "buy", "m3", 0.50, 100, 3),
+        ]
+
+        started = time.monotonic()
+        result = handler.rollback_opportunity(legs, concurrent=True)
+        elapsed = time.monotonic() - started
+
+        assert result["successful_rollbacks"] == 3
+        assert [d["order"] for d in result["rollback_details"]] == [3, 2, 1]
+        assert exchanges["polymarket"].reversals == [("m2", "buy")]
+        assert elapsed < 0.4
+
+        print("✓ test_concurrent_rollback_overlaps_reversals: Reversals overlapped")
+
 
 def run_all_tests():
     """Run all tests and report results"""
@@ -0,0 +1,298 @@
+"""
+Unit Tests for the Telegram outbox
+
+Runs TelegramOutbox against a local fake Bot API server and tests that
+sends are paced and non-blocking, bursts are batched instead of dropped,
+429 retry_after is honoured, and undelivered messages survive a restart.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from telegram_delivery import TelegramOutbox
+
+
+class FakeBotAPI:
+    """Minimal Bot API (getMe, sendMessage) on 127.0.0.1 with scripted failures"""
+
+    def __init__(self):
+        self.messages = []  # sendMessage payloads that succeeded
+        self.requests = 0
+        self.fail_with = []  # Status codes for the next sendMessage calls
+        self.retry_after = 0.2
+        self.reject_markdown = False
+        self.delay = 0.0
+        # Cleared by a test to hold sendMessage calls until it sets the gate
+        self.gate = threading.Event()
+        self.gate.set()
+        self.received = threading.Event()
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._reply(200, {"ok": True, "result": {"username": "fake_bot"}})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                api.received.set()
+                api.gate.wait(10)
+                time.sleep(api.delay)
+                with api.lock:
+                    api.requests += 1
+                    status = api.fail_with.pop(0) if api.fail_with else 200
+                    if status == 200 and api.reject_markdown and "parse_mode" in payload:
+                        status = 400
+                    if status == 200:
+                        api.messages.append(payload)
+                if status == 429:
+                    self._reply(
+                        429,
+                        {
+                            "ok": False,
+                            "error_code": 429,
+                            "parameters": {"retry_after": api.retry_after},
+                        },
+                    )
+                elif status != 200:
+                    self._reply(status, {"ok": False, "error_code": status})
+                else:
+                    self._reply(200, {"ok": True, "result": {"message_id": api.requests}})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def texts(self):
+        with self.lock:
+            return [m["text"] for m in self.messages]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestTelegramOutbox:
+    """Test suite for TelegramOutbox"""
+
+    def setup_method(self):
+        self.api = FakeBotAPI()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outbox_path = Path(self.tmp.name) / "telegram_outbox.json"
+        self.outboxes = []
+
+    def teardown_method(self):
+        for outbox in self.outboxes:
+            outbox.close(timeout=0)
+        self.api.stop()
+        self.tmp.cleanup()
+
+    def _outbox(self, chat_id=None, api_url=None, **kwargs):
+        kwargs.setdefault("messages_per_minute", 600)
+        kwargs.setdefault("burst", 1)
+        outbox = TelegramOutbox(
+            "TOKEN",
+            chat_id or f"chat-{uuid.uuid4().hex[:8]}",
+            api_url=api_url or self.api.url,
+            outbox_path=self.outbox_path,
+            **kwargs,
+        )
+        self.outboxes.append(outbox)
+        return outbox
+
+    def test_submit_does_not_wait_for_network(self):
+        self.api.delay = 0.3
+        outbox = self._outbox()
+
+        started = time.monotonic()
+        for i in range(5):
+            assert outbox.submit(f"message {i}")
+        assert time.monotonic() - started < 0.1
+
+        assert outbox.flush(timeout=5)
+        assert outbox.stats()["sent_messages"] == 5
+
+    def test_burst_is_batched_not_dropped(self):
+        outbox = self._outbox()
+        for i in range(30):
+            outbox.submit(f"event {i}")
+        assert outbox.flush(timeout=10)
+
+        delivered = "\n".join(self.api.texts())
+        for i in range(30):
+            assert f"event {i}" in delivered
+        assert self.api.requests < 30
+        assert any(text.startswith("📦") for text in self.api.texts())
+
+        stats = outbox.stats()
+        assert stats["sent_messages"] == 30
+        assert stats["dropped"] == 0
+        assert stats["batched"] > 0
+
+    def test_batches_respect_message_length_limit(self):
+        outbox = self._outbox(max_batch=50)
+        outbox.submit("first")  # Takes the only token
+        for i in range(5):
+            outbox.submit(f"{i}" * 1500)
+        assert outbox.flush(timeout=10)
+        assert all(len(text) <= 4096 for text in self.api.texts())
+        assert outbox.stats()["sent_messages"] == 6
+
+    def test_pacing_follows_token_bucket(self):
+        outbox = self._outbox(messages_per_minute=300, burst=1, max_batch=1)
+        started = time.monotonic()
+        for i in range(4):
+            outbox.submit(f"paced {i}")
+        assert outbox.flush(timeout=10)
+        # 1 immediate + 3 more at 5/s
+        assert time.monotonic() - started >= 0.55
+        assert self.api.requests == 4
+
+    def test_429_retry_after_is_honoured(self):
+        self.api.fail_with = [429]
+        outbox = self._outbox()
+
+        started = time.monotonic()
+        outbox.submit("throttled")
+        assert outbox.flush(timeout=5)
+
+        assert time.monotonic() - started >= self.api.retry_after
+        assert self.api.texts() == ["throttled"]
+        stats = outbox.stats()
+        assert stats["rate_limited"] == 1
+        assert stats["failed"] == 0
+
+    def test_rejected_markdown_resent_as_plain_text(self):
+        self.api.reject_markdown = True
+        outbox = self._outbox()
+        outbox.submit("unbalanced *markdown")
+        assert outbox.flush(timeout=5)
+        assert self.api.texts() == ["unbalanced *markdown"]
+        assert "parse_mode" not in self.api.messages[0]
+
+    def test_undelivered_messages_survive_restart(self):
+        chat_id = f"chat-{uuid.uuid4().hex[:8]}"
+        # Nothing listens on the dead server's port
+        dead = FakeBotAPI()
+        dead.stop()
+
+        offline = self._outbox(chat_id=chat_id, api_url=dead.url)
+        offline.submit("kept 1")
+        offline.submit("kept 2")
+        offline.close(timeout=0.3)
+        assert json.loads(self.outbox_path.read_text()) == ["kept 1", "kept 2"]
+        # A restart is a new process: drop the connection-error backoff
+        offline.bucket.reset()
+
+        restarted = self._outbox(chat_id=chat_id)
+        assert restarted.stats()["restored"] == 2
+        assert restarted.flush(timeout=5)
+        assert "kept 1" in "\n".join(self.api.texts())
+        assert "kept 2" in "\n".join(self.api.texts())
+
+        restarted.close(timeout=1)
+        assert json.loads(self.outbox_path.read_text()) == []
+
+    def test_deferred_restore_leaves_outbox_file_alone(self):
+        self.outbox_path.write_text(json.dumps(["owned by the running engine"]))
+
+        # A second engine refused the lock: it never sends or rewrites the file
+        refused = self._outbox(restore=False)
+        assert refused.stats()["restored"] == 0
+        refused.submit("startup notice")
+        refused.close(timeout=0)
+        assert self.api.texts() == []
+        assert json.loads(self.outbox_path.read_text()) == ["owned by the running engine"]
+
+        # The lock holder restores: persisted messages go out before newer ones
+        outbox = self._outbox(restore=False, max_batch=1)
+        outbox.submit("after lock")
+        assert outbox.restore() == 1
+        assert outbox.restore() == 0
+        assert outbox.flush(timeout=5)
+        assert self.api.texts() == ["owned by the running engine", "after lock"]
+
+    def test_full_queue_drops_oldest(self):
+        self.api.gate.clear()
+        self.api.fail_with = [500]
+        outbox = self._outbox(max_pending=3)
+
+        outbox.submit("m0")
+        assert self.api.received.wait(5)  # m0 is in flight, held at the server
+        for i in range(1, 6):
+            outbox.submit(f"m{i}")
+        assert outbox.stats()["dropped"] == 2  # m1, m2
+
+        # The 500 puts m0 back at the head; the queue is trimmed to max_pending
+        self.api.gate.set()
+        deadline = time.monotonic() + 5
+        while outbox.stats()["dropped"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        outbox.close(timeout=0)
+        assert json.loads(self.outbox_path.read_text()) == ["m3", "m4", "m5"]
+        stats = outbox.stats()
+        assert stats["dropped"] == 3
+        assert stats["pending"] == 3
+
+
+class TestSimpleTelegramBot:
+    """Test suite for run_bot.SimpleTelegramBot on the outbox"""
+
+    def setup_method(self):
+        self.api = FakeBotAPI()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.api.stop()
+        self.tmp.cleanup()
+
+    def test_send_message_queues_and_delivers(self):
+        from run_bot import SimpleTelegramBot
+
+        bot = SimpleTelegramBot(
+            "TOKEN",
+            f"chat-{uuid.uuid4().hex[:8]}",
+            outbox_path=Path(self.tmp.name) / "outbox.json",
+            api_url=self.api.url,
+        )
+        try:
+            assert bot.test_connection() == {"success": True, "bot_name": "fake_bot"}
+            assert bot.send_message("🔔 *Trade Executed*")
+            assert bot.outbox.flush(timeout=5)
+            assert self.api.texts() == ["🔔 *Trade Executed*"]
+        finally:
+            bot.close(timeout=1)
+
+    def test_async_disabled_posts_directly(self):
+        from run_bot import SimpleTelegramBot
+
+        bot = SimpleTelegramBot(
+            "TOKEN",
+            "chat-direct",
+            delivery_config={"async": False},
+            api_url=self.api.url,
+        )
+        assert bot.outbox is None
+        assert bot.send_message("direct")
+        assert self.api.texts() == ["direct"]
@@ -0,0 +1,151 @@
+"""
+Tests for the threshold ladder index (strategies/threshold_ladder.py).
+
+- Questions parse into (asset, direction, expiry) ladders
+- One sweep finds the same violating rungs as an all-pairs comparison
+- sync() applies listings, delistings and question edits incrementally
+- ArbitrageStrategy reports correlated opportunities from the ladders
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strategies.threshold_ladder import ThresholdLadderIndex, parse_ladder_rung
+
+
+def _market(market_id, question):
+    return {"id": market_id, "question": question}
+
+
+def _brute_force(index, prices_dict, min_gap):
+    """Rich market -> every looser rung it is overpriced against (all pairs)."""
+    found = {}
+    for (_, direction, _), rungs in index.ladders().items():
+        for t1, m1 in rungs:
+            for t2, m2 in rungs:
+                looser = t2 < t1 if direction == "above" else t2 > t1
+                if looser and prices_dict[m1]["yes"] - prices_dict[m2]["yes"] > min_gap:
+                    found.setdefault(m1, set()).add(m2)
+    return found
+
+
+class TestThresholdLadder:
+    """Test suite for ThresholdLadderIndex"""
+
+    def test_parse_ladder_rung(self):
+        """Asset, direction, threshold and expiry; the price is not taken for a year"""
+        assert parse_ladder_rung("Will Bitcoin reach $100K by March 2025?") == (
+            ("BTC", "above", "2025-03"),
+            100000.0,
+        )
+        assert parse_ladder_rung("Will BTC fall below $90,000 on Dec 31, 2025?") == (
+            ("BTC", "below", "2025-12-31"),
+            90000.0,
+        )
+        assert parse_ladder_rung("Will ETH surpass $2025 this market cycle?") == (
+            ("ETH", "above", None),
+            2025.0,
+        )
+        assert parse_ladder_rung("Will the Lakers win the NBA championship?") is None
+
+    def test_violations_both_directions_and_expiries(self):
+        """Above / below ladders sweep opposite ways; expiries never mix"""
+        index = ThresholdLadderIndex()
+        index.sync(
+            [
+                _market("a95", "Will BTC be above $95k by March 2026?"),
+                _market("a100", "Will BTC be above $100k by March 2026?"),
+                _market("a100_june", "Will BTC be above $100k by June 2026?"),
+                _market("b90", "Will BTC be below $90k by March 2026?"),
+                _market("b95", "Will BTC be below $95k by March 2026?"),
+            ]
+        )
+        prices = {
+            "a95": {"yes": 0.40},
+            "a100": {"yes": 0.55},  # Stricter than a95 but dearer
+            "a100_june": {"yes": 0.20},  # Different expiry: not compared
+            "b90": {"yes": 0.50},  # Stricter than b95 but dearer
+            "b95": {"yes": 0.30},
+        }
+        assert sorted(index.violations(prices, 0.05)) == [
+            ("a100", "a95", 0.55, 0.40),
+            ("b90", "b95", 0.50, 0.30),
+        ]
+        assert index.violations(prices, 0.2) == []
+
+    def test_sweep_matches_all_pairs(self):
+        """Every rich rung is found, paired with its cheapest looser rung"""
+        rng = random.Random(3)
+        markets, prices = [], {}
+        for i in range(300):
+            asset = rng.choice(["Bitcoin", "Ethereum", "Solana"])
+            direction = rng.choice(["above", "below"])
+            month = rng.choice(["March", "June"])
+            threshold = rng.choice(range(10, 200, 5))
+            markets.append(
+                _market(f"m{i}", f"Will {asset} be {direction} ${threshold}k by {month} 2026?")
+            )
+            prices[f"m{i}"] = {"yes": round(rng.random(), 2)}
+
+        index = ThresholdLadderIndex()
+        index.sync(markets)
+        assert len(index) == 300
+
+        expected = _brute_force(index, prices, 0.05)
+        found = index.violations(prices, 0.05)
+        assert {rich for rich, _, _, _ in found} == set(expected)
+        for rich, cheap, rich_yes, cheap_yes in found:
+            assert cheap in expected[rich]
+            assert cheap_yes == min(prices[m]["yes"] for m in expected[rich])
+            assert rich_yes == prices[rich]["yes"]
+
+    def test_sync_is_incremental(self, monkeypatch):
+        """Only new or edited questions are parsed; delisted markets leave their ladder"""
+        from strategies import threshold_ladder
+
+        parsed = []
+        real_parse = threshold_ladder.parse_ladder_rung
+        monkeypatch.setattr(
+            threshold_ladder, "parse_ladder_rung", lambda q: parsed.append(q) or real_parse(q)
+        )
+        index = ThresholdLadderIndex()
+        markets = [
+            _market("a", "Will BTC be above $95k by March 2026?"),
+            _market("b", "Will BTC be above $100k by March 2026?"),
+            _market("c", "Will it rain in Paris?"),
+        ]
+        index.sync(markets)
+        index.sync(markets)
+        assert len(parsed) == 3
+
+        index.sync([markets[0], _market("b", "Will BTC be above $105k by March 2026?")])
+        assert parsed[3:] == ["Will BTC be above $105k by March 2026?"]
+        assert index.ladders() == {
+            ("BTC", "above", "2026-03"): [(95000.0, "a"), (105000.0, "b")]
+        }
+
+        index.sync([])
+        assert index.ladders() == {}
+        assert len(index) == 0
+
+    def test_strategy_reports_correlated_opportunities(self):
+        """ArbitrageStrategy turns ladder violations into opportunities"""
+        from strategies.arbitrage_strategy import ArbitrageStrategy
+
+        strategy = ArbitrageStrategy({"arbitrage_types": {"reality_based": {"enabled": False}}})
+        markets = [
+            _market("low", "Will Bitcoin reach $95K by March 2026?"),
+            _market("high", "Will Bitcoin reach $100K by March 2026?"),
+        ]
+        prices = {"low": {"yes": 0.30, "no": 0.70}, "high": {"yes": 0.45, "no": 0.55}}
+
+        (opportunity,) = strategy.detect_correlated_markets_arbitrage(markets, prices)
+        assert opportunity.market_id == "high_low"
+        assert opportunity.arbitrage_type == "Correlated Markets"
+        assert opportunity.yes_price == 0.45
+
+        prices["high"]["yes"] = 0.32
+        assert strategy.detect_correlated_markets_arbitrage(markets, prices) == []
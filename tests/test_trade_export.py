@@ -0,0 +1,123 @@
+"""
+Tests for the streaming trade export (dashboard/services/trade_export.py).
+
+- Store exports are read in chunks with no row cap and honour filters
+- Gzip output decompresses to the plain CSV
+- Parquet / Arrow round-trip (skipped without pyarrow)
+- CSV / sample data fallback when the store is not in use
+"""
+
+import csv
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard.services.data_parser import DataParser
+from dashboard.services.trade_export import CSV_HEADER, stream_trade_export
+from database import trades_store
+
+
+def _insert_trades(log_dir, count):
+    for i in range(count):
+        trades_store.insert_trade(
+            log_dir,
+            timestamp=f"2024-03-{1 + i % 28:02d}T{i % 24:02d}:00:00",
+            market="BTC > 100k" if i % 2 else "ETH > 5k",
+            yes_price=0.45,
+            no_price=0.5,
+            profit_pct=1.0,
+            profit_usd=float(i),
+            strategy="arbitrage" if i % 3 else "momentum",
+        )
+
+
+def _csv_rows(blocks):
+    return list(csv.reader(io.StringIO(b"".join(blocks).decode("utf-8"))))
+
+
+class StoreParser:
+    """Parser stand-in whose trades come from the store"""
+
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+
+    def get_rollup_logs_dir(self):
+        return self.log_dir
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    _insert_trades(tmp_path, 53)
+    return tmp_path
+
+
+class TestTradeExport:
+    def test_store_csv_streams_all_rows_in_chunks(self, store_dir):
+        blocks, mimetype, filename = stream_trade_export(
+            StoreParser(store_dir), chunk_size=10
+        )
+        blocks = list(blocks)
+        rows = _csv_rows(blocks)
+        assert mimetype == "text/csv" and filename.endswith(".csv")
+        assert rows[0] == CSV_HEADER
+        assert len(rows) == 54
+        # header block + one block per chunk of 10 rows
+        assert len(blocks) == 1 + 6
+        assert [float(r[5]) for r in rows[1:]] == [float(i) for i in range(53)]
+
+    def test_filters(self, store_dir):
+        blocks, _, _ = stream_trade_export(
+            StoreParser(store_dir),
+            start_date="2024-03-10",
+            end_date="2024-03-20T23:59:59",
+            market="BTC > 100k",
+            strategy="arbitrage",
+        )
+        rows = _csv_rows(blocks)[1:]
+        assert rows
+        for r in rows:
+            assert "2024-03-10" <= r[0][:10] <= "2024-03-20"
+            assert r[1] == "BTC > 100k" and r[2] == "arbitrage"
+
+    def test_gzip_matches_plain_csv(self, store_dir):
+        plain, _, _ = stream_trade_export(StoreParser(store_dir), chunk_size=7)
+        packed, mimetype, filename = stream_trade_export(
+            StoreParser(store_dir), chunk_size=7, compress=True
+        )
+        assert mimetype == "application/gzip" and filename.endswith(".csv.gz")
+        assert gzip.decompress(b"".join(packed)) == b"".join(plain)
+
+    def test_unknown_format(self, store_dir):
+        with pytest.raises(ValueError):
+            stream_trade_export(StoreParser(store_dir), fmt="xlsx")
+
+    def test_bad_date_rejected_before_streaming(self, store_dir):
+        # Raised by the call itself, not on first iteration after the 200 went out
+        for kwargs in ({"start_date": "yesterday"}, {"end_date": "2024-13-01"}):
+            with pytest.raises(ValueError):
+                stream_trade_export(StoreParser(store_dir), **kwargs)
+
+    def test_parquet_and_arrow_round_trip(self, store_dir):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        blocks, _, _ = stream_trade_export(StoreParser(store_dir), fmt="parquet", chunk_size=20)
+        table = pq.read_table(io.BytesIO(b"".join(blocks)))
+        assert table.num_rows == 53
+        assert table.column("profit_usd").to_pylist() == [float(i) for i in range(53)]
+
+        blocks, _, _ = stream_trade_export(StoreParser(store_dir), fmt="arrow", chunk_size=20)
+        table = pa.ipc.open_stream(b"".join(blocks)).read_all()
+        assert table.num_rows == 53
+        assert table.column("market").to_pylist()[:2] == ["ETH > 5k", "BTC > 100k"]
+
+    def test_falls_back_to_parser_trades(self, tmp_path):
+        parser = DataParser(tmp_path)
+        expected = len(parser.get_all_trades())
+        blocks, _, _ = stream_trade_export(parser)
+        assert len(_csv_rows(blocks)) == expected + 1
@@ -0,0 +1,110 @@
+"""
+Tests for trade store rollups and the analytics services that read them.
+
+- Rollups maintained on insert match aggregating the trade rows
+- Databases created before rollups are backfilled
+- Rollups keep history beyond the trades row cap
+"""
+
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard.services.data_parser import DataParser
+from database import trades_store
+from services.market_analytics import MarketAnalytics
+from services.time_analytics import TimeAnalytics
+
+
+class RowsOnlyParser:
+    """Parser without rollup support: forces the row-aggregation path"""
+
+    def __init__(self, trades):
+        self.trades = trades
+
+    def get_trades(self, start_date=None, end_date=None, per_page=100, **kwargs):
+        return {"trades": list(self.trades)}
+
+
+def _insert_trades(log_dir, count, seed=11):
+    rng = random.Random(seed)
+    for _ in range(count):
+        trades_store.insert_trade(
+            log_dir,
+            timestamp=f"2024-{rng.randint(1, 4):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00",
+            market=rng.choice(["BTC > 100k", "ETH > 5k", "SOL > 300"]),
+            yes_price=0.45,
+            no_price=0.5,
+            profit_pct=1.0,
+            profit_usd=round(rng.uniform(-20, 30), 2),
+            strategy=rng.choice(["arbitrage", "momentum"]),
+        )
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    _insert_trades(tmp_path, 300)
+    return tmp_path
+
+
+def _both(store_dir, service_cls):
+    rows = trades_store.get_trades_since(store_dir, after_id=0, limit=100_000)
+    return service_cls(DataParser(store_dir)), service_cls(RowsOnlyParser(rows))
+
+
+class TestTradeRollups:
+    def test_time_analytics_match_rows(self, store_dir):
+        rollup, rows = _both(store_dir, TimeAnalytics)
+        assert rollup.get_hour_of_day_analysis() == rows.get_hour_of_day_analysis()
+        assert rollup.get_day_of_week_analysis() == rows.get_day_of_week_analysis()
+        assert rollup.get_monthly_performance() == rows.get_monthly_performance()
+
+    def test_market_analytics_match_rows(self, store_dir):
+        rollup, rows = _both(store_dir, MarketAnalytics)
+
+        def by_market(ms):
+            return sorted(ms, key=lambda m: m["market"])
+
+        assert by_market(rollup.get_market_performance()) == by_market(rows.get_market_performance())
+
+    def test_date_filter_uses_hour_buckets(self, store_dir):
+        months = TimeAnalytics(DataParser(store_dir)).get_monthly_performance(
+            start_date="2024-02-01T00:00:00", end_date="2024-03-31T23:59:59"
+        )
+        assert [m["month"] for m in months] == ["2024-02", "2024-03"]
+
+    def test_backfills_existing_database(self, store_dir):
+        expected = trades_store.query_rollups(store_dir, "strategy")
+        conn = sqlite3.connect(str(store_dir / "trades.db"))
+        conn.execute("DROP TABLE trade_rollups")
+        conn.commit()
+        conn.close()
+        assert trades_store.query_rollups(store_dir, "strategy") == expected
+
+    def test_insert_skips_schema_lookup_once_ready(self, tmp_path, monkeypatch):
+        trades_store.init_db(tmp_path)
+        _insert_trades(tmp_path, 1)
+        statements = []
+        real_connect = trades_store._connect
+
+        def traced_connect(log_dir):
+            conn = real_connect(log_dir)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(trades_store, "_connect", traced_connect)
+        _insert_trades(tmp_path, 3)
+        assert not [s for s in statements if "sqlite_master" in s]
+        assert sum(r["count"] for r in trades_store.query_rollups(tmp_path, "strategy")) == 4
+
+    def test_rollups_outlive_pruned_trades(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(trades_store, "TRADES_MAX_ROWS", 50)
+        _insert_trades(tmp_path, 80)
+        totals = trades_store.query_rollups(tmp_path, "strategy")
+        assert sum(r["count"] for r in totals) == 80
+        assert len(trades_store.get_trades_since(tmp_path, limit=1000)) == 50
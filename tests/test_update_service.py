@@ -163,5 +163,70 @@ class TestBackupCreation:
         assert len(backups) == 5
 
 
+class TestDeduplicatedBackups:
+    """Test content-addressed backups and incremental restore"""
+
+    @pytest.fixture
+    def update_service(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            (base_dir / "main.py").write_text("print('v1')")
+            (base_dir / "services").mkdir()
+            (base_dir / "services" / "a.py").write_text("A = 1")
+            (base_dir / "services" / "b.py").write_text("B = 1")
+            (base_dir / "state").mkdir()
+            (base_dir / "state" / "bot_state.json").write_text("{}")
+            yield UpdateService(base_dir)
+
+    def _object_count(self, us):
+        return len(list(us.backup_store.objects_dir.glob("*/*")))
+
+    def test_unchanged_backup_costs_nothing(self, update_service):
+        """Second backup of an unchanged tree stores no new objects"""
+        store = update_service.backup_store
+        first = store.snapshot("backup_1")
+        objects = self._object_count(update_service)
+        second = store.snapshot("backup_2")
+        assert first["new_bytes"] > 0
+        assert second["new_bytes"] == 0
+        assert self._object_count(update_service) == objects
+        assert second["files"] == first["files"]
+
+    def test_restore_copies_only_changed_files(self, update_service):
+        """Restore rewrites changed files and removes files added since the backup"""
+        base = update_service.base_dir
+        store = update_service.backup_store
+        store.snapshot("backup_1")
+        (base / "services" / "a.py").write_text("A = 2")
+        (base / "services" / "new.py").write_text("NEW = 1")
+
+        copied, removed = store.restore("backup_1")
+        assert (copied, removed) == (1, 1)
+        assert (base / "services" / "a.py").read_text() == "A = 1"
+        assert not (base / "services" / "new.py").exists()
+        assert store.restore("backup_1") == (0, 0)
+
+    def test_prune_deletes_unreferenced_objects(self, update_service):
+        """Objects only referenced by pruned backups are garbage collected"""
+        base = update_service.base_dir
+        store = update_service.backup_store
+        store.snapshot("backup_old")
+        (base / "services" / "a.py").write_text("A = 2")
+        time.sleep(0.01)
+        store.snapshot("backup_new")
+        before = self._object_count(update_service)
+        assert store.prune(keep=1) == 1
+        assert self._object_count(update_service) == before - 1
+        assert [b.name for b in store.list_backups()] == ["backup_new"]
+
+    def test_background_backup(self, update_service):
+        """Background snapshot completes and is visible after wait()"""
+        success, name = update_service.create_backup(background=True)
+        assert success is True
+        assert update_service.backup_store.wait(timeout=10)
+        assert update_service.backup_store.load_manifest(name) is not None
+        assert update_service.version_manager.get_latest_backup() == name
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Append-only activity feed and cheap change detection for engine files.
+
+The engine appends one JSON object per line to logs/activity.jsonl. Readers
+(the TUI) tail it from their last byte offset, so each refresh parses only
+the records written since the previous one, however long the history is.
+The feed rotates to activity.jsonl.1 once it passes max_bytes; tailers
+notice the new file and start over from its beginning.
+
+FileWatcher answers "did this file change?" from os.stat alone, so
+snapshot files such as bot_state.json are re-parsed only after a write.
+"""
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+ACTIVITY_FEED_NAME = "activity.jsonl"
+
+# Rotate the feed past this size (the previous file is kept as .1)
+MAX_FEED_BYTES = 5 * 1024 * 1024
+
+
+def append_activity(path: Path, record: Dict[str, Any], max_bytes: int = MAX_FEED_BYTES) -> None:
+    """
+    Append one record to the feed as a single JSON line.
+
+    Args:
+        path: Feed path (logs/activity.jsonl)
+        record: JSON-serializable activity record
+        max_bytes: Rotate to path.1 before appending once the feed is this big
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record, default=str) + "\n"
+    try:
+        if path.stat().st_size >= max_bytes:
+            os.replace(path, path.with_name(path.name + ".1"))
+    except FileNotFoundError:
+        pass
+    # One write() of a whole line in append mode: readers never see a
+    # record interleaved with another writer's
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class FileWatcher:
+    """Reports whether a file changed (inode, size or mtime) since the last check."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._checked = False
+
+    def changed(self) -> bool:
+        """True on the first call and whenever the file's stat signature moved."""
+        signature = _signature(self.path)
+        if self._checked and signature == self._signature:
+            return False
+        self._checked = True
+        self._signature = signature
+        return True
+
+
+class FeedTailer:
+    """
+    Incremental reader for an append-only JSON-lines feed.
+
+    Keeps the newest `keep` records. poll() reads from the last offset to
+    end of file; a trailing line without its newline yet is held back until
+    the writer finishes it. Malformed lines are skipped. The first poll only
+    reads the last backfill_bytes of an existing feed.
+    """
+
+    def __init__(self, path: Path, keep: int = 50, backfill_bytes: int = 64 * 1024):
+        """
+        Initialize tailer.
+
+        Args:
+            path: Feed path
+            keep: Number of most recent records to retain
+            backfill_bytes: How far back the first poll reads into an existing feed
+        """
+        self.path = Path(path)
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=keep)
+        self.backfill_bytes = backfill_bytes
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._partial = b""
+        self._skip_first_line = False
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def poll(self) -> int:
+        """
+        Read records appended since the last poll.
+
+        Returns:
+            Number of new records (0 when nothing changed, with one stat call)
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return 0
+
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # New or rotated file: start from its beginning (or, on the very
+            # first poll, from the last backfill_bytes)
+            first_poll = self._inode is None
+            self._inode = st.st_ino
+            self._offset = 0
+            self._partial = b""
+            if first_poll and st.st_size > self.backfill_bytes:
+                self._offset = st.st_size - self.backfill_bytes
+                self._skip_first_line = True
+        if st.st_size == self._offset:
+            return 0
+
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read(st.st_size - self._offset)
+        except OSError:
+            return 0
+        self._offset += len(chunk)
+
+        data = self._partial + chunk
+        lines = data.split(b"\n")
+        self._partial = lines.pop()  # b"" when the chunk ended on a newline
+        if self._skip_first_line and lines:
+            lines.pop(0)  # Started mid-record
+            self._skip_first_line = False
+
+        added = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                self.records.append(record)
+                added += 1
+        return added
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """Retained records, oldest first."""
+        return list(self.records)
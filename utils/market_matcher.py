@@ -8,6 +8,8 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import difflib
 
+from utils.market_parser import get_market_parse_cache
+
 
 class MarketMatcher:
     """
@@ -62,9 +64,11 @@ class MarketMatcher:
         Returns:
             Similarity score between 0 and 1
         """
-        # Get market questions/names
-        q1 = market1.get("question", market1.get("name", "")).lower()
-        q2 = market2.get("question", market2.get("name", "")).lower()
+        # Lowercased questions/names, from the shared parse cache (one
+        # lower() per market rather than per compared pair)
+        parse_cache = get_market_parse_cache()
+        q1 = parse_cache.get(market1).lower
+        q2 = parse_cache.get(market2).lower
 
         if not q1 or not q2:
             return 0.0
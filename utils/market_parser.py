@@ -3,10 +3,111 @@ Market Name Parser
 
 Parse crypto information from prediction market names.
 Extracts symbol, price threshold, and direction from market descriptions.
+
+MarketParser.parse() turns a question into a ParsedMarket (asset,
+threshold, comparator, expiry, location, category, ...) with precompiled
+patterns. Strategies read those fields through the shared cache returned by
+get_market_parse_cache(), so each question is parsed once, when its market
+is first seen, rather than lowercased and regex-scanned every cycle.
 """
 
 import re
-from typing import Dict, Optional, List
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, List, Tuple
+
+_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_MONTH_PATTERN = re.compile(
+    r"\b(january|february|march|april|may|june|july|august|september|october|november|december"
+    r"|jan|feb|mar|apr|jun|jul|aug|sept|sep|oct|nov|dec)\b\.?"
+    r"(?:\s+(\d{1,2})(?:st|nd|rd|th)?\b)?"
+)
+_QUARTER_PATTERN = re.compile(r"\bq([1-4])\b")
+_YEAR_PATTERN = re.compile(r"\b(20\d{2})\b")
+
+# Weather questions (matched against the lowercase question, in order)
+_TEMPERATURE_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"temperature.*exceed.*?(\d+).*?degrees?.*?in\s+([a-z\s]+)",
+        r"will it be.*?(\d+).*?degrees?.*?in\s+([a-z\s]+)",
+        r"(\d+).*?degrees?.*?or\s+(?:higher|hotter).*?in\s+([a-z\s]+)",
+        r"high temperature.*?(\d+).*?in\s+([a-z\s]+)",
+    )
+]
+_PRECIPITATION_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"will it rain.*?in\s+([a-z\s]+)",
+        r"precipitation.*?in\s+([a-z\s]+)",
+        r"snow.*?in\s+([a-z\s]+)",
+        r"chance of rain.*?in\s+([a-z\s]+)",
+    )
+]
+
+# Short-horizon UP/DOWN market keywords
+_UP_KEYWORDS = ("up", "higher", "above")
+_DOWN_KEYWORDS = ("down", "lower", "below")
+_FIFTEEN_MINUTE_KEYWORDS = ("15 min", "15-min", "15min", "fifteen minute")
+
+# Distinct markets kept by the shared parse cache
+PARSE_CACHE_SIZE = 50_000
+
+
+def parse_expiry(question_lower: str) -> Optional[str]:
+    """
+    Expiry key from a lowercase question, e.g. "2026-03-31", "2026-03",
+    "2026-q2", "2026". None when the question names no date.
+
+    Only used to keep different expiries apart (e.g. off the same threshold
+    ladder), so an odd parse can split a group but never merge two.
+    """
+    year_match = _YEAR_PATTERN.search(question_lower)
+    year = year_match.group(1) if year_match else "?"
+
+    month_match = _MONTH_PATTERN.search(question_lower)
+    if month_match:
+        month = _MONTHS.index(month_match.group(1)[:3]) + 1
+        day = month_match.group(2)
+        key = f"{year}-{month:02d}"
+        return f"{key}-{int(day):02d}" if day else key
+
+    quarter_match = _QUARTER_PATTERN.search(question_lower)
+    if quarter_match:
+        return f"{year}-q{quarter_match.group(1)}"
+
+    return year_match.group(1) if year_match else None
+
+
+@dataclass(frozen=True)
+class ParsedMarket:
+    """Structured fields of one market question (see MarketParser.parse)"""
+
+    question: str
+    lower: str
+    # Crypto price markets
+    asset: Optional[str]
+    threshold: Optional[float]
+    raw_price: Optional[str]
+    comparator: Optional[str]  # "above" | "below"
+    expiry: Optional[str]  # parse_expiry key, price removed first
+    # Short-horizon UP/DOWN markets
+    is_up: bool
+    is_down: bool
+    fifteen_minute: bool
+    # Weather markets
+    weather_kind: Optional[str]  # "temperature" | "precipitation"
+    location: Optional[str]
+    weather_threshold: Optional[float]
+    category: str  # "crypto" | "weather" | "other"
+
+    @property
+    def crypto_valid(self) -> bool:
+        """Asset, threshold and comparator all found (extract_crypto_info's valid)"""
+        return (
+            self.asset is not None and self.threshold is not None and self.comparator is not None
+        )
 
 
 class MarketParser:
@@ -14,6 +115,7 @@ class MarketParser:
 
     # Regex pattern for matching prices with optional $ and k suffix
     PRICE_PATTERN = r"\$?([\d,]+(?:\.\d+)?)\s*k?"
+    _PRICE_RE = re.compile(PRICE_PATTERN, re.IGNORECASE)
 
     # Symbol patterns for matching crypto names in market descriptions
     SYMBOL_PATTERNS = {
@@ -40,7 +142,7 @@ class MarketParser:
     }
 
     # Keywords indicating price should be above threshold
-    ABOVE_KEYWORDS = ["above", "over", "exceed", "more than", "greater than", ">"]
+    ABOVE_KEYWORDS = ["above", "over", "exceed", "surpass", "reach", "more than", "greater than", ">"]
 
     # Keywords indicating price should be below threshold
     BELOW_KEYWORDS = ["below", "under", "less than", "<"]
@@ -136,7 +238,7 @@ class MarketParser:
             Dictionary with 'value' (float) and 'raw' (str), or None if not found
         """
         # Find all price matches
-        matches = re.finditer(cls.PRICE_PATTERN, market_name, re.IGNORECASE)
+        matches = cls._PRICE_RE.finditer(market_name)
 
         for match in matches:
             raw_price = match.group(0)
@@ -181,6 +283,77 @@ class MarketParser:
 
         return None
 
+    @classmethod
+    def parse(cls, question: str) -> ParsedMarket:
+        """
+        Parse every structured field of a market question in one pass.
+
+        Args:
+            question: Market question / name
+
+        Returns:
+            ParsedMarket (uncached; see get_market_parse_cache)
+        """
+        lower = question.lower()
+
+        asset = cls._extract_symbol(lower)
+        price_info = cls._extract_price(question)
+        comparator = cls._extract_direction(lower)
+        threshold = price_info["value"] if price_info else None
+        raw_price = price_info["raw"] if price_info else None
+        # Drop the price itself so "$2025" is not read as a year
+        remainder = lower.replace(raw_price.lower(), " ", 1) if raw_price else lower
+
+        weather_kind, location, weather_threshold = cls._extract_weather(lower)
+        if weather_kind:
+            category = "weather"
+        elif asset:
+            category = "crypto"
+        else:
+            category = "other"
+
+        return ParsedMarket(
+            question=question,
+            lower=lower,
+            asset=asset,
+            threshold=threshold,
+            raw_price=raw_price,
+            comparator=comparator,
+            expiry=parse_expiry(remainder),
+            is_up=any(keyword in lower for keyword in _UP_KEYWORDS),
+            is_down=any(keyword in lower for keyword in _DOWN_KEYWORDS),
+            fifteen_minute=any(keyword in lower for keyword in _FIFTEEN_MINUTE_KEYWORDS),
+            weather_kind=weather_kind,
+            location=location,
+            weather_threshold=weather_threshold,
+            category=category,
+        )
+
+    @classmethod
+    def _extract_weather(
+        cls, market_lower: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+        """
+        Weather market kind, location and temperature threshold.
+
+        Args:
+            market_lower: Lowercase market name
+
+        Returns:
+            (kind, location, threshold), all None for non-weather markets
+        """
+        for pattern in _TEMPERATURE_PATTERNS:
+            match = pattern.search(market_lower)
+            if match:
+                return "temperature", match.group(2).strip().title(), float(match.group(1))
+
+        for pattern in _PRECIPITATION_PATTERNS:
+            match = pattern.search(market_lower)
+            if match:
+                return "precipitation", match.group(1).strip().title(), None
+
+        return None, None, None
+
     @classmethod
     def format_threshold(cls, threshold: float) -> str:
         """
@@ -209,3 +382,86 @@ class MarketParser:
             List of supported symbols
         """
         return list(cls.SYMBOL_PATTERNS.keys())
+
+
+class MarketParseCache:
+    """
+    ParsedMarket per market, parsed the first time the market is seen.
+
+    Entries are keyed by market ID (or by the question itself when there is
+    no ID) and re-parsed only if the question text changes. The least
+    recently used entries are evicted beyond max_size.
+    """
+
+    def __init__(self, max_size: int = PARSE_CACHE_SIZE):
+        """
+        Initialize parse cache.
+
+        Args:
+            max_size: Maximum number of cached markets
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, Tuple[int, ParsedMarket]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, question: str, market_id: Optional[str] = None) -> ParsedMarket:
+        """
+        Cached MarketParser.parse.
+
+        Args:
+            question: Market question
+            market_id: Market ID (None: key by question)
+
+        Returns:
+            ParsedMarket for question
+        """
+        key = market_id if market_id is not None else question
+        question_hash = hash(question)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == question_hash and entry[1].question == question:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        parsed = MarketParser.parse(question)
+        with self._lock:
+            self._entries[key] = (question_hash, parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def get(self, market: Dict[str, Any]) -> ParsedMarket:
+        """
+        ParsedMarket for a market dict.
+
+        Args:
+            market: Market with id / market_id and question / name
+
+        Returns:
+            ParsedMarket for the market's question
+        """
+        question = market.get("question", market.get("name", "")) or ""
+        return self.parse(question, market.get("id", market.get("market_id")))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_parse_cache: Optional[MarketParseCache] = None
+
+
+def get_market_parse_cache() -> MarketParseCache:
+    """Process-wide MarketParseCache shared by the strategies."""
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = MarketParseCache()
+    return _parse_cache
@@ -1,110 +1,422 @@
 """
 Rate Limiter
 
-Token bucket rate limiter for API calls.
-Thread-safe implementation to prevent exceeding API rate limits.
+Token bucket rate limiters for API calls, shared through a named registry.
+
+- TokenBucket: thread-safe bucket with non-polling sync/async acquire,
+  weighted costs per endpoint, reservations and 429/Retry-After backoff.
+- RateLimiterRegistry / get_rate_limiter(): one limiter per API so every
+  client draws from the same budget and the engine can publish a global view.
+- RateLimiter: per-minute limiter kept for existing callers.
 """
 
-import time
+import asyncio
 import threading
-from collections import deque
-from typing import Optional
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
 
 
-class RateLimiter:
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
     """
-    Thread-safe rate limiter using token bucket algorithm.
+    Parse a Retry-After header value (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
 
-    Limits API calls to a specified number per minute.
+    Tokens refill continuously at rate_per_second up to capacity. Acquiring
+    reserves tokens immediately (the balance may go negative) and returns how
+    long the caller must wait, so concurrent callers are spaced out in order
+    without polling. A 429 response pauses refill until Retry-After has passed.
     """
 
-    def __init__(self, calls_per_minute: int):
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        capacity: Optional[float] = None,
+        costs: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
-        Initialize rate limiter.
+        Initialize token bucket.
 
         Args:
-            calls_per_minute: Maximum number of calls allowed per minute
+            name: Limiter name (e.g. API name)
+            rate_per_second: Sustained refill rate
+            capacity: Burst size (default: one second of refill, at least 1)
+            costs: Optional token cost per endpoint name (default cost: 1)
+            clock: Monotonic time source (injectable for tests)
         """
-        if calls_per_minute <= 0:
-            raise ValueError("calls_per_minute must be positive")
-
-        self.calls_per_minute = calls_per_minute
-        self.call_times = deque()
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+
+        self.name = name
+        self.rate = float(rate_per_second)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self.costs: Dict[str, float] = dict(costs or {})
+        self._clock = clock
+        self._tokens = self.capacity
+        # Refill resumes from this instant; in the future while backing off after a 429
+        self._updated = clock()
         self.lock = threading.Lock()
-        self.window_seconds = 60.0
 
-    def acquire(self, timeout: Optional[float] = None) -> bool:
+        self.acquired = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.rate_limit_hits = 0
+
+    def configure(
+        self,
+        rate_per_second: Optional[float] = None,
+        capacity: Optional[float] = None,
+        costs: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Update rate, burst size or endpoint costs in place."""
+        with self.lock:
+            self._refill(self._clock())
+            if rate_per_second:
+                self.rate = float(rate_per_second)
+            if capacity:
+                self.capacity = float(capacity)
+                self._tokens = min(self._tokens, self.capacity)
+            if costs:
+                self.costs.update(costs)
+
+    def cost_of(self, endpoint: Optional[str] = None, cost: float = 1.0) -> float:
+        """Token cost of a call to endpoint (falls back to cost)."""
+        if endpoint is not None:
+            return float(self.costs.get(endpoint, cost))
+        return float(cost)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _delay(self, cost: float, now: float) -> float:
+        """Seconds until cost tokens are available (caller holds lock, bucket refilled)."""
+        delay = max(0.0, self._updated - now)
+        deficit = cost - self._tokens
+        if deficit > 0:
+            delay += deficit / self.rate
+        return delay
+
+    def _reserve(self, cost: float, timeout: Optional[float]) -> Optional[float]:
+        with self.lock:
+            now = self._clock()
+            self._refill(now)
+            delay = self._delay(cost, now)
+            if timeout is not None and delay > timeout:
+                self.rejected += 1
+                return None
+            self._tokens -= cost
+            self.acquired += 1
+            if delay > 0:
+                self.throttled += 1
+            return delay
+
+    def try_acquire(self, cost: float = 1.0, endpoint: Optional[str] = None) -> bool:
+        """Take tokens only if available right now. Never waits."""
+        return self._reserve(self.cost_of(endpoint, cost), timeout=0.0) is not None
+
+    def reserve(self, cost: float = 1.0, endpoint: Optional[str] = None) -> float:
         """
-        Acquire permission to make an API call.
+        Reserve tokens now (e.g. for a whole batch) without waiting.
 
-        Blocks if rate limit would be exceeded until a slot is available.
+        Returns:
+            Seconds the caller must wait before spending the reservation
+        """
+        return self._reserve(self.cost_of(endpoint, cost), timeout=None)
+
+    def reserve_within(
+        self, timeout: float, cost: float = 1.0, endpoint: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Reserve tokens only if they are available within timeout. Never waits.
+
+        Returns:
+            Seconds the caller must wait before sending, or None (nothing
+            reserved) if that would exceed timeout
+        """
+        return self._reserve(self.cost_of(endpoint, cost), timeout)
+
+    def acquire(
+        self,
+        cost: float = 1.0,
+        timeout: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> bool:
+        """
+        Acquire tokens, sleeping once for the computed delay if needed.
 
         Args:
-            timeout: Maximum time to wait in seconds (None = wait indefinitely)
+            cost: Number of tokens (ignored if endpoint has a configured cost)
+            timeout: Maximum time to wait in seconds (None = wait as long as needed)
+            endpoint: Optional endpoint name for weighted cost
 
         Returns:
-            True if acquired, False if timeout exceeded
+            True if acquired, False if the wait would exceed timeout
         """
-        start_time = time.time()
+        delay = self._reserve(self.cost_of(endpoint, cost), timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    async def acquire_async(
+        self,
+        cost: float = 1.0,
+        timeout: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> bool:
+        """asyncio variant of acquire(); awaits instead of blocking the event loop."""
+        delay = self._reserve(self.cost_of(endpoint, cost), timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+    def penalize(self, retry_after: float) -> None:
+        """Drain the bucket and pause refill for retry_after seconds."""
+        with self.lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + max(0.0, retry_after))
+            self.rate_limit_hits += 1
+
+    def on_response(
+        self, status_code: int, headers: Optional[Mapping[str, Any]] = None
+    ) -> Optional[float]:
+        """
+        Adapt to an HTTP response: back off on 429 (honouring Retry-After) and
+        never assume more budget than X-RateLimit-Remaining reports.
 
-        while True:
-            with self.lock:
-                current_time = time.time()
+        Returns:
+            Backoff applied in seconds, or None if no backoff
+        """
+        headers = headers or {}
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                remaining = float(remaining)
+            except (TypeError, ValueError):
+                remaining = None
+            if remaining is not None:
+                with self.lock:
+                    self._refill(self._clock())
+                    self._tokens = min(self._tokens, remaining)
+
+        if status_code != 429:
+            return None
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            # No hint from the server: wait long enough to refill the whole bucket
+            retry_after = self.capacity / self.rate
+        self.penalize(retry_after)
+        return retry_after
+
+    def wait_time(self, cost: float = 1.0) -> float:
+        """Seconds until cost tokens could be acquired (0 if available now)."""
+        with self.lock:
+            now = self._clock()
+            self._refill(now)
+            return self._delay(cost, now)
 
-                # Remove expired calls (older than 60 seconds)
-                self._remove_expired_calls(current_time)
+    def reset(self) -> None:
+        """Refill the bucket and clear any backoff."""
+        with self.lock:
+            self._tokens = self.capacity
+            self._updated = self._clock()
 
-                # Check if we can make a call
-                if len(self.call_times) < self.calls_per_minute:
-                    self.call_times.append(current_time)
-                    return True
+    def snapshot(self) -> Dict[str, Any]:
+        """Current budget for dashboards and metrics."""
+        with self.lock:
+            now = self._clock()
+            self._refill(now)
+            remaining = max(0.0, self._tokens)
+            return {
+                "capacity": self.capacity,
+                "rate_per_minute": round(self.rate * 60.0, 3),
+                "remaining": int(remaining),
+                "usage_pct": round((1.0 - remaining / self.capacity) * 100.0, 1),
+                "reset_seconds": round(self._delay(self.capacity, now), 2),
+                "backoff_seconds": round(max(0.0, self._updated - now), 2),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+                "rate_limit_hits": self.rate_limit_hits,
+            }
 
-                # Calculate wait time until oldest call expires
-                oldest_call = self.call_times[0]
-                wait_time = self.window_seconds - (current_time - oldest_call)
+    def __repr__(self) -> str:
+        return f"TokenBucket(name={self.name!r}, rate={self.rate}/s, capacity={self.capacity})"
 
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    return False
-                if wait_time > (timeout - elapsed):
-                    wait_time = timeout - elapsed
 
-            # Wait before retrying
-            if wait_time > 0:
-                time.sleep(wait_time)
+class RateLimiterRegistry:
+    """
+    Named token buckets shared process-wide.
 
-    def get_remaining_calls(self) -> int:
-        """
-        Get number of remaining calls available in current window.
+    Clients call get() with their default budget; config (rate_limits section)
+    applied through configure() overrides it whether it runs before or after.
+    """
 
-        Returns:
-            Number of calls that can be made immediately
+    DEFAULT_CALLS_PER_MINUTE = 60
+
+    def __init__(self):
+        self._limiters: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        calls_per_minute: float,
+        burst: Optional[float] = None,
+        costs: Optional[Mapping[str, float]] = None,
+    ) -> TokenBucket:
+        """Create limiter name, or reconfigure it in place if it exists."""
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limiter = TokenBucket(name, calls_per_minute / 60.0, capacity=burst, costs=costs)
+                self._limiters[name] = limiter
+                return limiter
+        limiter.configure(calls_per_minute / 60.0, burst, costs)
+        return limiter
+
+    def get(
+        self,
+        name: str,
+        calls_per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        costs: Optional[Mapping[str, float]] = None,
+    ) -> TokenBucket:
+        """Return limiter name, creating it with the given defaults on first use."""
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limiter = TokenBucket(
+                    name,
+                    (calls_per_minute or self.DEFAULT_CALLS_PER_MINUTE) / 60.0,
+                    capacity=burst,
+                    costs=costs,
+                )
+                self._limiters[name] = limiter
+            return limiter
+
+    def configure(self, rate_limits: Optional[Mapping[str, Mapping[str, Any]]]) -> None:
         """
-        with self.lock:
-            current_time = time.time()
-            self._remove_expired_calls(current_time)
-            return self.calls_per_minute - len(self.call_times)
-
-    def reset(self):
+        Apply a rate_limits config section, e.g.
+        {"coingecko": {"calls_per_minute": 50, "burst": 1, "costs": {"market_chart": 2}}}
         """
-        Reset the rate limiter, clearing all tracked calls.
+        for name, cfg in (rate_limits or {}).items():
+            if not isinstance(cfg, Mapping) or not cfg.get("calls_per_minute"):
+                continue
+            self.register(name, float(cfg["calls_per_minute"]), cfg.get("burst"), cfg.get("costs"))
+
+    def names(self):
+        with self._lock:
+            return sorted(self._limiters)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-limiter budget snapshots."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.snapshot() for limiter in limiters}
+
+    def summary(self) -> Dict[str, Any]:
         """
-        with self.lock:
-            self.call_times.clear()
+        Dashboard rate_limit block: headline figures from the most used limiter,
+        plus every limiter under "limiters".
+        """
+        limiters = self.snapshot()
+        if not limiters:
+            return {"usage_pct": 0.0, "remaining": 0, "reset_seconds": 0, "limiters": {}}
+        name, busiest = max(limiters.items(), key=lambda item: item[1]["usage_pct"])
+        return {
+            "usage_pct": busiest["usage_pct"],
+            "remaining": busiest["remaining"],
+            "reset_seconds": int(round(busiest["reset_seconds"])),
+            "busiest": name,
+            "limiters": limiters,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._limiters.clear()
+
+
+_registry = RateLimiterRegistry()
+
+
+def get_registry() -> RateLimiterRegistry:
+    """Process-wide rate limiter registry."""
+    return _registry
+
+
+def get_rate_limiter(
+    name: str,
+    calls_per_minute: Optional[float] = None,
+    burst: Optional[float] = None,
+    costs: Optional[Mapping[str, float]] = None,
+) -> TokenBucket:
+    """Shared limiter for name from the process-wide registry."""
+    return _registry.get(name, calls_per_minute, burst, costs)
+
+
+class RateLimiter(TokenBucket):
+    """
+    Thread-safe rate limiter using token bucket algorithm.
+
+    Limits API calls to a specified number per minute (burst = calls_per_minute).
+    """
 
-    def _remove_expired_calls(self, current_time: float):
+    def __init__(self, calls_per_minute: int, name: str = "default"):
         """
-        Remove calls older than the time window.
+        Initialize rate limiter.
 
         Args:
-            current_time: Current timestamp
+            calls_per_minute: Maximum number of calls allowed per minute
+            name: Limiter name used in snapshots
         """
-        cutoff_time = current_time - self.window_seconds
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
 
-        while self.call_times and self.call_times[0] < cutoff_time:
-            self.call_times.popleft()
+        super().__init__(name, calls_per_minute / 60.0, capacity=calls_per_minute)
+        self.calls_per_minute = calls_per_minute
+        self.window_seconds = 60.0
+
+    def get_remaining_calls(self) -> int:
+        """
+        Get number of remaining calls available now.
+
+        Returns:
+            Number of calls that can be made immediately
+        """
+        return self.snapshot()["remaining"]
 
     def get_wait_time(self) -> float:
         """
@@ -113,15 +425,7 @@ class RateLimiter:
         Returns:
             Wait time in seconds (0 if call can be made immediately)
         """
-        with self.lock:
-            current_time = time.time()
-            self._remove_expired_calls(current_time)
-
-            if len(self.call_times) < self.calls_per_minute:
-                return 0.0
-
-            oldest_call = self.call_times[0]
-            return self.window_seconds - (current_time - oldest_call)
+        return self.wait_time(1.0)
 
     def __repr__(self) -> str:
         """String representation of rate limiter state."""
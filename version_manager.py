@@ -302,7 +302,10 @@ class VersionManager:
                 return None
 
             # List all backup directories
-            backups = [d for d in backups_dir.iterdir() if d.is_dir()]
+            # Skip the backup object store (.objects)
+            backups = [
+                d for d in backups_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
+            ]
             if not backups:
                 return None
 